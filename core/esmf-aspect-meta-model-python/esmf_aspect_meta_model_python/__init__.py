@@ -85,5 +85,6 @@ from .impl import (
     DefaultTrait,
     DefaultUnit,
 )
+from .loader.aspect_cache import AspectCache
 from .loader.samm_graph import SAMMGraph
 from .resolver.handler import InputHandler
@@ -2,19 +2,22 @@ import pathlib
 import subprocess
 import tempfile
 
-from typing import Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from rdflib import Graph
 
 from esmf_aspect_meta_model_python import utils
 from esmf_aspect_meta_model_python.constants import SAMM_VERSION
 from esmf_aspect_meta_model_python.samm_cli import SammCli
+from esmf_aspect_meta_model_python.upgrade_cache import UpgradeCache
 
 
-class AdaptiveGraph(Graph):  # TODO: avoid double parsing when an upgrade is not performed
+class AdaptiveGraph(Graph):
     """An RDF graph that can adaptively upgrade SAMM files using the SAMM CLI."""
 
     _samm_cli = SammCli()
+    _upgraded_roots: Dict[Tuple[pathlib.Path, str], pathlib.Path] = {}
+    _upgrade_cache = UpgradeCache()
 
     def __init__(self, samm_version: str = SAMM_VERSION, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -28,16 +31,31 @@ class AdaptiveGraph(Graph):  # TODO: avoid double parsing when an upgrade is not
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"SAMM CLI failed for {file_path}:\n{e.stdout}\n{e.stderr}") from e
 
+    def _upgrade_cached(self, content: Union[str, bytes], upgrade: Callable[[], str]) -> str:
+        """Get the upgraded content from the upgrade cache or upgrade it and store the result."""
+        key = self._upgrade_cache.get_key(content, self._samm_version)
+        upgraded = self._upgrade_cache.get(key)
+
+        if upgraded is None:
+            upgraded = upgrade()
+            self._upgrade_cache.put(key, upgraded)
+
+        return upgraded
+
     def _upgrade_source(self, source_path: pathlib.Path) -> str:
         print(f"[INFO] SAMM version mismatch detected in {source_path}. Upgrading...")
 
-        return self._upgrade_ttl_file(source_path)
+        return self._upgrade_cached(source_path.read_bytes(), lambda: self._upgrade_ttl_file(source_path))
 
     def _upgrade_data(self, data: str | bytes) -> str:
         print(  # TODO: improve logging
             f"[INFO] SAMM version mismatch detected in provided data (target v{self._samm_version}) Upgrading..."
         )
 
+        return self._upgrade_cached(data, lambda: self._upgrade_temporary_file(data))
+
+    def _upgrade_temporary_file(self, data: str | bytes) -> str:
+        """Write the data to a temporary file and upgrade it with the SAMM CLI."""
         with tempfile.NamedTemporaryFile("wb", suffix=".ttl", delete=False) as tmp:
             tmp.write(data.encode("utf-8") if isinstance(data, str) else data)
             tmp_path = pathlib.Path(tmp.name)
@@ -47,6 +65,48 @@ class AdaptiveGraph(Graph):  # TODO: avoid double parsing when an upgrade is not
         finally:
             tmp_path.unlink(missing_ok=True)
 
+    @classmethod
+    def register_upgraded_root(
+        cls,
+        models_root: Union[str, pathlib.Path],
+        upgraded_root: Union[str, pathlib.Path],
+        samm_version: str = SAMM_VERSION,
+    ):
+        """Register a side directory with upgraded versions of the files of a models root.
+
+        Files of the models root with an up-to-date upgraded version are parsed from the side directory without
+        running the SAMM CLI. The side directory is only used by graphs for the SAMM version it was upgraded to, so a
+        models root can have one side directory per SAMM version.
+        """
+        cls._upgraded_roots[(pathlib.Path(models_root).resolve(), samm_version)] = pathlib.Path(upgraded_root)
+
+    @staticmethod
+    def is_upgraded(source_path: pathlib.Path, upgraded_path: pathlib.Path) -> bool:
+        """Check if the upgraded file exists and is not older than the source file."""
+        try:
+            return upgraded_path.stat().st_mtime >= source_path.stat().st_mtime
+        except OSError:
+            return False
+
+    def _get_upgraded_source(self, source_path: pathlib.Path) -> Optional[pathlib.Path]:
+        """Get the up-to-date upgraded version of a source file from the side directories of the SAMM version."""
+        if not self._upgraded_roots:
+            return None
+
+        resolved_path = source_path.resolve()
+        for (models_root, samm_version), upgraded_root in self._upgraded_roots.items():
+            if samm_version == self._samm_version and resolved_path.is_relative_to(models_root):
+                upgraded_path = upgraded_root / resolved_path.relative_to(models_root)
+                if self.is_upgraded(resolved_path, upgraded_path):
+                    return upgraded_path
+
+        return None
+
+    @property
+    def samm_version(self) -> str:
+        """SAMM version the parsed files are upgraded to."""
+        return self._samm_version
+
     def set_samm_version(self, samm_version: str) -> None:
         """Set the SAMM version for this graph."""
         self._samm_version = samm_version
@@ -62,7 +122,8 @@ class AdaptiveGraph(Graph):  # TODO: avoid double parsing when an upgrade is not
         Parse a TTL file into this graph, upgrading via SAMM CLI if version mismatch detected.
 
         If a SAMM version mismatch is detected, the TTL file will be upgraded using the SAMM CLI prettyprint
-        before parsing into this graph.
+        before parsing into this graph. A file with an up-to-date upgraded version in a registered side directory
+        (see BatchUpgrader) is parsed from there.
 
         Args:
             source: Path to the TTL file as pathlib.Path or str.
@@ -82,6 +143,12 @@ class AdaptiveGraph(Graph):  # TODO: avoid double parsing when an upgrade is not
         if source:
             input_source = source = pathlib.Path(source)
             upgrade_method = self._upgrade_source
+
+            upgraded_source = self._get_upgraded_source(source)
+            if upgraded_source:
+                super().parse(source=upgraded_source, **kwargs)
+
+                return self
         else:
             input_source = data  # type: ignore[assignment]
             upgrade_method = self._upgrade_data  # type: ignore[assignment]
@@ -25,6 +25,8 @@ class Aspect(StructureElement, ABC):
     An Aspect Model is described in RDF Turtle.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def operations(self) -> List[Operation]:
@@ -21,6 +21,8 @@ class Base(IsDescribed, ABC):
     Superclass from which all elements in the Meta Model inherit.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def parent_elements(self) -> Optional[list["Base"]]:
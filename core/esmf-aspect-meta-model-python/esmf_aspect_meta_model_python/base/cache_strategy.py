@@ -43,6 +43,33 @@ class CacheStrategy(ABC):
             list[Base]: the found elements or an empty list.
         """
 
+    def get_by_urn(self, urn: str) -> Base | None:
+        """Get element by URN.
+
+        The elements are cached by their URNs, so the default implementation gets the element by its key.
+
+        Args:
+            urn (str): URN of the element.
+
+        Returns:
+            Base | None: the found element or None.
+        """
+        return self.get(urn)
+
+    def find_by_type(self, element_type: type) -> list:
+        """Find all elements which are instances of a model element class or interface.
+
+        Args:
+            element_type (type): class or interface of the elements.
+
+        Returns:
+            list: the found elements or an empty list.
+
+        Raises:
+            NotImplementedError: If the cache strategy cannot list its elements, which is the default.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support finding elements by type.")
+
     @abstractmethod
     def resolve_instance(self, model_element: Base) -> Base:
         """Resolve cached element instance or add the given element to the cache.
@@ -24,6 +24,8 @@ class Characteristic(Base, ABC):
     (e.g., Enumeration or Collection).
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def data_type(self) -> Optional[DataType]:
@@ -19,3 +19,5 @@ class Code(Characteristic, ABC):
 
     Describes a Property which contains any kind of code.
     """
+
+    __slots__ = ()
@@ -23,6 +23,8 @@ class Collection(Characteristic, ABC):
     The values are not ordered and may include duplicates.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def element_characteristic(self) -> Optional[Characteristic]:
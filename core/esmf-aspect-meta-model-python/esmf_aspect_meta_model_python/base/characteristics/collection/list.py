@@ -19,3 +19,5 @@ class List(Collection, ABC):
 
     Collection with ordered elements and allowed duplicates.
     """
+
+    __slots__ = ()
@@ -19,3 +19,5 @@ class Set(Collection, ABC):
 
     Collection with unordered elements and without duplicates.
     """
+
+    __slots__ = ()
@@ -19,3 +19,5 @@ class SortedSet(Collection, ABC):
 
     Collection with ordered elements and without duplicates.
     """
+
+    __slots__ = ()
@@ -19,3 +19,5 @@ class TimeSeries(SortedSet, ABC):
 
     Sorted Set that has tuples of timestamps and values.
     """
+
+    __slots__ = ()
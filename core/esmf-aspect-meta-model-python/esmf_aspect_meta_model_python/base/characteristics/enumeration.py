@@ -10,7 +10,7 @@
 #   SPDX-License-Identifier: MPL-2.0
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List
 
 from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
 
@@ -21,7 +21,27 @@ class Enumeration(Characteristic, ABC):
     Describes a Property that has exactly one of multiple possible values.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def values(self) -> List:
         """Values."""
+
+    def contains(self, value: Any) -> bool:
+        """Check if a value is one of the values."""
+        return value in self.values
+
+    def get_value(self, key: Any, default: Any = None) -> Any:
+        """Get a value by its key, the scalar value itself or the name of an entity value.
+
+        The name of an entity value is stored under the samm:name URN of its meta model version.
+        """
+        for value in self.values:
+            if isinstance(value, dict):
+                if any(str(name).endswith("#name") and item == key for name, item in value.items()):
+                    return value
+            elif value == key:
+                return value
+
+        return default
@@ -19,3 +19,5 @@ class Duration(Quantifiable, ABC):
 
     Quantifiable where the unit quantifies time.
     """
+
+    __slots__ = ()
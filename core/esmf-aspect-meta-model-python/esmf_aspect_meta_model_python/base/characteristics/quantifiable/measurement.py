@@ -19,3 +19,5 @@ class Measurement(Quantifiable, ABC):
 
     Quantifiable where the unit is required.
     """
+
+    __slots__ = ()
@@ -24,6 +24,8 @@ class Quantifiable(Characteristic, ABC):
     It can have an optional unit.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def unit(self) -> typing.Optional[Unit]:
@@ -19,3 +19,5 @@ class SingleEntity(Characteristic, ABC):
 
     Describes a Property whose data type is an Entity.
     """
+
+    __slots__ = ()
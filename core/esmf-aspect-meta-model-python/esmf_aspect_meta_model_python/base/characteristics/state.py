@@ -20,6 +20,8 @@ class State(Enumeration, ABC):
     Enumeration that has also a Default value.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def default_value(self):
@@ -22,6 +22,8 @@ class StructuredValue(Characteristic, ABC):
     deconstructed with a regular expression.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def deconstruction_rule(self) -> Optional[str]:
@@ -25,6 +25,8 @@ class Trait(Characteristic, ABC):
     this value.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def base_characteristic(self) -> Optional[Characteristic]:
@@ -20,3 +20,5 @@ class Constraint(Base, ABC):
     A constraint restricts a characteristic in a certain way.
     Constraints are wrapped in a Trait which holds a reference to the actual characteristic.
     """
+
+    __slots__ = ()
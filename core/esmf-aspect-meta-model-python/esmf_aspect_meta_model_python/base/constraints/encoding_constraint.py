@@ -21,6 +21,8 @@ class EncodingConstraint(Constraint, ABC):
     Restricts the encoding of a Property (e.g., samm:UTF-8, samm:US:ASCII).
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value(self) -> Optional[str]:
@@ -22,6 +22,8 @@ class FixedPointConstraint(Constraint, ABC):
     The constraint may only be used with Characteristics that use the xsd:decimal data type.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def scale(self) -> Optional[int]:
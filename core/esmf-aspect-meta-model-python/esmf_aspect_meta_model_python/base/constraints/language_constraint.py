@@ -20,6 +20,8 @@ class LanguageConstraint(Constraint, ABC):
     Restricts a value to a specific language. The language is specified by a language code e.g. "de".
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def language_code(self) -> str:
@@ -23,6 +23,8 @@ class LengthConstraint(Constraint, ABC):
     - It can restrict a collection in the number of elements.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def min_value(self) -> Optional[int]:
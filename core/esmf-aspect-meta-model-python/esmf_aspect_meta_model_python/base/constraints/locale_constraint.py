@@ -21,6 +21,8 @@ class LocaleConstraint(Constraint, ABC):
     Restricts a value to a specific locale, i.e., a language with additional region information (e.g., "de-DE").
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def locale_code(self) -> Optional[str]:
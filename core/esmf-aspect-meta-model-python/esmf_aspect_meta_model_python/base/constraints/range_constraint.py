@@ -24,6 +24,8 @@ class RangeConstraint(Constraint, ABC):
     Additionally, the Bound Definition can specify whether the upper and lower value are included in the range.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def min_value(self) -> Optional[Any]:
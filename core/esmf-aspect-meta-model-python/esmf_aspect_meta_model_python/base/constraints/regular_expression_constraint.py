@@ -21,6 +21,8 @@ class RegularExpressionConstraint(Constraint, ABC):
     Restricts a string value to a regular expression as defined by XQuery 1.0 and XPath 2.0 Functions and Operators.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value(self) -> Optional[str]:
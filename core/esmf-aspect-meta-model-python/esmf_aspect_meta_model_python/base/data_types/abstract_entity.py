@@ -18,6 +18,8 @@ from esmf_aspect_meta_model_python.base.data_types.complex_type import ComplexTy
 class AbstractEntity(ComplexType, ABC):
     """Abstract Entity interface class."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def extending_elements(self) -> List[ComplexType]:
@@ -20,6 +20,8 @@ from esmf_aspect_meta_model_python.base.structure_element import StructureElemen
 class ComplexType(DataType, StructureElement, ABC):
     """Complex Type interface class."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def all_properties(self) -> List[Property]:
@@ -21,6 +21,8 @@ class DataType(HasUrn, ABC):
     Data types are classified in scalar (e.g. integer, string, etc.) and complex (Entity).
     """
 
+    __slots__ = ()
+
     @property
     def is_scalar(self) -> bool:
         """Is scalar flag."""
@@ -20,3 +20,5 @@ class Entity(ComplexType, ABC):
     Complex Data Type that includes a number of properties.
     An Entity specifies a value that can't be expressed by a scalar e.g. a vector.
     """
+
+    __slots__ = ()
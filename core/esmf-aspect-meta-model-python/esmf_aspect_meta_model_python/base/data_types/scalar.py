@@ -21,6 +21,8 @@ class Scalar(DataType, ABC):
     http://www.w3.org/2001/XMLSchema#integer for an integer value.
     """
 
+    __slots__ = ()
+
     @property
     def is_scalar(self) -> bool:
         """Is scalar flag."""
@@ -22,6 +22,8 @@ class Either(Base, ABC):
     Describes a property that has exactly one of two possible values.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def left(self) -> Optional[Characteristic]:
@@ -23,6 +23,8 @@ class Event(Base, ABC):
     Assets can for instance emit events to notify other assets in case of special occurrence.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def parameters(self) -> List[Property]:
@@ -22,6 +22,8 @@ class HasProperties(ABC):
     E.g. Aspect and ComplexType.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def properties(self) -> List[Property]:
@@ -20,6 +20,8 @@ class HasUrn(ABC):
     Class prescribes method to get the element urn and samm version.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def urn(self) -> Optional[str]:
@@ -22,6 +22,8 @@ class IsDescribed(HasUrn, ABC):
     Class prescribes methods to get preferred names, descriptions and see elements.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -16,3 +16,5 @@ from esmf_aspect_meta_model_python.base import Base
 
 class Namespace(Base, ABC):
     """Namespace interface class."""
+
+    __slots__ = ()
@@ -23,6 +23,8 @@ class Operation(Base, ABC):
     An operation has a number of input properties and one optional output property.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def input_properties(self) -> List[Property]:
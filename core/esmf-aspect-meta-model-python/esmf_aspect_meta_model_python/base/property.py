@@ -25,6 +25,8 @@ class AbstractProperty(Base, ABC):
     It does not have a characteristic and can be extended by a property inside an entity.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def example_value(self) -> Optional[Any]:
@@ -96,6 +98,8 @@ class Property(AbstractProperty, ABC):
     It has exactly one characteristic and may have an example value.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def characteristic(self) -> Optional[Characteristic]:
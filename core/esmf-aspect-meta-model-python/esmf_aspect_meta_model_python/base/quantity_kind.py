@@ -18,3 +18,5 @@ class QuantityKind(Base, ABC):
     """QuantityKind interface class.
 
     A quantity kind is a physical property of an object or a system, e.g. length, diameter, volume or voltage."""
+
+    __slots__ = ()
@@ -17,3 +17,5 @@ from esmf_aspect_meta_model_python.base.has_properties import HasProperties
 
 class StructureElement(Base, HasProperties, ABC):
     """Structure Element interface class."""
+
+    __slots__ = ()
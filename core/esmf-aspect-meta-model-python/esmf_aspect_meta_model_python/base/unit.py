@@ -23,6 +23,8 @@ class Unit(Base, ABC):
     Examples for units are meter, millimeter, inch, or volts. A Unit in the SAMM.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def symbol(self) -> Optional[str]:
@@ -18,6 +18,8 @@ from esmf_aspect_meta_model_python.base import Base
 class Value(Base, ABC):
     """Value interface class."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value(self) -> Any:
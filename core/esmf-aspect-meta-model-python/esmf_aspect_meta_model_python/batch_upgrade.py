@@ -0,0 +1,140 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import hashlib
+import os
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from esmf_aspect_meta_model_python import utils
+from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.samm_cli import SammCli
+
+
+class BatchUpgrader:
+    """Upgrade all outdated SAMM files of a models root to the current SAMM version in one run.
+
+    The upgraded files are written to a side directory with the same layout as the models root. After the upgrade,
+    the side directory is registered in AdaptiveGraph, so that later loads of the outdated files parse the upgraded
+    files directly instead of running the SAMM CLI again.
+
+    The SAMM CLI upgrades one model file per call, so the files are upgraded by a bounded pool of parallel SAMM CLI
+    processes.
+    """
+
+    def __init__(
+        self,
+        models_root: Union[str, Path],
+        upgraded_root: Optional[Union[str, Path]] = None,
+        samm_version: str = SAMM_VERSION,
+        max_workers: Optional[int] = None,
+        samm_cli: Optional[SammCli] = None,
+    ):
+        """Initialize the upgrader.
+
+        :param models_root: folder with the models in the namespace/version/file.ttl layout
+        :param upgraded_root: folder for the upgraded files, defaults to a folder in the loader cache directory
+        :param samm_version: SAMM version to upgrade to
+        :param max_workers: maximal number of parallel SAMM CLI processes, defaults to the number of CPUs
+        :param samm_cli: SAMM CLI wrapper to use, defaults to the one of AdaptiveGraph
+        """
+        self.models_root = Path(models_root).resolve()
+        self.samm_version = samm_version
+        self.upgraded_root = Path(upgraded_root) if upgraded_root else self._get_default_upgraded_root()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._samm_cli = samm_cli or AdaptiveGraph._samm_cli
+
+    def _get_default_upgraded_root(self) -> Path:
+        """Get the side directory in the loader cache directory for the models root."""
+        root_hash = hashlib.sha256(str(self.models_root).encode("utf-8")).hexdigest()[:16]
+
+        return utils.get_cache_dir() / "upgraded" / self.samm_version / root_hash
+
+    def get_upgraded_path(self, file_path: Union[str, Path]) -> Path:
+        """Get the path of the upgraded version of a model file.
+
+        :param file_path: path to a model file in the models root
+        :return: path to the upgraded file in the side directory
+        """
+        return self.upgraded_root / Path(file_path).resolve().relative_to(self.models_root)
+
+    def is_outdated(self, file_path: Union[str, Path]) -> bool:
+        """Check if a model file uses another SAMM version and has no up-to-date upgraded version.
+
+        :param file_path: path to a model file in the models root
+        """
+        if AdaptiveGraph.is_upgraded(Path(file_path), self.get_upgraded_path(file_path)):
+            return False
+
+        return utils.has_version_mismatch_from_input(Path(file_path), samm_version=self.samm_version)
+
+    def find_outdated_files(self) -> List[Path]:
+        """Find all model files of the models root which must be upgraded.
+
+        :return: paths to the outdated model files
+        """
+        return [file_path for file_path in sorted(self.models_root.rglob("*.ttl")) if self.is_outdated(file_path)]
+
+    def _upgrade_file(self, file_path: Path) -> Path:
+        """Upgrade a single model file to the side directory.
+
+        :param file_path: path to the outdated model file
+        :return: path to the upgraded file
+        """
+        try:
+            upgraded_data = self._samm_cli.prettyprint(str(file_path), capture=True)
+        except subprocess.CalledProcessError as error:
+            raise RuntimeError(f"SAMM CLI failed for {file_path}:\n{error.stdout}\n{error.stderr}") from error
+
+        upgraded_path = self.get_upgraded_path(file_path)
+        utils.write_file_atomically(upgraded_path, upgraded_data.encode("utf-8"))
+
+        return upgraded_path
+
+    def upgrade(self, files: Optional[Iterable[Union[str, Path]]] = None) -> Dict[Path, Path]:
+        """Upgrade the outdated model files and register the side directory in AdaptiveGraph.
+
+        :param files: model files to upgrade, defaults to all outdated files of the models root
+        :return: mapping of the upgraded model files to their upgraded versions
+        :raises RuntimeError: if any of the files is not in the models root or the SAMM CLI failed for it; all other
+            files are upgraded anyway
+        """
+        file_paths = self.find_outdated_files() if files is None else [Path(file).resolve() for file in files]
+        upgraded: Dict[Path, Path] = {}
+        errors: List[str] = [
+            f"{file_path} is not in the models root {self.models_root}."
+            for file_path in file_paths
+            if not file_path.is_relative_to(self.models_root)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                file_path: executor.submit(self._upgrade_file, file_path)
+                for file_path in file_paths
+                if file_path.is_relative_to(self.models_root)
+            }
+
+            for file_path, future in futures.items():
+                try:
+                    upgraded[file_path] = future.result()
+                except RuntimeError as error:
+                    errors.append(str(error))
+
+        AdaptiveGraph.register_upgraded_root(self.models_root, self.upgraded_root, self.samm_version)
+
+        if errors:
+            raise RuntimeError(f"Could not upgrade {len(errors)} of {len(file_paths)} files:\n" + "\n".join(errors))
+
+        return upgraded
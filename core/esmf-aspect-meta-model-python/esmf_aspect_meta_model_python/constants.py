@@ -9,9 +9,14 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+import os
 
 SAMM_VERSION = "2.2.0"
 JAVA_CLI_VERSION = "2.13.1"
 
 SAMM_NAMESPACE_PREFIX = "samm"
 SAMM_ORG_IDENTIFIER = "org.eclipse.esmf.samm"
+
+CACHE_DIR_ENV_VARIABLE = "ESMF_ASPECT_MODEL_LOADER_CACHE_DIR"
+CACHE_DISABLED_ENV_VARIABLE = "ESMF_ASPECT_MODEL_LOADER_DISABLE_CACHE"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "esmf-aspect-model-loader")
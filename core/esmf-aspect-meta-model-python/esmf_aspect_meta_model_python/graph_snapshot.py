@@ -0,0 +1,244 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+"""Compact binary encoding of RDF graphs.
+
+A snapshot stores every distinct RDF term once in a term table and the triples as a flat array of term indexes.
+The layout is:
+
+    MAGIC | header length | JSON header | term table length | JSON term table | padding | triple index array
+
+The term table lists every term as a (kind, lexical form[, language or datatype]) record. It contains plain values
+only, so reading a snapshot from a shared cache folder cannot execute code. The triple index array is read directly
+from a memory-mapped file, so loading a snapshot avoids any Turtle parsing.
+"""
+
+import json
+import mmap
+import struct
+import sys
+
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python import utils
+
+MAGIC = b"ESMFGS02"
+
+_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 4
+
+_URI = 0
+_BNODE = 1
+_LITERAL = 2
+_LANG_LITERAL = 3
+_TYPED_LITERAL = 4
+
+
+def _encode_term(term: Node) -> Tuple:
+    """Convert an RDF term into a JSON-serializable record of its kind and strings."""
+    if isinstance(term, URIRef):
+        return _URI, str(term)
+    if isinstance(term, BNode):
+        return _BNODE, str(term)
+    if isinstance(term, Literal):
+        if term.language:
+            return _LANG_LITERAL, str(term), term.language
+        if term.datatype:
+            return _TYPED_LITERAL, str(term), str(term.datatype)
+        return _LITERAL, str(term)
+
+    raise TypeError(f"Unsupported RDF term type {type(term).__name__}")
+
+
+def _decode_term(encoded: Sequence[Any]) -> Node:
+    """Convert a record produced by _encode_term back into an RDF term."""
+    kind = encoded[0]
+    if kind == _URI:
+        return URIRef(encoded[1])
+    if kind == _BNODE:
+        return BNode(encoded[1])
+    if kind == _LANG_LITERAL:
+        return Literal(encoded[1], lang=encoded[2])
+    if kind == _TYPED_LITERAL:
+        return Literal(encoded[1], datatype=URIRef(encoded[2]))
+    if kind == _LITERAL:
+        return Literal(encoded[1])
+
+    raise ValueError(f"The graph snapshot contains a term of unknown kind {kind!r}.")
+
+
+def encode_triples(
+    triples: Iterable[Tuple[Node, Node, Node]],
+    namespaces: Iterable[Tuple[str, Any]] = (),
+    metadata: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """Encode triples and namespace bindings into the snapshot format.
+
+    Args:
+        triples (Iterable[Tuple[Node, Node, Node]]): Triples to encode.
+        namespaces (Iterable[Tuple[str, Any]]): Prefix bindings to store with the triples.
+        metadata (Optional[Dict[str, Any]]): Additional JSON-serializable information stored in the header.
+
+    Returns:
+        bytes: The encoded snapshot.
+    """
+    term_ids: Dict[Node, int] = {}
+    terms: List[Tuple] = []
+    indexes = array("I")
+
+    for triple in triples:
+        for term in triple:
+            term_id = term_ids.get(term)
+            if term_id is None:
+                term_id = term_ids[term] = len(terms)
+                terms.append(_encode_term(term))
+            indexes.append(term_id)
+
+    header = {
+        "byteorder": sys.byteorder,
+        "namespaces": [[prefix, str(namespace)] for prefix, namespace in namespaces],
+        "triple_count": len(indexes) // 3,
+        "metadata": metadata or {},
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    terms_bytes = json.dumps(terms, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    parts = [MAGIC, _LENGTH.pack(len(header_bytes)), header_bytes, _LENGTH.pack(len(terms_bytes)), terms_bytes]
+    offset = sum(len(part) for part in parts)
+    parts.append(b"\0" * (-offset % _ALIGNMENT))
+    parts.append(indexes.tobytes())
+
+    return b"".join(parts)
+
+
+def encode_graph(graph: Graph, metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """Encode all triples and namespace bindings of a graph into the snapshot format.
+
+    Args:
+        graph (Graph): The graph to encode.
+        metadata (Optional[Dict[str, Any]]): Additional JSON-serializable information stored in the header.
+
+    Returns:
+        bytes: The encoded snapshot.
+    """
+    return encode_triples(graph.triples((None, None, None)), graph.namespaces(), metadata)
+
+
+def _read_header(buffer: memoryview) -> Tuple[Dict[str, Any], int]:
+    """Read the snapshot header and return it with the offset of the term table."""
+    if bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise ValueError("The data is not a graph snapshot or has an unsupported format version.")
+
+    offset = len(MAGIC)
+    (header_length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    header_end = offset + header_length
+    header = json.loads(bytes(buffer[offset:header_end]).decode("utf-8"))
+
+    return header, header_end
+
+
+def _decode_into(buffer: memoryview, graph: Graph) -> Dict[str, Any]:
+    """Add all triples and namespace bindings of an encoded snapshot to the graph."""
+    header, offset = _read_header(buffer)
+
+    (terms_length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    terms_end = offset + terms_length
+    terms = [_decode_term(encoded) for encoded in json.loads(bytes(buffer[offset:terms_end]).decode("utf-8"))]
+    offset = terms_end + (-terms_end % _ALIGNMENT)
+
+    triple_count = header["triple_count"]
+    indexes_end = offset + triple_count * 3 * 4
+    with buffer[offset:indexes_end] as raw_indexes:
+        if header["byteorder"] == sys.byteorder:
+            with raw_indexes.cast("I") as indexes:
+                graph.addN(
+                    (terms[indexes[i]], terms[indexes[i + 1]], terms[indexes[i + 2]], graph)  # type: ignore[misc]
+                    for i in range(0, triple_count * 3, 3)
+                )
+        else:
+            swapped = array("I", raw_indexes.tobytes())
+            swapped.byteswap()
+            graph.addN(
+                (terms[swapped[i]], terms[swapped[i + 1]], terms[swapped[i + 2]], graph)  # type: ignore[misc]
+                for i in range(0, triple_count * 3, 3)
+            )
+
+    for prefix, namespace in header["namespaces"]:
+        graph.bind(prefix, namespace)
+
+    return header["metadata"]
+
+
+def decode_into(data: Union[bytes, bytearray, memoryview], graph: Graph) -> Dict[str, Any]:
+    """Add all triples and namespace bindings of an encoded snapshot to the graph.
+
+    Args:
+        data (Union[bytes, bytearray, memoryview]): The encoded snapshot.
+        graph (Graph): The graph to populate.
+
+    Returns:
+        Dict[str, Any]: The metadata stored in the snapshot header.
+    """
+    with memoryview(data) as buffer:
+        return _decode_into(buffer, graph)
+
+
+def write_snapshot(path: Union[str, Path], data: bytes) -> None:
+    """Write an encoded snapshot to a file atomically.
+
+    The data is written to a temporary file in the target directory which then replaces the target file, so that
+    concurrent readers never see a partially written snapshot.
+
+    Args:
+        path (Union[str, Path]): The target file path.
+        data (bytes): The encoded snapshot.
+    """
+    utils.write_file_atomically(path, data)
+
+
+def read_snapshot(path: Union[str, Path], graph: Graph) -> Dict[str, Any]:
+    """Load a snapshot file into the graph using a memory-mapped read.
+
+    Args:
+        path (Union[str, Path]): Path to the snapshot file.
+        graph (Graph): The graph to populate.
+
+    Returns:
+        Dict[str, Any]: The metadata stored in the snapshot header.
+    """
+    with open(path, "rb") as snapshot_file:
+        with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as buffer:
+                return _decode_into(buffer, graph)
+
+
+def read_snapshot_metadata(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read only the metadata of a snapshot file.
+
+    Args:
+        path (Union[str, Path]): Path to the snapshot file.
+
+    Returns:
+        Dict[str, Any]: The metadata stored in the snapshot header.
+    """
+    with open(path, "rb") as snapshot_file:
+        with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as buffer:
+                header, _ = _read_header(buffer)
+
+    return header["metadata"]
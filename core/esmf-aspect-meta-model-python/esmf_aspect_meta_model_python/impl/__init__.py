@@ -22,6 +22,7 @@ from .characteristics.default_single_entity import DefaultSingleEntity
 from .characteristics.default_state import DefaultState
 from .characteristics.default_structured_value import DefaultStructuredValue
 from .characteristics.default_trait import DefaultTrait
+from .characteristics.enumeration_values import EnumerationValues
 from .characteristics.quantifiable.default_duration import DefaultDuration
 from .characteristics.quantifiable.default_measurement import DefaultMeasurement
 from .characteristics.quantifiable.default_quantifiable import DefaultQuantifiable
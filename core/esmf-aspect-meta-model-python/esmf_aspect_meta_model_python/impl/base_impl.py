@@ -11,19 +11,37 @@
 
 import abc
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from esmf_aspect_meta_model_python.base.base import Base
 from esmf_aspect_meta_model_python.base.is_described import IsDescribed
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+from esmf_aspect_meta_model_python.loader.shared_namespace_store import SharedNamespaceStore
 
 
 class BaseImpl(Base, metaclass=abc.ABCMeta):
     """Base implementation class for meta model elements.
 
     Provides common attribute management, string representation, and validation logic for meta model elements.
+
+    The state of the elements is kept in slots instead of a per-instance __dict__. Each subclass declares the slots of
+    the attributes it adds, and the interfaces of the base package declare no slots, so that large models take less
+    memory. The weak reference slot allows to keep the elements in a WeakElementCache.
     """
 
+    __slots__ = (
+        "_meta_model_version",
+        "_urn",
+        "_name",
+        "_preferred_names",
+        "_descriptions",
+        "_see",
+        "_parent_elements",
+        "_shared",
+        "_frozen",
+        "__weakref__",
+    )
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = ("meta_model_version", "urn", "preferred_names", "descriptions")
     LIST_ATTR_NAMES: Tuple[str, ...] = ("see",)
     REQUIRED_ATTRS: Tuple[str, ...] = tuple()  # To be defined in subclasses if they have required attributes.
@@ -34,6 +52,10 @@ class BaseImpl(Base, metaclass=abc.ABCMeta):
         Args:
             meta_model_base_attributes (MetaModelBaseAttributes): The base attributes for the meta model element.
         """
+        # Set for the elements of shared namespaces, see SharedNamespaceStore.
+        self._shared = False
+        self._frozen = False
+
         self._meta_model_version = meta_model_base_attributes.meta_model_version
         self._urn = meta_model_base_attributes.urn
         self._name = meta_model_base_attributes.name
@@ -42,6 +64,28 @@ class BaseImpl(Base, metaclass=abc.ABCMeta):
         self._see = meta_model_base_attributes.see
         self._parent_elements: Optional[list[Base]] = None
 
+    def __hash__(self) -> int:
+        """Returns the hash of the URN, which is the hash of the proxies of the element too, see ElementProxy.
+
+        Returns:
+            int: The hash of the element.
+        """
+        if self._urn is None:
+            return object.__hash__(self)
+
+        return hash(self._urn)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute unless the element is frozen.
+
+        Raises:
+            AttributeError: If the element is a frozen element of a shared namespace.
+        """
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Cannot set attribute {name} on the frozen shared element {self._urn}.")
+
+        super().__setattr__(name, value)
+
     @property
     def parent_elements(self) -> Optional[list[Base]]:
         """Returns the parent elements of this element, if any.
@@ -69,9 +113,15 @@ class BaseImpl(Base, metaclass=abc.ABCMeta):
     def append_parent_element(self, element: Base) -> None:
         """Appends a parent element to the parent_elements list.
 
+        The parent links of a shared element from the elements of other namespaces are collected per model instead,
+        see SharedNamespaceStore.
+
         Args:
             element (Base): The parent element to append.
         """
+        if self._shared and SharedNamespaceStore.record_parent_link(self, element):
+            return
+
         if self._parent_elements:
             self._parent_elements.append(element)
             return
@@ -260,6 +310,17 @@ class BaseImpl(Base, metaclass=abc.ABCMeta):
             # retains stale entries that would silently disable later validations.
             validating_attrs.discard(key)
 
+    def _get_validated_list(self, attr_name: str) -> Iterable[Any]:
+        """Gets the items of a list attribute which are validated one by one.
+
+        Args:
+            attr_name (str): The attribute name.
+
+        Returns:
+            Iterable[Any]: The items of the list attribute.
+        """
+        return getattr(self, attr_name, [])
+
     def validate(self, validating_attrs: Optional[set[str]] = None) -> None:
         """Validates the element and its attributes recursively.
 
@@ -279,6 +340,6 @@ class BaseImpl(Base, metaclass=abc.ABCMeta):
             self._validate_attribute(attr_name, attr_value, validating_attrs)
 
         for attr_name in self.LIST_ATTR_NAMES:
-            attr_list = getattr(self, attr_name, [])
+            attr_list = self._get_validated_list(attr_name)
             for attr_value in attr_list:
                 self._validate_attribute(attr_name, attr_value, validating_attrs)
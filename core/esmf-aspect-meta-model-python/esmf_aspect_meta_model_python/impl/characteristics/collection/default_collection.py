@@ -24,6 +24,8 @@ class DefaultCollection(DefaultCharacteristic, Collection):
     Represents a collection with a specific element characteristic and optional data type.
     """
 
+    __slots__ = ("_element_characteristic",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.SCALAR_ATTR_NAMES + ("element_characteristic",)
 
     def __init__(
@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.characteristics.collection.default_colle
 
 class DefaultList(DefaultCollection, List):
     """Default List class."""
+
+    __slots__ = ()
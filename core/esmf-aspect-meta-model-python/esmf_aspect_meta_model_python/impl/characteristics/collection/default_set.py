@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.characteristics.collection.default_colle
 
 class DefaultSet(DefaultCollection, Set):
     """Default Set class."""
+
+    __slots__ = ()
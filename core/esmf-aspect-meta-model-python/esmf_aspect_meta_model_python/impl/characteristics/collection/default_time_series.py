@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.characteristics.collection.default_sorte
 
 class DefaultTimeSeries(DefaultSortedSet, TimeSeries):
     """Default Time Series class."""
+
+    __slots__ = ()
@@ -23,6 +23,8 @@ class DefaultCharacteristic(BaseImpl, Characteristic):
     Represents a characteristic that may have a data type and manages parent-child relationships for complex types.
     """
 
+    __slots__ = ("_data_type",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + ("data_type",)
     REQUIRED_ATTRS: Tuple[str, ...] = BaseImpl.REQUIRED_ATTRS + ("data_type",)
 
@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.characteristics.default_characteristic i
 
 class DefaultCode(DefaultCharacteristic, Code):
     """Default Code class."""
+
+    __slots__ = ()
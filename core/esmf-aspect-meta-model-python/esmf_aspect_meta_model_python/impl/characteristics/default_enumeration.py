@@ -9,20 +9,25 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import List, Tuple
+from typing import Any, Iterable, Sequence, Tuple
 
 from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
 from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
 from esmf_aspect_meta_model_python.impl.characteristics.default_characteristic import DefaultCharacteristic
+from esmf_aspect_meta_model_python.impl.characteristics.enumeration_values import EnumerationValues
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 
 
 class DefaultEnumeration(DefaultCharacteristic, Enumeration):
     """Default implementation of an enumeration characteristic.
 
-    Represents an enumeration with a set of possible values and an optional data type.
+    Represents an enumeration with a set of possible values and an optional data type. The values are kept as
+    EnumerationValues, which materializes them on first access and answers the lookups by key from a hash index.
+    Neither the lookups nor the validation materialize all values, only accessing the values list does.
     """
 
+    __slots__ = ("_values",)
+
     LIST_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.LIST_ATTR_NAMES + ("values",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultCharacteristic.REQUIRED_ATTRS + ("values",)
 
@@ -30,24 +35,64 @@ class DefaultEnumeration(DefaultCharacteristic, Enumeration):
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
         data_type: DataType,
-        values: List,
+        values: Sequence,
     ):
         """Initializes the DefaultEnumeration.
 
         Args:
             meta_model_base_attributes (MetaModelBaseAttributes): The base attributes for the meta model element.
             data_type (DataType): The data type for this enumeration.
-            values (List): The list of possible values for the enumeration.
+            values (Sequence): The possible values for the enumeration, a list or lazily materialized values.
         """
         super().__init__(meta_model_base_attributes, data_type)
 
-        self._values = values
+        self._values = values if isinstance(values, EnumerationValues) else EnumerationValues(values)
 
     @property
-    def values(self) -> List:
-        """Returns the list of possible values for the enumeration.
+    def values(self) -> EnumerationValues:
+        """Returns the possible values for the enumeration.
+
+        Returns:
+            EnumerationValues: The list of enumeration values, all of them materialized.
+        """
+        return self._values.materialize()
+
+    def _get_validated_list(self, attr_name: str) -> Iterable[Any]:
+        """Gets the items of a list attribute which are validated one by one.
+
+        The enumeration values are no model elements, so they are only checked for being present, without
+        materializing them.
+
+        Args:
+            attr_name (str): The attribute name.
+
+        Returns:
+            Iterable[Any]: The items of the list attribute, the values as a whole.
+        """
+        if attr_name == "values":
+            return [self._values]
+
+        return super()._get_validated_list(attr_name)
+
+    def contains(self, value: Any) -> bool:
+        """Checks if a value is one of the possible values of the enumeration.
+
+        Args:
+            value (Any): A scalar value or an entity value, with or without its name.
+
+        Returns:
+            bool: True if the value is a possible value.
+        """
+        return value in self._values
+
+    def get_value(self, key: Any, default: Any = None) -> Any:
+        """Gets a possible value of the enumeration by its key.
+
+        Args:
+            key (Any): The scalar value itself, or the name of an entity value.
+            default (Any): The value returned if no value has the key.
 
         Returns:
-            List: The list of enumeration values.
+            Any: The value with the key, or the default value.
         """
-        return self._values
+        return self._values.get(key, default)
@@ -9,7 +9,7 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import Any, List, Tuple
+from typing import Any, Sequence, Tuple
 
 from esmf_aspect_meta_model_python.base.characteristics.state import State
 from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
@@ -23,13 +23,15 @@ class DefaultState(DefaultEnumeration, State):
     Represents a state with a set of possible values, a default value, and an optional data type.
     """
 
+    __slots__ = ("_default_value",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultEnumeration.SCALAR_ATTR_NAMES + ("default_value",)
 
     def __init__(
         self,
         meta_model_base_attributes: MetaModelBaseAttributes,
         data_type: DataType,
-        values: List,
+        values: Sequence,
         default_value: Any,
     ):
         """Initializes the DefaultState.
@@ -37,7 +39,7 @@ class DefaultState(DefaultEnumeration, State):
         Args:
             meta_model_base_attributes (MetaModelBaseAttributes): The base attributes for the meta model element.
             data_type (DataType): The data type for this state.
-            values (List): The list of possible values for the state.
+            values (Sequence): The possible values for the state, a list or lazily materialized values.
             default_value (Any): The default value for the state.
         """
         super().__init__(meta_model_base_attributes, data_type, values)
@@ -23,6 +23,8 @@ class DefaultStructuredValue(DefaultCharacteristic, StructuredValue):
     Represents a structured value with a deconstruction rule and a list of elements.
     """
 
+    __slots__ = ("_deconstruction_rule", "_elements")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.SCALAR_ATTR_NAMES + ("deconstruction_rule",)
     LIST_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.LIST_ATTR_NAMES + ("elements",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultCharacteristic.REQUIRED_ATTRS + ("deconstruction_rule", "elements")
@@ -24,6 +24,8 @@ class DefaultTrait(DefaultCharacteristic, Trait):
     Represents a trait with a base characteristic and a list of constraints.
     """
 
+    __slots__ = ("_trait_urn", "_base_characteristic", "_constraints")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.SCALAR_ATTR_NAMES + ("base_characteristic",)
     LIST_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.LIST_ATTR_NAMES + ("constraints",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultCharacteristic.REQUIRED_ATTRS + ("base_characteristic", "constraints")
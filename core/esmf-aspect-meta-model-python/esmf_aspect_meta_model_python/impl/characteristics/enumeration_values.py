@@ -0,0 +1,285 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+# Placeholder of a value which has not been materialized yet.
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Get a hashable representation of a value, dicts and lists of entity values included."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+
+    return value
+
+
+class EnumerationValues(list):
+    """Possible values of an enumeration, materialized on first access and indexed for lookups.
+
+    The values are kept as entries, e.g. the RDF nodes of the values, which are converted into the values by the
+    materialize function when they are accessed for the first time. Once all values have been materialized, they are
+    stored in the list itself and the entries and the functions are dropped. Until then the list itself is empty, so
+    the values must be materialized before the list is passed to code working on plain lists, e.g. json.dumps.
+
+    Two indices are built on first use:
+        - the key index maps the key of each value to its position. The key of a scalar value is the value itself,
+          the key of an entity value is its name stored under name_key. The get_key function gets the key of an entry
+          without materializing it and returns None if the value is needed for that.
+        - the value index holds a hashable representation of all values, without the name of entity values, so that
+          a payload value can be checked without a linear scan.
+
+    The indices are dropped when the list is modified. They are built into local variables and stored at once, so
+    materialized values, e.g. those of frozen shared elements, can be looked up by several threads. Materializing the
+    values is not synchronized, values shared between threads must be materialized before.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Any],
+        materialize: Optional[Callable[[Any], Any]] = None,
+        get_key: Optional[Callable[[Any], Optional[Hashable]]] = None,
+        name_key: Optional[str] = None,
+    ):
+        """Initializes the values.
+
+        Args:
+            entries (Iterable[Any]): The entries of the values, or the values themselves without materialize function.
+            materialize (Optional[Callable[[Any], Any]]): Converts an entry into its value.
+            get_key (Optional[Callable[[Any], Optional[Hashable]]]): Gets the key of an entry without materializing it.
+            name_key (Optional[str]): The key of the name in entity values.
+        """
+        super().__init__()
+        self._name_key = name_key
+        self._entries: Optional[List[Any]] = list(entries)
+        self._materialize = materialize
+        self._get_key = get_key
+        self._missing = len(self._entries) if materialize else 0
+        # The values materialized so far, None once all values are stored in the list.
+        self._values: Optional[List[Any]] = [_MISSING] * self._missing if materialize else self._entries
+        self._key_index: Optional[Dict[Hashable, int]] = None
+        self._value_index: Optional[Dict[Hashable, int]] = None
+        self._unindexed: List[int] = []
+
+        if not self._missing:
+            self._release()
+
+    def _release(self) -> None:
+        """Store the values in the list and drop the entries and the functions, which are not needed anymore."""
+        list.extend(self, self._values)  # type: ignore[arg-type]
+        self._values = None
+        self._entries = None
+        self._materialize = None
+        self._get_key = None
+
+    def _reset_indices(self) -> None:
+        """Drop the indices, which are rebuilt on the next lookup."""
+        self._key_index = None
+        self._value_index = None
+        self._unindexed = []
+
+    def _get(self, position: int) -> Any:
+        """Get the value at a position, materializing it if needed."""
+        if self._values is None:
+            return list.__getitem__(self, position)
+
+        value = self._values[position]
+        if value is _MISSING:
+            value = self._materialize(self._entries[position])  # type: ignore
+            self._values[position] = value
+            self._missing -= 1
+            if not self._missing:
+                self._release()
+
+        return value
+
+    @property
+    def is_materialized(self) -> bool:
+        """True if all values have been materialized."""
+        return self._values is None
+
+    def materialize(self) -> "EnumerationValues":
+        """Materialize all values, so that the list holds them.
+
+        Returns:
+            EnumerationValues: The values themselves.
+        """
+        if self._values is not None:
+            for position in range(len(self._values)):
+                self._get(position)
+
+        return self
+
+    def _get_value_key(self, value: Any) -> Optional[Hashable]:
+        """Get the key of a materialized value, which is the name for entity values."""
+        if isinstance(value, dict):
+            return value.get(self._name_key) if self._name_key else None
+
+        return _freeze(value)
+
+    def _get_entry_key(self, position: int) -> Optional[Hashable]:
+        """Get the key of the value at a position, materializing the value only if its entry has no key."""
+        if self._values is not None and self._values[position] is _MISSING and self._get_key is not None:
+            key = self._get_key(self._entries[position])  # type: ignore
+            if key is not None:
+                return key
+
+        return self._get_value_key(self._get(position))
+
+    def _get_key_index(self) -> Dict[Hashable, int]:
+        """Get the index of the value keys, the first value wins for duplicated keys."""
+        if self._key_index is None:
+            key_index: Dict[Hashable, int] = {}
+            for position in range(len(self)):
+                key = self._get_entry_key(position)
+                try:
+                    if key is not None:
+                        key_index.setdefault(key, position)
+                except TypeError:
+                    pass
+            self._key_index = key_index
+
+        return self._key_index
+
+    def _get_fingerprint(self, value: Any) -> Hashable:
+        """Get the hashable representation of a value, without the name of an entity value."""
+        if isinstance(value, dict) and self._name_key in value:
+            value = {key: item for key, item in value.items() if key != self._name_key}
+
+        return _freeze(value)
+
+    def _get_value_index(self) -> Dict[Hashable, int]:
+        """Get the index of all values, materializing them."""
+        if self._value_index is None:
+            value_index: Dict[Hashable, int] = {}
+            unindexed: List[int] = []
+            for position, value in enumerate(self):
+                try:
+                    value_index.setdefault(self._get_fingerprint(value), position)
+                except TypeError:
+                    unindexed.append(position)
+            self._unindexed = unindexed
+            self._value_index = value_index
+
+        return self._value_index
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a value by its key.
+
+        Args:
+            key (Any): The scalar value itself, or the name of an entity value.
+            default (Any): The value returned if no value has the key.
+
+        Returns:
+            Any: The value with the key, or the default value.
+        """
+        try:
+            position = self._get_key_index().get(_freeze(key))
+        except TypeError:
+            return default
+
+        return default if position is None else self._get(position)
+
+    def __contains__(self, value: object) -> bool:
+        """Check if a value is one of the values.
+
+        Scalar values are looked up in the key index, entity values in the value index by all their attributes except
+        the name, so that a payload value without name is found too.
+        """
+        if isinstance(value, dict):
+            try:
+                if self._get_fingerprint(value) in self._get_value_index():
+                    return True
+            except TypeError:
+                return any(item == value for item in self)
+
+            return any(self._get(position) == value for position in self._unindexed)
+
+        try:
+            position = self._get_key_index().get(_freeze(value))
+        except TypeError:
+            return any(item == value for item in self)
+
+        return position is not None and self._get(position) == value
+
+    def __len__(self) -> int:
+        return list.__len__(self) if self._values is None else len(self._values)
+
+    def __getitem__(self, index):
+        if self._values is None or isinstance(index, slice):
+            return list.__getitem__(self.materialize(), index)
+
+        return self._get(range(len(self._values))[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return list.__iter__(self.materialize())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return list.__reversed__(self.materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EnumerationValues):
+            other = other.materialize()
+
+        return list.__eq__(self.materialize(), other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+
+        return result if result is NotImplemented else not result
+
+    def __add__(self, other: List[Any]) -> List[Any]:  # type: ignore[override]
+        return list.__add__(self.materialize(), other)
+
+    def __reduce__(self):
+        """Pickle the materialized values, without the entries and the functions."""
+        return self.__class__, (list(self), None, None, self._name_key)
+
+    def __repr__(self) -> str:
+        return list.__repr__(self.materialize())
+
+
+def _get_modifier(name: str) -> Callable:
+    """Wrap a list method modifying the list, so that the values are materialized before and the indices dropped."""
+    method = getattr(list, name)
+
+    def modifier(self: EnumerationValues, *args: Any, **kwargs: Any) -> Any:
+        self.materialize()
+        self._reset_indices()
+
+        return method(self, *args, **kwargs)
+
+    modifier.__name__ = name
+    modifier.__doc__ = method.__doc__
+
+    return modifier
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(EnumerationValues, _name, _get_modifier(_name))
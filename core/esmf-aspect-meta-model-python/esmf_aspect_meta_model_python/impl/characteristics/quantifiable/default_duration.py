@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.characteristics.quantifiable.default_qua
 
 class DefaultDuration(DefaultQuantifiable, Duration):
     """Default Duration class."""
+
+    __slots__ = ()
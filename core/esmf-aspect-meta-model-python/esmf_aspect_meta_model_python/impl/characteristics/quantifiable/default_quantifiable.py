@@ -24,6 +24,8 @@ class DefaultQuantifiable(DefaultCharacteristic, Quantifiable):
     Represents a quantifiable characteristic with an optional unit and data type.
     """
 
+    __slots__ = ("_unit",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultCharacteristic.SCALAR_ATTR_NAMES + ("unit",)
 
     def __init__(
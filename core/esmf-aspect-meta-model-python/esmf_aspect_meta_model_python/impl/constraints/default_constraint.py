@@ -17,3 +17,5 @@ from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
 
 class DefaultConstraint(BaseImpl, Constraint, metaclass=abc.ABCMeta):
     """Default Constraint class."""
+
+    __slots__ = ()
@@ -22,6 +22,8 @@ class DefaultEncodingConstraint(DefaultConstraint, EncodingConstraint):
     Represents an encoding constraint with a required value.
     """
 
+    __slots__ = ("_value",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + ("value",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultConstraint.REQUIRED_ATTRS + ("value",)
 
@@ -22,6 +22,8 @@ class DefaultFixedPointConstraint(DefaultConstraint, FixedPointConstraint):
     Represents a fixed point constraint with required scale and integer values.
     """
 
+    __slots__ = ("_scale", "_integer")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + (
         "scale",
         "integer",
@@ -22,6 +22,8 @@ class DefaultLanguageConstraint(DefaultConstraint, LanguageConstraint):
     Represents a language constraint with a required language code.
     """
 
+    __slots__ = ("_language_code",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + ("language_code",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultConstraint.REQUIRED_ATTRS + ("language_code",)
 
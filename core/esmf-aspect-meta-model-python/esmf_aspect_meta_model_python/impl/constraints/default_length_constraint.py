@@ -22,6 +22,8 @@ class DefaultLengthConstraint(DefaultConstraint, LengthConstraint):
     Represents a length constraint with optional minimum and maximum values.
     """
 
+    __slots__ = ("_min_value", "_max_value")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + ("min_value", "max_value")
 
     def __init__(
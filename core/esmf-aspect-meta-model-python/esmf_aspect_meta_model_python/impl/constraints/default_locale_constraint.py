@@ -22,6 +22,8 @@ class DefaultLocaleConstraint(DefaultConstraint, LocaleConstraint):
     Represents a locale constraint with a required locale code.
     """
 
+    __slots__ = ("_locale_code",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + ("locale_code",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultConstraint.REQUIRED_ATTRS + ("locale_code",)
 
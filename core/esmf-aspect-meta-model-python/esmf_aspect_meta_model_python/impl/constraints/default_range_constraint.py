@@ -23,6 +23,8 @@ class DefaultRangeConstraint(DefaultConstraint, RangeConstraint):
     Represents a range constraint with minimum and maximum values and optional bound definitions.
     """
 
+    __slots__ = ("_min_value", "_max_value", "_lower_bound_definition", "_upper_bound_definition")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + (
         "min_value",
         "max_value",
@@ -22,6 +22,8 @@ class DefaultRegularExpressionConstraint(DefaultConstraint, RegularExpressionCon
     Represents a regular expression constraint with a required value.
     """
 
+    __slots__ = ("_value",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = DefaultConstraint.SCALAR_ATTR_NAMES + ("value",)
     REQUIRED_ATTRS: Tuple[str, ...] = DefaultConstraint.REQUIRED_ATTRS + ("value",)
 
@@ -21,6 +21,8 @@ from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import Meta
 class DefaultAbstractEntity(DefaultComplexType, AbstractEntity):
     """Default Abstract Entity class."""
 
+    __slots__ = ("__extending_elements",)
+
     LIST_ATTR_NAMES: Tuple[str, ...] = DefaultComplexType.LIST_ATTR_NAMES + ("extending_elements",)
 
     def __init__(
@@ -23,6 +23,8 @@ class DefaultComplexType(BaseImpl, ComplexType):
     This class manages complex types, including their properties, inheritance, and registration of instances.
     """
 
+    __slots__ = ("__properties", "__extends_urn")
+
     _instances: Dict[str, ComplexType] = {}
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + ("extends",)
     LIST_ATTR_NAMES: Tuple[str, ...] = BaseImpl.LIST_ATTR_NAMES + ("properties",)
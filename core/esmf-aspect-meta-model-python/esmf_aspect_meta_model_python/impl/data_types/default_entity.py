@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.data_types.default_complex_type import D
 
 class DefaultEntity(DefaultComplexType, Entity):
     """Default Entity class."""
+
+    __slots__ = ()
@@ -15,6 +15,8 @@ from esmf_aspect_meta_model_python.base.data_types.scalar import Scalar
 class DefaultScalar(Scalar):
     """Default Scalar class."""
 
+    __slots__ = ("_urn", "_meta_model_version")
+
     def __init__(self, urn: str, meta_model_version: str):
         self._urn = urn
         self._meta_model_version = meta_model_version
@@ -25,6 +25,8 @@ class DefaultAspect(Aspect, BaseImpl):
     Represents an aspect with properties, operations, events, and a collection aspect flag.
     """
 
+    __slots__ = ("_properties", "_operations", "_events", "_is_collection_aspect")
+
     LIST_ATTR_NAMES: Tuple[str, ...] = BaseImpl.LIST_ATTR_NAMES + ("properties", "operations", "events")
 
     def __init__(
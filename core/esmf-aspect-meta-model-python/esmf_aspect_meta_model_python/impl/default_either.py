@@ -23,6 +23,8 @@ class DefaultEither(BaseImpl, Either):
     Represents a characteristic that can be either a left or right characteristic.
     """
 
+    __slots__ = ("_left", "_right")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + ("left", "right")
     REQUIRED_ATTRS: Tuple[str, ...] = BaseImpl.REQUIRED_ATTRS + ("left", "right")
 
@@ -23,6 +23,8 @@ class DefaultEvent(BaseImpl, Event):
     Represents an event with a list of parameters.
     """
 
+    __slots__ = ("_parameters",)
+
     LIST_ATTR_NAMES: Tuple[str, ...] = BaseImpl.LIST_ATTR_NAMES + ("parameters",)
     REQUIRED_ATTRS: Tuple[str, ...] = BaseImpl.REQUIRED_ATTRS + ("parameters",)
 
@@ -15,3 +15,5 @@ from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
 
 class DefaultNamespace(BaseImpl, Namespace):
     """Default namespace class."""
+
+    __slots__ = ()
@@ -23,6 +23,8 @@ class DefaultOperation(BaseImpl, Operation):
     Represents an operation with input and output properties.
     """
 
+    __slots__ = ("_input_properties", "_output_property")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + ("output_property",)
     LIST_ATTR_NAMES: Tuple[str, ...] = BaseImpl.LIST_ATTR_NAMES + ("input_properties",)
     REQUIRED_ATTRS: Tuple[str, ...] = BaseImpl.REQUIRED_ATTRS + ("input_properties",)
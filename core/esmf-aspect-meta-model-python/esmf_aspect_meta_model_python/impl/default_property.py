@@ -25,6 +25,8 @@ class DefaultAbstractProperty(BaseImpl, AbstractProperty):
         - it must only be used in Abstract Entities
     """
 
+    __slots__ = ("_example_value", "_is_abstract", "_extends", "_optional", "_not_in_payload", "_payload_name")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + (
         "example_value",
         "extends",
@@ -158,6 +160,8 @@ class DefaultProperty(DefaultAbstractProperty, Property):
     Represents a property with a characteristic, example value, and various flags.
     """
 
+    __slots__ = ("_characteristic",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + (
         "characteristic",
         "example_value",
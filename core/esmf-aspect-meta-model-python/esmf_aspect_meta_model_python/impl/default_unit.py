@@ -20,6 +20,8 @@ from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import Meta
 class DefaultUnit(BaseImpl, Unit):
     """Default Unit class."""
 
+    __slots__ = ("_symbol", "_code", "_reference_unit", "_conversion_factor", "_quantity_kinds")
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + (
         "symbol",
         "code",
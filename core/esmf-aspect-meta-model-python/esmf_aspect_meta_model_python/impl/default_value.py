@@ -19,6 +19,8 @@ from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import Meta
 class DefaultValue(BaseImpl, Value):
     """Default value class."""
 
+    __slots__ = ("_value",)
+
     SCALAR_ATTR_NAMES: Tuple[str, ...] = BaseImpl.SCALAR_ATTR_NAMES + ("value",)
 
     def __init__(
@@ -0,0 +1,150 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from rdflib import Graph, URIRef
+from rdflib.store import Store
+
+from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+
+
+class LayeredStore(Store):
+    """RDF store presenting several graphs as a single union without copying their triples.
+
+    The first layer is writable: all added triples and namespace bindings go there. All other layers are only read.
+    A triple contained in several layers is reported once, by the first layer containing it.
+    """
+
+    context_aware = False
+    formula_aware = False
+    graph_aware = False
+
+    def __init__(self, layers: Sequence[Graph]):
+        super().__init__()
+
+        if not layers:
+            raise ValueError("At least one graph layer is required.")
+
+        self._layers: List[Graph] = list(layers)
+
+    @property
+    def layers(self) -> List[Graph]:
+        """Graph layers, the writable one first."""
+        return self._layers
+
+    def add(self, triple, context, quoted=False):
+        """Add a triple to the writable layer."""
+        self._layers[0].add(triple)
+        super().add(triple, context, quoted)
+
+    def remove(self, triple, context=None):
+        """Remove the triples matching the pattern from the writable layer.
+
+        Triples of the read-only layers are never removed.
+        """
+        self._layers[0].remove(triple)
+        super().remove(triple, context)
+
+    def _get_shadowing_layers(
+        self, subject, layer_index: int, overlaps: Dict[Tuple[Any, int], List[Graph]]
+    ) -> List[Graph]:
+        """Get the layers before the given one which have statements about the subject.
+
+        Only these layers can contain a triple of the subject again. The result is memoized in the given dictionary for
+        the duration of one query, so each subject is looked up once per layer and not once per triple.
+        """
+        key = (subject, layer_index)
+        layers = overlaps.get(key)
+        if layers is None:
+            layers = overlaps[key] = [layer for layer in self._layers[:layer_index] if (subject, None, None) in layer]
+
+        return layers
+
+    def _iter_unique_matching(self, triple_pattern) -> Iterator[Tuple[Any, Any, Any]]:
+        """Yield the triples of all layers matching the pattern, each triple once.
+
+        The triples of the first layer are never shadowed. A triple of a lower layer is checked only against the
+        earlier layers having statements about its subject. The aspect layers have no statements about meta-model
+        elements, so the triples of the meta-model layer are reported without any check.
+        """
+        overlaps: Dict[Tuple[Any, int], List[Graph]] = {}
+        for layer_index, layer in enumerate(self._layers):
+            for triple in layer.triples(triple_pattern):
+                if layer_index == 0:
+                    yield triple
+                    continue
+
+                shadowing_layers = self._get_shadowing_layers(triple[0], layer_index, overlaps)
+                if not any(triple in shadowing for shadowing in shadowing_layers):
+                    yield triple
+
+    def triples(self, triple_pattern, context=None):
+        """Yield the triples of all layers matching the pattern, each triple once."""
+        for triple in self._iter_unique_matching(triple_pattern):
+            yield triple, iter(())
+
+    def __len__(self, context=None) -> int:
+        """Number of distinct triples in all layers."""
+        return sum(1 for _ in self._iter_unique_matching((None, None, None)))
+
+    def contexts(self, triple=None):
+        """The store has no named graphs."""
+        return iter(())
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a namespace to a prefix in the writable layer."""
+        self._layers[0].store.bind(prefix, namespace, override=override)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        """Get the prefix of a namespace from the first layer binding it."""
+        for layer in self._layers:
+            prefix = layer.store.prefix(namespace)
+            if prefix is not None:
+                return prefix
+
+        return None
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        """Get the namespace of a prefix from the first layer binding it."""
+        for layer in self._layers:
+            namespace = layer.store.namespace(prefix)
+            if namespace is not None:
+                return namespace
+
+        return None
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        """Yield the namespace bindings of all layers, the binding of the first layer wins for each prefix."""
+        prefixes = set()
+        for layer in self._layers:
+            for prefix, namespace in layer.store.namespaces():
+                if prefix not in prefixes:
+                    prefixes.add(prefix)
+                    yield prefix, namespace
+
+
+class LayeredGraph(AdaptiveGraph):
+    """Union view over several RDF graphs.
+
+    The graph layers the given graphs, e.g. an aspect model graph over the SAMM meta-model graph, and answers queries
+    from all of them without copying their triples. Parsed or added data goes to an own writable layer on top, so the
+    given graphs are never modified.
+    """
+
+    def __init__(self, *graphs: Graph, samm_version: str = SAMM_VERSION) -> None:
+        super().__init__(samm_version, store=LayeredStore([Graph(), *graphs]))
+
+    @property
+    def layers(self) -> List[Graph]:
+        """Graph layers, the own writable one first."""
+        return self.store.layers  # type: ignore[attr-defined]
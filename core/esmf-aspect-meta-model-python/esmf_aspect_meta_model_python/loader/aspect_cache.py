@@ -0,0 +1,267 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import hashlib
+import threading
+import time
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+from esmf_aspect_meta_model_python import utils
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
+
+
+class _CacheEntry(NamedTuple):
+    """Loaded Aspect with the fingerprint of the files and the namespace folders it was loaded from."""
+
+    fingerprint: str
+    files: Tuple[str, ...]
+    folders: Tuple[str, ...]
+    aspect: Aspect
+    triple_count: int
+    checked_at: float
+
+
+_CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class AspectCache:
+    """Process-level LRU cache of loaded Aspect models.
+
+    An entry is stored for the main file of the Aspect model together with a fingerprint of the content of the main
+    file and all dependency files resolved while loading it, and of the listings of the namespace folders scanned
+    for dependencies. A cached Aspect is returned only if none of these files has changed and no file has been added
+    to or removed from these folders. The fingerprint is built from the digests the resolver takes before parsing
+    each file, so a file changed during the load is detected on the next load. The content digest of a file is only
+    recomputed if its modification time or size has changed, so a repeated load of an unchanged model does not read
+    any file. It still gets the status of every file and lists every folder of the entry on each hit, which can be
+    noticeable for large models on slow file systems. A check interval can be set to check the files of an entry at
+    most once in that interval, at the cost of returning a stale Aspect for up to this time after a change.
+
+    Models loaded from the same main file with different resolver options are cached as separate entries.
+
+    The least recently used entries are evicted if the number of entries or the total number of the triples the
+    entries were loaded from, which approximates their memory footprint, exceeds its limit. The most recently loaded
+    model is always kept.
+
+    The cached Aspect objects are shared by all callers and must not be modified.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 128,
+        max_triples: Optional[int] = None,
+        check_interval: Optional[float] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries (Optional[int]): Maximal number of cached Aspect models, None for no limit.
+            max_triples (Optional[int]): Maximal total number of triples of the cached Aspect models, None for no limit.
+            check_interval (Optional[float]): Minimal number of seconds between two checks of the files of an entry,
+                None to check them on every hit.
+        """
+        self.max_entries = max_entries
+        self.max_triples = max_triples
+        self.check_interval = check_interval
+
+        self._entries: OrderedDict[_CacheKey, _CacheEntry] = OrderedDict()
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get_digest(self, file_path: str) -> str:
+        """Gets the content digest of a file, recomputed only if the file has changed.
+
+        Args:
+            file_path (str): The path to the file.
+
+        Returns:
+            str: The SHA-256 digest of the file content.
+        """
+        file_stat = Path(file_path).stat()
+        known_digest = self._digests.get(file_path)
+        if known_digest and known_digest[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return known_digest[2]
+
+        digest = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+        self._digests[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, digest)
+
+        return digest
+
+    @staticmethod
+    def _build_fingerprint(digests: Iterable[Tuple[str, str]], listings: Iterable[Tuple[str, str]]) -> str:
+        """Builds a fingerprint from the digests of files and the listings of folders, both sorted by path."""
+        fingerprint = hashlib.sha256()
+        for file_path, digest in digests:
+            fingerprint.update(f"{file_path}\0{digest}\n".encode("utf-8"))
+        for folder, listing in listings:
+            fingerprint.update(f"{folder}/\0{listing}\n".encode("utf-8"))
+
+        return fingerprint.hexdigest()
+
+    def get_fingerprint(self, files: Iterable[str], folders: Iterable[str] = ()) -> str:
+        """Gets the fingerprint of the content of model files and the listings of namespace folders.
+
+        Args:
+            files (Iterable[str]): The paths to the files.
+            folders (Iterable[str]): The paths to the folders.
+
+        Returns:
+            str: The fingerprint of the files and folders.
+
+        Raises:
+            OSError: If a file can not be read.
+        """
+        return self._build_fingerprint(
+            ((file_path, self._get_digest(file_path)) for file_path in files),
+            ((folder, utils.get_folder_listing(folder)) for folder in folders),
+        )
+
+    @staticmethod
+    def _get_key(file_path: str, resolver_options: Dict[str, Any]) -> _CacheKey:
+        """Gets the key of the entry of a main file loaded with the resolver options, sorted by their names."""
+        return file_path, tuple((name, repr(value)) for name, value in sorted(resolver_options.items()))
+
+    def _get_valid_entry(self, key: _CacheKey) -> Optional[_CacheEntry]:
+        """Gets the entry of a main file if none of its files has changed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+        if self.check_interval is not None and now - entry.checked_at < self.check_interval:
+            self._entries.move_to_end(key)
+            return entry
+
+        try:
+            fingerprint = self.get_fingerprint(entry.files, entry.folders)
+        except OSError:
+            fingerprint = None
+
+        if fingerprint != entry.fingerprint:
+            del self._entries[key]
+            return None
+
+        entry = entry._replace(checked_at=now)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        return entry
+
+    def load(self, file_path: Union[str, Path], **resolver_options: Any) -> Aspect:
+        """Gets the Aspect model of a file from the cache or loads it.
+
+        The status of every file and the listing of every folder the cached model was loaded from are checked on a
+        hit, unless they were checked within the check interval of the cache.
+
+        Args:
+            file_path (Union[str, Path]): The path to the main file of the Aspect model.
+            **resolver_options: Options of the local file resolver used to load the model, see SAMMGraph.parse. They
+                are part of the cache key, so a model loaded with other options is not returned.
+
+        Returns:
+            Aspect: The loaded Aspect model.
+        """
+        main_path = str(Path(file_path).resolve())
+        key = self._get_key(main_path, resolver_options)
+
+        with self._lock:
+            entry = self._get_valid_entry(key)
+            if entry is not None:
+                self.hits += 1
+                return entry.aspect
+
+            self.misses += 1
+
+        samm_graph = SAMMGraph().parse(main_path, **resolver_options)
+        aspect = samm_graph.load_aspect_model()
+
+        report = samm_graph.resolution_report
+        digests = {str(Path(path).resolve()): file_info.get("digest") for path, file_info in report.files.items()}
+        digests.setdefault(main_path, None)
+        listings = {str(Path(folder).resolve()): listing for folder, listing in report.folder_listings.items()}
+        files = tuple(sorted(digests))
+        folders = tuple(sorted(listings))
+
+        with self._lock:
+            try:
+                fingerprint = self._build_fingerprint(
+                    ((file_path, digests[file_path] or self._get_digest(file_path)) for file_path in files),
+                    ((folder, listings[folder]) for folder in folders),
+                )
+                is_unchanged = fingerprint == self.get_fingerprint(files, folders)
+            except OSError:
+                is_unchanged = False
+
+            if is_unchanged:
+                self._entries[key] = _CacheEntry(
+                    fingerprint, files, folders, aspect, report.total_triples, time.monotonic()
+                )
+                self._entries.move_to_end(key)
+                self._evict()
+
+        return aspect
+
+    def _evict(self):
+        """Removes the least recently used entries until the cache fits into its limits."""
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_triples is not None and self.triple_count > self.max_triples)
+        ):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def triple_count(self) -> int:
+        """Total number of triples the cached Aspect models were loaded from."""
+        return sum(entry.triple_count for entry in self._entries.values())
+
+    def invalidate(self, file_path: Union[str, Path]):
+        """Removes the Aspect models of a main file loaded with any resolver options from the cache.
+
+        Args:
+            file_path (Union[str, Path]): The path to the main file of the Aspect model.
+        """
+        main_path = str(Path(file_path).resolve())
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == main_path]:
+                del self._entries[key]
+
+    def clear(self):
+        """Removes all Aspect models from the cache and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters, number of entries and their total number of triples."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "triples": self.triple_count,
+            }
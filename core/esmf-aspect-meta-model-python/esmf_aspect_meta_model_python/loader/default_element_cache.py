@@ -11,12 +11,15 @@
 
 import logging
 
-from typing import Optional
+from typing import MutableMapping, Optional, TypeVar
 
 from rdflib import Node
 
 from esmf_aspect_meta_model_python.base.base import Base
 from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
+from esmf_aspect_meta_model_python.loader.element_proxy import is_resolved
+
+ElementType = TypeVar("ElementType", bound=Base)
 
 _logger = logging.getLogger(__name__)
 
@@ -71,8 +74,9 @@ class DeferredReference:
 
         current_value = getattr(parent_obj, self.attr_name, None)
 
-        # If the attribute is a list, append the target (avoiding duplicates).
-        if isinstance(current_value, list):
+        # If the attribute is a list, append the target (avoiding duplicates). An unresolved proxy is not
+        # instantiated by the type check, the proxy of the target is equal to the target.
+        if is_resolved(current_value) and isinstance(current_value, list):
             if target_obj not in current_value:
                 current_value.append(target_obj)
             return
@@ -132,19 +136,32 @@ class DefaultElementCache(CacheStrategy):
     """Central cache for model element instantiation and cycle handling.
 
     This class maintains a registry of all created Python objects (model elements),
-    ensures each RDF node is instantiated only once, and provides lookup by URN or name.
-    It also manages the active path for recursion/cycle detection and stores deferred
+    ensures each RDF node is instantiated only once, and provides lookup by URN, name or type.
+    The lookups are served by secondary indexes which are kept in sync with the registry
+    whenever an element is stored. It also manages the active path for recursion/cycle detection and stores deferred
     references for cyclic relationships, restoring them after all objects are created.
     """
 
     def __init__(self) -> None:
         """Initialize the instance cache, active path, and cycle reference store."""
-        self._instance_cache: dict[str, Base] = {}
+        self._instance_cache: MutableMapping[str, Base] = self._create_mapping()
+        # Secondary indexes map a lookup value to the cached elements by their cache key, so an element is
+        # unindexed in O(1) when its key is overwritten and the results keep the order of the registry.
+        self._name_index: dict[str, MutableMapping[str, Base]] = {}
+        self._urn_index: dict[str, MutableMapping[str, Base]] = {}
+        self._type_index: dict[type, MutableMapping[str, Base]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
         self._active_path: set = set()
         # Dict keys keep insertion order (guaranteed since Python 3.7) and deduplicate
         # via DeferredReference.__hash__/__eq__, giving deterministic restoration order.
         self._cycle_reference_store: dict[DeferredReference, None] = {}
 
+    def _create_mapping(self) -> MutableMapping[str, Base]:
+        """Create the mapping which stores the elements of the registry and of an index bucket."""
+        return {}
+
     def add_to_active_path(self, node):
         """Add a node to the active path (for cycle detection during recursion)."""
         self._active_path.add(node)
@@ -157,6 +174,10 @@ class DefaultElementCache(CacheStrategy):
         """Check if a node is currently in the active path (cycle detection)."""
         return node in self._active_path
 
+    def has_active_path(self) -> bool:
+        """Check if any element is being instantiated."""
+        return bool(self._active_path)
+
     def add_deferred_reference(self, deferred_ref: DeferredReference):
         """Add a DeferredReference to the cycle reference store for later restoration, only if not already present."""
         self._cycle_reference_store[deferred_ref] = None
@@ -175,29 +196,114 @@ class DefaultElementCache(CacheStrategy):
     def reset(self) -> None:
         """Clear the instance cache, active path, and cycle reference store."""
         self._instance_cache.clear()
+        self._name_index.clear()
+        self._urn_index.clear()
+        self._type_index.clear()
         self._active_path.clear()
         self._cycle_reference_store.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, key: str) -> Base | None:
+        """Get a model element by its key without counting the lookup."""
+        return self._instance_cache.get(key)
 
     def get(self, key: str) -> Base | None:
         """Get a model element from the cache by its key (URN)."""
-        return self._instance_cache.get(key)
+        model_element = self._lookup(key)
+        if model_element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
 
-    def get_by_name(self, name: str) -> list[Base]:
-        """Get all model elements from the cache with the given name or payload_name."""
-        result: list[Base] = []
+        return model_element
 
-        for instance in self._instance_cache.values():
-            if hasattr(instance, "payload_name") and instance.payload_name is not None:  # type: ignore
-                if instance.payload_name == name:  # type: ignore
-                    result.append(instance)
-            elif instance.name == name:
-                result.append(instance)
+    def items(self) -> list[tuple[str, Base]]:
+        """Get all cached model elements with their keys."""
+        return list(self._instance_cache.items())
+
+    @staticmethod
+    def _get_lookup_name(model_element: Base) -> Optional[str]:
+        """Get the name an element is found by, which is the payload name if it is set."""
+        payload_name = getattr(model_element, "payload_name", None)
+
+        return payload_name if payload_name is not None else model_element.name
+
+    def _index(self, key: str, model_element: Base) -> None:
+        """Add a cached element to the secondary indexes."""
+        for index, value in (
+            (self._name_index, self._get_lookup_name(model_element)),
+            (self._urn_index, model_element.urn),
+            (self._type_index, type(model_element)),
+        ):
+            bucket = index.get(value)  # type: ignore
+            if bucket is None:
+                bucket = index[value] = self._create_mapping()  # type: ignore
+            bucket[key] = model_element
+
+    def _unindex(self, key: str, model_element: Base) -> None:
+        """Remove a cached element from the secondary indexes."""
+        for index, value in (
+            (self._name_index, self._get_lookup_name(model_element)),
+            (self._urn_index, model_element.urn),
+            (self._type_index, type(model_element)),
+        ):
+            bucket = index.get(value)  # type: ignore
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[value]  # type: ignore
+
+    def _remove(self, key: str) -> None:
+        """Remove an element from the registry and the secondary indexes."""
+        model_element = self._instance_cache.pop(key, None)
+        if model_element is not None:
+            self._unindex(key, model_element)
+
+    def _store(self, key: str, model_element: Base) -> None:
+        """Store an element in the registry and keep the secondary indexes in sync."""
+        cached_element = self._instance_cache.get(key)
+        if cached_element is not None:
+            self._unindex(key, cached_element)
+
+        self._instance_cache[key] = model_element
+        self._index(key, model_element)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Hit, miss and eviction counters of the lookups by key and the number of cached entries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._instance_cache),
+        }
 
-        return result
+    def get_by_name(self, name: str) -> list[Base]:
+        """Get all model elements from the cache with the given name or payload_name."""
+        return list(self._name_index.get(name, {}).values())
 
     def get_by_urn(self, urn: str) -> Optional[Base]:
         """Get a model element from the cache by its URN."""
-        return next((x for x in self._instance_cache.values() if x.urn == urn), None)
+        return next(iter(self._urn_index.get(urn, {}).values()), None)
+
+    def find_by_type(self, element_type: type[ElementType]) -> list[ElementType]:
+        """Get all distinct model elements from the cache which are instances of the given type.
+
+        Args:
+            element_type (type): Model element class or interface, e.g. Property or DefaultProperty.
+
+        Returns:
+            list: Found elements grouped by their class, each in the order it was cached.
+        """
+        found_elements: dict[int, ElementType] = {}
+        for cached_type, bucket in self._type_index.items():
+            if issubclass(cached_type, element_type):
+                for model_element in bucket.values():
+                    found_elements.setdefault(id(model_element), model_element)  # type: ignore
+
+        return list(found_elements.values())
 
     def resolve_instance(self, model_element: Base) -> Base:
         """Ensure a model element is uniquely stored in the cache by its URN.
@@ -207,11 +313,11 @@ class DefaultElementCache(CacheStrategy):
         if model_element.urn is None:
             return model_element
 
-        resolved_instance = self.get(model_element.urn)
+        resolved_instance = self._lookup(model_element.urn)
         if resolved_instance is not None:
             return resolved_instance
 
-        self._instance_cache[model_element.urn] = model_element
+        self._store(model_element.urn, model_element)
 
         return model_element
 
@@ -220,11 +326,11 @@ class DefaultElementCache(CacheStrategy):
 
         If overwrite is False and an element with the same name exists, do nothing.
         """
-        cached_element = self.get(name)
+        cached_element = self._lookup(name)
         if not overwrite and cached_element:
             return
 
         if cached_element:
             _logger.warning("Element with the name '%s' already exists. Overwriting existing element.", name)
 
-        self._instance_cache[name] = model_element
+        self._store(name, model_element)
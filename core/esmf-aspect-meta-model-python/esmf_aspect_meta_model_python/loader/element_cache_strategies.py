@@ -0,0 +1,218 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+"""Element cache strategies which trade memory against the cost of instantiating model elements again.
+
+Each strategy can be passed to SAMMGraph(cache=...) and counts its hits, misses and evictions in its statistics.
+"""
+
+import threading
+import weakref
+
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
+from typing import Any, MutableMapping
+
+from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache, DeferredReference
+
+
+class LRUElementCache(DefaultElementCache):
+    """Element cache holding at most a given number of entries.
+
+    The least recently used entries are evicted first. The element just stored and the entries needed to finish the
+    running instantiation, i.e. the elements in the active path and the parents and targets of pending cyclic
+    references, are never evicted. An evicted element is instantiated again if it is requested later, so the elements
+    of a model loaded with a small cache are not guaranteed to be unique.
+    """
+
+    def __init__(self, max_elements: int = 10000) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_elements (int): Maximal number of cached entries.
+
+        Raises:
+            ValueError: If max_elements is not positive.
+        """
+        if max_elements < 1:
+            raise ValueError(f"The maximal number of cached elements must be positive, got {max_elements}.")
+
+        self.max_elements = max_elements
+        super().__init__()
+
+    def _create_mapping(self) -> MutableMapping[str, Base]:
+        """Create an ordered mapping, so the registry keeps the order of use."""
+        return OrderedDict()
+
+    def _lookup(self, key: str) -> Base | None:
+        """Get a model element by its key and mark it as recently used."""
+        model_element = super()._lookup(key)
+        if model_element is not None:
+            self._instance_cache.move_to_end(key)  # type: ignore
+
+        return model_element
+
+    def _store(self, key: str, model_element: Base) -> None:
+        """Store an element as the most recently used one and evict the entries over the limit."""
+        super()._store(key, model_element)
+        self._instance_cache.move_to_end(key)  # type: ignore
+        self._evict(key)
+
+    def _get_protected_keys(self) -> set[str]:
+        """Get the keys of the elements needed to finish the running instantiation."""
+        protected_keys = {str(node) for node in self._active_path}
+        for deferred_reference in self._cycle_reference_store:
+            protected_keys.add(deferred_reference.parent_obj_ref)
+            protected_keys.add(deferred_reference.target_urn)
+
+        return protected_keys
+
+    def _evict(self, stored_key: str) -> None:
+        """Remove the least recently used entries until the cache fits into its limit.
+
+        Args:
+            stored_key (str): The key of the element just stored, which is always kept.
+        """
+        excess = len(self._instance_cache) - self.max_elements
+        if excess <= 0:
+            return
+
+        protected_keys = self._get_protected_keys()
+        protected_keys.add(stored_key)
+        for key in list(islice((key for key in self._instance_cache if key not in protected_keys), excess)):
+            self._remove(key)
+            self.evictions += 1
+
+
+class WeakElementCache(DefaultElementCache):
+    """Element cache holding weak references to the model elements.
+
+    An element stays in the cache as long as it is referenced elsewhere, e.g. by a loaded Aspect, so the model
+    elements of an unused subgraph are garbage-collected. Every entry removed by the garbage collector is counted as
+    an eviction. The model element classes must support weak references.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._references: dict[str, weakref.ref] = {}
+        super().__init__()
+
+    def _create_mapping(self) -> MutableMapping[str, Base]:
+        """Create a mapping which does not keep its elements alive."""
+        return weakref.WeakValueDictionary()
+
+    def _on_collected(self, key: str, reference: weakref.ref) -> None:
+        """Count the eviction of an entry whose element has been garbage-collected."""
+        if self._references.get(key) is reference:
+            del self._references[key]
+            self.evictions += 1
+
+    def _store(self, key: str, model_element: Base) -> None:
+        """Store an element and watch for its garbage collection."""
+        super()._store(key, model_element)
+        self._references[key] = weakref.ref(model_element, partial(self._on_collected, key))
+
+    def _remove(self, key: str) -> None:
+        """Remove an element without counting it as evicted."""
+        super()._remove(key)
+        self._references.pop(key, None)
+
+    def reset(self) -> None:
+        """Clear the instance cache, active path, and cycle reference store."""
+        self._references.clear()
+        super().reset()
+
+
+class SharedElementCache(DefaultElementCache):
+    """Thread-safe element cache shared by several SAMMGraph instances.
+
+    Model elements instantiated for one model are reused for all other models which refer to the same URNs, e.g. the
+    elements of a shared namespace. The active path and the pending cyclic references belong to the instantiation
+    running in the current thread, so several models can be loaded concurrently with the same cache.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        super().__init__()
+
+    @property  # type: ignore[override]
+    def _active_path(self) -> set:
+        """Active path of the instantiation running in the current thread."""
+        if not hasattr(self._local, "active_path"):
+            self._local.active_path = set()
+
+        return self._local.active_path
+
+    @_active_path.setter
+    def _active_path(self, active_path: set) -> None:
+        self._local.active_path = active_path
+
+    @property  # type: ignore[override]
+    def _cycle_reference_store(self) -> dict[DeferredReference, None]:
+        """Pending cyclic references of the instantiation running in the current thread."""
+        if not hasattr(self._local, "cycle_reference_store"):
+            self._local.cycle_reference_store = {}
+
+        return self._local.cycle_reference_store
+
+    @_cycle_reference_store.setter
+    def _cycle_reference_store(self, cycle_reference_store: dict[DeferredReference, None]) -> None:
+        self._local.cycle_reference_store = cycle_reference_store
+
+    def reset(self) -> None:
+        """Clear the instance cache, active path, and cycle reference store."""
+        with self._lock:
+            super().reset()
+
+    def get(self, key: str) -> Base | None:
+        """Get a model element from the cache by its key (URN)."""
+        with self._lock:
+            return super().get(key)
+
+    def items(self) -> list[tuple[str, Base]]:
+        """Get all cached model elements with their keys."""
+        with self._lock:
+            return super().items()
+
+    def get_by_name(self, name: str) -> list[Base]:
+        """Get all model elements from the cache with the given name or payload_name."""
+        with self._lock:
+            return super().get_by_name(name)
+
+    def get_by_urn(self, urn: str) -> Base | None:
+        """Get a model element from the cache by its URN."""
+        with self._lock:
+            return super().get_by_urn(urn)
+
+    def find_by_type(self, element_type: Any) -> list:
+        """Get all distinct model elements from the cache which are instances of the given type."""
+        with self._lock:
+            return super().find_by_type(element_type)
+
+    def resolve_instance(self, model_element: Base) -> Base:
+        """Ensure a model element is uniquely stored in the cache by its URN."""
+        with self._lock:
+            return super().resolve_instance(model_element)
+
+    def add_element(self, name: str, model_element: Base, overwrite: bool = False) -> None:
+        """Add a model element to the cache by name."""
+        with self._lock:
+            super().add_element(name, model_element, overwrite)
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Hit, miss and eviction counters of the lookups by key and the number of cached entries."""
+        with self._lock:
+            return super().statistics
@@ -0,0 +1,179 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from rdflib.term import Node, URIRef
+
+from esmf_aspect_meta_model_python.base.base import Base
+
+if TYPE_CHECKING:
+    from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+
+
+def _get_element(element: Base) -> Base:
+    """Returns the given element, pickled in place of its proxy."""
+    return element
+
+
+class ElementProxy:
+    """Placeholder of a model element which is instantiated on the first access.
+
+    The lazy mode of ModelElementFactory creates a proxy instead of each child element. Any attribute access, including
+    isinstance checks, instantiates the element with the factory and forwards to it. The parent elements appended to an
+    unresolved proxy are appended to the element once it is instantiated, so creating the parent does not instantiate
+    its children.
+
+    Comparing and hashing a proxy does not instantiate the element: a proxy equals the element the factory has
+    instantiated for its node, if any, and is hashed by the URN of the node like the elements. Only the proxies of
+    blank nodes, whose elements have no URN, are instantiated to be hashed.
+    """
+
+    __slots__ = ("_factory", "_node", "_parent_links", "_parent_node", "_attr_name", "_element", "_pending_parents")
+
+    def __init__(
+        self,
+        factory: "ModelElementFactory",
+        node: Node,
+        parent_links: Optional[Dict[str, List[Base]]] = None,
+        parent_node: Optional[Node] = None,
+        attr_name: Optional[Node] = None,
+    ):
+        """Initializes the proxy.
+
+        Args:
+            factory (ModelElementFactory): The factory which instantiates the element.
+            node (Node): The node of the element in the aspect graph.
+            parent_links (Optional[Dict[str, List[Base]]]): The parent links to shared elements collected for the
+                model, see SharedNamespaceStore.collect_parent_links.
+            parent_node (Optional[Node]): The node of the parent which created the proxy, to defer a cyclic reference.
+            attr_name (Optional[Node]): The SAMM predicate pointing from the parent to the element.
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_parent_links", parent_links)
+        object.__setattr__(self, "_parent_node", parent_node)
+        object.__setattr__(self, "_attr_name", attr_name)
+        object.__setattr__(self, "_element", None)
+        object.__setattr__(self, "_pending_parents", [])
+
+    def _instantiate(self) -> Optional[Base]:
+        """Gets the element, instantiating it on the first call.
+
+        Returns:
+            Optional[Base]: The element, or None if the element is being instantiated, i.e. the proxy is accessed on a
+                cycle of references. The reference from the parent is restored once the element has been instantiated.
+        """
+        element = self._element
+        if element is None:
+            element = self._factory.resolve_proxy(self._node, self._parent_links, self._parent_node, self._attr_name)
+            if element is None:
+                return None
+
+            object.__setattr__(self, "_element", element)
+            for parent in self._pending_parents:
+                element.append_parent_element(parent)
+            object.__setattr__(self, "_pending_parents", None)
+            object.__setattr__(self, "_factory", None)
+
+        return element
+
+    def _resolve(self) -> Base:
+        """Gets the element, instantiating it on the first call.
+
+        Raises:
+            AttributeError: If the element is being instantiated, see _instantiate.
+        """
+        element = self._instantiate()
+        if element is None:
+            raise AttributeError(f"The model element {self._node} is being instantiated.")
+
+        return element
+
+    @property  # type: ignore[misc]
+    def __class__(self):
+        """Returns the class of the element, so that isinstance checks see the element.
+
+        While the element is being instantiated, the proxy is an instance of no model element class.
+        """
+        element = self._instantiate()
+
+        return ElementProxy if element is None else type(element)
+
+    def append_parent_element(self, element: Base) -> None:
+        """Appends a parent element, without instantiating the element.
+
+        Args:
+            element (Base): The parent element to append.
+        """
+        if self._element is None:
+            self._pending_parents.append(element)
+        else:
+            self._element.append_parent_element(element)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ElementProxy.__slots__:
+            raise AttributeError(name)
+
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def _peek(self) -> Optional[Base]:
+        """Gets the element if it has been instantiated, by this proxy or otherwise, without instantiating it."""
+        if self._element is None and self._factory is not None:
+            return self._factory.find_instance(self._node)
+
+        return self._element
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if type(other) is ElementProxy:
+            if self._element is None and self._factory is other._factory and self._node == other._node:
+                return True
+            other = other._peek()
+            if other is None:
+                return False
+
+        element = self._peek()
+
+        return element is not None and element == other
+
+    def __hash__(self) -> int:
+        if isinstance(self._node, URIRef):
+            return hash(str(self._node))
+
+        return hash(self._resolve())
+
+    def __str__(self) -> str:
+        return str(self._resolve())
+
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
+    def __reduce__(self):
+        """Pickles the element instead of the proxy."""
+        return _get_element, (self._resolve(),)
+
+
+def is_resolved(element: Any) -> bool:
+    """Checks if an element has been instantiated, which is true for all objects except unresolved proxies.
+
+    Args:
+        element (Any): A model element or a proxy.
+
+    Returns:
+        bool: False if the element is a proxy which has not been accessed yet.
+    """
+    return type(element) is not ElementProxy or object.__getattribute__(element, "_element") is not None
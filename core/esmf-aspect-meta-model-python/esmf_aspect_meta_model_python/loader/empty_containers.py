@@ -0,0 +1,53 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Any, Dict, List, NoReturn
+
+
+def _raise_immutable(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    """Refuses any change of a shared empty container."""
+    raise TypeError(f"The shared empty {type(self).__mro__[1].__name__} cannot be changed.")
+
+
+class _EmptyDict(dict):
+    """Empty dict which cannot be changed, shared by all model elements without e.g. descriptions.
+
+    It is still a dict, so that the elements keep their attribute types. Copies and pickled elements refer to the
+    same instance.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _raise_immutable
+    clear = pop = popitem = setdefault = update = _raise_immutable
+
+    def __reduce__(self) -> str:
+        return "EMPTY_DICT"
+
+
+class _EmptyList(list):
+    """Empty list which cannot be changed, shared by all model elements without e.g. see references.
+
+    It is still a list, so that the elements keep their attribute types. Copies and pickled elements refer to the
+    same instance.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _raise_immutable
+
+    def __reduce__(self) -> str:
+        return "EMPTY_LIST"
+
+
+EMPTY_DICT: Dict[Any, Any] = _EmptyDict()
+EMPTY_LIST: List[Any] = _EmptyList()
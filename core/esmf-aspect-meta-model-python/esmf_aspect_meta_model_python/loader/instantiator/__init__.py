@@ -8,3 +8,130 @@
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 #
 #   SPDX-License-Identifier: MPL-2.0
+
+"""Instantiators of the meta model elements.
+
+INSTANTIATOR_CLASSES maps the name of each meta model element type to the class of its instantiator, and
+get_instantiator_classes maps the URN of each type of a meta model version to it.
+"""
+
+from typing import Dict, Type
+
+from rdflib import RDFS
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
+from esmf_aspect_meta_model_python.vocabulary.constants import CharacteristicElements
+from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
+from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
+
+from .abstract_entity_instantiator import AbstractEntityInstantiator
+from .abstract_property_instantiator import AbstractPropertyInstantiator
+from .aspect_instantiator import AspectInstantiator
+from .characteristic_instantiator import CharacteristicInstantiator
+from .code_instantiator import CodeInstantiator
+from .collection_instantiator import CollectionInstantiator
+from .datatype_instantiator import DatatypeInstantiator
+from .duration_instantiator import DurationInstantiator
+from .either_instantiator import EitherInstantiator
+from .encoding_constraint_instantiator import EncodingConstraintInstantiator
+from .entity_instantiator import EntityInstantiator
+from .enumeration_instantiator import EnumerationInstantiator
+from .event_instantiator import EventInstantiator
+from .fixed_point_constraint_instantiator import FixedPointConstraintInstantiator
+from .language_constraint_instantiator import LanguageConstraintInstantiator
+from .length_constraint_instantiator import LengthConstraintInstantiator
+from .list_instantiator import ListInstantiator
+from .locale_constraint_instantiator import LocaleConstraintInstantiator
+from .measurement_instantiator import MeasurementInstantiator
+from .namespace_instantiator import NamespaceInstantiator
+from .operation_instantiator import OperationInstantiator
+from .property_instantiator import PropertyInstantiator
+from .quantifiable_instantiator import QuantifiableInstantiator
+from .quantity_kind_instantiator import QuantityKindInstantiator
+from .range_constraint_instantiator import RangeConstraintInstantiator
+from .regular_expression_constraint_instantiator import RegularExpressionConstraintInstantiator
+from .scalar_instantiator import ScalarInstantiator
+from .set_instantiator import SetInstantiator
+from .single_entity_instantiator import SingleEntityInstantiator
+from .sorted_set_instantiator import SortedSetInstantiator
+from .state_instantiator import StateInstantiator
+from .structured_value_instantiator import StructuredValueInstantiator
+from .time_series_instantiator import TimeSeriesInstantiator
+from .trait_instantiator import TraitInstantiator
+from .unit_instantiator import UnitInstantiator
+from .value_instantiator import ValueInstantiator
+
+INSTANTIATOR_CLASSES: Dict[str, Type[InstantiatorBase]] = {
+    "AbstractEntity": AbstractEntityInstantiator,
+    "AbstractProperty": AbstractPropertyInstantiator,
+    "Aspect": AspectInstantiator,
+    "Characteristic": CharacteristicInstantiator,
+    "Code": CodeInstantiator,
+    "Collection": CollectionInstantiator,
+    "Datatype": DatatypeInstantiator,
+    "Duration": DurationInstantiator,
+    "Either": EitherInstantiator,
+    "EncodingConstraint": EncodingConstraintInstantiator,
+    "Entity": EntityInstantiator,
+    "Enumeration": EnumerationInstantiator,
+    "Event": EventInstantiator,
+    "FixedPointConstraint": FixedPointConstraintInstantiator,
+    "LanguageConstraint": LanguageConstraintInstantiator,
+    "LengthConstraint": LengthConstraintInstantiator,
+    "List": ListInstantiator,
+    "LocaleConstraint": LocaleConstraintInstantiator,
+    "Measurement": MeasurementInstantiator,
+    "Namespace": NamespaceInstantiator,
+    "Operation": OperationInstantiator,
+    "Property": PropertyInstantiator,
+    "Quantifiable": QuantifiableInstantiator,
+    "QuantityKind": QuantityKindInstantiator,
+    "RangeConstraint": RangeConstraintInstantiator,
+    "RegularExpressionConstraint": RegularExpressionConstraintInstantiator,
+    "Scalar": ScalarInstantiator,
+    "Set": SetInstantiator,
+    "SingleEntity": SingleEntityInstantiator,
+    "SortedSet": SortedSetInstantiator,
+    "State": StateInstantiator,
+    "StructuredValue": StructuredValueInstantiator,
+    "TimeSeries": TimeSeriesInstantiator,
+    "Trait": TraitInstantiator,
+    "Unit": UnitInstantiator,
+    "Value": ValueInstantiator,
+}
+
+# Type of the nodes without an rdf:type statement which are no properties, e.g. the XSD data types.
+SCALAR_TYPE = "Scalar"
+
+_CHARACTERISTIC_TYPES = frozenset(
+    value for name, value in vars(CharacteristicElements).items() if not name.startswith("_") and isinstance(value, str)
+)
+
+
+def get_instantiator_classes(meta_model_version: str) -> Dict[Node, Type[InstantiatorBase]]:
+    """Get the built-in instantiator classes by the URN of their meta model element type.
+
+    The characteristic and constraint types are defined in the characteristic namespace, the other types in the meta
+    model namespace. The data types defined by the meta model, e.g. samm:curie, have the type rdfs:Datatype.
+
+    Args:
+        meta_model_version (str): The meta model version.
+
+    Returns:
+        Dict[Node, Type[InstantiatorBase]]: A new dispatch table, which can be modified by the caller.
+    """
+    samm = SAMM(meta_model_version)
+    sammc = SAMMC(meta_model_version)
+    instantiator_classes: Dict[Node, Type[InstantiatorBase]] = {}
+
+    for element_type, instantiator_class in INSTANTIATOR_CLASSES.items():
+        if element_type == "Datatype":
+            element_type_urn = RDFS.Datatype
+        elif element_type in _CHARACTERISTIC_TYPES:
+            element_type_urn = sammc.get_urn(element_type)
+        else:
+            element_type_urn = samm.get_urn(element_type)
+        instantiator_classes[element_type_urn] = instantiator_class
+
+    return instantiator_classes
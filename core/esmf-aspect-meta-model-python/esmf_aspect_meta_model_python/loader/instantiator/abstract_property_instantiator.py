@@ -53,7 +53,7 @@ class AbstractPropertyInstantiator(InstantiatorBase[AbstractProperty]):
             AbstractProperty: The instantiated abstract property.
         """
         meta_model_base_attributes = self._get_base_attributes(element_node)
-        example_value = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.example_value))
+        example_value = self._describe(element_node).value(self._samm.get_urn(SAMM.example_value))
 
         return DefaultAbstractProperty(
             meta_model_base_attributes,
@@ -70,23 +70,16 @@ class AbstractPropertyInstantiator(InstantiatorBase[AbstractProperty]):
         Returns:
             AbstractProperty: The instantiated abstract property.
         """
-        optional = (
-            self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.optional)) is not None
-        )
-        not_in_payload = (
-            self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.not_in_payload))
-            is not None
-        )
+        description = self._describe(element_node)
+        optional = description.value(self._samm.get_urn(SAMM.optional)) is not None
+        not_in_payload = description.value(self._samm.get_urn(SAMM.not_in_payload)) is not None
         payload_name = self._get_child(element_node, self._samm.get_urn(SAMM.payload_name))
 
-        property_node = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.property))
+        property_node = description.value(self._samm.get_urn(SAMM.property))
 
         meta_model_base_attributes = self._get_base_attributes(property_node)  # type: ignore
 
-        example_value = self._aspect_graph.value(
-            subject=property_node,
-            predicate=self._samm.get_urn(SAMM.example_value),
-        )
+        example_value = self._describe(property_node).value(self._samm.get_urn(SAMM.example_value))
 
         return DefaultAbstractProperty(
             meta_model_base_attributes,
@@ -41,10 +41,7 @@ class ComplexTypeInstantiator(InstantiatorBase[T], metaclass=abc.ABCMeta):
         Returns:
             Optional[str]: URN of the extended element, or None if not found.
         """
-        extended_element_node = self._aspect_graph.value(
-            subject=entity_subject,
-            predicate=self._samm.get_urn(SAMM.extends),
-        )
+        extended_element_node = self._describe(entity_subject).value(self._samm.get_urn(SAMM.extends))
 
         if extended_element_node is None:
             return None
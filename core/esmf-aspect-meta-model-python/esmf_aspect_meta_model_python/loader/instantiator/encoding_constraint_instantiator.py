@@ -22,7 +22,7 @@ class EncodingConstraintInstantiator(InstantiatorBase[EncodingConstraint]):
     def _create_instance(self, element_node: Node) -> EncodingConstraint:
         meta_model_base_attributes = self._get_base_attributes(element_node)
         value = RdfHelper.to_python(
-            self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.value)),
+            self._describe(element_node).value(self._samm.get_urn(SAMM.value)),
         )
         value = value.split("#")[1]
         return DefaultEncodingConstraint(meta_model_base_attributes, value)
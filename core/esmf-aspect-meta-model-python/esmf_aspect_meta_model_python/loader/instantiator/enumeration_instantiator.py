@@ -9,7 +9,7 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Union
 
 import rdflib  # type: ignore
 
@@ -17,6 +17,7 @@ from rdflib.term import Node
 
 from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
 from esmf_aspect_meta_model_python.impl.characteristics.default_enumeration import DefaultEnumeration
+from esmf_aspect_meta_model_python.impl.characteristics.enumeration_values import EnumerationValues
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
 from esmf_aspect_meta_model_python.loader.rdf_helper import RdfHelper
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
@@ -27,7 +28,8 @@ class EnumerationInstantiator(InstantiatorBase[Enumeration]):
     """Instantiates Enumeration elements from RDF nodes.
 
     This class provides logic to create Enumeration instances, extract values, and handle both simple and complex
-    enumeration types from RDF graphs.
+    enumeration types from RDF graphs. In lazy mode the values are materialized from their nodes when they are first
+    accessed, so loading a model with large code lists does not build a dictionary for every complex value.
     """
 
     def _create_instance(self, element_node: Node) -> Enumeration:
@@ -44,15 +46,58 @@ class EnumerationInstantiator(InstantiatorBase[Enumeration]):
             raise ValueError(f"Enumeration {element_node} must have a data type.")
 
         meta_model_base_attributes = self._get_base_attributes(element_node)
-        value_collection_node = self._aspect_graph.value(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.values),
-        )
+        value_collection_node = self._describe(element_node).value(self._sammc.get_urn(SAMMC.values))
         value_nodes = RdfHelper.get_rdf_list_values(value_collection_node, self._aspect_graph)
-        values = [self.__to_enum_node_value(value_node) for value_node in value_nodes if value_node]
+        values = self._create_values(value_nodes, self.__to_enum_node_value)
 
         return DefaultEnumeration(meta_model_base_attributes, data_type, values)
 
+    def _create_values(self, value_nodes: Iterable[Node], to_value: Callable[[Node], Any]) -> EnumerationValues:
+        """Creates the values of an enumeration.
+
+        In lazy mode the values are materialized from their nodes on first access. The functions materializing them
+        keep this instantiator, and so the factory and the aspect graph, alive until then, like the proxies of the
+        lazily loaded model do. Otherwise the values are materialized at once, so the loaded elements do not refer to
+        the factory and can be shared and frozen.
+
+        Args:
+            value_nodes (Iterable[Node]): The RDF nodes of the values.
+            to_value (Callable[[Node], Any]): Instantiates one value from its node.
+
+        Returns:
+            EnumerationValues: The values, materialized unless the factory is lazy.
+        """
+        values = EnumerationValues(
+            [value_node for value_node in value_nodes if value_node],
+            to_value,
+            self._get_value_key,
+            self._samm.get_urn(SAMM.name).toPython(),
+        )
+        if not self._model_element_factory.is_lazy():
+            values.materialize()
+
+        return values
+
+    def _get_value_key(self, value_node: Node) -> Optional[Hashable]:
+        """Gets the key of a value from its node without instantiating the value.
+
+        Args:
+            value_node (Node): The RDF node for the value.
+
+        Returns:
+            Optional[Hashable]: The simple value, the name of a complex value, or None if the name of the complex
+                value depends on its properties.
+        """
+        if isinstance(value_node, rdflib.Literal) or (
+            isinstance(value_node, rdflib.URIRef) and value_node.find("#") == -1
+        ):
+            return value_node.toPython()
+
+        if isinstance(value_node, rdflib.URIRef):
+            return str(value_node).split("#")[1]
+
+        return None
+
     def _get_node_name(self, value_node: Node, dict_value: Dict) -> str:
         """Resolves the name for a value node using preferredName, value, or the node fragment.
 
@@ -89,7 +134,7 @@ class EnumerationInstantiator(InstantiatorBase[Enumeration]):
         """
         dict_value: Dict = {}
 
-        for property_urn, property_value in self._aspect_graph.predicate_objects(value_node):
+        for property_urn, property_value in self._describe(value_node).predicate_objects():
             if property_urn != rdflib.RDF.type and isinstance(property_urn, str):
                 property_name = property_urn.split("#")[1]
                 actual_value: Optional[Any]
@@ -153,11 +198,8 @@ class EnumerationInstantiator(InstantiatorBase[Enumeration]):
         Returns:
             bool: True if the property is a collection, False otherwise.
         """
-        characteristic = self._aspect_graph.value(  # type: ignore
-            subject=property_subject,
-            predicate=self._samm.get_urn(SAMM.characteristic),
-        )
-        characteristic_type = self._aspect_graph.value(subject=characteristic, predicate=rdflib.RDF.type)
+        characteristic = self._describe(property_subject).value(self._samm.get_urn(SAMM.characteristic))  # type: ignore
+        characteristic_type = self._describe(characteristic).value(rdflib.RDF.type)
 
         return characteristic_type in self._sammc.collections_urns()
 
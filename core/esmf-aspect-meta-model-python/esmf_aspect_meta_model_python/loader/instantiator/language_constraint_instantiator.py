@@ -22,6 +22,6 @@ class LanguageConstraintInstantiator(InstantiatorBase[LanguageConstraint]):
     def _create_instance(self, element_node: Node) -> LanguageConstraint:
         meta_model_base_attributes = self._get_base_attributes(element_node)
         language_code = RdfHelper.to_python(
-            self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.language_code)),
+            self._describe(element_node).value(self._sammc.get_urn(SAMMC.language_code)),
         )
         return DefaultLanguageConstraint(meta_model_base_attributes, language_code)
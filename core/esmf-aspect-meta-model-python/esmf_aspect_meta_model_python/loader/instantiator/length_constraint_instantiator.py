@@ -21,11 +21,12 @@ from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
 class LengthConstraintInstantiator(InstantiatorBase[LengthConstraint]):
     def _create_instance(self, element_node: Node) -> LengthConstraint:
         meta_model_base_attributes = self._get_base_attributes(element_node)
+        description = self._describe(element_node)
 
-        min_value_node = self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.min_value))
+        min_value_node = description.value(self._sammc.get_urn(SAMMC.min_value))
         min_value = int(RdfHelper.to_python(min_value_node)) if min_value_node else None
 
-        max_value_node = self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.max_value))
+        max_value_node = description.value(self._sammc.get_urn(SAMMC.max_value))
         max_value = int(RdfHelper.to_python(max_value_node)) if max_value_node else None
 
         return DefaultLengthConstraint(meta_model_base_attributes, min_value, max_value)
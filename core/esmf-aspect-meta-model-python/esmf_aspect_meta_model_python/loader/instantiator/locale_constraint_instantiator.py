@@ -22,6 +22,6 @@ class LocaleConstraintInstantiator(InstantiatorBase[LocaleConstraint]):
     def _create_instance(self, element_node: Node) -> LocaleConstraint:
         meta_model_base_attributes = self._get_base_attributes(element_node)
         locale_code = RdfHelper.to_python(
-            self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.locale_code)),
+            self._describe(element_node).value(self._sammc.get_urn(SAMMC.locale_code)),
         )
         return DefaultLocaleConstraint(meta_model_base_attributes, locale_code)
@@ -34,9 +34,10 @@ class PropertyInstantiator(InstantiatorBase[Property]):
             return self._create_property_direct_reference(element_node)
 
         elif isinstance(element_node, BNode):
-            if self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.property)) is not None:
+            description = self._describe(element_node)
+            if description.value(self._samm.get_urn(SAMM.property)) is not None:
                 return self._create_property_blank_node(element_node)
-            elif self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.extends)) is not None:
+            elif description.value(self._samm.get_urn(SAMM.extends)) is not None:
                 return self._create_property_with_extends(element_node)
 
         raise ValueError("The syntax of the property is not allowed.")
@@ -50,7 +51,7 @@ class PropertyInstantiator(InstantiatorBase[Property]):
             Property: The created DefaultProperty instance.
         """
         characteristic = self._get_child(element_node, self._samm.get_urn(SAMM.characteristic), required=True)
-        example_value = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.example_value))
+        example_value = self._describe(element_node).value(self._samm.get_urn(SAMM.example_value))
 
         return DefaultProperty(
             meta_model_base_attributes=self._get_base_attributes(element_node),
@@ -70,24 +71,20 @@ class PropertyInstantiator(InstantiatorBase[Property]):
         Raises:
             ValueError: If the property node cannot be found.
         """
-        property_node = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.property))
+        description = self._describe(element_node)
+        property_node = description.value(self._samm.get_urn(SAMM.property))
         if not property_node:
             raise ValueError(f"Could not find property for the node {element_node}")
 
-        optional_node = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.optional))
-        not_in_payload_node = self._aspect_graph.value(
-            subject=element_node, predicate=self._samm.get_urn(SAMM.not_in_payload)
-        )
+        optional_node = description.value(self._samm.get_urn(SAMM.optional))
+        not_in_payload_node = description.value(self._samm.get_urn(SAMM.not_in_payload))
         payload_name = self._get_child(element_node, self._samm.get_urn(SAMM.payload_name))
         characteristic = self._get_child(
             property_node,  # type: ignore
             self._samm.get_urn(SAMM.characteristic),
             required=True,
         )
-        example_value = self._aspect_graph.value(
-            subject=property_node,
-            predicate=self._samm.get_urn(SAMM.example_value),
-        )
+        example_value = self._describe(property_node).value(self._samm.get_urn(SAMM.example_value))
 
         return DefaultProperty(
             meta_model_base_attributes=self._get_base_attributes(property_node),
@@ -113,7 +110,7 @@ class PropertyInstantiator(InstantiatorBase[Property]):
             self._samm.get_urn(SAMM.characteristic),
             required=True,
         )
-        example_value = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.example_value))
+        example_value = self._describe(element_node).value(self._samm.get_urn(SAMM.example_value))
 
         return DefaultProperty(
             meta_model_base_attributes=self._get_base_attributes(element_node),
@@ -40,9 +40,8 @@ class RangeConstraintInstantiator(InstantiatorBase[RangeConstraint]):
         )
 
     def __get_upper_bound_definition(self, element_node, max_value):
-        upper_bound_definition_value = self._aspect_graph.value(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.upper_bound_definition),
+        upper_bound_definition_value = self._describe(element_node).value(
+            self._sammc.get_urn(SAMMC.upper_bound_definition)
         )
         if upper_bound_definition_value is not None:
             return RangeConstraintInstantiator.__get_bound_definition(upper_bound_definition_value)
@@ -50,9 +49,8 @@ class RangeConstraintInstantiator(InstantiatorBase[RangeConstraint]):
         return BoundDefinition.OPEN if max_value is None else BoundDefinition.AT_MOST
 
     def __get_lower_bound_definition(self, element_node, min_value):
-        lower_bound_definition_value = self._aspect_graph.value(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.lower_bound_definition),
+        lower_bound_definition_value = self._describe(element_node).value(
+            self._sammc.get_urn(SAMMC.lower_bound_definition)
         )
         if lower_bound_definition_value is not None:
             return RangeConstraintInstantiator.__get_bound_definition(lower_bound_definition_value)
@@ -60,13 +58,13 @@ class RangeConstraintInstantiator(InstantiatorBase[RangeConstraint]):
         return BoundDefinition.OPEN if min_value is None else BoundDefinition.AT_LEAST
 
     def __get_max_value(self, element_node):
-        max_value = self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.max_value))
+        max_value = self._describe(element_node).value(self._sammc.get_urn(SAMMC.max_value))
         if max_value is not None:
             max_value = max_value.toPython()
         return max_value
 
     def __get_min_value(self, element_node):
-        min_value = self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.min_value))
+        min_value = self._describe(element_node).value(self._sammc.get_urn(SAMMC.min_value))
         if min_value is not None:
             min_value = min_value.toPython()
         return min_value
@@ -24,6 +24,6 @@ class RegularExpressionConstraintInstantiator(InstantiatorBase[RegularExpression
     def _create_instance(self, element_node: Node) -> RegularExpressionConstraint:
         meta_model_base_attributes = self._get_base_attributes(element_node)
         value = RdfHelper.to_python(
-            self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.value)),
+            self._describe(element_node).value(self._samm.get_urn(SAMM.value)),
         )
         return DefaultRegularExpressionConstraint(meta_model_base_attributes, value)
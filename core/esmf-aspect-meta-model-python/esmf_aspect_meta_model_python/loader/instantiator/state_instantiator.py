@@ -27,7 +27,8 @@ class StateInstantiator(EnumerationInstantiator):
     """Instantiates State elements from RDF nodes.
 
     This class provides logic to create State instances, extract values, and handle both simple and complex
-    state types from RDF graphs.
+    state types from RDF graphs. Like the values of an enumeration, the values are materialized on first access in
+    lazy mode.
     """
 
     def _create_instance(self, element_node: Node) -> State:
@@ -44,16 +45,15 @@ class StateInstantiator(EnumerationInstantiator):
             raise ValueError(f"State {element_node} must have a data type.")
 
         meta_model_base_attributes = self._get_base_attributes(element_node)
-        value_collection_node = self._aspect_graph.value(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.values),
-        )
+        description = self._describe(element_node)
+        value_collection_node = description.value(self._sammc.get_urn(SAMMC.values))
         value_nodes = RdfHelper.get_rdf_list_values(value_collection_node, self._aspect_graph)
-        values = [self.__to_state_node_value(value_node) for value_node in value_nodes if value_node]
-        defaultValue = self._aspect_graph.value(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.default_value),
-        )
+        for value_node in value_nodes:
+            if value_node and not isinstance(value_node, (rdflib.Literal, rdflib.URIRef)):
+                # The values may be materialized on first access, so illegal node types are reported here.
+                self.__to_state_node_value(value_node)
+        values = self._create_values(value_nodes, self.__to_state_node_value)
+        defaultValue = description.value(self._sammc.get_urn(SAMMC.default_value))
         default = self.__to_state_node_value(defaultValue)
 
         return DefaultState(meta_model_base_attributes, data_type, values, default)
@@ -79,7 +79,7 @@ class StateInstantiator(EnumerationInstantiator):
         elif isinstance(value_node, rdflib.URIRef):
             # value represents a complex data type
             value = {}
-            value_node_properties = self._aspect_graph.predicate_objects(value_node)
+            value_node_properties = self._describe(value_node).predicate_objects()
             for property_urn, property_value in value_node_properties:
                 if property_urn != rdflib.RDF.type and isinstance(property_urn, str):
                     property_name = property_urn.split("#")[1]
@@ -42,13 +42,9 @@ class StructuredValueInstantiator(InstantiatorBase[StructuredValue]):
             raise ValueError(f"StructuredValue {element_node} must have a data type.")
 
         meta_model_base_attributes = self._get_base_attributes(element_node)
-        deconstruction_rule = RdfHelper.to_python(
-            self._aspect_graph.value(
-                subject=element_node,
-                predicate=self._sammc.get_urn(SAMMC.deconstruction_rule),
-            )
-        )
-        element_nodes = self._aspect_graph.value(subject=element_node, predicate=self._sammc.get_urn(SAMMC.elements))
+        description = self._describe(element_node)
+        deconstruction_rule = RdfHelper.to_python(description.value(self._sammc.get_urn(SAMMC.deconstruction_rule)))
+        element_nodes = description.value(self._sammc.get_urn(SAMMC.elements))
         element_node_list = RdfHelper.get_rdf_list_values(element_nodes, self._aspect_graph)
         elements = [self.__to_element_node_value(element_node) for element_node in element_node_list if element_node]
 
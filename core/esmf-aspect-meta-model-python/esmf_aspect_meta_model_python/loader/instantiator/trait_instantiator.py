@@ -40,10 +40,7 @@ class TraitInstantiator(InstantiatorBase[Trait]):
             ValueError: If the trait has no constraints or an element is not a Constraint.
         """
         meta_model_base_attributes = self._get_base_attributes(element_node)
-        constraint_subjects = self._aspect_graph.objects(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.constraint),
-        )
+        constraint_subjects = self._describe(element_node).objects(self._sammc.get_urn(SAMMC.constraint))
 
         constraints: List[Constraint] = []
         for constraint_subject in constraint_subjects:
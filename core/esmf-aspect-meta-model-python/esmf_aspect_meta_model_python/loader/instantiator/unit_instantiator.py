@@ -38,10 +38,7 @@ class UnitInstantiator(InstantiatorBase[Unit]):
         )
 
         quantity_kinds: List[QuantityKind] = []
-        quantity_kind_nodes = self._aspect_graph.objects(
-            subject=element_node,
-            predicate=self._samm.get_urn(SAMM.quantity_kind),
-        )
+        quantity_kind_nodes = self._describe(element_node).objects(self._samm.get_urn(SAMM.quantity_kind))
 
         quantity_kinds.extend(
             self.instantiate_quantity_kind(quantity_kind_node) for quantity_kind_node in quantity_kind_nodes
@@ -61,7 +58,7 @@ class UnitInstantiator(InstantiatorBase[Unit]):
         return DefaultQuantityKind(meta_model_base_attributes)
 
     def __get_unit_attribute_as_string(self, unit_subject: Node, attribute: URIRef) -> str | None:
-        attribute_value = self._aspect_graph.value(unit_subject, predicate=attribute)
+        attribute_value = self._describe(unit_subject).value(attribute)
         attribute_as_string = None
 
         if attribute_value is not None:
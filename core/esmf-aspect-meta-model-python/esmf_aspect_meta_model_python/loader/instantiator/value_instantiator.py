@@ -22,6 +22,6 @@ from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
 class ValueInstantiator(InstantiatorBase[Value]):
     def _create_instance(self, element_node: Node) -> Value:
         meta_model_base_attributes = self._get_base_attributes(element_node)
-        value: Any = self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.value))
+        value: Any = self._describe(element_node).value(self._samm.get_urn(SAMM.value))
 
         return DefaultValue(meta_model_base_attributes, value)
@@ -20,6 +20,7 @@ from rdflib.term import Node
 from esmf_aspect_meta_model_python.base.data_types.data_type import DataType
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
 from esmf_aspect_meta_model_python.loader.rdf_helper import RdfHelper
+from esmf_aspect_meta_model_python.loader.subject_description import SubjectDescription
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
 from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
 
@@ -52,6 +53,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         self._unit = model_element_factory.get_unit()
         self._meta_model_version = model_element_factory.get_meta_model_version()
         self._aspect_graph: rdflib.Graph = model_element_factory.get_aspect_graph()
+        self._reverse_edge_index = model_element_factory.get_reverse_edge_index()
 
         # Storage of all generated instances to prevent multiple instantiation of the same element.
         self._existing_instances: Dict[str, T] = {}
@@ -74,6 +76,10 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
 
         return instance
 
+    def clear_existing_instances(self) -> None:
+        """Drops the references to the instances generated so far, which are kept in the element cache."""
+        self._existing_instances.clear()
+
     @abc.abstractmethod
     def _create_instance(self, element_node: Node) -> T:
         """Creates an instance of the given element and returns it.
@@ -89,6 +95,17 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def _describe(self, element_subject: Optional[Node]) -> SubjectDescription:
+        """Gets all (predicate, object) pairs of an element, read once per element by the factory.
+
+        Args:
+            element_subject (Optional[Node]): Node in the aspect graph representing the element.
+
+        Returns:
+            SubjectDescription: The description of the element.
+        """
+        return self._model_element_factory.describe(element_subject)
+
     def _get_base_attributes(self, element_subject: Node) -> MetaModelBaseAttributes:
         """Creates an object with the base information of an element.
 
@@ -104,12 +121,15 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
             self._aspect_graph,
             self._samm,
             self._meta_model_version,
+            self._describe(element_subject),
+            self._reverse_edge_index,
         )
 
     def _get_child(self, parent_subject: Node, child_predicate, required=False):
         """Searches for a child node of a parent node and returns an instance of it.
 
-        The child can either be a Literal (e.g., a String) or a sub-element (e.g., Characteristic).
+        The child can either be a Literal (e.g., a String) or a sub-element (e.g., Characteristic). A sub-element is a
+        proxy if the factory is in lazy mode.
 
         Args:
             parent_subject (Node): Node in the aspect graph of the parent.
@@ -122,7 +142,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         Raises:
             ValueError: If the child is required but does not exist.
         """
-        child_subject = self._aspect_graph.value(subject=parent_subject, predicate=child_predicate)
+        child_subject = self._describe(parent_subject).value(child_predicate)
 
         if child_subject is None and required:
             raise ValueError(f"Child {child_predicate} is required for element {RdfHelper.to_python(parent_subject)}")
@@ -131,7 +151,7 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         elif isinstance(child_subject, rdflib.Literal):
             return RdfHelper.to_python(child_subject)
         else:
-            return self._model_element_factory.create_element(child_subject, parent_subject, attr_name=child_predicate)
+            return self._model_element_factory.create_child(child_subject, parent_subject, attr_name=child_predicate)
 
     def _get_list_children(self, element_subject: Node, list_predicate: rdflib.URIRef) -> list:
         """Extracts all children of an RDF list from the given element and returns a list of the instances.
@@ -146,13 +166,11 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
             list: A list of the instantiated elements.
         """
         children = []
-        list_node = self._aspect_graph.value(subject=element_subject, predicate=list_predicate)
+        list_node = self._describe(element_subject).value(list_predicate)
         children_nodes = RdfHelper.get_rdf_list_values(list_node, self._aspect_graph)
 
         for child_node in children_nodes:
-            child: Any = self._model_element_factory.create_element(
-                child_node, element_subject, attr_name=list_predicate
-            )
+            child: Any = self._model_element_factory.create_child(child_node, element_subject, attr_name=list_predicate)
             if child:
                 children.append(child)
 
@@ -169,30 +187,20 @@ class InstantiatorBase(Generic[T], metaclass=abc.ABCMeta):
         Returns:
             Optional[DataType]: Data type object or None.
         """
-        element_characteristic_node = self._aspect_graph.value(
-            subject=element_node,
-            predicate=self._sammc.get_urn(SAMMC.element_characteristic),
-        )
+        description = self._describe(element_node)
+        element_characteristic_node = description.value(self._sammc.get_urn(SAMMC.element_characteristic))
 
         if element_characteristic_node:
             # some characteristics (Collection, List, TimeSeries, etc.) may have
             # an attribute "element_characteristic". If it is given, then take
             # the data type of the element_characteristic.
-            data_type_node = self._aspect_graph.value(
-                subject=element_characteristic_node,
-                predicate=self._samm.get_urn(SAMM.data_type),
-            )
+            element_characteristic_description = self._describe(element_characteristic_node)
+            data_type_node = element_characteristic_description.value(self._samm.get_urn(SAMM.data_type))
 
             if not data_type_node:
-                data_type_node = self._aspect_graph.value(
-                    subject=element_characteristic_node,
-                    predicate=rdflib.RDF.type,
-                )
+                data_type_node = element_characteristic_description.value(rdflib.RDF.type)
         else:
-            data_type_node = self._aspect_graph.value(
-                subject=element_node,
-                predicate=self._samm.get_urn(SAMM.data_type),
-            )
+            data_type_node = description.value(self._samm.get_urn(SAMM.data_type))
 
         data_type_element: Optional[DataType] = None
         if data_type_node:
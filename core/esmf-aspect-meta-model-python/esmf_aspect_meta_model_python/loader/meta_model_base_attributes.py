@@ -17,13 +17,18 @@ import rdflib  # type: ignore
 from rdflib.term import Node
 
 from ..vocabulary.samm import SAMM
+from .empty_containers import EMPTY_DICT, EMPTY_LIST
 from .rdf_helper import RdfHelper
+from .reverse_edge_index import ReverseEdgeIndex
+from .subject_description import SubjectDescription
 
 
 class MetaModelBaseAttributes:
     """A Wrapper object that holds all information of a Base object: samm_version, urn, name, preferred_names,
     descriptions, see"""
 
+    __slots__ = ("meta_model_version", "urn", "name", "preferred_names", "descriptions", "see")
+
     def __init__(
         self,
         meta_model_version: str,
@@ -46,6 +51,8 @@ class MetaModelBaseAttributes:
         aspect_graph: rdflib.Graph,
         samm: SAMM,
         meta_model_version: str,
+        description: Optional[SubjectDescription] = None,
+        reverse_edge_index: Optional[ReverseEdgeIndex] = None,
     ) -> "MetaModelBaseAttributes":
         """
         Extracts all the given base information of an element (samm_version, urn, name,
@@ -55,35 +62,44 @@ class MetaModelBaseAttributes:
             aspect_graph: graph that represents the whole aspect
             samm: namespace including samm keywords used for aspect graph navigation
             meta_model_version: version of the samm used in URNs
+            description: all (predicate, object) pairs of the element, read from the aspect graph if not given
+            reverse_edge_index: index of the incoming edges of the aspect graph, used to name blank nodes after
+                their parent; the aspect graph is searched if not given
 
         Returns:
             A wrapper object with all the element attributes included
         """
+        if description is None:
+            description = SubjectDescription.from_graph(meta_model_element, aspect_graph)
+
         preferred_names = MetaModelBaseAttributes.__get_language_strings(
-            meta_model_element,
-            aspect_graph,
+            description,
             samm.get_urn(SAMM.preferred_name),
         )
         descriptions = MetaModelBaseAttributes.__get_language_strings(
-            meta_model_element,
-            aspect_graph,
+            description,
             samm.get_urn(SAMM.description),
         )
         see = MetaModelBaseAttributes.__get_attribute_value_list(
-            meta_model_element,
-            aspect_graph,
+            description,
             samm.get_urn(SAMM.see),
         )
         urn: Optional[str] = None
         name: str = ""
 
         if meta_model_version == "1.0.0":
-            name_result = aspect_graph.value(subject=meta_model_element, predicate=samm.get_urn(SAMM.name))
+            name_result = description.value(samm.get_urn(SAMM.name))
             if name_result is not None:
                 name = RdfHelper.to_python(name_result)
 
         elif isinstance(meta_model_element, rdflib.BNode):
-            name = MetaModelBaseAttributes.__create_default_name(meta_model_element, aspect_graph, samm)
+            name = MetaModelBaseAttributes.__create_default_name(
+                meta_model_element,
+                description,
+                aspect_graph,
+                samm,
+                reverse_edge_index,
+            )
 
             return MetaModelBaseAttributes(meta_model_version, None, name, preferred_names, descriptions, see)
 
@@ -97,16 +113,26 @@ class MetaModelBaseAttributes:
         raise TypeError("Unexpected type. Get MetaModelBaseAttributes.from_meta_model_element can't handle this type.")
 
     @staticmethod
-    def __create_default_name(meta_model_element: rdflib.BNode, aspect_graph, samm) -> str:
+    def __create_default_name(
+        meta_model_element: rdflib.BNode,
+        description,
+        aspect_graph,
+        samm,
+        reverse_edge_index: Optional[ReverseEdgeIndex] = None,
+    ) -> str:
         """Model elements that are defined as a blank node do not have a URI
         to identify. Therefore it is not possible to extract a name. This method
         generates an alternative name depending on the parent or the extended element.
+        The parent is looked up in the reverse edge index if there is one.
         """
-        extends_element = aspect_graph.value(subject=meta_model_element, predicate=samm.get_urn(SAMM.extends))
+        extends_element = description.value(samm.get_urn(SAMM.extends))
         if isinstance(extends_element, rdflib.URIRef):
             return f"extending_{samm.get_name(extends_element)}"
 
-        parent_name, predicate_name, parent_index = RdfHelper.find_named_parent(meta_model_element, aspect_graph)
+        if reverse_edge_index is not None:
+            parent_name, predicate_name, parent_index = reverse_edge_index.find_named_parent(meta_model_element)
+        else:
+            parent_name, predicate_name, parent_index = RdfHelper.find_named_parent(meta_model_element, aspect_graph)
 
         result = f"{SAMM.get_name(parent_name)}_{SAMM.get_name(predicate_name)}"
         if parent_index != 0:
@@ -137,49 +163,42 @@ class MetaModelBaseAttributes:
 
     @staticmethod
     def __get_language_strings(
-        meta_model_element: Node,
-        aspect_graph: rdflib.Graph,
+        description: SubjectDescription,
         samm_attribute: rdflib.URIRef,
     ) -> Dict[str, str]:
         """Generates a Mapping of language codes to strings.
         The strings represent e.g. descriptions or preferred names
 
         Arguments:
-            meta_model_element: URI of the node in the aspect graph representing the parent element
-            aspect_graph: rdf graph that represents the whole aspect
+            description: all (predicate, object) pairs of the parent element
             samm_attribute: URN of the attribute type: e.g.
                 "urn:samm:org.eclipse.esmf.samm:meta-model:1.0.0#description"
         Returns:
-            a dictionary mapping language strings on the values
+            a dictionary mapping language strings on the values, the shared EMPTY_DICT if there are none
         """
 
-        language_string_generator: Iterable[Node] = aspect_graph.objects(
-            subject=meta_model_element,
-            predicate=samm_attribute,
-        )
+        language_string_generator: Iterable[Node] = description.objects(samm_attribute)
 
         return {
             language_string.language: language_string.value  # type: ignore
             for language_string in language_string_generator
-        }
+        } or EMPTY_DICT
 
     @staticmethod
     def __get_attribute_value_list(
-        meta_model_element: Node,
-        aspect_graph: rdflib.Graph,
+        description: SubjectDescription,
         samm_attribute: rdflib.URIRef,
     ) -> List[str]:
         """
         generates a List of strings from a attribute that can have multiple values e.g. the attribute see.
 
         Arguments:
-            meta_model_element: URI of the node in the aspect graph representing the parent element
-            aspect_graph: rdf graph that represents the whole aspect
+            description: all (predicate, object) pairs of the parent element
             samm_attribute:URN of the attribute type: e.g.
                 "urn:samm:org.eclipse.esmf.samm:meta-model:1.0.0#see"
 
         Returns:
-            a list of strings
+            a list of strings, the shared EMPTY_LIST if there are none
         """
-        value_generator: Iterable[Node] = aspect_graph.objects(subject=meta_model_element, predicate=samm_attribute)
-        return [value.toPython() for value in value_generator]  # type: ignore
+        value_generator: Iterable[Node] = description.objects(samm_attribute)
+        return [value.toPython() for value in value_generator] or EMPTY_LIST  # type: ignore
@@ -13,7 +13,8 @@ import importlib
 import logging
 import re
 
-from typing import Dict, Optional, Tuple
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple, Type
 
 import rdflib
 
@@ -22,7 +23,12 @@ from rdflib.term import Node
 from esmf_aspect_meta_model_python.base.base import Base
 from esmf_aspect_meta_model_python.loader import instantiator
 from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache, DeferredReference
+from esmf_aspect_meta_model_python.loader.element_proxy import ElementProxy
 from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase, T
+from esmf_aspect_meta_model_python.loader.rdf_type_index import RdfTypeIndex
+from esmf_aspect_meta_model_python.loader.reverse_edge_index import ReverseEdgeIndex
+from esmf_aspect_meta_model_python.loader.shared_namespace_store import SharedNamespaceStore
+from esmf_aspect_meta_model_python.loader.subject_description import SubjectDescription
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
 from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
 from esmf_aspect_meta_model_python.vocabulary.unit import UNIT
@@ -51,6 +57,20 @@ class ModelElementFactory:
 
     Central class that handles the instantiation of model elements. The responsibility for different groups of model
     elements (e.g., aspect, characteristic) is delegated to instantiator classes.
+
+    The instantiator class of an element type is taken from a dispatch table keyed by the URN of the type, which
+    contains the built-in instantiators of the meta model version and the ones passed to the factory or added by
+    register_instantiator. The table belongs to the factory, so custom instantiators do not affect other factories.
+    Each factory creates one instantiator object per element type and keeps it for all elements of that type.
+
+    The attributes of a node are read from its SubjectDescription, which the factory reads once per node with a
+    single scan of the aspect graph and shares with all instantiators. Blank nodes are named after their parent,
+    which is looked up in the ReverseEdgeIndex of the aspect graph. The element type of a node is looked up in the
+    RdfTypeIndex of the aspect graph.
+
+    In lazy mode the children of an element, e.g. the properties of an aspect or the characteristic of a property, are
+    created as ElementProxy objects, which instantiate the element on the first access. The elements instantiated for
+    data types, constraints and extended elements are always created at once.
     """
 
     def __init__(
@@ -58,6 +78,10 @@ class ModelElementFactory:
         meta_model_version: str,
         aspect_graph: rdflib.Graph,
         cache: DefaultElementCache,
+        reverse_edge_index: Optional[ReverseEdgeIndex] = None,
+        type_index: Optional[RdfTypeIndex] = None,
+        lazy: bool = False,
+        instantiator_classes: Optional[Dict[Node, Type[InstantiatorBase]]] = None,
     ):
         """Initializes the model element factory with meta model version, aspect graph, and cache.
 
@@ -65,6 +89,13 @@ class ModelElementFactory:
             meta_model_version (str): The meta model version string.
             aspect_graph (rdflib.Graph): The RDF graph representing the aspect model.
             cache (DefaultElementCache): The cache for element instances and cycle handling.
+            reverse_edge_index (Optional[ReverseEdgeIndex]): The index of the incoming edges of the aspect graph,
+                e.g. shared by several factories of the same graph. A new index is created if not given.
+            type_index (Optional[RdfTypeIndex]): The index of the rdf:type statements of the aspect graph, e.g.
+                shared with the lookup of the model elements. A new index is created if not given.
+            lazy (bool): Whether child elements are created as proxies which are instantiated on first access.
+            instantiator_classes (Optional[Dict[Node, Type[InstantiatorBase]]]): Instantiator classes by the URN of
+                the element type, replacing the built-in ones of the same types.
         """
         self._samm = SAMM(meta_model_version)
         self._sammc = SAMMC(meta_model_version)
@@ -72,8 +103,19 @@ class ModelElementFactory:
         self._meta_model_version = meta_model_version
         self._aspect_graph = aspect_graph
         self._cache = cache
+        self._reverse_edge_index = (
+            reverse_edge_index if reverse_edge_index is not None else ReverseEdgeIndex(aspect_graph)
+        )
+        self._type_index = type_index if type_index is not None else RdfTypeIndex(aspect_graph)
 
-        self._instantiators: Dict[str, InstantiatorBase] = {}
+        self._lazy = lazy
+
+        self._instantiator_classes = instantiator.get_instantiator_classes(meta_model_version)
+        if instantiator_classes:
+            self._instantiator_classes.update(instantiator_classes)
+        self._instantiators: Dict[Node, InstantiatorBase] = {}
+        self._descriptions: Dict[Node, SubjectDescription] = {}
+        self._proxies: Dict[Node, ElementProxy] = {}
 
     def create_aspect(self, aspect_node: Node) -> Optional[Base]:
         """Creates an aspect model element for the given aspect node.
@@ -91,6 +133,14 @@ class ModelElementFactory:
 
         return aspect_instance
 
+    def _create_graph_element(self, node: Node) -> Optional[Base]:
+        """Creates the element of a node, logging the node which cannot be translated."""
+        try:
+            return self.create_element(node)
+        except Exception as error:
+            _logger.error("Could not translate the node %s to a Python object. Error: %s", node, error)
+            raise error
+
     def create_all_graph_elements(self, create_nodes: list[Node]):
         """Create elements from the list of nodes, then restore any deferred cyclic references.
 
@@ -100,30 +150,74 @@ class ModelElementFactory:
         Returns:
             list: List of Python created elements.
         """
-        all_nodes = []
-
-        for node in create_nodes:
-            try:
-                instance = self.create_element(node)
-            except Exception as error:
-                _logger.error("Could not translate the node %s to a Python object. Error: %s", node, error)
-                raise error
-            else:
-                all_nodes.append(instance)
+        all_nodes = [self._create_graph_element(node) for node in create_nodes]
 
         # Restore any deferred cyclic references after all elements are created
         self._cache.restore_cycle_references()
 
         return all_nodes
 
+    def create_graph_element(self, node: Node) -> Optional[Base]:
+        """Create the element of a node, then restore the cyclic references deferred while creating it.
+
+        The active instantiation path is empty once the element is created, so all targets of the deferred references
+        are in the cache and the element is complete. This allows to hand out the elements of a graph one by one.
+        The descriptions read and the instances kept by the instantiators are dropped afterwards, so that only the
+        element cache holds the elements and the memory used by the factory does not grow with the graph.
+
+        Args:
+            node (Node): The node to create the element from.
+
+        Returns:
+            Optional[Base]: The created element.
+        """
+        instance = self._create_graph_element(node)
+        self._cache.restore_cycle_references()
+
+        self._descriptions.clear()
+        for instantiator_object in self._instantiators.values():
+            instantiator_object.clear_existing_instances()
+
+        return instance
+
     def _add_to_cache(self, instance):
         """Adds an instance to the cache if it is a Base element.
 
+        An element of a shared namespace is replaced by the shared instance if the element has been added to the
+        store before, e.g. by a model instantiated at the same time. In lazy mode the elements are not added to the
+        store: their child proxies are bound to this factory, and the elements resolved after loading are never
+        frozen, so they are kept by this model only.
+
         Args:
             instance: The instance to add to the cache.
+
+        Returns:
+            The cached instance.
         """
         if isinstance(instance, Base):
-            self._cache.resolve_instance(instance)
+            if not self._lazy:
+                instance = SharedNamespaceStore.add(instance)
+            instance = self._cache.resolve_instance(instance)
+
+        return instance
+
+    def _get_shared_instance(self, element_node: Node) -> Optional[Base]:
+        """Gets the already instantiated element of a shared namespace and adds it to the cache.
+
+        Args:
+            element_node (Node): The node of the element.
+
+        Returns:
+            Optional[Base]: The shared element, or None if the node is not an instantiated shared element.
+        """
+        if not isinstance(element_node, rdflib.URIRef):
+            return None
+
+        shared_instance = SharedNamespaceStore.get(str(element_node))
+        if shared_instance is not None:
+            self._cache.resolve_instance(shared_instance)
+
+        return shared_instance
 
     def create_element(
         self,
@@ -172,18 +266,99 @@ class ModelElementFactory:
         else:
             # If already instantiated, return from cache
             cached_instance = self._cache.get(str(element_node))
+            if cached_instance is None:
+                cached_instance = self._get_shared_instance(element_node)
             if cached_instance is not None:
                 instance = cached_instance
             else:
                 self._cache.add_to_active_path(element_node)
                 element_type = self._get_element_type(element_node)
-                instantiator_class = self._instantiators.get(element_type, self._create_instantiator(element_type))
-                instance = instantiator_class.get_instance(element_node)
-                self._add_to_cache(instance)
+                instantiator_object = self._instantiators.get(element_type)
+                if instantiator_object is None:
+                    instantiator_object = self._create_instantiator(element_type)
+                instance = self._add_to_cache(instantiator_object.get_instance(element_node))
                 self._cache.remove_from_active_path(element_node)
 
         return instance
 
+    def create_child(self, element_node: Node, parent_obj: Node, attr_name: Node) -> Optional[Base]:
+        """Create a child element, or in lazy mode a proxy of it unless the element has been instantiated before.
+
+        Args:
+            element_node (Node): Node in the aspect graph that represents the child element.
+            parent_obj (Node): Parent node.
+            attr_name (Node): SAMM predicate pointing from the parent to the child.
+
+        Returns:
+            Optional[Base]: The element or its proxy, or None if the reference to the element is deferred.
+        """
+        if not self._lazy:
+            return self.create_element(element_node, parent_obj, attr_name)
+
+        instance = self._cache.get(str(element_node))
+        if instance is not None:
+            return instance
+
+        proxy = self._proxies.get(element_node)
+        if proxy is None:
+            proxy = ElementProxy(self, element_node, SharedNamespaceStore.get_parent_links(), parent_obj, attr_name)
+            self._proxies[element_node] = proxy
+
+        return proxy  # type: ignore[return-value]
+
+    def resolve_proxy(
+        self,
+        element_node: Node,
+        parent_links: Optional[Dict[str, List[Base]]],
+        parent_obj: Optional[Node] = None,
+        attr_name: Optional[Node] = None,
+    ) -> Optional[Base]:
+        """Instantiate the element of a proxy.
+
+        The element is instantiated like the elements of the model loaded before, so the parent links to shared
+        elements are collected for the same model. Its children are proxies again. The element is not shared with
+        other models, even if it belongs to a shared namespace, see _add_to_cache.
+
+        If the proxy is resolved while its element is being instantiated, the reference from the parent of the proxy
+        is deferred like any cyclic reference. The deferred references are restored once no element is being
+        instantiated anymore.
+
+        Args:
+            element_node (Node): Node in the aspect graph that represents the element.
+            parent_links (Optional[Dict[str, List[Base]]]): The parent links collected for the model.
+            parent_obj (Optional[Node]): The parent node which created the proxy.
+            attr_name (Optional[Node]): SAMM predicate pointing from the parent to the element.
+
+        Returns:
+            Optional[Base]: The instantiated element, or None if the reference to the element is deferred.
+        """
+        collect_parent_links = (
+            SharedNamespaceStore.collect_parent_links(parent_links) if parent_links is not None else nullcontext()
+        )
+        with collect_parent_links:
+            instance = self.create_element(element_node, parent_obj, attr_name)
+            if not self._cache.has_active_path():
+                self._cache.restore_cycle_references()
+        if instance is not None:
+            self._proxies.pop(element_node, None)
+
+        return instance
+
+    def find_instance(self, element_node: Node) -> Optional[Base]:
+        """Find the element of a node if it has been instantiated for this model, without instantiating it.
+
+        Args:
+            element_node (Node): Node in the aspect graph that represents the element.
+
+        Returns:
+            Optional[Base]: The instantiated element, or None if there is none.
+        """
+        instance = self._cache.get(str(element_node))
+        if instance is None and isinstance(element_node, rdflib.URIRef):
+            instance = SharedNamespaceStore.get(str(element_node))
+
+        return instance
+
     @staticmethod
     def _to_snake_case(name: Optional[str]) -> Optional[str]:
         """Converts a camelCase SAMM predicate name to a snake_case Python attribute name.
@@ -201,50 +376,69 @@ class ModelElementFactory:
 
         return _camel_to_snake(name)
 
-    def _get_element_type(self, element_node: Optional[Node]) -> str:
-        """Gets the element type of a node and returns it.
+    def _get_element_type(self, element_node: Optional[Node]) -> Node:
+        """Gets the URN of the element type of a node and returns it.
 
         Args:
             element_node (Optional[Node]): The RDF node to determine the type for.
 
         Returns:
-            str: The determined element type.
+            Node: The URN of the determined element type.
         """
-        element_type_urn = self._aspect_graph.value(subject=element_node, predicate=rdflib.RDF.type)
-        element_type = self._samm.get_name(element_type_urn)
+        element_types = self._type_index.get_types(element_node) if element_node is not None else ()
+        element_type: Optional[Node]
+        if len(element_types) == 1:
+            element_type = element_types[0]
+        else:
+            # The first type in the order of the node's own statements wins, as in rdflib.Graph.value().
+            element_type = self.describe(element_node).value(rdflib.RDF.type)
 
         if element_type is None:
             # If the node does not have a type it can be one of the following elements:
             # 1. A property that extends another property
             # 2. A property or abstract property that is defined as a blank node
             # 3. A scalar
-            if self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.extends)):
-                element_type = "Property"
-            elif self._aspect_graph.value(subject=element_node, predicate=self._samm.get_urn(SAMM.property)):
+            description = self.describe(element_node)
+            if description.value(self._samm.get_urn(SAMM.extends)):
+                element_type = self._samm.get_urn(SAMM.Property)
+            elif description.value(self._samm.get_urn(SAMM.property)):
                 # property is a blank node and can either be a property or
                 # an abstract property. Therefore, get the type of the subnode.
-                property_node = self._aspect_graph.value(
-                    subject=element_node,
-                    predicate=self._samm.get_urn(SAMM.property),
-                )
+                property_node = description.value(self._samm.get_urn(SAMM.property))
                 element_type = self._get_element_type(property_node)
             else:
-                element_type = "Scalar"
+                element_type = self._samm.get_urn(instantiator.SCALAR_TYPE)
 
         return element_type
 
-    def _create_instantiator(self, element_type: str) -> InstantiatorBase[T]:
+    def register_instantiator(self, element_type: Node, instantiator_class: Type[InstantiatorBase]) -> None:
+        """Registers the instantiator class for an element type, replacing the built-in one if there is any.
+
+        Args:
+            element_type (Node): URN of the element type, e.g. the URN of samm:Characteristic.
+            instantiator_class (Type[InstantiatorBase]): The instantiator class, which is created with the factory.
+        """
+        self._instantiator_classes[element_type] = instantiator_class
+        self._instantiators.pop(element_type, None)
+
+    def _create_instantiator(self, element_type: Node) -> InstantiatorBase[T]:
         """Creates the right instantiator for a given element type and adds it to the dictionary.
 
+        Element types missing in the dispatch table are resolved from the module of the instantiator package named
+        after the local name of the type.
+
         Args:
-            element_type (str): Type of a model element that should be created.
+            element_type (Node): URN of the type of a model element that should be created.
 
         Returns:
             InstantiatorBase[T]: The instantiator that can create a given model element.
         """
-        module_name, class_name = self.get_instantiator_path(element_type)
-        module = importlib.import_module(module_name)
-        instantiator_class = getattr(module, class_name)
+        instantiator_class = self._instantiator_classes.get(element_type)
+        if instantiator_class is None:
+            element_type_name = self._samm.get_name(element_type)
+            module_name, class_name = self.get_instantiator_path(element_type_name)  # type: ignore[arg-type]
+            module = importlib.import_module(module_name)
+            instantiator_class = getattr(module, class_name)
         instantiator_object: InstantiatorBase[T] = instantiator_class(self)
         self._instantiators[element_type] = instantiator_object
 
@@ -254,7 +448,7 @@ class ModelElementFactory:
         """Formats the module path and the class name for the needed instantiator.
 
         Args:
-            element_type (str): Type of a model element.
+            element_type (str): Name of the type of a model element.
 
         Returns:
             Tuple[str, str]:
@@ -286,6 +480,39 @@ class ModelElementFactory:
         """Returns the meta model version string."""
         return self._meta_model_version
 
+    def is_lazy(self) -> bool:
+        """Returns whether child elements are created as proxies which are instantiated on first access."""
+        return self._lazy
+
     def get_aspect_graph(self) -> rdflib.Graph:
         """Returns the aspect RDF graph."""
         return self._aspect_graph
+
+    def get_reverse_edge_index(self) -> ReverseEdgeIndex:
+        """Returns the index of the incoming edges of the aspect graph."""
+        return self._reverse_edge_index
+
+    def get_type_index(self) -> RdfTypeIndex:
+        """Returns the index of the rdf:type statements of the aspect graph."""
+        return self._type_index
+
+    def describe(self, subject: Optional[Node]) -> SubjectDescription:
+        """Returns all (predicate, object) pairs of a subject of the aspect graph.
+
+        The description of a subject is read with one scan of the graph on the first request and kept for the
+        lifetime of the factory, or until the element created by create_graph_element is complete. The aspect graph
+        must not be changed meanwhile.
+
+        Args:
+            subject (Optional[Node]): The subject node.
+
+        Returns:
+            SubjectDescription: The description of the subject.
+        """
+        description = self._descriptions.get(subject)  # type: ignore
+        if description is None:
+            description = SubjectDescription.from_graph(subject, self._aspect_graph)
+            if subject is not None:
+                self._descriptions[subject] = description
+
+        return description
@@ -0,0 +1,156 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+"""Binary snapshots of instantiated model element graphs.
+
+A snapshot stores the Python objects created by the model element factory, so that a model can be used without
+parsing any RDF data or running any instantiator. The layout is:
+
+    MAGIC | header length | JSON header | pickled model elements
+
+The header carries the format version, the loader version and the SAMM version. A snapshot is only loaded by the
+same loader version which has written it, as the pickled objects depend on the layout of the element classes.
+Like any pickle data, snapshots must only be loaded from trusted sources.
+"""
+
+import json
+import pickle
+import struct
+
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from esmf_aspect_meta_model_python import utils
+from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.impl.data_types.default_complex_type import DefaultComplexType
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+
+MAGIC = b"ESMFMS01"
+FORMAT_VERSION = 1
+
+_LENGTH = struct.Struct("<I")
+
+
+class ModelSnapshot(NamedTuple):
+    """Model elements restored from a snapshot."""
+
+    samm_version: str
+    aspect: Optional[Aspect]
+    model_elements: Optional[List[Base]]
+    cache: DefaultElementCache
+
+
+def get_loader_version() -> str:
+    """Get the version of the installed loader package.
+
+    Returns:
+        str: The package version or "unknown" if the package is not installed.
+    """
+    try:
+        return metadata.version("esmf-aspect-model-loader")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def save_model_snapshot(
+    path: Union[str, Path],
+    samm_version: str,
+    cache: DefaultElementCache,
+    aspect: Optional[Aspect] = None,
+    model_elements: Optional[List[Base]] = None,
+) -> None:
+    """Write the instantiated model elements to a snapshot file.
+
+    Pickling keeps the identity of the elements, so cyclic references and elements shared by several parents are
+    restored as they are.
+
+    Args:
+        path (Union[str, Path]): The target file path.
+        samm_version (str): The SAMM version of the model.
+        cache (DefaultElementCache): The element cache filled while instantiating the model.
+        aspect (Optional[Aspect]): The loaded Aspect element.
+        model_elements (Optional[List[Base]]): The loaded model elements.
+    """
+    header = {
+        "format": FORMAT_VERSION,
+        "loader_version": get_loader_version(),
+        "samm_version": samm_version,
+        "element_count": len(cache.items()),
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    payload = {"aspect": aspect, "model_elements": model_elements, "cache": cache.items()}
+    payload_bytes = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+    utils.write_file_atomically(path, b"".join([MAGIC, _LENGTH.pack(len(header_bytes)), header_bytes, payload_bytes]))
+
+
+def _read_header(data: bytes) -> tuple[Dict[str, Any], int]:
+    """Read the snapshot header and return it with the offset of the pickled elements."""
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("The data is not a model snapshot or has an unsupported format version.")
+
+    offset = len(MAGIC)
+    (header_length,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    header_end = offset + header_length
+
+    return json.loads(data[offset:header_end].decode("utf-8")), header_end
+
+
+def read_model_snapshot_header(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read only the header of a snapshot file.
+
+    Args:
+        path (Union[str, Path]): Path to the snapshot file.
+
+    Returns:
+        Dict[str, Any]: The version stamp and the number of elements of the snapshot.
+    """
+    header, _ = _read_header(Path(path).read_bytes())
+
+    return header
+
+
+def load_model_snapshot(path: Union[str, Path]) -> ModelSnapshot:
+    """Load the model elements from a snapshot file.
+
+    The element cache is rebuilt from the restored elements and the complex types are registered again, so that
+    lookups by name or URN and the resolution of extended entities work as after instantiating the model.
+
+    Args:
+        path (Union[str, Path]): Path to the snapshot file.
+
+    Returns:
+        ModelSnapshot: The restored model elements.
+
+    Raises:
+        ValueError: If the file is not a snapshot or was written by another format or loader version.
+    """
+    data = Path(path).read_bytes()
+    header, offset = _read_header(data)
+
+    if header.get("format") != FORMAT_VERSION or header.get("loader_version") != get_loader_version():
+        raise ValueError(
+            f"The model snapshot {path} was written by loader version {header.get('loader_version')} "
+            f"with format version {header.get('format')} and can not be loaded by this loader version."
+        )
+
+    payload = pickle.loads(data[offset:])
+
+    cache = DefaultElementCache()
+    for key, element in payload["cache"]:
+        cache.add_element(key, element)
+        if isinstance(element, DefaultComplexType) and element.urn is not None:
+            DefaultComplexType._instances[element.urn] = element
+
+    return ModelSnapshot(header["samm_version"], payload["aspect"], payload["model_elements"], cache)
@@ -11,7 +11,7 @@
 
 import sys
 
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 import rdflib  # type: ignore
 
@@ -21,28 +21,42 @@ from rdflib.term import Node
 
 class RdfHelper:
     @staticmethod
-    def get_rdf_list_values(rdf_list: Optional[Node], aspect_graph: Graph) -> List[term.Node]:
-        """A collection in rdf is a binary tree. The top of the tree is a blank node.
-        One predicate of the node is connected to the first element of the collection.
-        The other predicate is connected to a node with the rest of the binary tree.
-        This method gets all the Nodes of the collection elements by iterating the tree recursively.
+    def iter_rdf_list_values(rdf_list: Optional[Node], aspect_graph: Graph) -> Iterator[term.Node]:
+        """A collection in rdf is a linked list of blank nodes. Each node of the list is connected to one element of
+        the collection by rdf:first and to the node with the remaining elements by rdf:rest, the last node points
+        to rdf:nil. This method yields the Nodes of the collection elements by walking the list iteratively, so that
+        long collections do not exceed the recursion limit. The walk stops at a node which has already been visited.
 
         Arguments:
             rdf_list: Blank Node representing the collection
             aspect_graph: rdf graph representing the whole aspect
 
         Returns:
-            a list of all Nodes representing the collection elements
+            an iterator over all Nodes representing the collection elements
         """
-        list_elements: List[term.Node] = []
+        visited_nodes = set()
 
-        first_entry: Optional[term.Node] = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.first)
+        while rdf_list is not None and rdf_list not in visited_nodes:
+            visited_nodes.add(rdf_list)
+            first_entry: Optional[term.Node] = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.first)
+            if first_entry is None:
+                break
 
-        if first_entry is not None:
-            list_elements = [first_entry]
-            remaining_entries: Optional[term.Node] = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.rest)
-            list_elements.extend(RdfHelper.get_rdf_list_values(remaining_entries, aspect_graph))
-        return list_elements
+            yield first_entry
+            rdf_list = aspect_graph.value(subject=rdf_list, predicate=rdflib.RDF.rest)
+
+    @staticmethod
+    def get_rdf_list_values(rdf_list: Optional[Node], aspect_graph: Graph) -> List[term.Node]:
+        """Gets all the Nodes of the collection elements, see iter_rdf_list_values.
+
+        Arguments:
+            rdf_list: Blank Node representing the collection
+            aspect_graph: rdf graph representing the whole aspect
+
+        Returns:
+            a list of all Nodes representing the collection elements
+        """
+        return list(RdfHelper.iter_rdf_list_values(rdf_list, aspect_graph))
 
     @staticmethod
     def find_named_parent(meta_model_element: Node, aspect_graph: rdflib.Graph, counter: int = 0) -> tuple:
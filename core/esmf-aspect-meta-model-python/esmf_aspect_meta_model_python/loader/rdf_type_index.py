@@ -0,0 +1,102 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import rdflib
+
+from rdflib.term import Node
+
+
+class RdfTypeIndex:
+    """Index of the rdf:type statements of an aspect graph.
+
+    Maps every typed node to its types and every type to its nodes, both in the order in which the graph reports the
+    statements. The index is built with a single scan of the rdf:type statements on the first lookup, so the graph
+    must not be changed afterwards.
+    """
+
+    def __init__(self, aspect_graph: rdflib.Graph):
+        """Initializes the index, which is built on the first lookup.
+
+        Args:
+            aspect_graph (rdflib.Graph): The graph to index.
+        """
+        self._aspect_graph = aspect_graph
+        self._types: Optional[Dict[Node, List[Node]]] = None
+        self._nodes: Dict[Node, List[Node]] = {}
+
+    def _get_types_index(self) -> Dict[Node, List[Node]]:
+        """Gets the index of the types of the nodes, building both indices on the first call."""
+        if self._types is None:
+            types: Dict[Node, List[Node]] = {}
+            nodes: Dict[Node, List[Node]] = {}
+            for subject, _, node_type in self._aspect_graph.triples((None, rdflib.RDF.type, None)):
+                types.setdefault(subject, []).append(node_type)
+                nodes.setdefault(node_type, []).append(subject)
+            self._nodes = nodes
+            self._types = types
+
+        return self._types
+
+    def get_types(self, node: Node) -> Tuple[Node, ...]:
+        """Gets the types of a node.
+
+        Args:
+            node (Node): The typed node.
+
+        Returns:
+            Tuple[Node, ...]: The types of the node, empty if the node has no type.
+        """
+        return tuple(self._get_types_index().get(node, ()))
+
+    def get_nodes(self, node_type: Node) -> Tuple[Node, ...]:
+        """Gets the nodes of a type.
+
+        Args:
+            node_type (Node): The type, e.g. the URN of a meta model element.
+
+        Returns:
+            Tuple[Node, ...]: The nodes with the type, empty if there are none.
+        """
+        self._get_types_index()
+
+        return tuple(self._nodes.get(node_type, ()))
+
+    def get_nodes_of_types(self, node_types: Iterable[Node]) -> List[Node]:
+        """Gets the nodes having any of the given types.
+
+        Args:
+            node_types (Iterable[Node]): The types.
+
+        Returns:
+            List[Node]: The nodes grouped by the given types, each node once, with the first of its given types.
+        """
+        self._get_types_index()
+        found: Set[Node] = set()
+        result: List[Node] = []
+        for node_type in node_types:
+            for node in self._nodes.get(node_type, ()):
+                if node not in found:
+                    found.add(node)
+                    result.append(node)
+
+        return result
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._get_types_index()
+
+    def __len__(self) -> int:
+        return len(self._get_types_index())
+
+    def __repr__(self) -> str:
+        state = "not built" if self._types is None else f"nodes={len(self._types)}, types={len(self._nodes)}"
+        return f"RdfTypeIndex({state})"
@@ -0,0 +1,136 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import rdflib
+
+from rdflib.term import Node
+
+NamedParent = Tuple[Optional[Node], Optional[Node], int]
+
+_NO_PARENT: NamedParent = (None, None, 0)
+
+
+class ReverseEdgeIndex:
+    """Index of the incoming edges of the nodes of an aspect graph.
+
+    Maps every node which is the object of a triple, except literals, to the (subject, predicate) pairs pointing to
+    it, in the order in which the graph reports the triples. The index is built with a single scan of the graph on the
+    first lookup, so the graph must not be changed afterwards.
+
+    The named parents of the nodes, see find_named_parent, are resolved without recursion and memoized.
+    """
+
+    def __init__(self, aspect_graph: rdflib.Graph):
+        """Initializes the index, which is built on the first lookup.
+
+        Args:
+            aspect_graph (rdflib.Graph): The graph to index.
+        """
+        self._aspect_graph = aspect_graph
+        self._parents: Optional[Dict[Node, List[Tuple[Node, Node]]]] = None
+        self._named_parents: Dict[Node, NamedParent] = {}
+
+    def _get_parents_index(self) -> Dict[Node, List[Tuple[Node, Node]]]:
+        """Gets the index, building it on the first call."""
+        if self._parents is None:
+            parents: Dict[Node, List[Tuple[Node, Node]]] = {}
+            for subject, predicate, obj in self._aspect_graph.triples((None, None, None)):
+                if not isinstance(obj, rdflib.Literal):
+                    parents.setdefault(obj, []).append((subject, predicate))
+            self._parents = parents
+
+        return self._parents
+
+    def get_parents(self, node: Node) -> Tuple[Tuple[Node, Node], ...]:
+        """Gets the incoming edges of a node.
+
+        Args:
+            node (Node): The child node.
+
+        Returns:
+            Tuple[Tuple[Node, Node], ...]: The (subject, predicate) pairs of the triples with the node as object.
+        """
+        return tuple(self._get_parents_index().get(node, ()))
+
+    @staticmethod
+    def _is_named_edge(subject: Node, predicate: Node) -> bool:
+        """Checks if an edge comes from a named parent."""
+        return isinstance(subject, rdflib.URIRef) and isinstance(predicate, rdflib.URIRef)
+
+    def _resolve_named_parent(self, node: Node) -> NamedParent:
+        """Resolves the named parent of a node whose anonymous parents have been resolved before.
+
+        Like RdfHelper.find_named_parent, the last incoming edge of the node wins. An anonymous parent without named
+        parent, e.g. one on a cycle of blank nodes, gives no named parent.
+        """
+        result = _NO_PARENT
+        for subject, predicate in self._get_parents_index().get(node, ()):
+            if self._is_named_edge(subject, predicate):
+                result = (subject, predicate, 0)
+            else:
+                parent, parent_predicate, distance = self._named_parents.get(subject, _NO_PARENT)
+                result = (parent, parent_predicate, distance + 1) if parent is not None else _NO_PARENT
+
+        return result
+
+    def find_named_parent(self, node: Node) -> NamedParent:
+        """Searches the named parent of a node, walking up through the anonymous parents.
+
+        Args:
+            node (Node): The child node, usually a blank node.
+
+        Returns:
+            Tuple[Optional[Node], Optional[Node], int]: The named parent, the predicate pointing from it towards the
+                child and the number of anonymous nodes in between, or (None, None, 0) if there is no named parent.
+        """
+        named_parent = self._named_parents.get(node)
+        if named_parent is not None:
+            return named_parent
+
+        parents_index = self._get_parents_index()
+        pending: Set[Node] = set()
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in self._named_parents:
+                stack.pop()
+                continue
+
+            if current not in pending:
+                pending.add(current)
+                anonymous_parents = [
+                    subject
+                    for subject, predicate in parents_index.get(current, ())
+                    if not self._is_named_edge(subject, predicate)
+                    and subject not in self._named_parents
+                    and subject not in pending
+                ]
+                if anonymous_parents:
+                    stack.extend(anonymous_parents)
+                    continue
+
+            self._named_parents[current] = self._resolve_named_parent(current)
+            pending.discard(current)
+            stack.pop()
+
+        return self._named_parents[node]
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._get_parents_index()
+
+    def __len__(self) -> int:
+        return len(self._get_parents_index())
+
+    def __repr__(self) -> str:
+        state = "not built" if self._parents is None else f"objects={len(self._parents)}"
+        return f"ReverseEdgeIndex({state})"
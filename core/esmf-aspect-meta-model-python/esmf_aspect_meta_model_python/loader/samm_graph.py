@@ -10,7 +10,7 @@
 #   SPDX-License-Identifier: MPL-2.0
 
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
 
 from rdflib import RDF, Graph, Node
 
@@ -22,10 +22,17 @@ from esmf_aspect_meta_model_python.base.aspect import Aspect
 from esmf_aspect_meta_model_python.base.base import Base
 from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.impl.base_impl import BaseImpl
-from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.layered_graph import LayeredGraph, LayeredStore
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache, ElementType
+from esmf_aspect_meta_model_python.loader.instantiator_base import InstantiatorBase
 from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+from esmf_aspect_meta_model_python.loader.model_snapshot import load_model_snapshot, save_model_snapshot
+from esmf_aspect_meta_model_python.loader.rdf_type_index import RdfTypeIndex
+from esmf_aspect_meta_model_python.loader.reverse_edge_index import ReverseEdgeIndex
+from esmf_aspect_meta_model_python.loader.shared_namespace_store import SharedNamespaceStore
 from esmf_aspect_meta_model_python.resolver.handler import InputHandler
-from esmf_aspect_meta_model_python.resolver.meta_model import AspectMetaModelResolver
+from esmf_aspect_meta_model_python.resolver.meta_model_store import MetaModelStore
+from esmf_aspect_meta_model_python.resolver.resolution_report import ResolutionReport
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
 
 
@@ -35,17 +42,35 @@ class SAMMGraph:
     This class manages the RDF and SAMM graphs, handles parsing, and provides methods to load and query aspect models.
     """
 
-    def __init__(self):
-        """Initializes the SAMMGraph with default graphs, cache, and version information."""
+    def __init__(
+        self,
+        cache: Optional[DefaultElementCache] = None,
+        instantiator_classes: Optional[Dict[Node, Type[InstantiatorBase]]] = None,
+    ):
+        """Initializes the SAMMGraph with default graphs, cache, and version information.
+
+        Args:
+            cache (Optional[DefaultElementCache]): The cache for the instantiated model elements, e.g. one of the
+                strategies of the element_cache_strategies module. Defaults to an unbounded DefaultElementCache.
+            instantiator_classes (Optional[Dict[Node, Type[InstantiatorBase]]]): Custom instantiator classes by the
+                URN of the element type, used by the model element factories of this graph only. The elements of
+                shared namespaces instantiated by other models before are reused as they are.
+        """
         self.rdf_graph = AdaptiveGraph()
         self.samm_graph = Graph()
-        self._cache = DefaultElementCache()
+        self._cache = cache if cache is not None else DefaultElementCache()
+        self._instantiator_classes = instantiator_classes
 
         self.samm_version = const.SAMM_VERSION
-        self.aspect = None
-        self.model_elements = None
-        self._samm = None
-        self._reader = None
+        self.aspect: Any = None
+        self.model_elements: Any = None
+        self._samm: Any = None
+        self._reader: Any = None
+        self._model_graph: Optional[LayeredGraph] = None
+        self._model_layers: Optional[Graph] = None
+        self._reverse_edge_index: Optional[ReverseEdgeIndex] = None
+        self._type_index: Optional[RdfTypeIndex] = None
+        self._parent_links: Dict[str, List[Base]] = {}
 
     def __str__(self) -> str:
         """Returns a string representation of the SAMMGraph object."""
@@ -57,7 +82,7 @@ class SAMMGraph:
             f"<SAMMGraph identifier={id(self)} (<class 'esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph'>)>"
         )
 
-    def _get_rdf_graph(self, input_data: Union[str, Path], input_type: Optional[str] = None):
+    def _get_rdf_graph(self, input_data: Union[str, Path], input_type: Optional[str] = None, **resolver_options):
         """Reads the RDF graph from the given input data.
 
         This method initializes the InputHandler with the provided input data and type, retrieves the reader,
@@ -66,22 +91,34 @@ class SAMMGraph:
         Args:
             input_data (Union[str, Path]): The input data to read the RDF graph from. This can be a file path or a str.
             input_type (Optional[str]): The type of the input data. If not provided, the type will be inferred.
+            **resolver_options: Options of the local file resolver, see LocalFileResolver.
 
         Returns:
             None
         """
-        self._reader = InputHandler(input_data, input_type).get_reader()
+        self._reader = InputHandler(input_data, input_type, **resolver_options).get_reader()
         self.rdf_graph = self._reader.read(input_data)
+        self._model_graph = None
+        self._model_layers = None
+        self._reverse_edge_index = None
+        self._type_index = None
 
     def _get_samm(self):
         """Initializes the SAMM object with the current SAMM version."""
         self._samm = SAMM(self.samm_version)
 
     def _get_samm_graph(self):
-        """Parses SAMM graph base data and populates samm_graph with SAMM elements for the current version."""
-        AspectMetaModelResolver().parse(self.samm_graph, self.samm_version)
+        """Gets the read-only graph with the SAMM elements of the current version.
+
+        The graph provided by the reader is used if there is one, e.g. the meta-model subset of a bundle. Otherwise,
+        the graph shared by the whole process is used.
+        """
+        if self._reader is not None and self._reader.samm_graph is not None:
+            self.samm_graph = self._reader.samm_graph
+        else:
+            self.samm_graph = MetaModelStore.get_graph(self.samm_version)
 
-    def parse(self, input_data: Union[str, Path], input_type: Optional[str] = None):
+    def parse(self, input_data: Union[str, Path], input_type: Optional[str] = None, **resolver_options):
         """Parses the RDF graph and initializes SAMM elements.
 
         This method reads the RDF graph from the given input data, retrieves and sets the SAMM version,
@@ -90,16 +127,88 @@ class SAMMGraph:
         Args:
             input_data (Union[str, Path]): The input data to read the RDF graph from (file path or string).
             input_type (Optional[str]): The type of the input data. If not provided, the type will be inferred.
+            **resolver_options: Options of the local file resolver, e.g. parallel=True to parse the dependency
+                files in worker processes. They are ignored for data strings.
 
         Returns:
             SAMMGraph: The instance of the SAMMGraph with the parsed data.
         """
-        self._get_rdf_graph(input_data, input_type)
+        self._get_rdf_graph(input_data, input_type, **resolver_options)
         self._get_samm()
         self._get_samm_graph()
 
         return self
 
+    def _get_model_graph(self) -> LayeredGraph:
+        """Gets the aspect model graph with all dependencies layered over the SAMM graph.
+
+        The graph is a view over rdf_graph and samm_graph, so none of their triples are copied. The dependencies
+        resolved by the reader are parsed into the own layer of the view. The graph is built once and shared by
+        load_aspect_model and load_model_elements.
+
+        Returns:
+            LayeredGraph: The graph with the aspect model, its dependencies and the SAMM elements.
+        """
+        if self._model_graph is None:
+            self._model_graph = LayeredGraph(self.rdf_graph, self.samm_graph, samm_version=self.samm_version)
+            self._reader.prepare_aspect_model(self._model_graph)
+
+        return self._model_graph
+
+    def _get_model_layers(self) -> Graph:
+        """Gets a view over the aspect model graph and its dependencies, without the SAMM elements below them.
+
+        The indices of the model are built over this view, so the triples of the meta-model and the units are not
+        scanned.
+
+        Returns:
+            Graph: The view over the dependencies layer and the aspect model layer of the model graph.
+        """
+        if self._model_layers is None:
+            dependencies_layer, aspect_layer = self._get_model_graph().layers[:2]
+            self._model_layers = Graph(store=LayeredStore([dependencies_layer, aspect_layer]))
+
+        return self._model_layers
+
+    @property
+    def reverse_edge_index(self) -> ReverseEdgeIndex:
+        """Index of the incoming edges of the aspect model graph, to navigate from a node to its parents.
+
+        The index is built once, on the first lookup, and shared by load_aspect_model and load_model_elements. It
+        covers the aspect model and its dependencies, not the SAMM elements.
+
+        Returns:
+            ReverseEdgeIndex: The index of the model graph.
+        """
+        if self._reverse_edge_index is None:
+            self._reverse_edge_index = ReverseEdgeIndex(self._get_model_layers())
+
+        return self._reverse_edge_index
+
+    @property
+    def type_index(self) -> RdfTypeIndex:
+        """Index of the rdf:type statements of the aspect model graph, to query the nodes of a type and vice versa.
+
+        The index is built once, on the first lookup, and shared by the instantiations of the model elements. It covers
+        the aspect model and its dependencies, the types of the SAMM elements are looked up in the model graph.
+
+        Returns:
+            RdfTypeIndex: The index of the model graph.
+        """
+        if self._type_index is None:
+            self._type_index = RdfTypeIndex(self._get_model_layers())
+
+        return self._type_index
+
+    @property
+    def resolution_report(self) -> Optional[ResolutionReport]:
+        """Report of the files parsed and the folders scanned while resolving the aspect model dependencies.
+
+        Returns:
+            Optional[ResolutionReport]: The report of the reader, None if no data has been parsed yet.
+        """
+        return self._reader.resolution_report if self._reader else None
+
     def get_aspect_urn(self) -> Node:
         """Retrieves the URN pointing to the main aspect node of the RDF graph.
 
@@ -118,55 +227,67 @@ class SAMMGraph:
 
         return aspect_urn
 
-    def _get_node_from_graph(self, node: Node) -> List[Node]:
-        """Retrieves nodes from the RDF graph that match the given node type.
-
-        Args:
-            node (Node): The RDF node type to search for in the graph.
-
-        Returns:
-            List[Node]: A list of nodes from the RDF graph that match the given node type.
-        """
-        return [subject for subject in self.rdf_graph.subjects(predicate=RDF.type, object=node) if subject]
-
     def get_all_model_elements(self) -> List[Node]:
         """Retrieves all SAMM elements from the RDF graph.
 
+        The nodes are looked up in a type index of the RDF graph, built with a single scan of its rdf:type statements,
+        so the dependencies of the aspect model are not resolved.
+
         Returns:
-            List[Node]: A list of nodes representing all model elements in the RDF graph.
+            List[Node]: A list of nodes representing all model elements in the RDF graph, each node once.
 
         Raises:
             ValueError: If no SAMM elements are found in the RDF graph.
         """
-        model_elements: List[Node] = []
-        for element in self._samm.meta_model_elements:
-            model_elements += self._get_node_from_graph(self._samm.get_urn(element))
+        meta_model_types = (self._samm.get_urn(element) for element in self._samm.meta_model_elements)
+        model_elements: List[Node] = [
+            node for node in RdfTypeIndex(self.rdf_graph).get_nodes_of_types(meta_model_types) if node
+        ]
 
         if not model_elements:
             raise ValueError("There are no SAMM elements in the RDF graph.")
 
         return model_elements
 
-    def load_aspect_model(self) -> Aspect:
+    def load_aspect_model(self, lazy: bool = False) -> Aspect:
         """Creates Python objects to represent the Aspect model graph.
 
         This function takes an RDF graph and a URN for an Aspect node and converts it into a set of structured and
         connected Python objects that represent the Aspect model graph. The output is a list of Python objects derived
         from the RDF graph centered around the specified Aspect node.
 
+        In lazy mode only the Aspect is instantiated at once. Its child elements are proxies which instantiate the
+        element on first access, so the cost of loading grows with the elements actually used. The elements are not
+        validated while loading, Aspect.validate() instantiates and validates all of them. The find methods only see
+        the elements instantiated so far. The elements of shared namespaces instantiated by other models before are
+        reused, but the elements instantiated in lazy mode are not shared with other models.
+
+        Args:
+            lazy (bool): Whether the child elements are instantiated on first access. Only used by the first call.
+
         Returns:
             Aspect: The Aspect object representing the Aspect model graph.
         """
         if not self.aspect:
             aspect_urn = self.get_aspect_urn()
 
-            graph = self.rdf_graph + self.samm_graph
-            self._reader.prepare_aspect_model(graph)
+            graph = self._get_model_graph()
             self._validate_samm_namespace_version(graph)
 
-            model_element_factory = ModelElementFactory(self.samm_version, graph, self._cache)
-            self.aspect = model_element_factory.create_aspect(aspect_urn)
-            self.aspect.validate()
+            model_element_factory = ModelElementFactory(
+                self.samm_version,
+                graph,
+                self._cache,
+                self.reverse_edge_index,
+                self.type_index,
+                lazy=lazy,
+                instantiator_classes=self._instantiator_classes,
+            )
+            with SharedNamespaceStore.collect_parent_links(self._parent_links):
+                self.aspect = model_element_factory.create_aspect(aspect_urn)
+            SharedNamespaceStore.freeze(element for _, element in self._cache.items())
+            if not lazy:
+                self.aspect.validate()
 
         return self.aspect
 
@@ -198,11 +319,19 @@ class SAMMGraph:
         """Creates Python objects to represent all model elements in the Aspect model graph."""
         if self.model_elements is None:
             model_elements = self.get_all_model_elements()
-            graph = self.rdf_graph + self.samm_graph
-            self._reader.prepare_aspect_model(graph)
-
-            model_element_factory = ModelElementFactory(self.samm_version, graph, self._cache)
-            self.model_elements = model_element_factory.create_all_graph_elements(model_elements)
+            graph = self._get_model_graph()
+
+            model_element_factory = ModelElementFactory(
+                self.samm_version,
+                graph,
+                self._cache,
+                self.reverse_edge_index,
+                self.type_index,
+                instantiator_classes=self._instantiator_classes,
+            )
+            with SharedNamespaceStore.collect_parent_links(self._parent_links):
+                self.model_elements = model_element_factory.create_all_graph_elements(model_elements)
+            SharedNamespaceStore.freeze(element for _, element in self._cache.items())
             for element in self.model_elements:
                 element.validate()
 
@@ -210,6 +339,92 @@ class SAMMGraph:
 
         return self.model_elements
 
+    def iter_model_elements(self, validate: bool = True) -> Iterator[BaseImpl]:
+        """Yields the Python objects of all model elements in the Aspect model graph one by one.
+
+        Streaming variant of load_model_elements: each element is yielded as soon as it is created together with its
+        children, so that the consumer can process it while loading continues. The elements are not collected in a
+        list, with a bounded cache such as LRUElementCache the memory used is limited by the active instantiation path
+        and the cache size. The shared elements are frozen once all elements have been yielded.
+
+        If the model elements have been loaded before, they are yielded from the list.
+
+        Args:
+            validate (bool): Whether each element is validated before it is yielded.
+
+        Yields:
+            BaseImpl: The model elements, in the order of get_all_model_elements.
+        """
+        if self.model_elements is not None:
+            yield from self.model_elements
+            return
+
+        model_elements = self.get_all_model_elements()
+        graph = self._get_model_graph()
+
+        model_element_factory = ModelElementFactory(
+            self.samm_version,
+            graph,
+            self._cache,
+            self.reverse_edge_index,
+            self.type_index,
+            instantiator_classes=self._instantiator_classes,
+        )
+        for node in model_elements:
+            # The parent links are collected per element, the context must not be kept open across the yields.
+            with SharedNamespaceStore.collect_parent_links(self._parent_links):
+                element: Any = model_element_factory.create_graph_element(node)
+            if validate:
+                element.validate()
+            if not self.aspect and isinstance(element, Aspect):
+                self.aspect = element
+
+            yield element
+
+        SharedNamespaceStore.freeze(element for _, element in self._cache.items())
+
+    def save_snapshot(self, path: Union[str, Path]) -> None:
+        """Saves the instantiated model elements to a snapshot file.
+
+        All model elements are loaded first if they have not been loaded yet. The snapshot can be loaded with
+        load_snapshot without parsing any RDF data.
+
+        Args:
+            path (Union[str, Path]): The target file path.
+        """
+        if self.model_elements is None:
+            self.load_model_elements()
+
+        save_model_snapshot(path, self.samm_version, self._cache, self.aspect, self.model_elements)
+
+    @classmethod
+    def load_snapshot(cls, path: Union[str, Path]) -> "SAMMGraph":
+        """Creates a SAMMGraph with the model elements of a snapshot file.
+
+        The RDF graphs of the returned instance are empty, the model elements are available through
+        load_aspect_model, load_model_elements and the find methods.
+
+        Args:
+            path (Union[str, Path]): Path to the snapshot file.
+
+        Returns:
+            SAMMGraph: The instance with the restored model elements.
+        """
+        snapshot = load_model_snapshot(path)
+
+        samm_graph = cls()
+        samm_graph.samm_version = snapshot.samm_version
+        samm_graph.aspect = snapshot.aspect
+        samm_graph.model_elements = snapshot.model_elements
+        samm_graph._cache = snapshot.cache
+
+        return samm_graph
+
+    @property
+    def cache_statistics(self) -> dict[str, int]:
+        """Hit, miss and eviction counters and the number of entries of the element cache."""
+        return self._cache.statistics
+
     def find_by_name(self, element_name: str) -> list[Base]:
         """Finds model elements by name and returns the found elements.
 
@@ -232,6 +447,35 @@ class SAMMGraph:
         """
         return self._cache.get_by_urn(urn)
 
+    def find_by_type(self, element_type: type[ElementType]) -> list[ElementType]:
+        """Finds all model elements of a given class or interface.
+
+        Args:
+            element_type (type): Model element class or interface, e.g. Property or Characteristic.
+
+        Returns:
+            list: List of found elements.
+        """
+        return self._cache.find_by_type(element_type)
+
+    def get_parent_elements(self, element: Base) -> list[Base]:
+        """Gets the parent elements of a model element in this model.
+
+        The elements of shared namespaces only keep the parent elements of shared namespaces, so the parent elements
+        from this model are added.
+
+        Args:
+            element (Base): The model element.
+
+        Returns:
+            list[Base]: List of parent elements.
+        """
+        parent_elements = list(element.parent_elements or [])
+        if element.urn is not None:
+            parent_elements.extend(self._parent_links.get(element.urn, []))
+
+        return parent_elements
+
     def determine_access_path(self, base_element_name: str) -> list[list[str]]:
         """Determines all access paths for a given element name.
 
@@ -282,14 +526,18 @@ class SAMMGraph:
         Returns:
             list[list[str]]: List of paths found to access the respective value.
         """
-        if base_element is None or base_element.parent_elements is None or len(base_element.parent_elements) == 0:
+        if base_element is None:
+            return path
+
+        parent_elements = self.get_parent_elements(base_element)
+        if len(parent_elements) == 0:
             return path
 
         # in case of multiple parent get the number of additional parents and
         # clone the existing paths
-        path.extend(path[0] for _ in range(len(base_element.parent_elements) - 1))
+        path.extend(path[0] for _ in range(len(parent_elements) - 1))
 
-        for index, parent in enumerate(base_element.parent_elements):
+        for index, parent in enumerate(parent_elements):
             if isinstance(parent, Property):
                 if hasattr(parent, "payload_name") and parent.payload_name is not None:  # type: ignore
                     path_segment = parent.payload_name  # type: ignore
@@ -0,0 +1,168 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import threading
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from esmf_aspect_meta_model_python.base.base import Base
+
+# Parent links of the shared elements collected for the model instantiated in the current context.
+_parent_links: ContextVar[Optional[Dict[str, List[Base]]]] = ContextVar("parent_links", default=None)
+
+
+class SharedNamespaceStore:
+    """Process-wide store of the model elements of shared namespaces.
+
+    The elements of a registered namespace are instantiated once, by the first model referring to them, and reused
+    by reference by all models loaded later. Once the model which instantiated them has been loaded, the elements are
+    frozen, so that no model can change the elements seen by the others.
+
+    A shared element only keeps the parent elements of its own namespaces. The parent links from the elements of
+    other models are collected per model while it is instantiated, see SAMMGraph.get_parent_elements.
+    """
+
+    _namespaces: Set[str] = set()
+    _elements: Dict[str, Base] = {}
+    _lock = threading.RLock()
+
+    @staticmethod
+    def _get_namespace(urn: str) -> str:
+        """Get the namespace part of an element URN, e.g. urn:samm:org.example:1.0.0."""
+        return urn.split("#", 1)[0]
+
+    @classmethod
+    def register_namespace(cls, namespace: str) -> None:
+        """Register a namespace whose elements are shared by all models.
+
+        Args:
+            namespace (str): The namespace URN with its version, e.g. "urn:samm:org.example.shared:1.0.0".
+        """
+        with cls._lock:
+            cls._namespaces.add(namespace.rstrip("#"))
+
+    @classmethod
+    def unregister_namespace(cls, namespace: str) -> None:
+        """Stop sharing the elements of a namespace and drop its elements from the store.
+
+        Args:
+            namespace (str): The namespace URN with its version.
+        """
+        namespace = namespace.rstrip("#")
+        with cls._lock:
+            cls._namespaces.discard(namespace)
+            for urn in [urn for urn in cls._elements if cls._get_namespace(urn) == namespace]:
+                del cls._elements[urn]
+
+    @classmethod
+    def is_shared(cls, urn: Optional[str]) -> bool:
+        """Check if an element URN belongs to a shared namespace.
+
+        Args:
+            urn (Optional[str]): The element URN.
+        """
+        return urn is not None and cls._get_namespace(urn) in cls._namespaces
+
+    @classmethod
+    def get(cls, urn: str) -> Optional[Base]:
+        """Get an instantiated element of a shared namespace.
+
+        Args:
+            urn (str): The element URN.
+
+        Returns:
+            Optional[Base]: The shared element or None if it has not been instantiated yet.
+        """
+        return cls._elements.get(urn)
+
+    @classmethod
+    def add(cls, model_element: Base) -> Base:
+        """Add an instantiated element to the store if it belongs to a shared namespace.
+
+        Args:
+            model_element (Base): The instantiated element.
+
+        Returns:
+            Base: The shared element, which is the given one unless the element has been added before.
+        """
+        if not cls.is_shared(model_element.urn):
+            return model_element
+
+        with cls._lock:
+            shared_element = cls._elements.setdefault(model_element.urn, model_element)  # type: ignore
+            if not getattr(shared_element, "_shared", True):
+                shared_element._shared = True  # type: ignore
+
+        return shared_element
+
+    @classmethod
+    def freeze(cls, model_elements: Iterable[Base]) -> None:
+        """Freeze the given elements which are stored as shared elements.
+
+        Args:
+            model_elements (Iterable[Base]): The elements of a completely instantiated model.
+        """
+        with cls._lock:
+            for model_element in model_elements:
+                shared_element = cls._elements.get(model_element.urn)  # type: ignore
+                if shared_element is model_element and not getattr(model_element, "_frozen", True):
+                    object.__setattr__(model_element, "_frozen", True)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all elements from the store, keeping the registered namespaces."""
+        with cls._lock:
+            cls._elements.clear()
+
+    @classmethod
+    @contextmanager
+    def collect_parent_links(cls, parent_links: Dict[str, List[Base]]) -> Iterator[Dict[str, List[Base]]]:
+        """Collect the parent links to shared elements from the elements of other namespaces.
+
+        Args:
+            parent_links (Dict[str, List[Base]]): The mapping of shared element URNs to their parent elements.
+        """
+        token = _parent_links.set(parent_links)
+        try:
+            yield parent_links
+        finally:
+            _parent_links.reset(token)
+
+    @classmethod
+    def get_parent_links(cls) -> Optional[Dict[str, List[Base]]]:
+        """Get the parent links collected for the model instantiated in the current context, if any."""
+        return _parent_links.get()
+
+    @classmethod
+    def record_parent_link(cls, model_element: Base, parent: Base) -> bool:
+        """Record the parent link to a shared element for the model instantiated in the current context.
+
+        Links from elements of shared namespaces are kept by the shared element itself until it is frozen, later ones
+        are collected like the others. Without a running collection a link to a shared element is dropped, as the
+        shared element must not be modified.
+
+        Args:
+            model_element (Base): The shared element.
+            parent (Base): The parent element.
+
+        Returns:
+            bool: True if the link must not be stored on the shared element.
+        """
+        if cls.is_shared(parent.urn) and not getattr(model_element, "_frozen", False):
+            return False
+
+        parent_links = _parent_links.get()
+        if parent_links is not None:
+            parent_links.setdefault(model_element.urn, []).append(parent)  # type: ignore
+
+        return True
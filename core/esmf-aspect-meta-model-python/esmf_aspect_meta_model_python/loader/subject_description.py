@@ -0,0 +1,89 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import rdflib
+
+from rdflib.term import Node
+
+
+class SubjectDescription:
+    """All (predicate, object) pairs of one subject of the aspect graph.
+
+    The pairs are read with a single triples((subject, None, None)) scan, so that the lookups of the attributes of
+    a model element do not each run a triple pattern search on the graph. The objects of each predicate keep the
+    order in which the graph reports them, so value() returns the same object as rdflib.Graph.value().
+    """
+
+    __slots__ = ("subject", "_objects")
+
+    def __init__(self, subject: Optional[Node], objects: Dict[Node, Tuple[Node, ...]]):
+        self.subject = subject
+        self._objects = objects
+
+    @classmethod
+    def from_graph(cls, subject: Optional[Node], aspect_graph: rdflib.Graph) -> "SubjectDescription":
+        """Reads the description of a subject from the graph.
+
+        Args:
+            subject (Optional[Node]): The subject node. None gives an empty description.
+            aspect_graph (rdflib.Graph): The graph containing the subject.
+
+        Returns:
+            SubjectDescription: The description of the subject.
+        """
+        objects: Dict[Node, List[Node]] = {}
+        if subject is not None:
+            for _, predicate, obj in aspect_graph.triples((subject, None, None)):
+                objects.setdefault(predicate, []).append(obj)
+
+        return cls(subject, {predicate: tuple(values) for predicate, values in objects.items()})
+
+    def value(self, predicate: Node, default: Optional[Node] = None) -> Optional[Node]:
+        """Gets the first object of a predicate.
+
+        Args:
+            predicate (Node): The predicate.
+            default (Optional[Node]): The value returned if the subject has no such predicate.
+
+        Returns:
+            Optional[Node]: The object, or the default value.
+        """
+        objects = self._objects.get(predicate)
+
+        return objects[0] if objects else default
+
+    def objects(self, predicate: Node) -> Tuple[Node, ...]:
+        """Gets all objects of a predicate.
+
+        Args:
+            predicate (Node): The predicate.
+
+        Returns:
+            Tuple[Node, ...]: The objects, empty if the subject has no such predicate.
+        """
+        return self._objects.get(predicate, ())
+
+    def predicate_objects(self) -> Iterator[Tuple[Node, Node]]:
+        """Yields all (predicate, object) pairs of the subject."""
+        for predicate, objects in self._objects.items():
+            for obj in objects:
+                yield predicate, obj
+
+    def __contains__(self, predicate: object) -> bool:
+        return predicate in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __repr__(self) -> str:
+        return f"SubjectDescription(subject={self.subject!r}, predicates={len(self._objects)})"
@@ -16,6 +16,7 @@ from typing import Union
 import esmf_aspect_meta_model_python.constants as const
 
 from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
+from esmf_aspect_meta_model_python.resolver.resolution_report import ResolutionReport
 from esmf_aspect_meta_model_python.samm_meta_model import SammUnitsGraph
 
 
@@ -37,6 +38,7 @@ class ResolverInterface(ABC):
         self.graph = AdaptiveGraph()
         self.samm_graph = None
         self.samm_version = const.SAMM_VERSION
+        self.resolution_report = ResolutionReport()
 
     @abstractmethod
     def read(self, input_data: Union[str, Path]):
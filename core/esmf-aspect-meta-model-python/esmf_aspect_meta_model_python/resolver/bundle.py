@@ -0,0 +1,233 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+"""Precompiled single-file aspect model bundles.
+
+A bundle contains the triples of an aspect model file, the triples of its whole dependency closure and the subset of
+the SAMM meta-model referenced by them, each encoded as a graph snapshot. The layout is:
+
+    MAGIC | header length | JSON header | padding | model snapshot | padding | dependencies snapshot | padding |
+    meta-model snapshot
+
+The header carries the SAMM version, the files of the dependency closure and the offsets of the snapshots relative
+to the end of the padded header. The aspect model file and its dependencies are kept apart, so that the bundle is read
+into the same graph layers as the model files. A bundle is read through a memory-mapped file and never touches the
+models root.
+"""
+
+import json
+import mmap
+import struct
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from rdflib import BNode, Graph, URIRef
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python import graph_snapshot, utils
+from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.layered_graph import LayeredGraph
+from esmf_aspect_meta_model_python.resolver.base import ResolverInterface
+from esmf_aspect_meta_model_python.resolver.local_file import LocalFileResolver
+from esmf_aspect_meta_model_python.resolver.meta_model_store import MetaModelStore, ReadOnlyGraph
+
+MAGIC = b"ESMFBD02"
+FORMAT_VERSION = 2
+
+_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+
+
+def _pad(offset: int) -> int:
+    """Get the number of padding bytes up to the next aligned offset."""
+    return -offset % _ALIGNMENT
+
+
+def get_meta_model_subset(model_graph: Graph, samm_graph: Graph) -> Iterator[Tuple[Node, Node, Node]]:
+    """Get the triples of the SAMM graph describing the nodes referenced by the model graph.
+
+    Starting with all URIs of the model graph, the triples of each node are collected, and the URIs and blank nodes
+    they refer to are followed in turn.
+
+    :param model_graph: graph with the aspect model and its dependencies
+    :param samm_graph: graph with the SAMM meta-model
+    :return: triples of the referenced meta-model subset
+    """
+    pending: List[Node] = list({term for triple in model_graph for term in triple if isinstance(term, URIRef)})
+    visited: Set[Node] = set()
+
+    while pending:
+        node = pending.pop()
+        if node in visited:
+            continue
+
+        visited.add(node)
+        for triple in samm_graph.triples((node, None, None)):  # type: ignore[arg-type]
+            yield triple
+            pending.extend(term for term in triple[1:] if isinstance(term, (URIRef, BNode)) and term not in visited)
+
+
+def compile_bundle(
+    aspect_file: Union[str, Path],
+    bundle_path: Union[str, Path],
+    **resolver_options: Any,
+) -> Dict[str, Any]:
+    """Compile an aspect model file with all its dependencies into a bundle file.
+
+    :param aspect_file: path to the aspect model file in a models root
+    :param bundle_path: path to the bundle file to write
+    :param resolver_options: options of the LocalFileResolver used to resolve the dependencies, e.g. lazy=True
+    :return: header of the written bundle
+    """
+    resolver = LocalFileResolver(**resolver_options)
+    aspect_graph = resolver.read(aspect_file)
+    model_graph = LayeredGraph(aspect_graph, samm_version=aspect_graph.samm_version)
+    resolver.prepare_aspect_model(model_graph)
+    dependencies_graph = model_graph.layers[0]
+
+    samm_graph = MetaModelStore.get_graph(model_graph.samm_version)
+    snapshots = {
+        "model": graph_snapshot.encode_graph(aspect_graph),
+        "dependencies": graph_snapshot.encode_triples(
+            (triple for triple in dependencies_graph if triple not in aspect_graph),
+            dependencies_graph.namespaces(),
+        ),
+        "meta_model": graph_snapshot.encode_triples(get_meta_model_subset(model_graph, samm_graph)),
+    }
+
+    sections = {}
+    parts = []
+    offset = 0
+    for section, snapshot in snapshots.items():
+        sections[section] = [offset, len(snapshot)]
+        parts += [snapshot, b"\0" * _pad(len(snapshot))]
+        offset += len(snapshot) + _pad(len(snapshot))
+
+    header = {
+        "format": FORMAT_VERSION,
+        "samm_version": model_graph.samm_version,
+        "aspect_file": Path(aspect_file).name,
+        "files": sorted(resolver.resolution_report.files),
+        "sections": sections,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_end = len(MAGIC) + _LENGTH.size + len(header_bytes)
+
+    parts = [MAGIC, _LENGTH.pack(len(header_bytes)), header_bytes, b"\0" * _pad(header_end)] + parts
+    utils.write_file_atomically(bundle_path, b"".join(parts))
+
+    return header
+
+
+def _read_header(buffer: memoryview) -> Tuple[Dict[str, Any], int]:
+    """Read the bundle header and return it with the offset of the snapshots."""
+    if bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise ValueError("The data is not an aspect model bundle or has an unsupported format version.")
+
+    offset = len(MAGIC)
+    (header_length,) = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    header_end = offset + header_length
+    header = json.loads(bytes(buffer[offset:header_end]).decode("utf-8"))
+
+    return header, header_end + _pad(header_end)
+
+
+def is_bundle(file_path: Union[str, Path]) -> bool:
+    """Check if a file is an aspect model bundle.
+
+    :param file_path: path to the file
+    """
+    try:
+        with open(file_path, "rb") as bundle_file:
+            return bundle_file.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def read_bundle(
+    bundle_path: Union[str, Path],
+    model_graph: Graph,
+    meta_model_graph: Graph,
+    dependencies_graph: Optional[Graph] = None,
+) -> Dict[str, Any]:
+    """Load the model, dependency and meta-model triples of a bundle file using a memory-mapped read.
+
+    :param bundle_path: path to the bundle file
+    :param model_graph: graph to populate with the aspect model file
+    :param meta_model_graph: graph to populate with the meta-model subset
+    :param dependencies_graph: graph to populate with the dependency closure, defaults to the model graph
+    :return: header of the bundle
+    """
+    graphs = (
+        ("model", model_graph),
+        ("dependencies", model_graph if dependencies_graph is None else dependencies_graph),
+        ("meta_model", meta_model_graph),
+    )
+    with open(bundle_path, "rb") as bundle_file:
+        with mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as buffer:
+                header, data_start = _read_header(buffer)
+
+                for section, graph in graphs:
+                    offset, length = header["sections"][section]
+                    section_start = data_start + offset
+                    section_end = section_start + length
+                    with buffer[section_start:section_end] as section_buffer:
+                        graph_snapshot.decode_into(section_buffer, graph)
+
+    return header
+
+
+class BundleResolver(ResolverInterface):
+    """Precompiled aspect model bundle resolver.
+
+    The bundle already contains the whole dependency closure and the referenced SAMM meta-model subset, so no model
+    files are resolved and the meta-model files are not loaded. Like for the model files, the graph read contains
+    the aspect model file only, and its dependencies are added by prepare_aspect_model.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.dependencies_graph = Graph()
+
+    def read(self, bundle_path: Union[str, Path]) -> AdaptiveGraph:
+        """Read the RDF graphs stored in a bundle file.
+
+        :param bundle_path: path to the bundle file
+        :return: graph with the aspect model file
+        """
+        self.graph = AdaptiveGraph()
+        self.dependencies_graph = Graph()
+        meta_model_graph = ReadOnlyGraph()
+        header = read_bundle(bundle_path, self.graph, meta_model_graph, self.dependencies_graph)
+
+        if header["samm_version"] != SAMM_VERSION:
+            raise ValueError(
+                f"The bundle {bundle_path} is compiled for SAMM {header['samm_version']}, "
+                f"but SAMM {SAMM_VERSION} is required. Compile the bundle again."
+            )
+
+        self.samm_graph = meta_model_graph.freeze()
+
+        return self.graph
+
+    def prepare_aspect_model(self, graph: AdaptiveGraph):
+        """Add the dependency closure of the bundle to the graph.
+
+        :param graph: graph with the aspect model, e.g. a layered view with an own layer for the dependencies
+        """
+        graph.addN((subject, predicate, value, graph) for subject, predicate, value in self.dependencies_graph)
+        for prefix, namespace in self.dependencies_graph.namespaces():
+            graph.bind(prefix, namespace)
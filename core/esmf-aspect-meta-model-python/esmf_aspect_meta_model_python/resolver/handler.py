@@ -12,9 +12,10 @@
 import os
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from esmf_aspect_meta_model_python.resolver.base import ResolverInterface
+from esmf_aspect_meta_model_python.resolver.bundle import BundleResolver, is_bundle
 from esmf_aspect_meta_model_python.resolver.data_string import DataStringResolver
 from esmf_aspect_meta_model_python.resolver.local_file import LocalFileResolver
 
@@ -29,8 +30,8 @@ class InputHandler:
 
     Attributes:
         input_data (str): The initial input data which can be a path or a direct graph description.
-        input_type (Optional[str]): Type of input data provided, could be 'file' for file path and
-        'string' for direct data.
+        input_type (Optional[str]): Type of input data provided, could be 'file' for file path,
+        'string' for direct data and 'bundle' for a precompiled aspect model bundle.
 
     Methods:
         get_reader(): Returns the appropriate reader for the input type.
@@ -42,8 +43,9 @@ class InputHandler:
 
     DATA_STRING = "data_string"
     FILE_PATH_TYPE = "file_path"
+    BUNDLE_TYPE = "bundle"
 
-    def __init__(self, input_data: Union[str, Path], input_type: Optional[str] = None):
+    def __init__(self, input_data: Union[str, Path], input_type: Optional[str] = None, **file_resolver_options: Any):
         """
         Initializes the InputHandler with provided input data and optional input type.
 
@@ -51,9 +53,12 @@ class InputHandler:
             input_data (str): A string which is either the path to the RDF file or the string of RDF data.
             input_type (Optional[str]): Optional string indicating type of input ('file' or 'string').
                 If None, the type is guessed.
+            **file_resolver_options: Options of the LocalFileResolver, e.g. parallel=True.
+                They are ignored for the other input types.
         """
         self.input_data = input_data
         self.input_type = input_type if input_type else self.guess_input_type(input_data)
+        self.file_resolver_options = file_resolver_options
 
     def get_reader(self) -> ResolverInterface:
         """
@@ -71,9 +76,11 @@ class InputHandler:
         reader: Optional[ResolverInterface] = None
 
         if self.input_type == self.FILE_PATH_TYPE:
-            reader = LocalFileResolver()
+            reader = LocalFileResolver(**self.file_resolver_options)
         elif self.input_type == self.DATA_STRING:
             reader = DataStringResolver()
+        elif self.input_type == self.BUNDLE_TYPE:
+            reader = BundleResolver()
 
         if not reader:
             raise ValueError("Unknown input type")
@@ -88,13 +95,13 @@ class InputHandler:
             input_str (str): The input string to type-check.
 
         Returns:
-            str: Guessed input type ('file' or 'string').
+            str: Guessed input type ('bundle', 'file' or 'string').
         """
         if isinstance(input_str, Path):
             input_str = str(input_str)
 
         if not self.contains_newline(input_str) and os.path.isfile(input_str):
-            return self.FILE_PATH_TYPE
+            return self.BUNDLE_TYPE if is_bundle(input_str) else self.FILE_PATH_TYPE
         return self.DATA_STRING
 
     @staticmethod
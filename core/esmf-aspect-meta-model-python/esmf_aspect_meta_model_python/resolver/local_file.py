@@ -9,22 +9,75 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+import re
+import time
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from os.path import exists, join
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from rdflib import Graph, URIRef
 
+from esmf_aspect_meta_model_python import graph_snapshot, utils
 from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
-from esmf_aspect_meta_model_python.constants import SAMM_NAMESPACE_PREFIX, SAMM_ORG_IDENTIFIER
 from esmf_aspect_meta_model_python.resolver.base import ResolverInterface
+from esmf_aspect_meta_model_python.resolver.resolution_report import ResolutionReport
+
+if TYPE_CHECKING:
+    from esmf_aspect_meta_model_python.resolver.model_index import ModelIndex
+
+_LOCAL_NAME_PATTERN = re.compile(rb"[:#]([\w-]+)")
+
+
+def _encode_dependency_file(file_path: str, samm_version: str) -> Tuple[bytes, float, int, str, List[str]]:
+    """Parse a dependency file in a worker process.
+
+    :param file_path: path to the turtle file
+    :param samm_version: SAMM version of the aspect model
+    :return snapshot: the triples and prefixes of the file encoded as a graph snapshot
+    :return seconds: time spent parsing the file
+    :return triple_count: number of triples in the file
+    :return digest: digest of the file content taken before parsing
+    :return dependency_folders: dependency folders of the namespaces of the file
+    """
+    digest = utils.get_file_digest(file_path)
+    start = time.perf_counter()
+    graph = AdaptiveGraph(samm_version)
+    graph.parse(source=file_path, format="turtle")
+    seconds = time.perf_counter() - start
+    dependency_folders = LocalFileResolver._get_namespace_folders(file_path, graph.namespace_manager.namespaces())
+
+    return graph_snapshot.encode_graph(graph), seconds, len(graph), digest, dependency_folders
 
 
 class LocalFileResolver(ResolverInterface):
     """Local storage aspect model file resolver."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        lazy: bool = False,
+        model_index: Optional["ModelIndex"] = None,
+    ):
+        """Initialize the resolver.
+
+        :param parallel: parse the dependency files in a pool of worker processes
+        :param max_workers: maximal number of worker processes, defaults to the number of CPUs
+        :param lazy: parse only the dependency files defining the URNs referenced by the aspect model instead of
+            all files of the referenced namespace folders, takes precedence over parallel
+        :param model_index: index of the models root used to find the files defining the URNs in the lazy mode
+        """
         super().__init__()
 
-        self.file_path = None
+        self.file_path: Any = None
+        self.aspect_graph: Optional[AdaptiveGraph] = None
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.lazy = lazy
+        self.model_index = model_index
 
     @staticmethod
     def validate_file(file_path: Union[str, Path]):
@@ -48,11 +101,16 @@ class LocalFileResolver(ResolverInterface):
         Returns:
             RDFGraph: An object representing the RDF graph constructed from the input data.
         """
-        self.file_path = file_path
+        self.file_path = str(file_path)
 
         self.validate_file(self.file_path)
-        self.graph = AdaptiveGraph()
+        self.resolution_report = ResolutionReport()
+
+        digest = utils.get_file_digest(self.file_path)
+        start = time.perf_counter()
+        self.graph = self.aspect_graph = AdaptiveGraph()
         self.graph.parse(source=self.file_path)
+        self.resolution_report.add_file(self.file_path, time.perf_counter() - start, len(self.graph), digest)
 
         return self.graph
 
@@ -64,34 +122,32 @@ class LocalFileResolver(ResolverInterface):
         :return namespace_specific_str: dir of the namespace
         :return version: version of the model
         """
-        namespace_specific_str = None
-        version = None
+        return utils.parse_namespace(prefix_namespace)
 
-        namespace_info = prefix_namespace.split(":")
-        if len(namespace_info) == 4:
-            urn, namespace_id, namespace_specific_str, version = namespace_info
+    def _get_dirs_for_advanced_loading(self, file_path: str, graph: Optional[Graph] = None) -> List[str]:
+        """Get directories from graph namespaces for advanced loading.
 
-            if urn == "urn" and namespace_id == SAMM_NAMESPACE_PREFIX:
-                if namespace_specific_str == SAMM_ORG_IDENTIFIER:
-                    namespace_specific_str = None
-                    version = None
-                else:
-                    version = version.replace("#", "")
+        :param file_path: str path to the main file
+        :param graph: graph to take the namespaces from, defaults to the whole aspect model graph
+        :return: list of str path for further advanced files loading
+        """
+        namespaces = (self.graph if graph is None else graph).namespace_manager.namespaces()
 
-        return namespace_specific_str, version
+        return self._get_namespace_folders(file_path, namespaces)
 
-    def _get_dirs_for_advanced_loading(self, file_path: str) -> List[str]:
-        """Get directories from graph namespaces for advanced loading.
+    @staticmethod
+    def _get_namespace_folders(file_path: str, namespaces: Iterable[Tuple[str, URIRef]]) -> List[str]:
+        """Get the folders of the aspect model namespaces next to a model file.
 
-        :param file_path: str path to the main file
+        :param file_path: path to the model file
+        :param namespaces: prefixes and namespaces bound in the graph of the file
         :return: list of str path for further advanced files loading
         """
         paths_for_advanced_loading = []
         base_path = Path(file_path).parents[2]
 
-        namespaces = self.graph.namespace_manager.namespaces()
         for prefix, namespace in namespaces:
-            namespace_specific_str, version = self._parse_namespace(namespace)
+            namespace_specific_str, version = LocalFileResolver._parse_namespace(namespace)
             if namespace_specific_str and version:
                 paths_for_advanced_loading.append(join(base_path, namespace_specific_str, version))
 
@@ -103,10 +159,11 @@ class LocalFileResolver(ResolverInterface):
         :param file_path: path to the model file
         :return: list of dependency folders
         """
-        if file_path != self.file_path:
-            self.graph.parse(source=file_path, format="turtle")
+        if file_path == self.file_path:
+            return self._get_dirs_for_advanced_loading(file_path)
 
-        dependency_folders = self._get_dirs_for_advanced_loading(file_path)
+        file_graph = self._parse_dependency_file(file_path)
+        dependency_folders = self._get_dirs_for_advanced_loading(file_path, file_graph)
 
         return dependency_folders
 
@@ -127,6 +184,23 @@ class LocalFileResolver(ResolverInterface):
 
         return additional_files
 
+    def _scan_folders(self, folder_dependencies: Dict[str, List[str]], folders: List[str]) -> List[str]:
+        """Scan the dependency folders which have not been scanned yet.
+
+        :param folder_dependencies: dict with dependency by folder name
+        :param folders: dependency folders
+        :return: turtle files of the newly scanned folders
+        """
+        new_files = []
+        for folder in folders:
+            if folder not in folder_dependencies:
+                listing = utils.get_folder_listing(folder)
+                folder_dependencies[folder] = self._get_additional_files_from_dir(folder)
+                self.resolution_report.add_folder(folder, len(folder_dependencies[folder]), listing)
+                new_files.extend(folder_dependencies[folder])
+
+        return new_files
+
     def _get_dependency_files(
         self,
         file_dependencies: Dict[str, List[str]],
@@ -135,37 +209,261 @@ class LocalFileResolver(ResolverInterface):
     ) -> Dict[str, List[str]]:
         """Get dependency files with folder dependencies.
 
+        The files are resolved from a worklist: each file is parsed once, and each dependency folder is scanned once
+        when it is first referenced, adding its files to the worklist.
+
+        :param file_dependencies: dict with dependency by file name
+        :param folder_dependencies: dict with dependency by folder name
+        :param file_path: path to the base file
+        :return: collected dependencies for the files by their names
+        """
+        worklist = deque([file_path])
+        queued_files = {file_path}
+
+        while worklist:
+            current_file = worklist.popleft()
+            try:
+                file_dependencies[current_file] = self._get_dependency_folders(current_file)
+            except Exception as error:
+                if current_file != file_path:
+                    print(f"Could not parse file {current_file}\nError: {error}")
+                raise
+
+            for new_file in self._scan_folders(folder_dependencies, file_dependencies[current_file]):
+                if new_file not in queued_files and new_file not in file_dependencies:
+                    queued_files.add(new_file)
+                    worklist.append(new_file)
+
+        return file_dependencies
+
+    def _parse_dependency_files_parallel(
+        self,
+        executor: ProcessPoolExecutor,
+        file_paths: List[str],
+    ) -> Dict[str, List[str]]:
+        """Parse dependency files in worker processes and merge their triples into the graph.
+
+        :param executor: pool of worker processes
+        :param file_paths: paths to the dependency files
+        :return: dependency folders of the namespaces of each file, by file name
+        """
+        futures = {
+            file_path: executor.submit(_encode_dependency_file, file_path, self.graph.samm_version)
+            for file_path in file_paths
+        }
+        file_dependencies = {}
+
+        for file_path, future in futures.items():
+            try:
+                snapshot, seconds, triple_count, digest, dependency_folders = future.result()
+                graph_snapshot.decode_into(snapshot, self.graph)
+                self.resolution_report.add_file(file_path, seconds, triple_count, digest)
+                file_dependencies[file_path] = dependency_folders
+            except Exception as error:
+                print(f"Could not parse file {file_path}\nError: {error}")
+                raise
+
+        return file_dependencies
+
+    def _get_dependency_files_parallel(
+        self,
+        file_dependencies: Dict[str, List[str]],
+        folder_dependencies: Dict[str, List[str]],
+        file_path: str,
+    ) -> Dict[str, List[str]]:
+        """Get dependency files with folder dependencies, parsing each level of new files in parallel.
+
+        The namespaces are discovered in the same way as by _get_dependency_files, but all files found in the
+        dependency folders of one level are parsed at once by a pool of worker processes. Each worker returns the
+        dependency folders of the namespaces of its file, so the dependencies are the same as in sequential mode.
+
         :param file_dependencies: dict with dependency by file name
         :param folder_dependencies: dict with dependency by folder name
         :param file_path: path to the base file
-        :return: collected dependencies for the file by its name
+        :return: collected dependencies for the files by their names
         """
+        new_files = [file_path]
         file_dependencies[file_path] = self._get_dependency_folders(file_path)
-        for folder in file_dependencies[file_path]:
-            if folder not in folder_dependencies:
-                folder_dependencies[folder] = self._get_additional_files_from_dir(folder)
 
-        files = set()
-        for tmp in folder_dependencies.values():
-            files.update(tmp)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            while new_files:
+                level_folders = [folder for new_file in new_files for folder in file_dependencies[new_file]]
+                new_files = sorted(
+                    {
+                        folder_file
+                        for folder_file in self._scan_folders(folder_dependencies, level_folders)
+                        if folder_file not in file_dependencies
+                    }
+                )
+                file_dependencies.update(self._parse_dependency_files_parallel(executor, new_files))
+
+        return file_dependencies
+
+    @staticmethod
+    def _mentions(file_path: str, name: str) -> bool:
+        """Check if the text of a turtle file contains the local name of an element.
+
+        :param file_path: path to the turtle file
+        :param name: local name of the element
+        """
+        pattern = re.compile(rb"[:#]" + re.escape(name.encode("utf-8")) + rb"(?![\w-])")
+
+        return pattern.search(Path(file_path).read_bytes()) is not None
+
+    @staticmethod
+    def _get_mentioned_names(file_path: str) -> Set[str]:
+        """Get the local names of the elements mentioned in the text of a turtle file.
+
+        :param file_path: path to the turtle file
+        :return: words following a colon or a hash sign
+        """
+        return {name.decode("ascii") for name in _LOCAL_NAME_PATTERN.findall(Path(file_path).read_bytes())}
+
+    def _get_files_by_name(
+        self,
+        names_by_folder: Dict[str, Dict[str, List[str]]],
+        folder: str,
+        folder_files: List[str],
+    ) -> Dict[str, List[str]]:
+        """Get the files of a namespace folder by the local names they mention, reading each file once.
+
+        :param names_by_folder: dict with the files by local name by folder name, filled during one resolution
+        :param folder: namespace folder
+        :param folder_files: turtle files of the folder
+        :return: files of the folder by local name
+        """
+        files_by_name = names_by_folder.get(folder)
+        if files_by_name is None:
+            files_by_name = names_by_folder[folder] = {}
+            for file_path in folder_files:
+                for name in self._get_mentioned_names(file_path):
+                    files_by_name.setdefault(name, []).append(file_path)
+
+        return files_by_name
+
+    def _get_definition_candidates(
+        self,
+        folder_dependencies: Dict[str, List[str]],
+        names_by_folder: Dict[str, Dict[str, List[str]]],
+        base_path: Path,
+        urn: URIRef,
+    ) -> Iterator[str]:
+        """Get the files which may define an element.
+
+        The files defining the element according to the model index are tried first. After that, the file of the
+        namespace folder named after the element is tried, as the SAMM convention is one file per aspect model element.
+        At last, only the files of the namespace folder whose text mentions the local name of the element are tried.
+        The files of a folder are read once per resolution to find the names they mention.
+
+        :param folder_dependencies: dict with dependency by folder name
+        :param names_by_folder: dict with the files by local name by folder name
+        :param base_path: path to the models root
+        :param urn: URN of the element
+        :return: paths to the candidate files
+        """
+        if self.model_index is not None:
+            yield from (str(file_path) for file_path in self.model_index.find_definition_files(urn))
+
+        namespace_specific_str, version, name = utils.split_urn(urn)
+        folder = join(base_path, namespace_specific_str, version)  # type: ignore[arg-type]
+        self._scan_folders(folder_dependencies, [folder])
+
+        folder_files = folder_dependencies[folder]
+        conventional_files = [file_path for file_path in folder_files if Path(file_path).stem == name]
+        yield from conventional_files
+
+        if _LOCAL_NAME_PATTERN.fullmatch(f"#{name}".encode("utf-8")):
+            mentioning_files = self._get_files_by_name(names_by_folder, folder, folder_files).get(name, [])
+        else:
+            mentioning_files = [file_path for file_path in folder_files if self._mentions(file_path, name)]
+
+        for file_path in mentioning_files:
+            if file_path not in conventional_files:
+                yield file_path
+
+    def _parse_dependency_file(self, file_path: str) -> Graph:
+        """Parse a dependency file and merge its triples and prefixes into the graph.
+
+        :param file_path: path to the turtle file
+        :return: graph with the triples of the file only
+        """
+        digest = utils.get_file_digest(file_path)
+        start = time.perf_counter()
+        file_graph = AdaptiveGraph(self.graph.samm_version)
+        file_graph.parse(source=file_path, format="turtle")
+        self.resolution_report.add_file(file_path, time.perf_counter() - start, len(file_graph), digest)
+
+        self.graph.addN((subject, predicate, value, self.graph) for subject, predicate, value in file_graph)
+        for prefix, namespace in file_graph.namespaces():
+            self.graph.bind(prefix, namespace)
+
+        return file_graph
+
+    def _get_dependency_files_lazy(
+        self,
+        folder_dependencies: Dict[str, List[str]],
+        file_path: str,
+    ) -> Dict[str, List[str]]:
+        """Get only the dependency files defining the URNs referenced by the aspect model.
+
+        Every URN referenced by the aspect model file which is not defined yet is looked up in its namespace folder.
+        The files defining new URNs are parsed, and their references are resolved in turn until the closure is
+        complete. URNs which are not defined in any file of their folder are left unresolved. Only the graph of the
+        aspect model file is scanned, not the whole target graph, which may be layered over the SAMM meta-model.
 
-        for file_path in files:
-            if file_path not in file_dependencies:
+        :param folder_dependencies: dict with dependency by folder name
+        :param file_path: path to the base file
+        :return: parsed files with the URNs they were parsed for
+        """
+        base_path = Path(file_path).parents[2]
+        file_dependencies: Dict[str, List[str]] = {}
+        names_by_folder: Dict[str, Dict[str, List[str]]] = {}
+        parsed_files = {str(Path(file_path).resolve())}
+        defined, pending = utils.collect_urns(self.aspect_graph)  # type: ignore[arg-type]
+        pending -= defined
+        unresolved: Set[URIRef] = set()
+
+        while pending:
+            urn = pending.pop()
+            for candidate in self._get_definition_candidates(folder_dependencies, names_by_folder, base_path, urn):
+                candidate_path = str(Path(candidate).resolve())
+                if candidate_path in parsed_files:
+                    continue
+
+                parsed_files.add(candidate_path)
                 try:
-                    self._get_dependency_files(file_dependencies, folder_dependencies, file_path)
+                    file_defined, file_referenced = utils.collect_urns(self._parse_dependency_file(candidate))
                 except Exception as error:
-                    print(f"Could not parse file {file_path}\nError: {error}")
+                    print(f"Could not parse file {candidate}\nError: {error}")
                     raise
 
+                file_dependencies[candidate] = sorted(str(term) for term in file_defined & {urn, *pending})
+                defined |= file_defined
+                pending |= file_referenced - unresolved
+                pending -= defined
+
+                if urn in defined:
+                    break
+            else:
+                unresolved.add(urn)
+
         return file_dependencies
 
-    def prepare_aspect_model(self, graph: AdaptiveGraph):
+    def prepare_aspect_model(self, graph: AdaptiveGraph) -> ResolutionReport:
         """Parse namespaces from the Aspect model.
 
         :param graph: RDF Graph
+        :return: report of the files parsed and the folders scanned
         """
         self.graph = graph
         file_dependencies: Dict[str, List[str]] = {}
         folder_dependencies: Dict[str, List[str]] = {}
 
-        self._get_dependency_files(file_dependencies, folder_dependencies, self.file_path)
+        if self.lazy:
+            self._get_dependency_files_lazy(folder_dependencies, self.file_path)
+        elif self.parallel:
+            self._get_dependency_files_parallel(file_dependencies, folder_dependencies, self.file_path)
+        else:
+            self._get_dependency_files(file_dependencies, folder_dependencies, self.file_path)
+
+        return self.resolution_report
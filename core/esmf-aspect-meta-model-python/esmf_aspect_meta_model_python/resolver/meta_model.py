@@ -9,23 +9,48 @@
 #
 #   SPDX-License-Identifier: MPL-2.0
 
+import hashlib
+import logging
+
 from glob import glob
-from os.path import exists, join
+from os.path import exists, join, relpath
 from pathlib import Path
-from typing import List
+from string import Template
+from typing import Dict, List, Optional, Tuple, Union
 
 from rdflib import Graph
 
+from esmf_aspect_meta_model_python import graph_snapshot, utils
 from esmf_aspect_meta_model_python.vocabulary import SAMM, SAMMC, SAMME, UNIT
 
+_logger = logging.getLogger(__name__)
+
 
 class AspectMetaModelResolver:
     """SAMM meta-model resolver class."""
 
     samm_folder_path = join("esmf_aspect_meta_model_python", "samm_aspect_meta_model", "samm")
-
-    def __init__(self, base_path: str = ""):
+    SNAPSHOT_FORMAT_VERSION = 1
+    SNAPSHOT_FILE_NAME = Template("samm-meta-model-$version-$fingerprint.bin")
+
+    _file_hashes: Dict[str, Tuple[int, int, str]] = {}
+
+    def __init__(
+        self,
+        base_path: str = "",
+        use_snapshot: Optional[bool] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the resolver.
+
+        :param base_path: path to the folder containing the SAMM meta-model package folder
+        :param use_snapshot: load the meta-model from a compiled binary snapshot instead of the Turtle files,
+            defaults to True unless the persistent loader caches are disabled with an environment variable
+        :param cache_dir: folder for the compiled snapshots, defaults to the loader cache directory
+        """
         self._base_path = base_path if base_path else str(Path(__file__).parents[2])
+        self._use_snapshot = utils.is_cache_enabled() if use_snapshot is None else use_snapshot
+        self._cache_dir = Path(cache_dir) if cache_dir else utils.get_cache_dir()
 
     def _get_samm_files_path(self, meta_model_version: str) -> List[str]:
         """Collect all SAMM files.
@@ -60,13 +85,116 @@ class AspectMetaModelResolver:
             - entity
             - unit
 
+        If snapshots are enabled, the parsed files are compiled once into a binary snapshot keyed by the SAMM version
+        and the hashes of the source files. Later calls load the snapshot instead of parsing the Turtle files again.
+        A change of any source file produces a new key, so an outdated snapshot is never used.
+
         :param rdf_graph: RDF graph
         :param meta_model_version: version of the meta-model to extract the right SAMM turtle files
         """
-        for file_path in self._get_samm_files_path(meta_model_version):
+        samm_files = self._get_samm_files_path(meta_model_version)
+        for file_path in samm_files:
             self.validate_file(file_path)
+
+        if not self._use_snapshot or not samm_files:
+            self._parse_files(rdf_graph, samm_files)
+            return
+
+        snapshot_path = self.get_snapshot_path(samm_files, meta_model_version)
+        if not self._load_snapshot(rdf_graph, snapshot_path):
+            meta_model_graph = Graph()
+            self._parse_files(meta_model_graph, samm_files)
+
+            data = graph_snapshot.encode_graph(meta_model_graph, {"samm_version": meta_model_version})
+            self._write_snapshot(snapshot_path, data, meta_model_version)
+            graph_snapshot.decode_into(data, rdf_graph)
+
+    @staticmethod
+    def _parse_files(rdf_graph: Graph, samm_files: List[str]):
+        """Parse the SAMM turtle files into the graph.
+
+        :param rdf_graph: RDF graph
+        :param samm_files: paths to the SAMM turtle files
+        """
+        for file_path in samm_files:
             rdf_graph.parse(file_path, format="turtle")
 
+    def get_snapshot_path(self, samm_files: List[str], meta_model_version: str) -> Path:
+        """Get the path of the compiled snapshot for the given SAMM files.
+
+        :param samm_files: paths to the SAMM turtle files
+        :param meta_model_version: meta-model version
+        :return: path to the snapshot file named after the SAMM version and the fingerprint of the files
+        """
+        fingerprint = hashlib.sha256(f"{self.SNAPSHOT_FORMAT_VERSION}:{meta_model_version}".encode("utf-8"))
+        samm_folder = join(self._base_path, self.samm_folder_path)
+
+        for file_path in sorted(samm_files):
+            file_hash = self._get_file_hash(file_path)
+            fingerprint.update(f"{relpath(file_path, samm_folder)}:{file_hash}".encode("utf-8"))
+
+        file_name = self.SNAPSHOT_FILE_NAME.substitute(
+            version=meta_model_version,
+            fingerprint=fingerprint.hexdigest()[:16],
+        )
+
+        return self._cache_dir / file_name
+
+    @classmethod
+    def _get_file_hash(cls, file_path: str) -> str:
+        """Get the hash of a SAMM file, recomputed only if its modification time or size has changed.
+
+        :param file_path: path to the SAMM turtle file
+        :return: SHA-256 digest of the file content
+        """
+        file_stat = Path(file_path).stat()
+        known_hash = cls._file_hashes.get(file_path)
+        if known_hash and known_hash[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return known_hash[2]
+
+        file_hash = utils.get_file_digest(file_path)
+        cls._file_hashes[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, file_hash)
+
+        return file_hash
+
+    @staticmethod
+    def _load_snapshot(rdf_graph: Graph, snapshot_path: Path) -> bool:
+        """Load a compiled snapshot into the graph.
+
+        :param rdf_graph: RDF graph
+        :param snapshot_path: path to the snapshot file
+        :return: True if the snapshot was loaded, False if it does not exist or cannot be read
+        """
+        if not snapshot_path.is_file():
+            return False
+
+        try:
+            graph_snapshot.read_snapshot(snapshot_path, rdf_graph)
+        except Exception as error:
+            _logger.warning("Could not read the SAMM meta-model snapshot %s: %s", snapshot_path, error)
+            return False
+
+        return True
+
+    def _write_snapshot(self, snapshot_path: Path, data: bytes, meta_model_version: str):
+        """Write a compiled snapshot and remove outdated snapshots of the same SAMM version.
+
+        The snapshot is an optimization only, so a failing write is logged and otherwise ignored.
+
+        :param snapshot_path: path to the snapshot file
+        :param data: encoded snapshot
+        :param meta_model_version: meta-model version
+        """
+        try:
+            graph_snapshot.write_snapshot(snapshot_path, data)
+
+            outdated_pattern = self.SNAPSHOT_FILE_NAME.substitute(version=meta_model_version, fingerprint="*")
+            for outdated_path in self._cache_dir.glob(outdated_pattern):
+                if outdated_path != snapshot_path:
+                    outdated_path.unlink(missing_ok=True)
+        except OSError as error:
+            _logger.warning("Could not write the SAMM meta-model snapshot %s: %s", snapshot_path, error)
+
     @staticmethod
     def get_samm_prefixes(meta_model_version: str) -> list[str]:
         """Get all SAMM prefix values."""
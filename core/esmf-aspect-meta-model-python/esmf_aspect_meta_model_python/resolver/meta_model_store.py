@@ -0,0 +1,103 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import threading
+
+from typing import Dict, Tuple
+
+from rdflib import Graph
+from rdflib.graph import ModificationException
+
+from esmf_aspect_meta_model_python.resolver.meta_model import AspectMetaModelResolver
+
+
+class ReadOnlyGraph(Graph):
+    """RDF graph which rejects any modification after it has been frozen."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._frozen = False
+
+    @property
+    def frozen(self) -> bool:
+        """Check if the graph is read-only."""
+        return self._frozen
+
+    def freeze(self) -> "ReadOnlyGraph":
+        """Make the graph read-only.
+
+        :return: the graph itself
+        """
+        self._frozen = True
+
+        return self
+
+    def _check_modification(self):
+        """Raise an exception if the graph is frozen."""
+        if self._frozen:
+            raise ModificationException()
+
+    def add(self, triple):
+        """Add a triple if the graph is not frozen."""
+        self._check_modification()
+
+        return super().add(triple)
+
+    def addN(self, quads):
+        """Add a sequence of quads if the graph is not frozen."""
+        self._check_modification()
+
+        return super().addN(quads)
+
+    def remove(self, triple):
+        """Remove a triple if the graph is not frozen."""
+        self._check_modification()
+
+        return super().remove(triple)
+
+
+class MetaModelStore:
+    """Process-wide store of the SAMM meta-model graphs.
+
+    The meta-model graph of each SAMM version is loaded once and shared between all SAMMGraph and SammUnitsGraph
+    instances of the process. The shared graphs are frozen, so that no consumer can change the meta-model data
+    seen by the others.
+    """
+
+    _graphs: Dict[Tuple[str, str], ReadOnlyGraph] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_graph(cls, meta_model_version: str, base_path: str = "") -> ReadOnlyGraph:
+        """Get the shared meta-model graph of a SAMM version.
+
+        :param meta_model_version: version of the meta-model
+        :param base_path: path to the folder containing the SAMM meta-model package folder
+        :return: read-only graph with the SAMM meta-model data
+        """
+        key = (base_path, meta_model_version)
+        graph = cls._graphs.get(key)
+
+        if graph is None:
+            with cls._lock:
+                graph = cls._graphs.get(key)
+                if graph is None:
+                    graph = ReadOnlyGraph()
+                    AspectMetaModelResolver(base_path).parse(graph, meta_model_version)
+                    cls._graphs[key] = graph.freeze()
+
+        return graph
+
+    @classmethod
+    def clear(cls):
+        """Drop all loaded meta-model graphs."""
+        with cls._lock:
+            cls._graphs.clear()
@@ -0,0 +1,176 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import hashlib
+import json
+import logging
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from rdflib import Graph
+
+from esmf_aspect_meta_model_python import utils
+
+_logger = logging.getLogger(__name__)
+
+
+class ModelIndex:
+    """Persistent index of the aspect model element URNs defined and referenced by the files of a models root.
+
+    The models root has the SAMM layout namespace/version/file.ttl. For each file, the index records the URNs of the
+    model elements the file defines and the URNs it references, together with the modification time and the size of
+    the file. An update re-indexes only the new and changed files and drops the deleted ones.
+    """
+
+    FORMAT_VERSION = 1
+    FOLDER_NAME = "model-index"
+
+    def __init__(self, models_root: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """Initialize the index.
+
+        :param models_root: folder with the models in the namespace/version/file.ttl layout
+        :param index_path: path to the index file, defaults to a file in the loader cache directory
+        """
+        self.models_root = Path(models_root).resolve()
+        self.index_path = Path(index_path) if index_path else self._get_default_index_path()
+
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._definitions: Dict[str, List[str]] = {}
+
+    def _get_default_index_path(self) -> Path:
+        """Get the index file in the loader cache directory for the models root."""
+        root_hash = hashlib.sha256(str(self.models_root).encode("utf-8")).hexdigest()[:16]
+
+        return utils.get_cache_dir() / self.FOLDER_NAME / f"{root_hash}.json"
+
+    def load(self) -> "ModelIndex":
+        """Load the index file.
+
+        A missing, unreadable or incompatible index file results in an empty index.
+
+        :return: the index itself
+        """
+        self._files = {}
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+
+        if data.get("format") == self.FORMAT_VERSION and data.get("models_root") == str(self.models_root):
+            self._files = data["files"]
+
+        self._build_definitions()
+
+        return self
+
+    def save(self):
+        """Write the index file atomically."""
+        data = {"format": self.FORMAT_VERSION, "models_root": str(self.models_root), "files": self._files}
+        utils.write_file_atomically(self.index_path, json.dumps(data, sort_keys=True).encode("utf-8"))
+
+    def _build_definitions(self):
+        """Build the lookup of the files by the URNs they define."""
+        self._definitions = {}
+        for relative_path, entry in sorted(self._files.items()):
+            for urn in entry["defines"]:
+                self._definitions.setdefault(urn, []).append(relative_path)
+
+    @staticmethod
+    def _index_file(file_path: Path, file_stat) -> Dict[str, Any]:
+        """Get the index entry of a model file.
+
+        :param file_path: path to the model file
+        :param file_stat: stat result of the file
+        :return: entry with the defined and referenced URNs
+        """
+        graph = Graph()
+        try:
+            graph.parse(source=str(file_path), format="turtle")
+        except Exception as error:
+            _logger.warning("Could not index the file %s: %s", file_path, error)
+            graph = Graph()
+
+        defined, referenced = utils.collect_urns(graph)
+        defined = {urn for urn in defined if utils.split_urn(urn)[0]}
+
+        return {
+            "mtime_ns": file_stat.st_mtime_ns,
+            "size": file_stat.st_size,
+            "defines": sorted(str(urn) for urn in defined),
+            "references": sorted(str(urn) for urn in referenced - defined),
+        }
+
+    def update(self) -> int:
+        """Re-index the new and changed files of the models root and drop the deleted ones.
+
+        The index file is written if anything has changed.
+
+        :return: number of the indexed or dropped files
+        """
+        files = {}
+        changes = 0
+
+        for file_path in sorted(self.models_root.glob("*/*/*.ttl")):
+            relative_path = file_path.relative_to(self.models_root).as_posix()
+            file_stat = file_path.stat()
+            entry = self._files.get(relative_path)
+
+            if entry is None or entry["mtime_ns"] != file_stat.st_mtime_ns or entry["size"] != file_stat.st_size:
+                entry = self._index_file(file_path, file_stat)
+                changes += 1
+
+            files[relative_path] = entry
+
+        changes += len(self._files.keys() - files.keys())
+        self._files = files
+
+        if changes:
+            self._build_definitions()
+            self.save()
+
+        return changes
+
+    def find_definition_files(self, urn: str) -> List[Path]:
+        """Get the files defining a model element.
+
+        :param urn: URN of the element
+        :return: paths to the files
+        """
+        return [self.models_root / relative_path for relative_path in self._definitions.get(str(urn), [])]
+
+    def get_defined_urns(self, file_path: Union[str, Path]) -> List[str]:
+        """Get the URNs of the model elements defined by a file.
+
+        :param file_path: path to a model file in the models root
+        :return: URNs of the elements
+        """
+        return self._get_entry(file_path)["defines"]
+
+    def get_referenced_urns(self, file_path: Union[str, Path]) -> List[str]:
+        """Get the URNs of the model elements referenced but not defined by a file.
+
+        :param file_path: path to a model file in the models root
+        :return: URNs of the elements
+        """
+        return self._get_entry(file_path)["references"]
+
+    def _get_entry(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """Get the index entry of a model file."""
+        relative_path = Path(file_path).resolve().relative_to(self.models_root).as_posix()
+        entry = self._files.get(relative_path)
+        if entry is None:
+            raise KeyError(f"File {file_path} is not indexed")
+
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._files)
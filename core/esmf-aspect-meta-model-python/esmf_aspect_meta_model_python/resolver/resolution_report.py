@@ -0,0 +1,75 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ResolutionReport:
+    """Record of the files parsed and the folders scanned while resolving the dependencies of an aspect model."""
+
+    def __init__(self):
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.folders: Dict[str, int] = {}
+        self.folder_listings: Dict[str, str] = {}
+
+    def add_file(self, file_path: str, seconds: float, triple_count: int, digest: Optional[str] = None):
+        """Record a parsed file.
+
+        :param file_path: path to the file
+        :param seconds: time spent parsing the file
+        :param triple_count: number of triples in the file
+        :param digest: digest of the file content taken before parsing, see utils.get_file_digest
+        """
+        file_info: Dict[str, Any] = {"seconds": seconds, "triples": triple_count}
+        if digest is not None:
+            file_info["digest"] = digest
+
+        self.files[str(file_path)] = file_info
+
+    def add_folder(self, folder: str, file_count: int, listing: Optional[str] = None):
+        """Record a scanned namespace folder.
+
+        :param folder: path to the folder
+        :param file_count: number of model files in the folder
+        :param listing: digest of the folder listing taken before scanning, see utils.get_folder_listing
+        """
+        self.folders[str(folder)] = file_count
+        if listing is not None:
+            self.folder_listings[str(folder)] = listing
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent parsing all files."""
+        return sum(file_info["seconds"] for file_info in self.files.values())
+
+    @property
+    def total_triples(self) -> int:
+        """Number of triples in all files."""
+        return sum(file_info["triples"] for file_info in self.files.values())
+
+    def get_slowest_files(self, count: int = 10) -> List[Tuple[str, float]]:
+        """Get the files which took the longest time to parse.
+
+        :param count: maximal number of files
+        :return: paths to the files with the parse time, the slowest first
+        """
+        slowest_files = sorted(self.files.items(), key=lambda item: item[1]["seconds"], reverse=True)
+
+        return [(file_path, file_info["seconds"]) for file_path, file_info in slowest_files[:count]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the report as a JSON-serializable dictionary."""
+        return {
+            "files": self.files,
+            "folders": self.folders,
+            "total_seconds": self.total_seconds,
+            "total_triples": self.total_triples,
+        }
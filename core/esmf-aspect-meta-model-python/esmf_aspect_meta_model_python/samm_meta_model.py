@@ -18,6 +18,8 @@ import rdflib
 
 import esmf_aspect_meta_model_python.constants as const
 
+from esmf_aspect_meta_model_python.resolver.meta_model_store import MetaModelStore
+
 
 class SammUnitsGraph:
     """Model units graph."""
@@ -49,11 +51,8 @@ class SammUnitsGraph:
             raise ValueError(f"There is no such file {self.unit_file_path}")
 
     def _get_units(self) -> rdflib.Graph:
-        """Parse a units to graph."""
-        graph = rdflib.Graph()
-        graph.parse(self.unit_file_path, format="turtle")
-
-        return graph
+        """Get the shared meta-model graph which contains the units."""
+        return MetaModelStore.get_graph(self.SAMM_VERSION)
 
     def _get_nested_data(self, value: str) -> tuple[str, Union[str, Dict]]:
         """Get data of the nested node."""
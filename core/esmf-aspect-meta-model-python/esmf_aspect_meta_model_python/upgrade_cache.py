@@ -0,0 +1,192 @@
+#  Copyright (c) 2026 Robert Bosch Manufacturing Solutions GmbH
+#
+#  See the AUTHORS file(s) distributed with this work for additional
+#  information regarding authorship.
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#   SPDX-License-Identifier: MPL-2.0
+
+import hashlib
+import logging
+import os
+import threading
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from esmf_aspect_meta_model_python import utils
+from esmf_aspect_meta_model_python.constants import JAVA_CLI_VERSION
+
+_logger = logging.getLogger(__name__)
+
+
+class UpgradeCache:
+    """Persistent content-addressed cache of Turtle data upgraded by the SAMM CLI.
+
+    An entry is keyed by the hash of the original content, the target SAMM version and the SAMM CLI version, so
+    the same bytes are upgraded only once. If the total size of the entries exceeds the size limit, the least recently
+    used entries are evicted.
+
+    The cache is used by all AdaptiveGraph instances and writes to the loader cache directory in the home folder by
+    default. It is disabled, so that nothing is read or written, if the persistent loader caches are disabled with
+    an environment variable.
+
+    The total size is counted from a scan of the cache folder on the first write and then kept up to date with the
+    written entries. The folder is only scanned again when the size limit is crossed, which also takes the entries
+    written by other processes into account.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+    FOLDER_NAME = "upgraded-turtle"
+    FILE_SUFFIX = ".ttl"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        enabled: Optional[bool] = None,
+    ):
+        """Initialize the cache.
+
+        :param cache_dir: folder for the cache entries, defaults to a folder in the loader cache directory
+        :param max_size: maximal total size of the cache entries in bytes
+        :param enabled: use the cache, defaults to True unless the persistent loader caches are disabled with an
+            environment variable when the cache is accessed
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_size = max_size
+        self._enabled = enabled
+
+        self._lock = threading.Lock()
+        self._total_size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Folder with the cache entries."""
+        return self._cache_dir or utils.get_cache_dir() / self.FOLDER_NAME
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache entries are read and written."""
+        return utils.is_cache_enabled() if self._enabled is None else self._enabled
+
+    @staticmethod
+    def get_key(content: Union[str, bytes], samm_version: str) -> str:
+        """Get the cache key of the content upgraded to a SAMM version.
+
+        :param content: original Turtle data
+        :param samm_version: target SAMM version
+        :return: cache key
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        key = hashlib.sha256(f"{samm_version}:{JAVA_CLI_VERSION}:".encode("utf-8"))
+        key.update(content)
+
+        return key.hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        """Get the path of the cache entry file."""
+        return self.cache_dir / f"{key}{self.FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Get upgraded Turtle data from the cache.
+
+        :param key: cache key
+        :return: the upgraded data or None if there is no entry for the key or the cache is disabled
+        """
+        if not self.enabled:
+            return None
+
+        entry_path = self._get_entry_path(key)
+        try:
+            data = entry_path.read_text(encoding="utf-8")
+            os.utime(entry_path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+
+            return None
+
+        with self._lock:
+            self.hits += 1
+
+        return data
+
+    def put(self, key: str, data: str):
+        """Store upgraded Turtle data in the cache and evict the least recently used entries if needed.
+
+        The cache is an optimization only, so a failing write is logged and otherwise ignored.
+
+        :param key: cache key
+        :param data: upgraded Turtle data
+        """
+        if not self.enabled:
+            return
+
+        entry_path = self._get_entry_path(key)
+        encoded_data = data.encode("utf-8")
+        try:
+            replaced_size = self._get_size(entry_path)
+            utils.write_file_atomically(entry_path, encoded_data)
+            with self._lock:
+                if self._total_size is not None:
+                    self._total_size += len(encoded_data) - replaced_size
+                must_evict = self._total_size is None or self._total_size > self.max_size
+
+            if must_evict:
+                self._evict()
+        except OSError as error:
+            _logger.warning("Could not write the upgrade cache entry %s: %s", key, error)
+
+    @staticmethod
+    def _get_size(entry_path: Path) -> int:
+        """Get the size of an entry file, 0 if it does not exist."""
+        try:
+            return entry_path.stat().st_size
+        except OSError:
+            return 0
+
+    def _evict(self):
+        """Scan the cache folder and remove the least recently used entries until the cache fits into the size limit."""
+        entries = []
+        for entry_path in self.cache_dir.glob(f"*{self.FILE_SUFFIX}"):
+            try:
+                entry_stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            with self._lock:
+                self.evictions += 1
+
+        with self._lock:
+            self._total_size = total_size
+
+    def clear(self):
+        """Remove all cache entries."""
+        for entry_path in self.cache_dir.glob(f"*{self.FILE_SUFFIX}"):
+            entry_path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._total_size = None
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters of the cache."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
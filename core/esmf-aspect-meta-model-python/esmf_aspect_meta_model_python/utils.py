@@ -1,10 +1,34 @@
+import hashlib
+import io
+import os
 import pathlib
+import re
+import tempfile
 
-from typing import Iterator, Union
+from typing import Iterable, Iterator, Optional, Set, Tuple, Union
 
-from rdflib import Graph
+from rdflib import Graph, URIRef
 
-from esmf_aspect_meta_model_python.constants import SAMM_NAMESPACE_PREFIX, SAMM_ORG_IDENTIFIER
+from esmf_aspect_meta_model_python.constants import (
+    CACHE_DIR_ENV_VARIABLE,
+    CACHE_DISABLED_ENV_VARIABLE,
+    DEFAULT_CACHE_DIR,
+    SAMM_NAMESPACE_PREFIX,
+    SAMM_ORG_IDENTIFIER,
+)
+
+TURTLE_FILE_SUFFIXES = (".ttl", ".turtle")
+
+_SEPARATOR = re.compile(r"(?:[\s\ufeff]+|#.*)*")
+_DIRECTIVE = re.compile(
+    r"""
+    @prefix\s+(?P<prefix>[^\s:<>]*):\s*<(?P<namespace>[^>]*)>\s*\.
+    |(?i:PREFIX)\s+(?P<sparql_prefix>[^\s:<>]*):\s*<(?P<sparql_namespace>[^>]*)>
+    |@base\s+<[^>]*>\s*\.
+    |(?i:BASE)\s+<[^>]*>
+    """,
+    re.VERBOSE,
+)
 
 
 def _parse_graph_from_input(input_source: Union[str, pathlib.Path]) -> Graph:
@@ -19,9 +43,44 @@ def _parse_graph_from_input(input_source: Union[str, pathlib.Path]) -> Graph:
     return graph
 
 
-def get_samm_versions_from_graph(graph: Graph) -> Iterator[str]:
-    """Yield all SAMM versions found in the RDF graph namespaces."""
-    for prefix, namespace in graph.namespace_manager.namespaces():
+def _scan_prefix_lines(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield the prefix declarations from the header of Turtle lines, stopping at the first statement."""
+    for line in lines:
+        position = 0
+        while True:
+            position = _SEPARATOR.match(line, position).end()  # type: ignore[union-attr]
+            if position >= len(line):
+                break
+
+            directive = _DIRECTIVE.match(line, position)
+            if directive is None:
+                return
+
+            if directive["namespace"] is not None:
+                yield directive["prefix"], directive["namespace"]
+            elif directive["sparql_namespace"] is not None:
+                yield directive["sparql_prefix"], directive["sparql_namespace"]
+
+            position = directive.end()
+
+
+def scan_prefixes(input_source: Union[str, bytes, pathlib.Path]) -> Iterator[Tuple[str, str]]:
+    """Yield the prefix declarations of a Turtle document without parsing it into a graph.
+
+    Only the `@prefix`/`PREFIX` and `@base`/`BASE` directives at the start of the document are read. A file is
+    streamed line by line and the scan stops at the first triple.
+    """
+    if isinstance(input_source, pathlib.Path):
+        with open(input_source, encoding="utf-8-sig") as turtle_file:
+            yield from _scan_prefix_lines(turtle_file)
+    else:
+        data = input_source.decode("utf-8-sig") if isinstance(input_source, bytes) else input_source
+        yield from _scan_prefix_lines(io.StringIO(data))
+
+
+def get_samm_versions_from_namespaces(namespaces: Iterable[Tuple[str, str]]) -> Iterator[str]:
+    """Yield all SAMM versions found in the prefix and namespace pairs."""
+    for prefix, namespace in namespaces:
         if prefix.startswith(SAMM_NAMESPACE_PREFIX):
             parts = namespace.split(":")
 
@@ -29,11 +88,127 @@ def get_samm_versions_from_graph(graph: Graph) -> Iterator[str]:
                 yield parts[-1].strip("#")
 
 
+def parse_namespace(prefix_namespace: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return the namespace folder and the version of an aspect model namespace, None for other namespaces."""
+    namespace_specific_str = None
+    version = None
+
+    namespace_info = prefix_namespace.split(":")
+    if len(namespace_info) == 4:
+        urn, namespace_id, namespace_specific_str, version = namespace_info
+
+        if urn == "urn" and namespace_id == SAMM_NAMESPACE_PREFIX:
+            if namespace_specific_str == SAMM_ORG_IDENTIFIER:
+                namespace_specific_str = None
+                version = None
+            else:
+                version = version.replace("#", "")
+
+    return namespace_specific_str, version
+
+
+def split_urn(urn: Union[URIRef, str]) -> Tuple[Optional[str], Optional[str], str]:
+    """Return the namespace folder, the version and the local name of a model element URN.
+
+    The namespace folder and the version are None if the URN is not the URN of an aspect model element.
+    """
+    namespace, separator, name = str(urn).partition("#")
+    if not separator or not name:
+        return None, None, name
+
+    namespace_specific_str, version = parse_namespace(f"{namespace}#")
+
+    return namespace_specific_str, version, name
+
+
+def collect_urns(graph: Graph) -> Tuple[Set[URIRef], Set[URIRef]]:
+    """Return the URNs used as a subject and the aspect model element URNs used as a predicate or an object."""
+    defined = set()
+    referenced = set()
+
+    for subject, predicate, value in graph:
+        if isinstance(subject, URIRef):
+            defined.add(subject)
+        for term in (predicate, value):
+            if isinstance(term, URIRef) and split_urn(term)[0]:
+                referenced.add(term)
+
+    return defined, referenced
+
+
+def get_samm_versions_from_graph(graph: Graph) -> Iterator[str]:
+    """Yield all SAMM versions found in the RDF graph namespaces."""
+    return get_samm_versions_from_namespaces(graph.namespace_manager.namespaces())
+
+
 def has_version_mismatch_in_graph(graph: Graph, samm_version: str) -> bool:
     """Check if there is a SAMM version mismatch in the provided RDF graph."""
     return any(v != samm_version for v in get_samm_versions_from_graph(graph))
 
 
-def has_version_mismatch_from_input(input_source: Union[str, pathlib.Path], samm_version: str) -> bool:
-    """Detect SAMM version mismatch from an input source (path or Turtle string)."""
-    return has_version_mismatch_in_graph(_parse_graph_from_input(input_source), samm_version=samm_version)
+def has_version_mismatch_from_input(input_source: Union[str, bytes, pathlib.Path], samm_version: str) -> bool:
+    """Detect SAMM version mismatch from an input source (path or Turtle string).
+
+    Turtle input is only scanned for its prefix declarations. Files in other RDF formats and Turtle input without a
+    SAMM prefix found by the scan, e.g. with a prefix declaration spanning several lines, are parsed into a graph.
+    """
+    if isinstance(input_source, pathlib.Path) and input_source.suffix.lower() not in TURTLE_FILE_SUFFIXES:
+        return has_version_mismatch_in_graph(_parse_graph_from_input(input_source), samm_version=samm_version)
+
+    versions = list(get_samm_versions_from_namespaces(scan_prefixes(input_source)))
+    if not versions:
+        if isinstance(input_source, bytes):
+            input_source = input_source.decode("utf-8-sig")
+
+        return has_version_mismatch_in_graph(_parse_graph_from_input(input_source), samm_version=samm_version)
+
+    return any(version != samm_version for version in versions)
+
+
+def get_cache_dir() -> pathlib.Path:
+    """Return the directory for persistent loader caches, configurable with an environment variable."""
+    return pathlib.Path(os.environ.get(CACHE_DIR_ENV_VARIABLE) or DEFAULT_CACHE_DIR)
+
+
+def is_cache_enabled() -> bool:
+    """Return False if the persistent loader caches are disabled with an environment variable."""
+    return os.environ.get(CACHE_DISABLED_ENV_VARIABLE, "").strip().lower() not in ("1", "true", "yes")
+
+
+def get_file_digest(path: Union[str, pathlib.Path]) -> str:
+    """Return the SHA-256 digest of the content of a file."""
+    return hashlib.sha256(pathlib.Path(path).read_bytes()).hexdigest()
+
+
+def get_folder_listing(folder: Union[str, pathlib.Path]) -> str:
+    """Return a digest of the names, modification times and sizes of the Turtle files in a folder.
+
+    The digest changes when a Turtle file is added to the folder, removed from it or changed. A missing folder has
+    an empty digest.
+    """
+    entries = []
+    try:
+        with os.scandir(folder) as folder_entries:
+            for entry in folder_entries:
+                if entry.name.endswith(".ttl") and entry.is_file():
+                    entry_stat = entry.stat()
+                    entries.append(f"{entry.name}\0{entry_stat.st_mtime_ns}\0{entry_stat.st_size}")
+    except (FileNotFoundError, NotADirectoryError):
+        return ""
+
+    return hashlib.sha256("\n".join(sorted(entries)).encode("utf-8")).hexdigest()
+
+
+def write_file_atomically(path: Union[str, pathlib.Path], data: bytes) -> None:
+    """Write a file through a temporary file, so that concurrent readers never see a partially written file."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        pathlib.Path(tmp_path).unlink(missing_ok=True)
+        raise
@@ -10,8 +10,9 @@
 #   SPDX-License-Identifier: MPL-2.0
 
 import abc
+import threading
 
-from typing import Optional, Union
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 import rdflib  # type: ignore
 
@@ -19,6 +20,47 @@ from rdflib.term import Node
 
 
 class Namespace(metaclass=abc.ABCMeta):
+    """Vocabulary of a meta model namespace.
+
+    There is a single vocabulary object per class and meta model version, so the URNs of the element and attribute
+    names declared by the constant classes of the vocabulary are built once per process. get_urn returns the same
+    URIRef object for each call with such a name, and get_name resolves these URNs from a reverse map. Other names,
+    e.g. unit names, are not interned, so the memory used does not grow with the names looked up.
+
+    Subclasses implement get_urn, which can look the interned URNs up in _urns before building a new URIRef.
+    """
+
+    _instances: Dict[Tuple[type, str], "Namespace"] = {}
+    _names: Dict[rdflib.URIRef, str] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls, meta_model_version: str):
+        key = (cls, meta_model_version)
+        instance = Namespace._instances.get(key)
+        if instance is None:
+            with Namespace._lock:
+                instance = Namespace._instances.setdefault(key, super().__new__(cls))
+
+        return instance
+
+    def _intern_vocabulary(self) -> None:
+        """Builds the URNs of all element and attribute names of the vocabulary once."""
+        if "_urns" in vars(self):
+            return
+
+        self._urns: Dict[str, rdflib.URIRef] = {}
+        for name in self._get_vocabulary_names():
+            urn = self._urns.setdefault(name, self.get_urn(name))
+            Namespace._names.setdefault(urn, name)
+
+    @classmethod
+    def _get_vocabulary_names(cls) -> Iterator[str]:
+        """Gets the element and attribute names defined by the constant classes of the vocabulary."""
+        for klass in cls.__mro__:
+            for attr_name, value in vars(klass).items():
+                if not attr_name.startswith("_") and isinstance(value, str) and ":" not in value:
+                    yield value
+
     @abc.abstractmethod
     def get_urn(self, element_type: str) -> rdflib.URIRef:
         pass
@@ -31,5 +73,8 @@ class Namespace(metaclass=abc.ABCMeta):
         """
         if element_urn is None:
             return None
+        name = Namespace._names.get(element_urn)  # type: ignore
+        if name is not None:
+            return name
         element_urn = str(element_urn)
         return element_urn.split("#")[1]
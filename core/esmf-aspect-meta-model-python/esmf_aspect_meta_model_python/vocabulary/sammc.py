@@ -23,14 +23,22 @@ class SAMMC(Namespace, CharacteristicElements, CharacteristicElementAttributes):
     # Constants listed in the constant classes
     def __init__(self, meta_model_version: str):
         self.meta_model_version: str = meta_model_version
+        self._intern_vocabulary()
 
     def get_urn(self, element_type: str) -> URIRef:
         """Get urn of the given element type.
 
         Example: get_urn(SAMM.scale) -> "urn:samm:org.eclipse.esmf.samm:characteristic:1.0.0#scale"
         """
-        return URIRef(f"{SAMMC.sammc_prefix}{self.meta_model_version}#{element_type}")
+        urn = self._urns.get(element_type)
+        if urn is None:
+            urn = URIRef(f"{SAMMC.sammc_prefix}{self.meta_model_version}#{element_type}")
+
+        return urn
 
     def collections_urns(self) -> List[Optional[URIRef]]:
         """Get a list of urns of collection characteristics."""
-        return [self.get_urn(element) for element in SAMMC.collections]
+        if "_collections_urns" not in vars(self):
+            self._collections_urns: List[Optional[URIRef]] = [self.get_urn(element) for element in SAMMC.collections]
+
+        return self._collections_urns
@@ -21,9 +21,14 @@ class SAMME(Namespace, SAMMEElements, SAMMEElementAttributes):
     # Constants listed in the constant classes
     def __init__(self, meta_model_version: str):
         self.meta_model_version: str = meta_model_version
+        self._intern_vocabulary()
 
     def get_urn(self, element_type: str) -> rdflib.URIRef:
         """returns the URN string of the given element type.
         Example: get_urn(SAMM.characteristic) -> "urn:samm:org.eclipse.esmf.samm:meta-model:1.0.0#characteristic"
         """
-        return rdflib.URIRef(f"{SAMME.samme_prefix}{self.meta_model_version}#{element_type}")
+        urn = self._urns.get(element_type)
+        if urn is None:
+            urn = rdflib.URIRef(f"{SAMME.samme_prefix}{self.meta_model_version}#{element_type}")
+
+        return urn
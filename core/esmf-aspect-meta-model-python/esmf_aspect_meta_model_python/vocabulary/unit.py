@@ -19,9 +19,14 @@ class UNIT(Namespace):
 
     def __init__(self, meta_model_version: str):
         self.meta_model_version: str = meta_model_version
+        self._intern_vocabulary()
 
     def get_urn(self, element_type: str) -> rdflib.URIRef:
         """returns the URN string of the given element type.
         Example: get_urn(SAMM.reference_unit) -> "urn:samm:org.eclipse.esmf.samm:unit:2.0.0#referenceUnit"
         """
-        return rdflib.URIRef(f"{UNIT.samm_prefix}{self.meta_model_version}#{element_type}")
+        urn = self._urns.get(element_type)
+        if urn is None:
+            urn = rdflib.URIRef(f"{UNIT.samm_prefix}{self.meta_model_version}#{element_type}")
+
+        return urn
@@ -0,0 +1,84 @@
+"""Benchmark of the memory held by instantiated model elements.
+
+Builds a graph with the given number of properties, each with a characteristic, a trait and a length constraint, of
+which only the properties have a preferred name. All elements are instantiated with ModelElementFactory, then the
+factory is dropped and the memory still allocated for the elements is reported, in total and per element.
+
+    python -m scripts.benchmark_element_memory --properties 5000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from typing import List
+
+from rdflib import RDF, XSD, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
+from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
+
+NAMESPACE = "urn:samm:org.example.benchmark:1.0.0#"
+
+
+def build_graph(property_count: int) -> tuple:
+    """Build a graph with a constrained characteristic per property, and get the nodes of the properties."""
+    samm = SAMM(SAMM_VERSION)
+    sammc = SAMMC(SAMM_VERSION)
+    graph = Graph()
+    nodes: List[Node] = []
+    for index in range(property_count):
+        aspect_property = URIRef(f"{NAMESPACE}property{index}")
+        trait = URIRef(f"{NAMESPACE}Trait{index}")
+        characteristic = URIRef(f"{NAMESPACE}Characteristic{index}")
+        constraint = URIRef(f"{NAMESPACE}Constraint{index}")
+        graph.add((aspect_property, RDF.type, samm.get_urn(SAMM.Property)))
+        graph.add((aspect_property, samm.get_urn(SAMM.preferred_name), Literal(f"Property {index}", lang="en")))
+        graph.add((aspect_property, samm.get_urn(SAMM.characteristic), trait))
+        graph.add((trait, RDF.type, sammc.get_urn(SAMMC.Trait)))
+        graph.add((trait, sammc.get_urn(SAMMC.base_characteristic), characteristic))
+        graph.add((trait, sammc.get_urn(SAMMC.constraint), constraint))
+        graph.add((characteristic, RDF.type, samm.get_urn(SAMM.Characteristic)))
+        graph.add((characteristic, samm.get_urn(SAMM.data_type), XSD.string))
+        graph.add((constraint, RDF.type, sammc.get_urn(SAMMC.Length_constraint)))
+        graph.add((constraint, sammc.get_urn(SAMMC.max_value), Literal(index + 1)))
+        nodes.append(aspect_property)
+
+    return graph, nodes
+
+
+def measure(graph: Graph, nodes: List[Node]) -> tuple:
+    """Get the number of instantiated elements and the memory in bytes which they hold."""
+    gc.collect()
+    tracemalloc.start()
+    cache = DefaultElementCache()
+    factory = ModelElementFactory(SAMM_VERSION, graph, cache)
+    elements = factory.create_all_graph_elements(nodes)
+    del factory
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(elements) == len(nodes)
+
+    return len(cache.items()), allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--properties", type=int, default=5000, help="number of properties in the graph")
+    args = parser.parse_args()
+
+    graph, nodes = build_graph(args.properties)
+    element_count, allocated = measure(graph, nodes)
+
+    print(f"{element_count} model elements")
+    print(f"  memory:      {allocated / 1024 / 1024:8.2f} MiB")
+    print(f"  per element: {allocated / element_count:8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark of the creation and the membership checks of large enumerations.
+
+Compares a plain list of values, which is materialized when the enumeration is created and checked by a linear scan,
+with EnumerationValues, which materializes the values on first access and checks them in a hash index. The values are
+entity values like those built by EnumerationInstantiator for a code list.
+
+    python -m scripts.benchmark_enumeration_values --values 50000 --checks 1000
+"""
+
+import argparse
+import random
+import timeit
+
+from esmf_aspect_meta_model_python.impl import EnumerationValues
+
+NAME_KEY = "urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#name"
+
+
+def to_value(entry: int) -> dict:
+    """Build the entity value of a code list entry."""
+    return {"code": entry, "description": f"Code {entry}", NAME_KEY: f"Code{entry}"}
+
+
+def get_key(entry: int) -> str:
+    """Get the name of a code list entry without building its value."""
+    return f"Code{entry}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=50_000, help="number of enumeration values")
+    parser.add_argument("--checks", type=int, default=1_000, help="number of membership checks")
+    args = parser.parse_args()
+
+    entries = list(range(args.values))
+    payloads = [{"code": code, "description": f"Code {code}"} for code in random.choices(entries, k=args.checks)]
+
+    eager_create = timeit.timeit(lambda: [to_value(entry) for entry in entries], number=1)
+    lazy_create = timeit.timeit(lambda: EnumerationValues(entries, to_value, get_key, NAME_KEY), number=1)
+
+    plain_values = [to_value(entry) for entry in entries]
+    linear_check = timeit.timeit(
+        lambda: [any({**value, **payload} == value for value in plain_values) for payload in payloads], number=1
+    )
+    lazy_values = EnumerationValues(entries, to_value, get_key, NAME_KEY)
+    indexed_check = timeit.timeit(lambda: [payload in lazy_values for payload in payloads], number=1)
+
+    print(f"Enumeration with {args.values} values, {args.checks} membership checks")
+    print(f"  creation, eager list:         {eager_create * 1000:10.2f} ms")
+    print(f"  creation, lazy values:        {lazy_create * 1000:10.2f} ms")
+    print(f"  checks, linear scan:          {linear_check * 1000:10.2f} ms")
+    print(f"  checks, index incl. building: {indexed_check * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark of the instantiator lookup per model element.
+
+Compares the former lookup, which resolved the instantiator module by name and created a new instantiator object for
+every element, with the dispatch table of ModelElementFactory, which is keyed by the URN of the element type and keeps one instantiator object per element type.
+Only the lookup is measured, the instantiation of the elements themselves is the same in both cases.
+
+    python -m scripts.benchmark_instantiator_dispatch --elements 100000
+"""
+
+import argparse
+import importlib
+import itertools
+import timeit
+
+from rdflib import Graph, URIRef
+
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.loader import instantiator
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+
+# Element types in the proportion of a typical aspect model, mostly properties and characteristics.
+ELEMENT_TYPES = ["Property"] * 4 + ["Characteristic"] * 2 + ["Entity", "Enumeration", "Measurement", "Scalar"]
+
+
+def lookup_by_module_name(factory: ModelElementFactory, element_type: URIRef):
+    """Instantiator lookup as done before the dispatch table."""
+    element_name = factory.get_samm().get_name(element_type)
+    module_name, class_name = factory.get_instantiator_path(element_name)  # type: ignore[arg-type]
+    instantiator_object = getattr(importlib.import_module(module_name), class_name)(factory)
+    factory._instantiators[element_type] = instantiator_object
+
+    return factory._instantiators.get(element_type, instantiator_object)
+
+
+def lookup_by_dispatch_table(factory: ModelElementFactory, element_type: URIRef):
+    """Instantiator lookup of ModelElementFactory.create_element."""
+    instantiator_object = factory._instantiators.get(element_type)
+    if instantiator_object is None:
+        instantiator_object = factory._create_instantiator(element_type)
+
+    return instantiator_object
+
+
+def measure(lookup, element_count: int) -> float:
+    """Get the mean lookup time per element in microseconds."""
+    factory = ModelElementFactory(SAMM_VERSION, Graph(), DefaultElementCache())
+    type_urns = {
+        factory.get_samm().get_name(type_urn): type_urn
+        for type_urn in instantiator.get_instantiator_classes(SAMM_VERSION)
+    }
+    element_types = [type_urns[name] for name in itertools.islice(itertools.cycle(ELEMENT_TYPES), element_count)]
+    seconds = timeit.timeit(lambda: [lookup(factory, element_type) for element_type in element_types], number=1)
+
+    return seconds / element_count * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--elements", type=int, default=100_000, help="number of simulated model elements")
+    args = parser.parse_args()
+
+    before = measure(lookup_by_module_name, args.elements)
+    after = measure(lookup_by_dispatch_table, args.elements)
+
+    print(f"Instantiator lookup for {args.elements} elements")
+    print(f"  module name resolution: {before:8.3f} us per element")
+    print(f"  dispatch table:         {after:8.3f} us per element")
+    print(f"  speed-up:               {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
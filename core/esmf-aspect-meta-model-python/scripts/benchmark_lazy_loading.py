@@ -0,0 +1,83 @@
+"""Benchmark of the eager and the lazy instantiation of a large aspect.
+
+Builds an aspect with the given number of properties, each with its own characteristic, and instantiates it with
+ModelElementFactory in both modes. The lazy mode is measured with the given number of properties read afterwards,
+as a service which only uses some properties would do.
+
+    python -m scripts.benchmark_lazy_loading --properties 300 --touched 5
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from typing import Any, List
+
+from rdflib import RDF, XSD, BNode, Graph, Literal, URIRef
+from rdflib.collection import Collection
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
+
+NAMESPACE = "urn:samm:org.example.benchmark:1.0.0#"
+
+
+def build_graph(property_count: int) -> Graph:
+    """Build an aspect with one characteristic per property."""
+    samm = SAMM(SAMM_VERSION)
+    graph = Graph()
+    aspect = URIRef(f"{NAMESPACE}BenchmarkAspect")
+    properties: List[Node] = []
+    for index in range(property_count):
+        aspect_property = URIRef(f"{NAMESPACE}property{index}")
+        characteristic = URIRef(f"{NAMESPACE}Characteristic{index}")
+        graph.add((aspect_property, RDF.type, samm.get_urn(SAMM.Property)))
+        graph.add((aspect_property, samm.get_urn(SAMM.preferred_name), Literal(f"Property {index}", lang="en")))
+        graph.add((aspect_property, samm.get_urn(SAMM.characteristic), characteristic))
+        graph.add((characteristic, RDF.type, samm.get_urn(SAMM.Characteristic)))
+        graph.add((characteristic, samm.get_urn(SAMM.data_type), XSD.string))
+        properties.append(aspect_property)
+
+    properties_list = BNode()
+    Collection(graph, properties_list, properties)
+    graph.add((aspect, RDF.type, samm.get_urn(SAMM.Aspect)))
+    graph.add((aspect, samm.get_urn(SAMM.properties), properties_list))
+
+    return graph
+
+
+def measure(graph: Graph, lazy: bool, touched: int) -> tuple:
+    """Get the time in milliseconds and the peak of allocated memory in KiB to load the aspect and read properties."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    factory = ModelElementFactory(SAMM_VERSION, graph, DefaultElementCache(), lazy=lazy)
+    aspect: Any = factory.create_aspect(URIRef(f"{NAMESPACE}BenchmarkAspect"))
+    for aspect_property in aspect.properties[:touched]:
+        aspect_property.characteristic.data_type.urn
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--properties", type=int, default=300, help="number of properties of the aspect")
+    parser.add_argument("--touched", type=int, default=5, help="number of properties read after loading")
+    args = parser.parse_args()
+
+    graph = build_graph(args.properties)
+    eager_ms, eager_kib = measure(graph, False, args.touched)
+    lazy_ms, lazy_kib = measure(graph, True, args.touched)
+
+    print(f"Aspect with {args.properties} properties, {args.touched} properties read")
+    print(f"  eager: {eager_ms:8.1f} ms {eager_kib:10.1f} KiB peak")
+    print(f"  lazy:  {lazy_ms:8.1f} ms {lazy_kib:10.1f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark of loading all model elements at once and streaming them one by one.
+
+Builds a graph with the given number of properties, each with its own characteristic, and instantiates all of its
+elements with ModelElementFactory. The batch variant collects all elements in a list with an unbounded cache, as
+SAMMGraph.load_model_elements does. The streaming variant hands out one element after the other, as
+SAMMGraph.iter_model_elements does, to a consumer which only keeps the element names, with a bounded cache.
+
+    python -m scripts.benchmark_streaming_elements --properties 2000 --cache-size 64
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from typing import List
+
+from rdflib import RDF, XSD, Graph, Literal, URIRef
+from rdflib.term import Node
+
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.element_cache_strategies import LRUElementCache
+from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
+
+NAMESPACE = "urn:samm:org.example.benchmark:1.0.0#"
+
+
+def build_graph(property_count: int) -> tuple:
+    """Build a graph with one characteristic per property, and get the nodes of all its elements."""
+    samm = SAMM(SAMM_VERSION)
+    graph = Graph()
+    nodes: List[Node] = []
+    for index in range(property_count):
+        aspect_property = URIRef(f"{NAMESPACE}property{index}")
+        characteristic = URIRef(f"{NAMESPACE}Characteristic{index}")
+        graph.add((aspect_property, RDF.type, samm.get_urn(SAMM.Property)))
+        graph.add((aspect_property, samm.get_urn(SAMM.preferred_name), Literal(f"Property {index}", lang="en")))
+        graph.add((aspect_property, samm.get_urn(SAMM.characteristic), characteristic))
+        graph.add((characteristic, RDF.type, samm.get_urn(SAMM.Characteristic)))
+        graph.add((characteristic, samm.get_urn(SAMM.data_type), XSD.string))
+        nodes += [aspect_property, characteristic]
+
+    return graph, nodes
+
+
+def measure_batch(graph: Graph, nodes: List[Node]) -> tuple:
+    """Get the time to the first element and the total time in milliseconds, and the memory peak in KiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    factory = ModelElementFactory(SAMM_VERSION, graph, DefaultElementCache())
+    elements = factory.create_all_graph_elements(nodes)
+    first = time.perf_counter() - start
+    names = [element.name for element in elements]
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(names) == len(nodes)
+
+    return first * 1000, total * 1000, peak / 1024
+
+
+def measure_streaming(graph: Graph, nodes: List[Node], cache_size: int) -> tuple:
+    """Get the time to the first element and the total time in milliseconds, and the memory peak in KiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    factory = ModelElementFactory(SAMM_VERSION, graph, LRUElementCache(cache_size))
+    first = None
+    names = []
+    for node in nodes:
+        element = factory.create_graph_element(node)
+        if first is None:
+            first = time.perf_counter() - start
+        names.append(element.name)  # type: ignore[union-attr]
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(names) == len(nodes)
+
+    return (first or 0.0) * 1000, total * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--properties", type=int, default=2000, help="number of properties in the graph")
+    parser.add_argument("--cache-size", type=int, default=64, help="number of cached elements while streaming")
+    args = parser.parse_args()
+
+    graph, nodes = build_graph(args.properties)
+    batch = measure_batch(graph, nodes)
+    streaming = measure_streaming(graph, nodes, args.cache_size)
+
+    print(f"{len(nodes)} model elements, streaming with a cache of {args.cache_size} elements")
+    print("              first element      total    memory peak")
+    print(f"  batch:     {batch[0]:10.1f} ms {batch[1]:8.1f} ms {batch[2]:10.1f} KiB")
+    print(f"  streaming: {streaming[0]:10.1f} ms {streaming[1]:8.1f} ms {streaming[2]:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
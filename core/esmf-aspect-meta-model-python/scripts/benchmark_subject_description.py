@@ -0,0 +1,89 @@
+"""Benchmark of the attribute lookups of the model elements in the aspect graph.
+
+Compares one rdflib.Graph.value call per attribute, as the instantiators did before, with reading all
+(predicate, object) pairs of the element once into a SubjectDescription. Every element has the attributes of a typical
+property (type, name, preferred names, descriptions, see, characteristic, example value) and every lookup of an
+instantiator is repeated for each of them. With --layered the aspect graph is layered over a second graph, as the
+model graph of SAMMGraph is layered over the SAMM meta model.
+
+    python -m scripts.benchmark_subject_description --elements 10000 --layered
+"""
+
+import argparse
+import timeit
+
+from rdflib import RDF, Graph, Literal, Namespace
+
+from esmf_aspect_meta_model_python.layered_graph import LayeredGraph
+from esmf_aspect_meta_model_python.loader.subject_description import SubjectDescription
+
+SAMM = Namespace("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#")
+EX = Namespace("urn:samm:org.example:1.0.0#")
+
+# Predicates looked up by the property instantiator and MetaModelBaseAttributes, including the missing ones.
+PREDICATES = [
+    RDF.type,
+    SAMM.preferredName,
+    SAMM.description,
+    SAMM.see,
+    SAMM.characteristic,
+    SAMM.exampleValue,
+    SAMM.extends,
+    SAMM.property,
+    SAMM.payloadName,
+]
+
+
+def create_graph(element_count: int) -> Graph:
+    """Create an aspect graph with the given number of properties."""
+    graph = Graph()
+    for index in range(element_count):
+        element = EX[f"property{index}"]
+        graph.add((element, RDF.type, SAMM.Property))
+        graph.add((element, SAMM.preferredName, Literal(f"Property {index}", lang="en")))
+        graph.add((element, SAMM.preferredName, Literal(f"Eigenschaft {index}", lang="de")))
+        graph.add((element, SAMM.description, Literal(f"Description {index}", lang="en")))
+        graph.add((element, SAMM.characteristic, EX[f"Characteristic{index}"]))
+        graph.add((element, SAMM.exampleValue, Literal(index)))
+
+    return graph
+
+
+def lookup_by_graph(graph: Graph, elements: list) -> None:
+    """Attribute lookups as done before the subject descriptions."""
+    for element in elements:
+        for predicate in PREDICATES:
+            graph.value(subject=element, predicate=predicate)
+
+
+def lookup_by_description(graph: Graph, elements: list) -> None:
+    """Attribute lookups of the instantiators."""
+    for element in elements:
+        description = SubjectDescription.from_graph(element, graph)
+        for predicate in PREDICATES:
+            description.value(predicate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--elements", type=int, default=10_000, help="number of properties in the aspect graph")
+    parser.add_argument("--layered", action="store_true", help="layer the aspect graph over a meta model graph")
+    args = parser.parse_args()
+
+    graph = create_graph(args.elements)
+    if args.layered:
+        meta_model_graph = Graph()
+        meta_model_graph.add((SAMM.Property, RDF.type, SAMM.Element))
+        graph = LayeredGraph(graph, meta_model_graph)
+    elements = list(graph.subjects(RDF.type, SAMM.Property))
+    before = timeit.timeit(lambda: lookup_by_graph(graph, elements), number=1) / args.elements * 1_000_000
+    after = timeit.timeit(lambda: lookup_by_description(graph, elements), number=1) / args.elements * 1_000_000
+
+    print(f"Attribute lookups for {args.elements} elements, {len(PREDICATES)} lookups per element")
+    print(f"  one graph lookup per attribute: {before:8.3f} us per element")
+    print(f"  subject description:            {after:8.3f} us per element")
+    print(f"  speed-up:                       {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Cache strategy interface test suite."""
+
+import pytest
+
+from esmf_aspect_meta_model_python.base.cache_strategy import CacheStrategy
+
+
+class CacheStrategyInterface(CacheStrategy):
+    """Cache strategy implementing only the abstract methods, like the strategies written before the lookups."""
+
+    def __init__(self):
+        self._elements = {}
+
+    def reset(self):
+        self._elements.clear()
+
+    def get(self, key):
+        return self._elements.get(key)
+
+    def get_by_name(self, name):
+        return []
+
+    def resolve_instance(self, model_element):
+        return model_element
+
+    def add_element(self, name, model_element, overwrite=False):
+        self._elements[name] = model_element
+
+
+class TestCacheStrategy:
+    """Cache strategy interface test suite."""
+
+    def test_get_by_urn(self):
+        cache = CacheStrategyInterface()
+        cache.add_element("urn:samm:org.example:1.0.0#element", "element")
+
+        assert cache.get_by_urn("urn:samm:org.example:1.0.0#element") == "element"
+        assert cache.get_by_urn("urn:samm:org.example:1.0.0#other") is None
+
+    def test_find_by_type(self):
+        with pytest.raises(NotImplementedError) as error:
+            CacheStrategyInterface().find_by_type(str)
+
+        assert str(error.value) == "CacheStrategyInterface does not support finding elements by type."
@@ -2,7 +2,10 @@
 
 from unittest import mock
 
-from esmf_aspect_meta_model_python.impl import DefaultEnumeration
+import pytest
+
+from esmf_aspect_meta_model_python.base.characteristics.enumeration import Enumeration
+from esmf_aspect_meta_model_python.impl import DefaultEnumeration, EnumerationValues
 
 
 class TestDefaultEnumeration:
@@ -17,14 +20,73 @@ class TestDefaultEnumeration:
         result = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, ["value"])
 
         super_mock.assert_called_once_with(self.meta_model_mock, self.data_type_mock)
+        assert isinstance(result._values, EnumerationValues)
         assert result._values == ["value"]
 
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_init_enumeration_values(self, _):
+        """Test DefaultEnumeration initialization with lazily materialized values."""
+        values = EnumerationValues(["node"], lambda node: "value")
+        result = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, values)
+
+        assert result._values is values
+
     @mock.patch(
         "esmf_aspect_meta_model_python.impl.characteristics.default_characteristic.DefaultCharacteristic.__init__"
     )
     def test_values(self, _):
         """Test values getter."""
-        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, ["value"])
+        values = EnumerationValues(["node"], lambda node: "value")
+        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, values)
         result = characteristic.values
 
         assert result == ["value"]
+        assert result.is_materialized is True
+        assert list.__len__(result) == 1
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_contains(self, _):
+        """Test contains method."""
+        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, ["red", "green"])
+
+        assert characteristic.contains("green") is True
+        assert characteristic.contains("blue") is False
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_get_value(self, _):
+        """Test get_value method."""
+        values = EnumerationValues([{"code": 1, "name": "Red"}], name_key="name")
+        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, values)
+
+        assert characteristic.get_value("Red") == {"code": 1, "name": "Red"}
+        assert characteristic.get_value("Blue", "default") == "default"
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_get_validated_list(self, _):
+        """Test the values are validated as a whole, without materializing them."""
+        values = EnumerationValues(["node"], lambda node: "value")
+        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, values)
+
+        assert characteristic._get_validated_list("values") == [values]
+        assert values.is_materialized is False
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_validate_empty_values(self, _):
+        """Test the validation of an enumeration without values."""
+        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, [])
+
+        with pytest.raises(ValueError, match="missing required attribute: values"):
+            characteristic._validate_attribute("values", characteristic._get_validated_list("values")[0], set())
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_interface_defaults(self, _):
+        """Test the default lookups of the Enumeration interface, which scan the values."""
+        name_key = "urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#name"
+        values = [{"code": 1, name_key: "Red"}, "green"]
+        characteristic = DefaultEnumeration(self.meta_model_mock, self.data_type_mock, values)
+
+        assert Enumeration.contains(characteristic, "green") is True
+        assert Enumeration.contains(characteristic, "blue") is False
+        assert Enumeration.get_value(characteristic, "Red") == {"code": 1, name_key: "Red"}
+        assert Enumeration.get_value(characteristic, "green") == "green"
+        assert Enumeration.get_value(characteristic, 1, "default") == "default"
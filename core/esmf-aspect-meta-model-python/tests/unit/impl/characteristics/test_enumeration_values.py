@@ -0,0 +1,155 @@
+"""EnumerationValues class unit tests suit."""
+
+import json
+import pickle
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.impl import EnumerationValues
+
+NAME_KEY = "urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#name"
+
+
+def to_value(entry):
+    """Materialize an entry of the tests, entries starting with # are entity values."""
+    if entry.startswith("#"):
+        return {"code": len(entry), NAME_KEY: entry[1:]}
+
+    return entry.upper()
+
+
+def get_key(entry):
+    """Get the key of an entry of the tests without materializing it."""
+    return entry[1:] if entry.startswith("#") else entry.upper()
+
+
+class TestEnumerationValues:
+    """EnumerationValues unit tests class."""
+
+    def test_plain_values(self):
+        """Test values given without materialize function."""
+        values = EnumerationValues(["a", "b"])
+
+        assert values.is_materialized is True
+        assert len(values) == 2
+        assert values == ["a", "b"]
+        assert values[-1] == "b"
+        assert values[0:1] == ["a"]
+        assert "b" in values
+        assert "c" not in values
+
+    def test_materialize_on_access(self):
+        """Test the values are materialized when they are accessed for the first time."""
+        materialize_mock = mock.MagicMock(name="materialize", side_effect=to_value)
+        values = EnumerationValues(["a", "b", "c"], materialize_mock)
+
+        assert len(values) == 3
+        materialize_mock.assert_not_called()
+        assert values[1] == "B"
+        assert values[1] == "B"
+        materialize_mock.assert_called_once_with("b")
+        assert values.is_materialized is False
+        assert list(values) == ["A", "B", "C"]
+        assert materialize_mock.call_count == 3
+        assert values.is_materialized is True
+        assert values._entries is None
+        assert values._materialize is None
+        assert list.__len__(values) == 3
+
+    def test_index_error(self):
+        """Test access by a position out of range."""
+        values = EnumerationValues(["a"], to_value)
+
+        with pytest.raises(IndexError):
+            values[1]
+
+    def test_get_by_entry_key(self):
+        """Test get only materializes the value with the key if the entries have keys."""
+        materialize_mock = mock.MagicMock(name="materialize", side_effect=to_value)
+        values = EnumerationValues(["#Red", "#Green"], materialize_mock, get_key, NAME_KEY)
+
+        assert values.get("Green") == {"code": 6, NAME_KEY: "Green"}
+        assert values.get("Blue") is None
+        assert values.get("Blue", "default") == "default"
+        assert values.get(["unhashable"]) is None
+        materialize_mock.assert_called_once_with("#Green")
+
+    def test_get_by_value_key(self):
+        """Test get materializes the values whose entries have no key."""
+        values = EnumerationValues(["#Red", "green"], to_value, name_key=NAME_KEY)
+
+        assert values.get("Red") == {"code": 4, NAME_KEY: "Red"}
+        assert values.get("GREEN") == "GREEN"
+        assert values.is_materialized is True
+
+    def test_contains_scalar(self):
+        """Test the membership check of scalar values."""
+        values = EnumerationValues(["a", "b", "a"], to_value, get_key)
+
+        assert "A" in values
+        assert "a" not in values
+        assert ["A"] not in values
+        assert values.is_materialized is False
+
+    def test_contains_entity(self):
+        """Test the membership check of entity values with and without name."""
+        values = EnumerationValues(["#Red", "#Green"], to_value, get_key, NAME_KEY)
+
+        assert {"code": 4, NAME_KEY: "Red"} in values
+        assert {"code": 4} in values
+        assert {"code": 5} not in values
+        assert "Red" not in values
+
+    def test_contains_nested_entity(self):
+        """Test the membership check of entity values with collection values."""
+        values = EnumerationValues([{"codes": [1, 2], "see": {"a"}, NAME_KEY: "Nested"}], name_key=NAME_KEY)
+
+        assert {"codes": [1, 2], "see": {"a"}} in values
+        assert {"codes": [2, 1], "see": {"a"}} not in values
+
+    def test_contains_unhashable_entity(self):
+        """Test the membership check of entity values which cannot be hashed."""
+        unhashable = bytearray(b"value")
+        values = EnumerationValues([{"data": unhashable}])
+
+        assert {"data": bytearray(b"value")} in values
+        assert {"data": bytearray(b"other")} not in values
+
+    def test_pickle(self):
+        """Test pickling materializes the values and drops the functions."""
+        values = EnumerationValues(["#Red", "green"], to_value, get_key, NAME_KEY)
+        result = pickle.loads(pickle.dumps(values))
+
+        assert result == [{"code": 4, NAME_KEY: "Red"}, "GREEN"]
+        assert result.is_materialized is True
+        assert result.get("Red") == {"code": 4, NAME_KEY: "Red"}
+
+    def test_repr(self):
+        """Test the representation of the values."""
+        assert repr(EnumerationValues(["a"], to_value)) == "['A']"
+
+    def test_list_compatibility(self):
+        """Test the values can be used like a plain list once they are materialized."""
+        values = EnumerationValues(["#Red", "green"], to_value, get_key, NAME_KEY).materialize()
+
+        assert isinstance(values, list)
+        assert json.dumps(values) == json.dumps([{"code": 4, NAME_KEY: "Red"}, "GREEN"])
+        assert values + ["BLUE"] == [{"code": 4, NAME_KEY: "Red"}, "GREEN", "BLUE"]
+        assert values != ["GREEN"]
+        assert list(reversed(values)) == ["GREEN", {"code": 4, NAME_KEY: "Red"}]
+
+    def test_modify(self):
+        """Test modifying the list materializes the values and drops the indices."""
+        values = EnumerationValues(["a", "b"], to_value, get_key)
+
+        assert "C" not in values
+        values.append("C")
+
+        assert values.is_materialized is True
+        assert values == ["A", "B", "C"]
+        assert "C" in values
+        del values[0]
+        assert values.get("A") is None
+        assert values.get("B") == "B"
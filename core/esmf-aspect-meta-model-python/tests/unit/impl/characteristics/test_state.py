@@ -26,3 +26,12 @@ class TestDefaultState:
         result = characteristic.default_value
 
         assert result == "default_value"
+
+    @mock.patch("esmf_aspect_meta_model_python.impl.characteristics.default_enumeration.DefaultCharacteristic.__init__")
+    def test_lookup(self, _):
+        """Test the lookup of the state values."""
+        characteristic = DefaultState(self.meta_model_mock, self.data_type_mock, ["on", "off"], "off")
+
+        assert characteristic.contains(characteristic.default_value) is True
+        assert characteristic.contains("standby") is False
+        assert characteristic.get_value("on") == "on"
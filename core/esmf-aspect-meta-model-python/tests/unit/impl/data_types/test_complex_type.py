@@ -58,8 +58,8 @@ class TestComplexType:
         """Test preferred_names property with no extends."""
         DefaultComplexType.urn = None
         DefaultComplexType._instances = {}
-        DefaultComplexType._preferred_names = {"name": "instance"}
         complex_type = DefaultComplexType(self.meta_model_mock, [self.property_mock], "extends_urn")
+        complex_type._preferred_names = {"name": "instance"}
         result = complex_type.preferred_names
 
         assert result == {"name": "instance"}
@@ -71,8 +71,8 @@ class TestComplexType:
         complex_type_data_mock = mock.MagicMock(name="complex_type_data")
         complex_type_data_mock.preferred_names = {"preferred_name_1": "instance_1"}
         DefaultComplexType._instances = {"extends_urn": complex_type_data_mock}
-        DefaultComplexType._preferred_names = {"preferred_name_2": "instance_2"}
         complex_type = DefaultComplexType(self.meta_model_mock, [self.property_mock], "extends_urn")
+        complex_type._preferred_names = {"preferred_name_2": "instance_2"}
         result = complex_type.preferred_names
 
         assert "preferred_name_1" in result
@@ -85,8 +85,8 @@ class TestComplexType:
         """Test descriptions property with no extends."""
         DefaultComplexType.urn = None
         DefaultComplexType._instances = {}
-        DefaultComplexType._descriptions = {"name": "description"}
         complex_type = DefaultComplexType(self.meta_model_mock, [self.property_mock], "extends_urn")
+        complex_type._descriptions = {"name": "description"}
         result = complex_type.descriptions
 
         assert result == {"name": "description"}
@@ -98,8 +98,8 @@ class TestComplexType:
         complex_type_data_mock = mock.MagicMock(name="complex_type_data")
         complex_type_data_mock.descriptions = {"name_1": "descriptions_1"}
         DefaultComplexType._instances = {"extends_urn": complex_type_data_mock}
-        DefaultComplexType._descriptions = {"name_2": "descriptions_2"}
         complex_type = DefaultComplexType(self.meta_model_mock, [self.property_mock], "extends_urn")
+        complex_type._descriptions = {"name_2": "descriptions_2"}
         result = complex_type.descriptions
 
         assert "name_1" in result
@@ -112,8 +112,8 @@ class TestComplexType:
         """Test see property with no extends."""
         DefaultComplexType.urn = None
         DefaultComplexType._instances = {}
-        DefaultComplexType._see = ["see"]
         complex_type = DefaultComplexType(self.meta_model_mock, [self.property_mock], "extends_urn")
+        complex_type._see = ["see"]
         result = complex_type.see
 
         assert result == ["see"]
@@ -125,8 +125,8 @@ class TestComplexType:
         complex_type_data_mock = mock.MagicMock(name="complex_type_data")
         complex_type_data_mock.see = ["see_1"]
         DefaultComplexType._instances = {"extends_urn": complex_type_data_mock}
-        DefaultComplexType._see = ["see_2"]
         complex_type = DefaultComplexType(self.meta_model_mock, [self.property_mock], "extends_urn")
+        complex_type._see = ["see_2"]
         result = complex_type.see
 
         assert sorted(result) == ["see_1", "see_2"]
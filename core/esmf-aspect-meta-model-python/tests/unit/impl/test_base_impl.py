@@ -1,5 +1,7 @@
 """BaseImpl class unit tests suit."""
 
+import weakref
+
 from unittest import mock
 
 import pytest
@@ -25,11 +27,25 @@ def get_meta_model_mock():
     return meta_model_mock
 
 
+class BaseImplWithAttributes(BaseImpl):
+    """BaseImpl with an instance dictionary, for the attributes set by the tests."""
+
+
 class TestBaseImpl:
     """BaseImpl unit tests class."""
 
     meta_model_mock = get_meta_model_mock()
 
+    def test_hash(self):
+        """Test the hash of an element is the hash of its URN, or the identity without URN."""
+        element = BaseImpl(self.meta_model_mock)
+        anonymous = BaseImplWithAttributes(self.meta_model_mock)
+        anonymous._urn = None
+
+        assert hash(element) == hash("urn")
+        assert hash(anonymous) == object.__hash__(anonymous)
+        assert element != BaseImpl(self.meta_model_mock)
+
     def test_init(self):
         """Test BaseImpl initialization and attribute assignment."""
         result = BaseImpl(self.meta_model_mock)
@@ -41,6 +57,17 @@ class TestBaseImpl:
         assert result._descriptions == "descriptions"
         assert result._see == "see"
         assert result._parent_elements is None
+        assert result._shared is False
+        assert result._frozen is False
+
+    def test_slots(self):
+        """Test BaseImpl keeps its state in slots and can be weakly referenced."""
+        base = BaseImpl(self.meta_model_mock)
+
+        assert not hasattr(base, "__dict__")
+        assert weakref.ref(base)() is base
+        with pytest.raises(AttributeError):
+            base.unknown_attribute = "value"
 
     def test_parent_elements_getter_none(self):
         """Test parent_elements returns None if not set."""
@@ -201,7 +228,7 @@ class TestBaseImpl:
     def test_get_scalar_attr_info(self, prepare_attr_message_mock):
         """Test _get_scalar_attr_info output."""
         prepare_attr_message_mock.return_value = "attr_message"
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.SCALAR_ATTR_NAMES = ("attr_name",)
         base.attr_name = "attr_value"
         result = base._get_scalar_attr_info()
@@ -210,7 +237,7 @@ class TestBaseImpl:
 
     def test_get_scalar_attr_info_no_attr_value(self):
         """Test _get_scalar_attr_info output when attribute value is None."""
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.SCALAR_ATTR_NAMES = ("attr_name",)
         base.attr_name = None
         result = base._get_scalar_attr_info()
@@ -241,7 +268,7 @@ class TestBaseImpl:
     def test_get_list_attr_info(self, prepare_list_attr_message_mock):
         """Test _get_list_attr_info output."""
         prepare_list_attr_message_mock.return_value = "attr_message"
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.LIST_ATTR_NAMES = ["attr_name"]
         base.attr_name = "attr_value"
         result = base._get_list_attr_info()
@@ -250,7 +277,7 @@ class TestBaseImpl:
 
     def test_get_list_attr_info_no_attr_value(self):
         """Test _get_list_attr_info output when attribute value is None."""
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.LIST_ATTR_NAMES = ["attr_name"]
         base.attr_name = None
         result = base._get_list_attr_info()
@@ -276,7 +303,7 @@ class TestBaseImpl:
         isinstance_mock.side_effect = (True, True)
         attr_value_mock = mock.MagicMock(name="attr_value")
         attr_value_mock.urn = "urn:model#aspect"
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.REQUIRED_ATTRS = "attr_name"
         validating_attrs = set()
         result = base._validate_attribute("attr_name", attr_value_mock, validating_attrs)
@@ -291,7 +318,7 @@ class TestBaseImpl:
         isinstance_mock.side_effect = (True, False)
         attr_value_mock = mock.MagicMock(name="attr_value")
         attr_value_mock.urn = "urn:model#aspect"
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.REQUIRED_ATTRS = ["other_attr_name"]
         validating_attrs = set()
         result = base._validate_attribute("attr_name", attr_value_mock, validating_attrs)
@@ -302,14 +329,14 @@ class TestBaseImpl:
 
     def test_validate_attribute_raise_exception(self):
         """Test _validate_attribute with missing required value."""
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.REQUIRED_ATTRS = "attr_name"
         validating_attrs = set()
         attr_value = None
         with pytest.raises(ValueError) as error:
             base._validate_attribute("attr_name", attr_value, validating_attrs)
 
-        assert str(error.value) == "BaseImpl is missing required attribute: attr_name."
+        assert str(error.value) == "BaseImplWithAttributes is missing required attribute: attr_name."
 
     def test_validate_attribute_discards_key_on_exception(self):
         """The cycle-guard key must be discarded even when validation raises.
@@ -317,7 +344,7 @@ class TestBaseImpl:
         Regression test for the mutable-default-argument leak: a failed validation must not leave a
         stale key behind that would silently skip the same check on a subsequent call.
         """
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.REQUIRED_ATTRS = ("attr_name",)
         validating_attrs: set = set()
 
@@ -349,7 +376,7 @@ class TestBaseImpl:
 
     def test_validate(self):
         """Test validate method with valid attributes."""
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.SCALAR_ATTR_NAMES = ("scalar_attr",)
         base.LIST_ATTR_NAMES = ("list_attr",)
         base.scalar_attr = "scalar_value"
@@ -369,7 +396,7 @@ class TestBaseImpl:
 
     def test_validate_empty_input_set(self):
         """Test validate method with valid attributes."""
-        base = BaseImpl(self.meta_model_mock)
+        base = BaseImplWithAttributes(self.meta_model_mock)
         base.SCALAR_ATTR_NAMES = ("scalar_attr",)
         base.LIST_ATTR_NAMES = ("list_attr",)
         base.scalar_attr = "scalar_value"
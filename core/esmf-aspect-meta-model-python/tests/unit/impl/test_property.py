@@ -247,10 +247,9 @@ class TestDefaultProperty:
 
     def test_characteristic_setter(self):
         """Test setting the characteristic and parent element assignment."""
-        set_characteristic_mock = mock.MagicMock(name="set_characteristic")
         property_cls = self._get_property_class()
-        property_cls._set_characteristic = set_characteristic_mock
-        property_cls.characteristic = "characteristic"
+        with mock.patch.object(DefaultProperty, "_set_characteristic") as set_characteristic_mock:
+            property_cls.characteristic = "characteristic"
 
         set_characteristic_mock.assert_called_once_with("characteristic")
 
@@ -52,9 +52,9 @@ class TestAbstractPropertyInstantiator:
         """Test _create_property_direct_reference creates a direct reference property."""
         base_class_mock = mock.MagicMock(name="AbstractPropertyInstantiator_class")
         base_class_mock._get_base_attributes = mock.MagicMock(return_value="meta_model_base_attributes")
-        aspect_graph_mock = mock.MagicMock(name="AspectGraph")
-        aspect_graph_mock.value.return_value = "example_value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "example_value"
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
         base_class_mock._samm = samm_mock
@@ -67,7 +67,8 @@ class TestAbstractPropertyInstantiator:
         assert result == "default_property"
         base_class_mock._get_base_attributes.assert_called_once_with("element_node")
         samm_mock.get_urn.assert_called_once_with(SAMM.example_value)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         default_abstract_property_mock.assert_called_once_with(
             "meta_model_base_attributes",
             example_value="example_value",
@@ -82,9 +83,9 @@ class TestAbstractPropertyInstantiator:
         base_class_mock = mock.MagicMock(name="AbstractPropertyInstantiator_class")
         base_class_mock._get_child.return_value = "payload_name"
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
-        aspect_graph_mock = mock.MagicMock(name="AspectGraph")
-        aspect_graph_mock.value.side_effect = ("optional", "not_in_payload", "property_node", "example_value")
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = ("optional", "not_in_payload", "property_node", "example_value")
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
         base_class_mock._samm = samm_mock
@@ -95,12 +96,12 @@ class TestAbstractPropertyInstantiator:
         )
 
         assert result == "default_property"
-        aspect_graph_mock.value.has_call(
+        description_mock.value.has_call(
             [
-                mock.call(subject="element_node", predicate="predicate"),
+                mock.call("predicate"),
             ]
         )
-        assert aspect_graph_mock.value.call_count == 4
+        assert description_mock.value.call_count == 4
         samm_mock.get_urn.assert_has_calls(
             [
                 mock.call(SAMM.optional),
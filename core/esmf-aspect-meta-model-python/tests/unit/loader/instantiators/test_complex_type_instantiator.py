@@ -14,18 +14,19 @@ class TestComplexTypeInstantiator:
         """Test get_extended_element returns extended element when node is not None."""
         base_class_mock = mock.MagicMock(name="ComplexTypeInstantiator_class")
         base_class_mock._model_element_factory = mock.MagicMock(return_value="_model_element_factory")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "extended_element_node"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "extended_element_node"
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         base_class_mock._samm = samm_mock
         base_class_mock._instantiating_now = []
         to_python_mock.return_value = "extended_element"
         result = ComplexTypeInstantiator.get_extended_element(base_class_mock, "entity_subject")
 
         assert result == "extended_element"
-        aspect_graph_mock.value.assert_called_once_with(subject="entity_subject", predicate="predicate")
+        base_class_mock._describe.assert_called_with("entity_subject")
+        description_mock.value.assert_called_once_with("predicate")
         samm_mock.get_urn.assert_has_calls(
             [
                 mock.call(SAMM.extends),
@@ -43,34 +44,36 @@ class TestComplexTypeInstantiator:
         _instantiating_now.
         """
         base_class_mock = mock.MagicMock(name="ComplexTypeInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "extended_element_node"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "extended_element_node"
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         base_class_mock._samm = samm_mock
         base_class_mock._instantiating_now = ["extended_element_node"]
         to_python_mock.return_value = "extended_element"
         result = ComplexTypeInstantiator.get_extended_element(base_class_mock, "entity_subject")
 
         assert result == "extended_element"
-        aspect_graph_mock.value.assert_called_once_with(subject="entity_subject", predicate="predicate")
+        base_class_mock._describe.assert_called_with("entity_subject")
+        description_mock.value.assert_called_once_with("predicate")
         samm_mock.get_urn.assert_called_once_with(SAMM.extends)
         to_python_mock.assert_called_once_with("extended_element_node")
 
     def test_get_extended_element_extended_element_node_is_none(self):
         """Test get_extended_element returns None when extended element node is None."""
         base_class_mock = mock.MagicMock(name="ComplexTypeInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = None
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = None
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         base_class_mock._samm = samm_mock
         result = ComplexTypeInstantiator.get_extended_element(base_class_mock, "entity_subject")
 
         assert result is None
-        aspect_graph_mock.value.assert_called_once_with(subject="entity_subject", predicate="predicate")
+        base_class_mock._describe.assert_called_with("entity_subject")
+        description_mock.value.assert_called_once_with("predicate")
         samm_mock.get_urn.assert_called_once_with(SAMM.extends)
 
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.complex_type_instantiator.RdfHelper.to_python")
@@ -21,9 +21,9 @@ class TestEncodingConstraintInstantiator:
         base_class_mock = mock.MagicMock(name="EncodingConstraintInstantiator_class")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         base_class_mock._get_child.side_effect = ("left", "right")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "base_value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "base_value"
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
         base_class_mock._samm = samm_mock
@@ -34,5 +34,6 @@ class TestEncodingConstraintInstantiator:
         assert result == "instance"
         base_class_mock._get_base_attributes.assert_called_once_with("element_node")
         samm_mock.get_urn.assert_called_once_with(SAMM.value)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         default_encoding_constraint_mock.assert_called_once_with("meta_model_base_attributes", "value")
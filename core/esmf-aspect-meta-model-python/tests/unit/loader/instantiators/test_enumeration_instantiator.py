@@ -23,10 +23,12 @@ class TestEnumerationInstantiator:
         base_class_mock._get_data_type.return_value = "data_type"
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         base_class_mock.get_extended_element.return_value = "extends_element"
-        base_class_mock._EnumerationInstantiator__to_enum_node_value.return_value = "value"
+        base_class_mock._create_values.return_value = "values"
         aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "value_collection_node"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "value_collection_node"
         base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -37,11 +39,55 @@ class TestEnumerationInstantiator:
         assert result == "instance"
         base_class_mock._get_data_type.assert_called_once_with("element_node")
         base_class_mock._get_base_attributes.assert_called_once_with("element_node")
-        base_class_mock._EnumerationInstantiator__to_enum_node_value.assert_called_once_with("value_node")
+        base_class_mock._create_values.assert_called_once_with(
+            ["value_node"], base_class_mock._EnumerationInstantiator__to_enum_node_value
+        )
         sammc_mock.get_urn.assert_called_once_with(SAMMC.values)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         get_rdf_list_values_mock.assert_called_once_with("value_collection_node", aspect_graph_mock)
-        default_enumeration_mock.assert_called_once_with("meta_model_base_attributes", "data_type", ["value"])
+        default_enumeration_mock.assert_called_once_with("meta_model_base_attributes", "data_type", "values")
+
+    def test_create_values(self):
+        """Test _create_values method in lazy mode."""
+        base_class_mock = mock.MagicMock(name="EnumerationInstantiator_class")
+        base_class_mock._model_element_factory.is_lazy.return_value = True
+        base_class_mock._samm.get_urn.return_value = rdflib.URIRef("urn:samm:name")
+        base_class_mock._get_value_key.side_effect = lambda value_node: str(value_node).split("#")[1]
+        to_value_mock = mock.MagicMock(name="to_value", side_effect=lambda value_node: f"value_{value_node}")
+        value_nodes = [rdflib.URIRef("urn:node#first"), None, rdflib.URIRef("urn:node#second")]
+        result = EnumerationInstantiator._create_values(base_class_mock, value_nodes, to_value_mock)
+
+        to_value_mock.assert_not_called()
+        base_class_mock._samm.get_urn.assert_called_once_with(SAMM.name)
+        assert len(result) == 2
+        assert result.get("second") == "value_urn:node#second"
+        to_value_mock.assert_called_once_with(rdflib.URIRef("urn:node#second"))
+        assert list(result) == ["value_urn:node#first", "value_urn:node#second"]
+
+    def test_create_values_not_lazy(self):
+        """Test _create_values materializes the values at once if the factory is not lazy."""
+        base_class_mock = mock.MagicMock(name="EnumerationInstantiator_class")
+        base_class_mock._model_element_factory.is_lazy.return_value = False
+        base_class_mock._samm.get_urn.return_value = rdflib.URIRef("urn:samm:name")
+        to_value_mock = mock.MagicMock(name="to_value", side_effect=lambda value_node: f"value_{value_node}")
+        value_nodes = [rdflib.URIRef("urn:node#first"), rdflib.URIRef("urn:node#second")]
+        result = EnumerationInstantiator._create_values(base_class_mock, value_nodes, to_value_mock)
+
+        assert result.is_materialized is True
+        assert result._materialize is None
+        assert result._get_key is None
+        assert to_value_mock.call_count == 2
+        assert result == ["value_urn:node#first", "value_urn:node#second"]
+
+    def test_get_value_key(self):
+        """Test _get_value_key method."""
+        base_class_mock = mock.MagicMock(name="EnumerationInstantiator_class")
+
+        assert EnumerationInstantiator._get_value_key(base_class_mock, rdflib.Literal(42)) == 42
+        assert EnumerationInstantiator._get_value_key(base_class_mock, rdflib.URIRef("urn:value")) == "urn:value"
+        assert EnumerationInstantiator._get_value_key(base_class_mock, rdflib.URIRef("urn:node#name")) == "name"
+        assert EnumerationInstantiator._get_value_key(base_class_mock, rdflib.BNode()) is None
 
     def test_get_name(self):
         """Test _get_node_name returns name from node URI."""
@@ -81,12 +127,12 @@ class TestEnumerationInstantiator:
         base_class_mock._EnumerationInstantiator__is_collection_value.return_value = True
         base_class_mock._EnumerationInstantiator__instantiate_enum_collection.return_value = "property_actual_value"
         base_class_mock._get_node_name.return_value = "value_node_name"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.predicate_objects.return_value = [
+        description_mock = mock.MagicMock(name="description")
+        description_mock.predicate_objects.return_value = [
             ("property_urn#entity", "entity_value"),
             ("property_urn#property", "property_value"),
         ]
-        base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         value_mock = mock.MagicMock(name="value")
         value_mock.toPython.return_value = "value_key"
@@ -102,7 +148,8 @@ class TestEnumerationInstantiator:
         assert result["property"] == "property_actual_value"
         assert "value_key" in result
         assert result["value_key"] == "value_node_name"
-        aspect_graph_mock.predicate_objects.assert_called_once_with("value_node#value_node_name")
+        base_class_mock._describe.assert_called_once_with("value_node#value_node_name")
+        description_mock.predicate_objects.assert_called_once_with()
         base_class_mock._EnumerationInstantiator__is_collection_value.assert_called_once_with("property_urn#property")
         base_class_mock._EnumerationInstantiator__instantiate_enum_collection.assert_called_once_with("property_value")
         samm_mock.get_urn.assert_called_once_with(SAMM.name)
@@ -116,12 +163,12 @@ class TestEnumerationInstantiator:
         base_class_mock._EnumerationInstantiator__is_collection_value.side_effect = (False, False)
         base_class_mock._EnumerationInstantiator__to_enum_node_value.side_effect = ("actual_value_1", "actual_value_2")
         base_class_mock._get_node_name.return_value = "value_node_name"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.predicate_objects.return_value = [
+        description_mock = mock.MagicMock(name="description")
+        description_mock.predicate_objects.return_value = [
             ("property_urn#see", "property_value_1"),
             ("property_urn#see", "property_value_2"),
         ]
-        base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         value_mock = mock.MagicMock(name="value")
         value_mock.toPython.return_value = "value_key"
@@ -137,7 +184,8 @@ class TestEnumerationInstantiator:
         assert sorted(result["see"]) == ["actual_value_1", "actual_value_2"]
         assert "value_key" in result
         assert result["value_key"] == "value_node_name"
-        aspect_graph_mock.predicate_objects.assert_called_once_with("value_node#value_node_name")
+        base_class_mock._describe.assert_called_once_with("value_node#value_node_name")
+        description_mock.predicate_objects.assert_called_once_with()
         base_class_mock._EnumerationInstantiator__is_collection_value.assert_has_calls(
             [
                 mock.call("property_urn#see"),
@@ -237,9 +285,9 @@ class TestEnumerationInstantiator:
     def test_is_collection_value(self):
         """Test __is_collection_value returns True for collection type."""
         base_class_mock = mock.MagicMock(name="EnumerationInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = ("characteristic", "characteristic_type")
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = ("characteristic", "characteristic_type")
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
         base_class_mock._samm = samm_mock
@@ -252,10 +300,11 @@ class TestEnumerationInstantiator:
         )
 
         assert result is True
-        aspect_graph_mock.value.assert_has_calls(
+        base_class_mock._describe.assert_has_calls([mock.call("property_subject"), mock.call("characteristic")])
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="property_subject", predicate="predicate"),
-                mock.call(subject="characteristic", predicate=rdflib.RDF.type),
+                mock.call("predicate"),
+                mock.call(rdflib.RDF.type),
             ]
         )
         samm_mock.get_urn.assert_called_once_with(SAMM.characteristic)
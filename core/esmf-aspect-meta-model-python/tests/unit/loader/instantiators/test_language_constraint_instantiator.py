@@ -21,9 +21,9 @@ class TestLanguageConstraintInstantiator:
     def test_create_instance(self, default_language_constraint_mock, to_python_mock):
         base_class_mock = mock.MagicMock(name="LanguageConstraintInstantiator_class")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "value"
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -34,6 +34,7 @@ class TestLanguageConstraintInstantiator:
         assert result == "instance"
         base_class_mock._get_base_attributes.assert_called_once_with("element_node")
         sammc_mock.get_urn.assert_called_once_with(SAMMC.language_code)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         to_python_mock.assert_called_once_with("value")
         default_language_constraint_mock.assert_called_once_with("meta_model_base_attributes", "language_code")
@@ -18,9 +18,9 @@ class TestLengthConstraintInstantiator:
     def test_create_instance(self, default_length_constraint_mock, to_python_mock):
         base_class_mock = mock.MagicMock(name="LengthConstraintInstantiator_class")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "value"
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -36,8 +36,8 @@ class TestLengthConstraintInstantiator:
                 mock.call(SAMMC.max_value),
             ]
         )
-        aspect_graph_mock.value.assert_has_calls([mock.call(subject="element_node", predicate="predicate")])
-        assert aspect_graph_mock.value.call_count == 2
+        description_mock.value.assert_has_calls([mock.call("predicate")])
+        assert description_mock.value.call_count == 2
         to_python_mock.assert_has_calls([mock.call("value")])
         assert to_python_mock.call_count == 2
         default_length_constraint_mock.assert_called_once_with("meta_model_base_attributes", 0, 10)
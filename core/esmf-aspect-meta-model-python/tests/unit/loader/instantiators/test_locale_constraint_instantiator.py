@@ -18,9 +18,9 @@ class TestLocaleConstraintInstantiator:
     def test_create_instance(self, default_locale_constraint_mock, to_python_mock):
         base_class_mock = mock.MagicMock(name="LocaleConstraintInstantiator_class")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "value"
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -30,7 +30,8 @@ class TestLocaleConstraintInstantiator:
 
         assert result == "instance"
         base_class_mock._get_base_attributes.assert_called_once_with("element_node")
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         sammc_mock.get_urn.assert_called_once_with(SAMMC.locale_code)
         to_python_mock.assert_called_once_with("value")
         default_locale_constraint_mock.assert_called_once_with("meta_model_base_attributes", "locale_code")
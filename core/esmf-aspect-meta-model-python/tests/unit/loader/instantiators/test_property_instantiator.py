@@ -39,15 +39,15 @@ class TestPropertyInstantiator:
     def test_create_instance_element_blank_node(self, isinstance_mock, create_property_blank_node_mock):
         """Test _create_instance for element_node as BNode with property value."""
         isinstance_mock.side_effect = (False, True)
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.value.return_value = "value"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "value"
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
         element_node_mock = mock.MagicMock(name="element_node")
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "urn"
         create_property_blank_node_mock.return_value = "property_instance"
         instantiator_cls = PropertyInstantiator(model_element_factory_mock)
-        instantiator_cls._aspect_graph = graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator_cls._samm = samm_mock
         result = instantiator_cls._create_instance(element_node_mock)
 
@@ -59,7 +59,8 @@ class TestPropertyInstantiator:
             ]
         )
         samm_mock.get_urn.assert_called_once_with(SAMM.property)
-        graph_mock.value.assert_called_once_with(subject=element_node_mock, predicate="urn")
+        model_element_factory_mock.describe.assert_called_with(element_node_mock)
+        description_mock.value.assert_called_once_with("urn")
         create_property_blank_node_mock.assert_called_once_with(element_node_mock)
 
     @mock.patch(
@@ -70,15 +71,15 @@ class TestPropertyInstantiator:
     def test_create_instance_element_node_with_extends(self, isinstance_mock, create_property_with_extends_mock):
         """Test _create_instance for element_node as BNode with extends value."""
         isinstance_mock.side_effect = (False, True)
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.value.side_effect = (None, "value")
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = (None, "value")
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
         element_node_mock = mock.MagicMock(name="element_node")
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ("urn1", "urn2")
         create_property_with_extends_mock.return_value = "property_instance"
         instantiator_cls = PropertyInstantiator(model_element_factory_mock)
-        instantiator_cls._aspect_graph = graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator_cls._samm = samm_mock
         result = instantiator_cls._create_instance(element_node_mock)
 
@@ -95,10 +96,10 @@ class TestPropertyInstantiator:
                 mock.call(SAMM.extends),
             ]
         )
-        graph_mock.value.assert_has_calls(
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject=element_node_mock, predicate="urn1"),
-                mock.call(subject=element_node_mock, predicate="urn2"),
+                mock.call("urn1"),
+                mock.call("urn2"),
             ]
         )
         create_property_with_extends_mock.assert_called_once_with(element_node_mock)
@@ -127,15 +128,15 @@ class TestPropertyInstantiator:
     ):
         """Test _create_instance for element_node as BNode with extends value."""
         isinstance_mock.side_effect = (False, True)
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.value.side_effect = (None, None)
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = (None, None)
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
         element_node_mock = mock.MagicMock(name="element_node")
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ("urn1", "urn2")
         create_property_with_extends_mock.return_value = "property_instance"
         instantiator_cls = PropertyInstantiator(model_element_factory_mock)
-        instantiator_cls._aspect_graph = graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator_cls._samm = samm_mock
         with pytest.raises(ValueError) as error:
             instantiator_cls._create_instance(element_node_mock)
@@ -154,13 +155,13 @@ class TestPropertyInstantiator:
         get_child_mock.return_value = "characteristic"
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ("characteristic_urn", "example_value_urn")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "example_value"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "example_value"
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator_cls = PropertyInstantiator(model_element_factory_mock)
         instantiator_cls._get_base_attributes = get_base_attributes_mock
         instantiator_cls._get_child = get_child_mock
         instantiator_cls._samm = samm_mock
-        instantiator_cls._aspect_graph = aspect_graph_mock
         result = instantiator_cls._create_property_direct_reference(element_node_mock)
 
         assert result == "default_property"
@@ -172,7 +173,8 @@ class TestPropertyInstantiator:
                 mock.call(SAMM.example_value),
             ]
         )
-        aspect_graph_mock.value.assert_called_once_with(subject=element_node_mock, predicate="example_value_urn")
+        model_element_factory_mock.describe.assert_called_once_with(element_node_mock)
+        description_mock.value.assert_called_once_with("example_value_urn")
         default_property_mock.assert_called_once_with(
             meta_model_base_attributes="base_attributes",
             characteristic="characteristic",
@@ -183,8 +185,8 @@ class TestPropertyInstantiator:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.property_instantiator.DefaultProperty")
     def test_create_property_blank_node(self, default_property_mock):
         """Test _create_property_blank_node creates DefaultProperty with correct args."""
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.value.side_effect = [
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = [
             "property",
             "optional",
             "not_in_payload",
@@ -206,7 +208,7 @@ class TestPropertyInstantiator:
         get_base_attributes_mock = mock.MagicMock(name="_get_base_attributes")
         get_base_attributes_mock.return_value = "meta_model_base_attributes"
         instantiator_cls = PropertyInstantiator(model_element_factory_mock)
-        instantiator_cls._aspect_graph = graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator_cls._samm = samm_mock
         instantiator_cls._get_child = get_child_mock
         instantiator_cls._get_base_attributes = get_base_attributes_mock
@@ -224,12 +226,12 @@ class TestPropertyInstantiator:
                 mock.call(SAMM.example_value),
             ]
         )
-        graph_mock.value.assert_has_calls(
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject=element_node_mock, predicate="property_urn"),
-                mock.call(subject=element_node_mock, predicate="optional_urn"),
-                mock.call(subject=element_node_mock, predicate="not_in_payload_urn"),
-                mock.call(subject="property", predicate="example_value_urn"),
+                mock.call("property_urn"),
+                mock.call("optional_urn"),
+                mock.call("not_in_payload_urn"),
+                mock.call("example_value_urn"),
             ]
         )
         get_child_mock.assert_has_calls(
@@ -250,30 +252,31 @@ class TestPropertyInstantiator:
 
     def test_create_property_blank_node_raise_exception(self):
         """Test _create_property_blank_node raises ValueError if property not found."""
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.value.return_value = ""
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = ""
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "urn"
         element_node_mock = mock.MagicMock(name="element_node")
         element_node_mock.__str__.return_value = "element_node"
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
         instantiator_cls = PropertyInstantiator(model_element_factory_mock)
-        instantiator_cls._aspect_graph = graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator_cls._samm = samm_mock
         with pytest.raises(ValueError) as error:
             instantiator_cls._create_property_blank_node(element_node_mock)
 
         assert str(error.value) == "Could not find property for the node element_node"
         samm_mock.get_urn.assert_called_once_with(SAMM.property)
-        graph_mock.value.assert_called_once_with(subject=element_node_mock, predicate="urn")
+        model_element_factory_mock.describe.assert_called_with(element_node_mock)
+        description_mock.value.assert_called_once_with("urn")
 
     # @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.property_instantiator.DefaultPropertyWithExtends")
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.property_instantiator.DefaultProperty")
     def test_create_property_with_extends(self, default_property_with_extends_mock):
         """Test _create_property_with_extends creates DefaultPropertyWithExtends with correct args."""
         element_node_mock = mock.MagicMock(name="element_node")
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.value.return_value = "example_value"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "example_value"
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ["payload_name_urn", "extends_urn", "characteristic_urn", "example_value_urn"]
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
@@ -286,11 +289,12 @@ class TestPropertyInstantiator:
         instantiator_cls._get_base_attributes = get_base_attributes_mock
         instantiator_cls._get_child = get_child_mock
         instantiator_cls._samm = samm_mock
-        instantiator_cls._aspect_graph = graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         result = instantiator_cls._create_property_with_extends(element_node_mock)
 
         assert result == "default_property_with_extends"
-        graph_mock.value.assert_called_once_with(subject=element_node_mock, predicate="example_value_urn")
+        model_element_factory_mock.describe.assert_called_with(element_node_mock)
+        description_mock.value.assert_called_once_with("example_value_urn")
         samm_mock.get_urn.assert_has_calls(
             [
                 mock.call(SAMM.payload_name),
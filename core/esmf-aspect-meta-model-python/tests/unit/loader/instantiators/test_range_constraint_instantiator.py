@@ -43,9 +43,9 @@ class TestRangeConstraintInstantiator:
     )
     def test_get_upper_bound_definition_range_constraint(self, get_bound_definition_mock):
         base_class_mock = mock.MagicMock(name="RangeConstraintInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "upper_bound_definition_value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "upper_bound_definition_value"
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -59,14 +59,15 @@ class TestRangeConstraintInstantiator:
 
         assert result == "instance"
         sammc_mock.get_urn.assert_called_once_with(SAMMC.upper_bound_definition)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         get_bound_definition_mock.assert_called_with("upper_bound_definition_value")
 
     def test_get_upper_bound_definition(self):
         base_class_mock = mock.MagicMock(name="RangeConstraintInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = None
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = None
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -79,7 +80,8 @@ class TestRangeConstraintInstantiator:
 
         assert result == BoundDefinition.OPEN
         sammc_mock.get_urn.assert_called_once_with(SAMMC.upper_bound_definition)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
 
     @mock.patch(
         "esmf_aspect_meta_model_python.loader.instantiator.range_constraint_instantiator."
@@ -87,9 +89,9 @@ class TestRangeConstraintInstantiator:
     )
     def test_get_lower_bound_definition_range_constraint(self, get_bound_definition_mock):
         base_class_mock = mock.MagicMock(name="RangeConstraintInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "lower_bound_definition_value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "lower_bound_definition_value"
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -103,14 +105,15 @@ class TestRangeConstraintInstantiator:
 
         assert result == "instance"
         sammc_mock.get_urn.assert_called_once_with(SAMMC.lower_bound_definition)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         get_bound_definition_mock.assert_called_with("lower_bound_definition_value")
 
     def test_get_lower_bound_definition(self):
         base_class_mock = mock.MagicMock(name="RangeConstraintInstantiator_class")
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = None
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = None
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -123,15 +126,16 @@ class TestRangeConstraintInstantiator:
 
         assert result == BoundDefinition.OPEN
         sammc_mock.get_urn.assert_called_once_with(SAMMC.lower_bound_definition)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
 
     def test_get_max_value(self):
         base_class_mock = mock.MagicMock(name="RangeConstraintInstantiator_class")
         max_value_mock = mock.MagicMock(name="max_value")
         max_value_mock.toPython.return_value = "max_value"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = max_value_mock
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = max_value_mock
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -143,16 +147,17 @@ class TestRangeConstraintInstantiator:
 
         assert result == "max_value"
         sammc_mock.get_urn.assert_called_once_with(SAMMC.max_value)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         max_value_mock.toPython.assert_called_once()
 
     def test_get_min_value(self):
         base_class_mock = mock.MagicMock(name="RangeConstraintInstantiator_class")
         max_value_mock = mock.MagicMock(name="max_value")
         max_value_mock.toPython.return_value = "max_value"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = max_value_mock
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = max_value_mock
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -164,7 +169,8 @@ class TestRangeConstraintInstantiator:
 
         assert result == "max_value"
         sammc_mock.get_urn.assert_called_once_with(SAMMC.min_value)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         max_value_mock.toPython.assert_called_once()
 
     def test_get_bound_definition(self):
@@ -23,9 +23,9 @@ class TestRegularExpressionConstraintInstantiator:
         base_class_mock = mock.MagicMock(name="RegularExpressionConstraintInstantiator_class")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
         to_python_mock.return_value = "value"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "graph_value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "graph_value"
+        base_class_mock._describe.return_value = description_mock
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.return_value = "predicate"
         base_class_mock._samm = samm_mock
@@ -35,6 +35,7 @@ class TestRegularExpressionConstraintInstantiator:
         assert result == "instance"
         base_class_mock._get_base_attributes.assert_called_once_with("element_node")
         samm_mock.get_urn.assert_called_once_with(SAMM.value)
-        aspect_graph_mock.value.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.value.assert_called_once_with("predicate")
         to_python_mock.assert_called_once_with("graph_value")
         default_regular_expression_constraint_mock.assert_called_once_with("meta_model_base_attributes", "value")
@@ -3,6 +3,7 @@
 from unittest import mock
 
 import pytest
+import rdflib
 
 from esmf_aspect_meta_model_python.loader.instantiator.state_instantiator import StateInstantiator
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
@@ -33,15 +34,17 @@ class TestStateInstantiator:
         """Test _create_instance method."""
         get_data_type_mock.return_value = "data_type"
         get_base_attributes_mock.return_value = "meta_model_base_attributes"
-        to_state_node_value_mock.side_effect = ("value", "default")
+        to_state_node_value_mock.side_effect = ("default", "value")
         aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = ("value_collection_node", "defaultValue")
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = ("value_collection_node", "defaultValue")
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.side_effect = ("predicate_1", "predicate_2")
-        get_rdf_list_values_mock.return_value = ["element_node"]
+        get_rdf_list_values_mock.return_value = [rdflib.Literal("element_node")]
         model_elements_mock = mock.MagicMock(name="model_elements")
         instantiator = StateInstantiator(model_elements_mock)
         instantiator._aspect_graph = aspect_graph_mock
+        model_elements_mock.describe.return_value = description_mock
         instantiator._sammc = sammc_mock
         element_node_mock = mock.MagicMock(name="element_node")
         default_state_mock.return_value = "instance"
@@ -56,26 +59,39 @@ class TestStateInstantiator:
                 mock.call(SAMMC.default_value),
             ]
         )
-        aspect_graph_mock.value.assert_has_calls(
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject=element_node_mock, predicate="predicate_1"),
-                mock.call(subject=element_node_mock, predicate="predicate_2"),
+                mock.call("predicate_1"),
+                mock.call("predicate_2"),
             ]
         )
-        assert aspect_graph_mock.value.call_count == 2
+        assert description_mock.value.call_count == 2
         get_rdf_list_values_mock.assert_called_once_with("value_collection_node", aspect_graph_mock)
-        to_state_node_value_mock.assert_has_calls(
-            [
-                mock.call("element_node"),
-                mock.call("defaultValue"),
-            ]
-        )
+        to_state_node_value_mock.assert_called_once_with("defaultValue")
         default_state_mock.assert_called_once_with(
             "meta_model_base_attributes",
             "data_type",
-            ["value"],
+            mock.ANY,
             "default",
         )
+        assert list(default_state_mock.call_args.args[2]) == ["value"]
+        to_state_node_value_mock.assert_called_with(rdflib.Literal("element_node"))
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.state_instantiator.RdfHelper.get_rdf_list_values")
+    @mock.patch(
+        "esmf_aspect_meta_model_python.loader.instantiator.state_instantiator.StateInstantiator._get_base_attributes"
+    )
+    @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.state_instantiator.StateInstantiator._get_data_type")
+    def test_create_instance_raise_exception(self, get_data_type_mock, _, get_rdf_list_values_mock):
+        """Test _create_instance raises TypeError for a blank node value before the values are materialized."""
+        get_data_type_mock.return_value = "data_type"
+        get_rdf_list_values_mock.return_value = [rdflib.Literal("value"), rdflib.BNode()]
+        model_elements_mock = mock.MagicMock(name="model_elements")
+        instantiator = StateInstantiator(model_elements_mock)
+        with pytest.raises(TypeError) as error:
+            instantiator._create_instance("element_node")
+
+        assert "Values of type BNode are not allowed" in str(error.value)
 
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator.state_instantiator.isinstance")
     def test_to_state_node_value_rdflib_literal(self, isinstance_mock):
@@ -99,10 +115,10 @@ class TestStateInstantiator:
     def test_to_state_node_value_rdflib_uriref_state_value(self, isinstance_mock, is_collection_value_mock):
         """Test __to_state_node_value with rdflib URIRef state value."""
         isinstance_mock.side_effect = (False, True, False, True, True)
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
+        description_mock = mock.MagicMock(name="description")
         property_value_mock = mock.MagicMock(name="property_value")
         property_value_mock.toPython.return_value = "actual_value"
-        aspect_graph_mock.predicate_objects.return_value = [
+        description_mock.predicate_objects.return_value = [
             ("property_urn#property_name", "property_value"),
             ("property_urn#property_name", property_value_mock),
         ]
@@ -113,7 +129,7 @@ class TestStateInstantiator:
         samm_mock.get_urn.return_value = name_urn_mock
         model_elements_mock = mock.MagicMock(name="model_elements")
         instantiator = StateInstantiator(model_elements_mock)
-        instantiator._aspect_graph = aspect_graph_mock
+        model_elements_mock.describe.return_value = description_mock
         instantiator._samm = samm_mock
         result = instantiator._StateInstantiator__to_state_node_value("value_node#value_node_name")
 
@@ -121,7 +137,8 @@ class TestStateInstantiator:
         assert result["property_name"] == "actual_value"
         assert "value_key" in result
         assert result["value_key"] == "value_node_name"
-        aspect_graph_mock.predicate_objects.assert_called_once_with("value_node#value_node_name")
+        model_elements_mock.describe.assert_called_once_with("value_node#value_node_name")
+        description_mock.predicate_objects.assert_called_once_with()
         is_collection_value_mock.assert_called_once_with("property_urn#property_name")
         samm_mock.get_urn.assert_called_once_with(SAMM.name)
         name_urn_mock.toPython.assert_called_once()
@@ -143,8 +160,8 @@ class TestStateInstantiator:
     ):
         """Test __to_state_node_value with rdflib URIRef collection value."""
         isinstance_mock.side_effect = (False, True, True)
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.predicate_objects.return_value = [("property_urn#property_name", "property_value")]
+        description_mock = mock.MagicMock(name="description")
+        description_mock.predicate_objects.return_value = [("property_urn#property_name", "property_value")]
         is_collection_value_mock.return_value = True
         instantiate_enum_collection_mock.return_value = "actual_value"
         name_urn_mock = mock.MagicMock(name="name_urn")
@@ -153,7 +170,7 @@ class TestStateInstantiator:
         samm_mock.get_urn.return_value = name_urn_mock
         model_elements_mock = mock.MagicMock(name="model_elements")
         instantiator = StateInstantiator(model_elements_mock)
-        instantiator._aspect_graph = aspect_graph_mock
+        model_elements_mock.describe.return_value = description_mock
         instantiator._samm = samm_mock
         result = instantiator._StateInstantiator__to_state_node_value("value_node#value_node_name")
 
@@ -161,7 +178,8 @@ class TestStateInstantiator:
         assert result["property_name"] == "actual_value"
         assert "value_key" in result
         assert result["value_key"] == "value_node_name"
-        aspect_graph_mock.predicate_objects.assert_called_once_with("value_node#value_node_name")
+        model_elements_mock.describe.assert_called_once_with("value_node#value_node_name")
+        description_mock.predicate_objects.assert_called_once_with()
         is_collection_value_mock.assert_called_once_with("property_urn#property_name")
         instantiate_enum_collection_mock.assert_called_once_with("property_value")
         samm_mock.get_urn.assert_called_once_with(SAMM.name)
@@ -24,8 +24,10 @@ class TestStructuredValueInstantiator:
         base_class_mock._get_child.return_value = "element_characteristic"
         base_class_mock._StructuredValueInstantiator__to_element_node_value.return_value = "element"
         aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = ("deconstruction_rule_value", "element_nodes")
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = ("deconstruction_rule_value", "element_nodes")
         base_class_mock._aspect_graph = aspect_graph_mock
+        base_class_mock._describe.return_value = description_mock
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
@@ -43,12 +45,12 @@ class TestStructuredValueInstantiator:
                 mock.call(SAMMC.elements),
             ]
         )
-        aspect_graph_mock.value.assert_has_calls(
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="element_node", predicate="predicate"),
+                mock.call("predicate"),
             ]
         )
-        assert aspect_graph_mock.value.call_count == 2
+        assert description_mock.value.call_count == 2
         to_python_mock.assert_called_once_with("deconstruction_rule_value")
         get_rdf_list_values_mock.assert_called_once_with("element_nodes", aspect_graph_mock)
         base_class_mock._StructuredValueInstantiator__to_element_node_value.assert_called_once_with("element_node")
@@ -23,9 +23,9 @@ class TestTraitInstantiator:
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.side_effect = ("constraint_urn", "constraint_urn", "base_characteristic")
         base_class_mock._sammc = sammc_mock
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.objects.return_value = ["constraint_subject"]
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.objects.return_value = ["constraint_subject"]
+        base_class_mock._describe.return_value = description_mock
         default_trait_mock.return_value = "instance"
         isinstance_mock.return_value = True
         result = TraitInstantiator._create_instance(base_class_mock, "element_node")
@@ -36,7 +36,8 @@ class TestTraitInstantiator:
         base_class_mock._model_element_factory.create_element.assert_called_once_with(
             "constraint_subject", "element_node", attr_name="constraint_urn"
         )
-        aspect_graph_mock.objects.assert_called_once_with(subject="element_node", predicate="constraint_urn")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.objects.assert_called_once_with("constraint_urn")
         sammc_mock.get_urn.assert_has_calls(
             [
                 mock.call(SAMMC.constraint),
@@ -56,9 +57,9 @@ class TestTraitInstantiator:
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.side_effect = ("constraint_urn", "constraint_urn")
         base_class_mock._sammc = sammc_mock
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.objects.return_value = ["constraint_subject"]
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.objects.return_value = ["constraint_subject"]
+        base_class_mock._describe.return_value = description_mock
         isinstance_mock.return_value = False
         with pytest.raises(ValueError) as error:
             TraitInstantiator._create_instance(base_class_mock, "element_node")
@@ -68,7 +69,8 @@ class TestTraitInstantiator:
         base_class_mock._model_element_factory.create_element.assert_called_once_with(
             "constraint_subject", "element_node", attr_name="constraint_urn"
         )
-        aspect_graph_mock.objects.assert_called_once_with(subject="element_node", predicate="constraint_urn")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.objects.assert_called_once_with("constraint_urn")
         sammc_mock.get_urn.assert_has_calls(
             [
                 mock.call(SAMMC.constraint),
@@ -84,8 +86,8 @@ class TestTraitInstantiator:
         sammc_mock = mock.MagicMock(name="SAMMC")
         sammc_mock.get_urn.return_value = "predicate"
         base_class_mock._sammc = sammc_mock
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.objects.return_value = []
+        description_mock = mock.MagicMock(name="description")
+        description_mock.objects.return_value = []
         with pytest.raises(ValueError) as error:
             TraitInstantiator._create_instance(base_class_mock, "element_node")
 
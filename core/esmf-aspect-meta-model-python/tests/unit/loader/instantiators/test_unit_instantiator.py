@@ -23,9 +23,9 @@ class TestUnitInstantiator:
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ("urn", "urn", "urn", "urn", "predicate")
         base_class_mock._samm = samm_mock
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.objects.return_value = ["quantity_kind_node"]
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.objects.return_value = ["quantity_kind_node"]
+        base_class_mock._describe.return_value = description_mock
         default_unit_mock.return_value = "instance"
         result = UnitInstantiator._create_instance(base_class_mock, "element_node")
 
@@ -38,7 +38,8 @@ class TestUnitInstantiator:
         )
         assert base_class_mock._UnitInstantiator__get_unit_attribute_as_string.call_count == 4
         base_class_mock.instantiate_quantity_kind.assert_called_once_with("quantity_kind_node")
-        aspect_graph_mock.objects.assert_called_once_with(subject="element_node", predicate="predicate")
+        base_class_mock._describe.assert_called_with("element_node")
+        description_mock.objects.assert_called_once_with("predicate")
         samm_mock.get_urn.assert_has_calls(
             [
                 mock.call(SAMM.symbol),
@@ -72,9 +73,9 @@ class TestUnitInstantiator:
     def test_get_unit_attribute_as_string(self, to_python_mock):
         base_class_mock = mock.MagicMock(name="UnitInstantiator_class")
         base_class_mock._get_base_attributes.return_value = "meta_model_base_attributes"
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "attribute_value"
-        base_class_mock._aspect_graph = aspect_graph_mock
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "attribute_value"
+        base_class_mock._describe.return_value = description_mock
         to_python_mock.return_value = "attribute_as_string"
         result = UnitInstantiator._UnitInstantiator__get_unit_attribute_as_string(
             base_class_mock,
@@ -83,5 +84,6 @@ class TestUnitInstantiator:
         )
 
         assert result == "attribute_as_string"
-        aspect_graph_mock.value.assert_called_once_with("unit_subject", predicate="attribute")
+        base_class_mock._describe.assert_called_once_with("unit_subject")
+        description_mock.value.assert_called_once_with("attribute")
         to_python_mock.assert_called_once_with("attribute_value")
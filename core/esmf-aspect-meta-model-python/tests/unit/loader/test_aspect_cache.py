@@ -0,0 +1,205 @@
+"""AspectCache class test suit."""
+
+import os
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python import utils
+from esmf_aspect_meta_model_python.loader.aspect_cache import AspectCache
+
+
+class TestAspectCache:
+    """AspectCache class test suit."""
+
+    @pytest.fixture
+    def model_files(self, tmp_path):
+        main_path = tmp_path / "Aspect.ttl"
+        main_path.write_text("main")
+        dependency_path = tmp_path / "Dependency.ttl"
+        dependency_path.write_text("dependency")
+
+        return main_path, dependency_path
+
+    @pytest.fixture
+    def samm_graph_mock(self, model_files):
+        with mock.patch("esmf_aspect_meta_model_python.loader.aspect_cache.SAMMGraph") as samm_graph_class_mock:
+            samm_graph_mock = samm_graph_class_mock.return_value.parse.return_value
+            samm_graph_mock.load_aspect_model.side_effect = lambda: mock.MagicMock(name="aspect")
+            samm_graph_mock.resolution_report.files = {str(file_path): {} for file_path in model_files}
+            samm_graph_mock.resolution_report.folder_listings = {}
+            samm_graph_mock.resolution_report.total_triples = 10
+
+            yield samm_graph_class_mock
+
+    def test_init(self):
+        result = AspectCache()
+
+        assert result.max_entries == 128
+        assert result.max_triples is None
+        assert len(result) == 0
+        assert result.statistics == {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "triples": 0}
+
+    def test_load(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        result = cache.load(model_files[0], lazy=True)
+
+        assert result is not None
+        samm_graph_mock.return_value.parse.assert_called_once_with(str(model_files[0].resolve()), lazy=True)
+        assert cache.statistics == {"hits": 0, "misses": 1, "evictions": 0, "entries": 1, "triples": 10}
+
+    def test_load_hit(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        aspect = cache.load(model_files[0])
+        result = cache.load(str(model_files[0]))
+
+        assert result is aspect
+        samm_graph_mock.return_value.parse.assert_called_once()
+        assert cache.statistics["hits"] == 1
+
+    def test_load_hit_does_not_read_unchanged_files(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        cache.load(model_files[0])
+
+        with mock.patch("esmf_aspect_meta_model_python.loader.aspect_cache.Path.read_bytes") as read_bytes_mock:
+            cache.load(model_files[0])
+
+        read_bytes_mock.assert_not_called()
+
+    def test_load_other_resolver_options(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        aspect = cache.load(model_files[0])
+        lazy_aspect = cache.load(model_files[0], lazy=True)
+        result = cache.load(model_files[0], lazy=True)
+
+        assert lazy_aspect is not aspect
+        assert result is lazy_aspect
+        assert cache.load(model_files[0]) is aspect
+        assert samm_graph_mock.return_value.parse.call_count == 2
+        assert len(cache) == 2
+
+    def test_load_within_check_interval(self, model_files, samm_graph_mock):
+        cache = AspectCache(check_interval=60)
+        aspect = cache.load(model_files[0])
+
+        with mock.patch.object(cache, "get_fingerprint") as get_fingerprint_mock:
+            result = cache.load(model_files[0])
+
+        assert result is aspect
+        get_fingerprint_mock.assert_not_called()
+
+    def test_load_after_check_interval(self, model_files, samm_graph_mock):
+        cache = AspectCache(check_interval=60)
+        with mock.patch("esmf_aspect_meta_model_python.loader.aspect_cache.time.monotonic", return_value=0):
+            aspect = cache.load(model_files[0])
+        model_files[1].write_text("changed dependency")
+
+        with mock.patch("esmf_aspect_meta_model_python.loader.aspect_cache.time.monotonic", return_value=30):
+            stale_result = cache.load(model_files[0])
+        with mock.patch("esmf_aspect_meta_model_python.loader.aspect_cache.time.monotonic", return_value=61):
+            result = cache.load(model_files[0])
+
+        assert stale_result is aspect
+        assert result is not aspect
+        assert samm_graph_mock.return_value.parse.call_count == 2
+
+    def test_load_changed_dependency(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        aspect = cache.load(model_files[0])
+        model_files[1].write_text("changed dependency")
+        result = cache.load(model_files[0])
+
+        assert result is not aspect
+        assert samm_graph_mock.return_value.parse.call_count == 2
+        assert cache.statistics["misses"] == 2
+
+    def test_load_changed_content_with_same_stat(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        aspect = cache.load(model_files[0])
+        file_stat = model_files[1].stat()
+        model_files[1].write_text("DEPENDENCY")
+        os.utime(model_files[1], ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1))
+        result = cache.load(model_files[0])
+
+        assert result is not aspect
+
+    def test_load_deleted_dependency(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        cache.load(model_files[0])
+        model_files[1].unlink()
+        samm_graph_mock.return_value.parse.return_value.resolution_report.files = {str(model_files[0]): {}}
+        cache.load(model_files[0])
+
+        assert samm_graph_mock.return_value.parse.call_count == 2
+
+    def test_load_new_file_in_scanned_folder(self, model_files, samm_graph_mock, tmp_path):
+        samm_graph_mock.return_value.parse.return_value.resolution_report.folder_listings = {
+            str(tmp_path): utils.get_folder_listing(tmp_path)
+        }
+        cache = AspectCache()
+        aspect = cache.load(model_files[0])
+        (tmp_path / "New.ttl").write_text("new")
+        result = cache.load(model_files[0])
+
+        assert result is not aspect
+        assert samm_graph_mock.return_value.parse.call_count == 2
+
+    def test_load_dependency_changed_during_load(self, model_files, samm_graph_mock):
+        samm_graph_mock.return_value.parse.return_value.resolution_report.files = {
+            str(model_files[0]): {"digest": utils.get_file_digest(model_files[0])},
+            str(model_files[1]): {"digest": utils.get_file_digest(model_files[1])},
+        }
+        samm_graph_mock.return_value.parse.return_value.load_aspect_model.side_effect = lambda: (
+            model_files[1].write_text("changed during the load") or mock.MagicMock(name="aspect")
+        )
+        cache = AspectCache()
+        cache.load(model_files[0])
+
+        assert len(cache) == 0
+
+    def test_evict_by_count(self, tmp_path, samm_graph_mock):
+        cache = AspectCache(max_entries=2)
+        file_paths = []
+        for name in ("A", "B", "C"):
+            file_path = tmp_path / f"{name}.ttl"
+            file_path.write_text(name)
+            file_paths.append(file_path)
+
+        samm_graph_mock.return_value.parse.return_value.resolution_report.files = {}
+        cache.load(file_paths[0])
+        cache.load(file_paths[1])
+        cache.load(file_paths[0])
+        cache.load(file_paths[2])
+
+        assert len(cache) == 2
+        assert cache.statistics["evictions"] == 1
+        cache.load(file_paths[0])
+        assert cache.statistics["hits"] == 2
+
+    def test_evict_by_triples(self, tmp_path, samm_graph_mock):
+        cache = AspectCache(max_entries=None, max_triples=15)
+        samm_graph_mock.return_value.parse.return_value.resolution_report.files = {}
+        for name in ("A", "B"):
+            file_path = tmp_path / f"{name}.ttl"
+            file_path.write_text(name)
+            cache.load(file_path)
+
+        assert len(cache) == 1
+        assert cache.statistics == {"hits": 0, "misses": 2, "evictions": 1, "entries": 1, "triples": 10}
+
+    def test_invalidate(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        cache.load(model_files[0])
+        cache.load(model_files[0], lazy=True)
+        cache.invalidate(model_files[0])
+
+        assert len(cache) == 0
+
+    def test_clear(self, model_files, samm_graph_mock):
+        cache = AspectCache()
+        cache.load(model_files[0])
+        cache.load(model_files[0])
+        cache.clear()
+
+        assert cache.statistics == {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "triples": 0}
@@ -245,7 +245,9 @@ class TestDefaultElementCache:
         instance_mock_4 = MagicMock(name="instance_4")
         instance_mock_4.payload_name = None
         instance_mock_4.name = "foo"
-        cache._instance_cache = {"1": instance_mock_1, "2": instance_mock_2, "3": instance_mock_3, "4": instance_mock_4}
+        for key, instance_mock in (("1", instance_mock_1), ("2", instance_mock_2), ("3", instance_mock_3)):
+            cache.add_element(key, instance_mock)
+        cache.add_element("4", instance_mock_4)
         result = cache.get_by_name("foo")
 
         assert instance_mock_1 not in result
@@ -259,7 +261,8 @@ class TestDefaultElementCache:
         instance_mock_1.urn = "urn:foo"
         instance_mock_2 = MagicMock(name="instance_2")
         instance_mock_2.urn = "urn:bar"
-        cache._instance_cache = {"foo": instance_mock_1, "bar": instance_mock_2}
+        cache.add_element("foo", instance_mock_1)
+        cache.add_element("bar", instance_mock_2)
 
         assert cache.get_by_urn("urn:foo") is instance_mock_1
         assert cache.get_by_urn("urn:bar") is instance_mock_2
@@ -327,3 +330,59 @@ class TestDefaultElementCache:
 
         assert result is None
         assert cache._instance_cache["urn:instance"] is new_element_mock
+
+    def test_get_by_name_follows_overwrite(self):
+        """Test get_by_name no longer finds an element after its key is overwritten."""
+        cache = DefaultElementCache()
+        old_element_mock = MagicMock(name="old_element")
+        old_element_mock.payload_name = "old"
+        new_element_mock = MagicMock(name="new_element")
+        new_element_mock.payload_name = "new"
+        cache.add_element("key", old_element_mock)
+        cache.add_element("key", new_element_mock, overwrite=True)
+
+        assert cache.get_by_name("old") == []
+        assert cache.get_by_name("new") == [new_element_mock]
+
+    def test_get_by_urn_resolved_instance(self):
+        """Test get_by_urn finds elements added by resolve_instance."""
+        cache = DefaultElementCache()
+        instance_mock = MagicMock(name="instance")
+        instance_mock.urn = "urn:instance"
+        cache.resolve_instance(instance_mock)
+
+        assert cache.get_by_urn("urn:instance") is instance_mock
+
+    def test_find_by_type(self):
+        """Test find_by_type returns each element which is an instance of the type once."""
+
+        class _Element:
+            urn = "urn:element"
+            name = "element"
+
+        class _SubElement(_Element):
+            urn = "urn:sub_element"
+            name = "sub_element"
+
+        cache = DefaultElementCache()
+        element = _Element()
+        sub_element = _SubElement()
+        cache.resolve_instance(element)
+        cache.add_element("element", element)
+        cache.resolve_instance(sub_element)
+
+        assert cache.find_by_type(_Element) == [element, sub_element]
+        assert cache.find_by_type(_SubElement) == [sub_element]
+        assert cache.find_by_type(str) == []
+
+    def test_reset_clears_indexes(self):
+        """Test reset clears the secondary indexes."""
+        cache = DefaultElementCache()
+        instance_mock = MagicMock(name="instance")
+        instance_mock.urn = "urn:instance"
+        cache.resolve_instance(instance_mock)
+        cache.reset()
+
+        assert cache.get_by_urn("urn:instance") is None
+        assert cache._name_index == {}
+        assert cache._type_index == {}
@@ -0,0 +1,114 @@
+"""Element cache strategies test suite."""
+
+import gc
+import threading
+
+import pytest
+
+from esmf_aspect_meta_model_python.loader.default_element_cache import DeferredReference
+from esmf_aspect_meta_model_python.loader.element_cache_strategies import (
+    LRUElementCache,
+    SharedElementCache,
+    WeakElementCache,
+)
+from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
+
+
+class _Element:
+    def __init__(self, name):
+        self.name = name
+        self.urn = f"urn:samm:org.example:1.0.0#{name}"
+
+
+class TestLRUElementCache:
+    """LRU element cache test suite."""
+
+    def test_init_raise_error(self):
+        with pytest.raises(ValueError):
+            LRUElementCache(0)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUElementCache(2)
+        first, second, third = _Element("first"), _Element("second"), _Element("third")
+        cache.resolve_instance(first)
+        cache.resolve_instance(second)
+        cache.get(first.urn)
+        cache.resolve_instance(third)
+
+        assert cache.get(second.urn) is None
+        assert cache.get_by_name("second") == []
+        assert cache.get(first.urn) is first
+        assert cache.get(third.urn) is third
+        assert cache.statistics == {"hits": 3, "misses": 1, "evictions": 1, "entries": 2}
+
+    def test_keeps_elements_of_running_instantiation(self):
+        cache = LRUElementCache(1)
+        parent, target, other = _Element("parent"), _Element("target"), _Element("other")
+        cache.add_to_active_path(parent.urn)
+        cache.add_deferred_reference(DeferredReference(parent.urn, "attr", target.urn))
+        cache.resolve_instance(parent)
+        cache.resolve_instance(target)
+        cache.resolve_instance(other)
+
+        assert cache.get(parent.urn) is parent
+        assert cache.get(target.urn) is target
+        assert cache.get(other.urn) is other
+        assert cache.evictions == 0
+
+        cache.remove_from_active_path(parent.urn)
+        cache.restore_cycle_references()
+        cache.resolve_instance(_Element("last"))
+
+        assert cache.statistics["entries"] == 1
+        assert cache.evictions == 3
+
+
+class TestWeakElementCache:
+    """Weak element cache test suite."""
+
+    def test_unreferenced_elements_are_evicted(self):
+        cache = WeakElementCache()
+        kept, dropped = _Element("kept"), _Element("dropped")
+        cache.resolve_instance(kept)
+        cache.resolve_instance(dropped)
+        del dropped
+        gc.collect()
+
+        assert cache.get(kept.urn) is kept
+        assert cache.get("urn:samm:org.example:1.0.0#dropped") is None
+        assert cache.get_by_name("dropped") == []
+        assert cache.find_by_type(_Element) == [kept]
+        assert cache.evictions == 1
+
+    def test_overwritten_elements_are_not_evicted(self):
+        cache = WeakElementCache()
+        old_element, element = _Element("old"), _Element("element")
+        cache.add_element("key", old_element)
+        cache.add_element("key", element, overwrite=True)
+        gc.collect()
+
+        assert cache.get("key") is element
+        assert cache.evictions == 0
+
+
+class TestSharedElementCache:
+    """Shared element cache test suite."""
+
+    def test_active_path_is_thread_local(self):
+        cache = SharedElementCache()
+        cache.add_to_active_path("node")
+        in_other_thread = []
+        thread = threading.Thread(target=lambda: in_other_thread.append(cache.is_in_active_path("node")))
+        thread.start()
+        thread.join()
+
+        assert cache.is_in_active_path("node") is True
+        assert in_other_thread == [False]
+
+    def test_shared_by_samm_graphs(self):
+        cache = SharedElementCache()
+        element = _Element("element")
+        SAMMGraph(cache=cache)._cache.resolve_instance(element)
+
+        assert SAMMGraph(cache=cache).find_by_urn(element.urn) is element
+        assert SAMMGraph(cache=cache).cache_statistics["entries"] == 1
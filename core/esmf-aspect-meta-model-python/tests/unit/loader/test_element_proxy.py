@@ -0,0 +1,178 @@
+"""Element proxy test suit."""
+
+import pickle
+
+from unittest import mock
+
+import pytest
+
+from rdflib import BNode, Graph, URIRef
+
+from esmf_aspect_meta_model_python.base.characteristics.characteristic import Characteristic
+from esmf_aspect_meta_model_python.base.property import Property
+from esmf_aspect_meta_model_python.impl.characteristics.default_characteristic import DefaultCharacteristic
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.element_proxy import ElementProxy, is_resolved
+from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
+
+NAMESPACE = "urn:samm:org.example:1.0.0#"
+ASPECT_MODEL = """
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#> .
+@prefix samm-c: <urn:samm:org.eclipse.esmf.samm:characteristic:2.2.0#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix : <urn:samm:org.example:1.0.0#> .
+
+:TestAspect a samm:Aspect ;
+   samm:properties ( :first :second ) ;
+   samm:operations ( ) .
+
+:first a samm:Property ;
+   samm:characteristic :FirstCharacteristic .
+
+:second a samm:Property ;
+   samm:characteristic :SecondCharacteristic .
+
+:FirstCharacteristic a samm:Characteristic ;
+   samm:dataType xsd:string .
+
+:SecondCharacteristic a samm:Characteristic ;
+   samm:dataType xsd:int .
+"""
+
+
+def get_characteristic(name="Characteristic"):
+    base_attributes = MetaModelBaseAttributes("2.2.0", f"{NAMESPACE}{name}", name, {}, {}, [])
+
+    return DefaultCharacteristic(base_attributes, None)
+
+
+@pytest.fixture
+def factory_mock():
+    factory_mock = mock.MagicMock(name="factory")
+    factory_mock.resolve_proxy.return_value = get_characteristic()
+
+    return factory_mock
+
+
+class TestElementProxy:
+    """Element proxy test suit."""
+
+    def test_resolve_on_attribute_access(self, factory_mock):
+        proxy = ElementProxy(factory_mock, "node", "parent_links")
+
+        assert is_resolved(proxy) is False
+        factory_mock.resolve_proxy.assert_not_called()
+        assert proxy.name == "Characteristic"
+        assert proxy.urn == f"{NAMESPACE}Characteristic"
+        assert is_resolved(proxy) is True
+        factory_mock.resolve_proxy.assert_called_once_with("node", "parent_links", None, None)
+
+    def test_isinstance(self, factory_mock):
+        proxy = ElementProxy(factory_mock, "node")
+
+        assert isinstance(proxy, ElementProxy)
+        assert isinstance(proxy, Characteristic)
+        assert not isinstance(proxy, Property)
+        assert is_resolved(proxy) is True
+
+    def test_pending_parent_elements(self, factory_mock):
+        proxy = ElementProxy(factory_mock, "node")
+        proxy.append_parent_element("parent_1")
+
+        assert is_resolved(proxy) is False
+        assert proxy.parent_elements == ["parent_1"]
+        proxy.append_parent_element("parent_2")
+        assert proxy.parent_elements == ["parent_1", "parent_2"]
+
+    def test_set_attribute(self, factory_mock):
+        proxy = ElementProxy(factory_mock, "node")
+        proxy._data_type = "data_type"
+
+        assert factory_mock.resolve_proxy.return_value.data_type == "data_type"
+
+    def test_equality(self, factory_mock):
+        element = factory_mock.resolve_proxy.return_value
+        factory_mock.find_instance.return_value = None
+        proxy = ElementProxy(factory_mock, URIRef(f"{NAMESPACE}Characteristic"))
+        other = ElementProxy(factory_mock, URIRef(f"{NAMESPACE}Characteristic"))
+
+        assert proxy == other
+        assert proxy != element
+        assert hash(proxy) == hash(element)
+        assert element not in [proxy]
+        factory_mock.resolve_proxy.assert_not_called()
+        factory_mock.find_instance.return_value = element
+        assert proxy == element
+        assert element in [other]
+        assert proxy != get_characteristic()
+        factory_mock.resolve_proxy.assert_not_called()
+        assert str(proxy) == str(element)
+        assert repr(proxy) == repr(element)
+        assert proxy == element
+
+    def test_hash_blank_node(self, factory_mock):
+        proxy = ElementProxy(factory_mock, BNode())
+
+        assert hash(proxy) == hash(factory_mock.resolve_proxy.return_value)
+        assert is_resolved(proxy) is True
+
+    def test_pickle(self, factory_mock):
+        result = pickle.loads(pickle.dumps([ElementProxy(factory_mock, "node")]))
+
+        assert type(result[0]) is DefaultCharacteristic
+        assert result[0].name == "Characteristic"
+
+    def test_deferred(self, factory_mock):
+        factory_mock.resolve_proxy.return_value = None
+        proxy = ElementProxy(factory_mock, "node", None, "parent", "attr_name")
+
+        with pytest.raises(AttributeError) as error:
+            proxy.name
+
+        assert str(error.value) == "The model element node is being instantiated."
+        assert not isinstance(proxy, Characteristic)
+        assert is_resolved(proxy) is False
+        factory_mock.resolve_proxy.assert_called_with("node", None, "parent", "attr_name")
+
+    def test_is_resolved(self):
+        assert is_resolved(get_characteristic()) is True
+        assert is_resolved(None) is True
+
+    def test_lazy_factory(self):
+        graph = Graph().parse(data=ASPECT_MODEL, format="turtle")
+        cache = DefaultElementCache()
+        factory = ModelElementFactory("2.2.0", graph, cache, lazy=True)
+        aspect = factory.create_aspect(URIRef(f"{NAMESPACE}TestAspect"))
+        first, second = aspect.properties
+
+        assert [is_resolved(aspect_property) for aspect_property in aspect.properties] == [False, False]
+        assert [key for key, _ in cache.items()] == [f"{NAMESPACE}TestAspect"]
+        assert first.name == "first"
+        assert first.parent_elements == [aspect]
+        assert is_resolved(first.characteristic) is False
+        assert first.characteristic.data_type.urn == "http://www.w3.org/2001/XMLSchema#string"
+        assert first.characteristic.parent_elements == [first]
+        assert is_resolved(second) is False
+        assert cache.get_by_urn(f"{NAMESPACE}SecondCharacteristic") is None
+        assert factory._proxies.keys() == {URIRef(f"{NAMESPACE}second")}
+
+    def test_cycle_behind_proxy(self):
+        graph = Graph().parse(data=ASPECT_MODEL, format="turtle")
+        cache = DefaultElementCache()
+        factory = ModelElementFactory("2.2.0", graph, cache, lazy=True)
+        aspect = factory.create_aspect(URIRef(f"{NAMESPACE}TestAspect"))
+        first = aspect.properties[0]
+        first_node = URIRef(f"{NAMESPACE}first")
+        cache.add_to_active_path(first_node)
+
+        with pytest.raises(AttributeError):
+            first.name
+
+        assert len(cache._cycle_reference_store) == 1
+        cache.remove_from_active_path(first_node)
+        assert first.name == "first"
+        assert cache._cycle_reference_store == {}
+        assert aspect.properties[0] is first
+        assert len(aspect.properties) == 2
+        assert is_resolved(aspect.properties[1]) is False
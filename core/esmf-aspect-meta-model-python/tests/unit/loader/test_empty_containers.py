@@ -0,0 +1,90 @@
+"""Shared empty containers test suit."""
+
+import copy
+import pickle
+
+import pytest
+
+from esmf_aspect_meta_model_python.loader.empty_containers import EMPTY_DICT, EMPTY_LIST
+
+
+class TestEmptyDict:
+    """Shared empty dict test suit."""
+
+    def test_is_empty_dict(self):
+        assert isinstance(EMPTY_DICT, dict)
+        assert EMPTY_DICT == {}
+        assert not EMPTY_DICT
+        assert EMPTY_DICT.get("en") is None
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda value: value.__setitem__("en", "name"),
+            lambda value: value.__delitem__("en"),
+            lambda value: value.update({"en": "name"}),
+            lambda value: value.setdefault("en", "name"),
+            lambda value: value.pop("en"),
+            lambda value: value.popitem(),
+            lambda value: value.clear(),
+        ],
+    )
+    def test_cannot_be_changed(self, change):
+        with pytest.raises(TypeError) as error:
+            change(EMPTY_DICT)
+
+        assert str(error.value) == "The shared empty dict cannot be changed."
+        assert EMPTY_DICT == {}
+
+    def test_union_returns_new_dict(self):
+        result = EMPTY_DICT | {"en": "name"}
+
+        assert type(result) is dict
+        assert result == {"en": "name"}
+        assert EMPTY_DICT == {}
+
+    def test_copy_and_pickle_keep_identity(self):
+        assert copy.copy(EMPTY_DICT) is EMPTY_DICT
+        assert copy.deepcopy(EMPTY_DICT) is EMPTY_DICT
+        assert pickle.loads(pickle.dumps(EMPTY_DICT)) is EMPTY_DICT
+
+
+class TestEmptyList:
+    """Shared empty list test suit."""
+
+    def test_is_empty_list(self):
+        assert isinstance(EMPTY_LIST, list)
+        assert EMPTY_LIST == []
+        assert not EMPTY_LIST
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda value: value.append("see"),
+            lambda value: value.extend(["see"]),
+            lambda value: value.insert(0, "see"),
+            lambda value: value.__setitem__(slice(0, 0), ["see"]),
+            lambda value: value.__iadd__(["see"]),
+            lambda value: value.remove("see"),
+            lambda value: value.clear(),
+            lambda value: value.sort(),
+        ],
+    )
+    def test_cannot_be_changed(self, change):
+        with pytest.raises(TypeError) as error:
+            change(EMPTY_LIST)
+
+        assert str(error.value) == "The shared empty list cannot be changed."
+        assert EMPTY_LIST == []
+
+    def test_concatenation_returns_new_list(self):
+        result = EMPTY_LIST + ["see"]
+
+        assert type(result) is list
+        assert result == ["see"]
+        assert EMPTY_LIST == []
+
+    def test_copy_and_pickle_keep_identity(self):
+        assert copy.copy(EMPTY_LIST) is EMPTY_LIST
+        assert copy.deepcopy(EMPTY_LIST) is EMPTY_LIST
+        assert pickle.loads(pickle.dumps(EMPTY_LIST)) is EMPTY_LIST
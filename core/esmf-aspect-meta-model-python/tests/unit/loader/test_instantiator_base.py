@@ -30,6 +30,7 @@ class TestInstantiatorBase:
         model_element_factory_mock.get_unit.return_value = "unit"
         model_element_factory_mock.get_meta_model_version.return_value = "version"
         model_element_factory_mock.get_aspect_graph.return_value = "aspect_graph"
+        model_element_factory_mock.get_reverse_edge_index.return_value = "reverse_edge_index"
         result = InstantiatorBaseImpl(model_element_factory_mock)
 
         assert result._model_element_factory == model_element_factory_mock
@@ -38,6 +39,7 @@ class TestInstantiatorBase:
         assert result._unit == "unit"
         assert result._meta_model_version == "version"
         assert result._aspect_graph == "aspect_graph"
+        assert result._reverse_edge_index == "reverse_edge_index"
         assert result._existing_instances == dict()
 
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator_base.RdfHelper.to_python")
@@ -64,6 +66,14 @@ class TestInstantiatorBase:
         to_python_mock.assert_called_once_with("element_node")
         instantiator._existing_instances["urn"] = "instance"
 
+    def test_clear_existing_instances(self):
+        """Test clear_existing_instances drops the generated instances."""
+        instantiator = InstantiatorBaseImpl(MagicMock(name="model_element_factory"))
+        instantiator._existing_instances = {"urn": "instance"}
+        instantiator.clear_existing_instances()
+
+        assert instantiator._existing_instances == {}
+
     @mock.patch(
         "esmf_aspect_meta_model_python.loader.instantiator_base.MetaModelBaseAttributes.from_meta_model_element"
     )
@@ -75,60 +85,69 @@ class TestInstantiatorBase:
         model_element_factory_mock.get_unit.return_value = "unit"
         model_element_factory_mock.get_meta_model_version.return_value = "version"
         model_element_factory_mock.get_aspect_graph.return_value = "aspect_graph"
+        model_element_factory_mock.describe.return_value = "description"
+        model_element_factory_mock.get_reverse_edge_index.return_value = "reverse_edge_index"
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
         from_meta_model_element_mock.return_value = "base_attributes"
         result = instantiator._get_base_attributes("element_subject")
 
         assert result == "base_attributes"
+        model_element_factory_mock.describe.assert_called_once_with("element_subject")
         from_meta_model_element_mock.assert_called_once_with(
             "element_subject",
             "aspect_graph",
             "samm",
             "version",
+            "description",
+            "reverse_edge_index",
         )
 
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator_base.RdfHelper.to_python")
     def test_get_child_required_missing_raises(self, to_python_mock):
         """Test _get_child raises ValueError if required child is missing."""
         to_python_mock.return_value = "parent_node_urn"
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = None
+        description_mock = MagicMock(name="description")
+        description_mock.value.return_value = None
         model_element_factory_mock = MagicMock(name="model_element_factory")
-        model_element_factory_mock.get_aspect_graph.return_value = aspect_graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
         with pytest.raises(ValueError) as error:
             instantiator._get_child("parent", "predicate", required=True)
 
         assert str(error.value) == "Child predicate is required for element parent_node_urn"
-        aspect_graph_mock.value.assert_called_once_with(subject="parent", predicate="predicate")
+        model_element_factory_mock.describe.assert_called_once_with("parent")
+        description_mock.value.assert_called_once_with("predicate")
 
     def test_get_child_optional_missing_returns_none(self):
         """Test _get_child returns None if optional child is missing."""
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = None
+        description_mock = MagicMock(name="description")
+        description_mock.value.return_value = None
         model_element_factory_mock = MagicMock(name="model_element_factory")
-        model_element_factory_mock.get_aspect_graph.return_value = aspect_graph_mock
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
         result = instantiator._get_child("parent", "predicate", required=False)
 
         assert result is None
-        aspect_graph_mock.value.assert_called_once_with(subject="parent", predicate="predicate")
+        model_element_factory_mock.describe.assert_called_once_with("parent")
+        description_mock.value.assert_called_once_with("predicate")
 
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator_base.RdfHelper.to_python")
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator_base.isinstance")
     def test_get_child_literal_returns_converted(self, isinstance_mock, to_python_mock):
         """Test _get_child returns converted value if child is Literal."""
         child_subject_mock = MagicMock(name="child_subject")
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = child_subject_mock
+        description_mock = MagicMock(name="description")
+        description_mock.value.return_value = child_subject_mock
         isinstance_mock.return_value = True
         to_python_mock.return_value = "node_value"
-        instantiator = InstantiatorBaseImpl(mock.MagicMock(name="model_element_factory"))
-        instantiator._aspect_graph = aspect_graph_mock
+        model_element_factory_mock = mock.MagicMock(name="model_element_factory")
+        model_element_factory_mock.describe.return_value = description_mock
+        instantiator = InstantiatorBaseImpl(model_element_factory_mock)
         result = instantiator._get_child("parent", "predicate")
 
         assert result == "node_value"
-        aspect_graph_mock.value.assert_called_once_with(subject="parent", predicate="predicate")
+        model_element_factory_mock.describe.assert_called_once_with("parent")
+        description_mock.value.assert_called_once_with("predicate")
         isinstance_mock.assert_called_once_with(child_subject_mock, rdflib.Literal)
         to_python_mock.assert_called_once_with(child_subject_mock)
 
@@ -136,19 +155,20 @@ class TestInstantiatorBase:
     def test_get_child_sub_element_calls_factory(self, isinstance_mock):
         """Test _get_child calls factory for sub-element child."""
         child_subject_mock = MagicMock(name="child_subject")
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = child_subject_mock
+        description_mock = MagicMock(name="description")
+        description_mock.value.return_value = child_subject_mock
         isinstance_mock.return_value = False
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
-        model_element_factory_mock.create_element.return_value = "child_node"
+        model_element_factory_mock.create_child.return_value = "child_node"
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
-        instantiator._aspect_graph = aspect_graph_mock
         result = instantiator._get_child("parent", "predicate")
 
         assert result == "child_node"
-        aspect_graph_mock.value.assert_called_once_with(subject="parent", predicate="predicate")
+        model_element_factory_mock.describe.assert_called_once_with("parent")
+        description_mock.value.assert_called_once_with("predicate")
         isinstance_mock.assert_called_once_with(child_subject_mock, rdflib.Literal)
-        model_element_factory_mock.create_element.assert_called_once_with(
+        model_element_factory_mock.create_child.assert_called_once_with(
             child_subject_mock,
             "parent",
             attr_name="predicate",
@@ -158,18 +178,21 @@ class TestInstantiatorBase:
     def test_get_list_children(self, get_rdf_list_values_mock):
         """Test _get_list_children returns list of children."""
         aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "list_node"
+        description_mock = MagicMock(name="description")
+        description_mock.value.return_value = "list_node"
         get_rdf_list_values_mock.return_value = ["child_node_1", "child_node_2"]
         model_element_factory_mock = mock.MagicMock(name="model_element_factory")
-        model_element_factory_mock.create_element.side_effect = [None, "child_node_instance"]
+        model_element_factory_mock.create_child.side_effect = [None, "child_node_instance"]
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
         instantiator._aspect_graph = aspect_graph_mock
         result = instantiator._get_list_children("element_subject", "list_predicate")
 
         assert result == ["child_node_instance"]
-        aspect_graph_mock.value.assert_called_once_with(subject="element_subject", predicate="list_predicate")
+        model_element_factory_mock.describe.assert_called_once_with("element_subject")
+        description_mock.value.assert_called_once_with("list_predicate")
         get_rdf_list_values_mock.assert_called_once_with("list_node", aspect_graph_mock)
-        model_element_factory_mock.create_element.assert_has_calls(
+        model_element_factory_mock.create_child.assert_has_calls(
             [
                 mock.call("child_node_1", "element_subject", attr_name="list_predicate"),
                 mock.call("child_node_2", "element_subject", attr_name="list_predicate"),
@@ -179,16 +202,16 @@ class TestInstantiatorBase:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator_base.isinstance")
     def test_get_data_type_with_element_characteristic_and_data_type(self, isinstance_mock):
         """Test _get_data_type returns DataType instance from element_characteristic with data_type predicate."""
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = [
+        description_mock = MagicMock(name="description")
+        description_mock.value.side_effect = [
             "element_characteristic_node",
             "data_type_node",
         ]
         model_element_factory_mock = MagicMock(name="model_element_factory")
         model_element_factory_mock.create_element.return_value = "instance"
+        model_element_factory_mock.describe.return_value = description_mock
         isinstance_mock.return_value = True
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
-        instantiator._aspect_graph = aspect_graph_mock
         instantiator._samm = MagicMock()
         instantiator._sammc = MagicMock()
         instantiator._samm.get_urn.return_value = "data_type_predicate"
@@ -196,10 +219,13 @@ class TestInstantiatorBase:
         result = instantiator._get_data_type("element_node")
 
         assert result == "instance"
-        aspect_graph_mock.value.assert_has_calls(
+        model_element_factory_mock.describe.assert_has_calls(
+            [mock.call("element_node"), mock.call("element_characteristic_node")]
+        )
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="element_node", predicate="element_characteristic_predicate"),
-                mock.call(subject="element_characteristic_node", predicate="data_type_predicate"),
+                mock.call("element_characteristic_predicate"),
+                mock.call("data_type_predicate"),
             ]
         )
         instantiator._sammc.get_urn.assert_called_once_with(SAMMC.element_characteristic)
@@ -218,17 +244,17 @@ class TestInstantiatorBase:
     @mock.patch("esmf_aspect_meta_model_python.loader.instantiator_base.isinstance")
     def test_get_data_type_with_element_characteristic_and_no_data_type(self, isinstance_mock):
         """Test _get_data_type tries RDF.type if no data_type found for element_characteristic."""
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = [
+        description_mock = MagicMock(name="description")
+        description_mock.value.side_effect = [
             "element_characteristic_node",
             None,
             "data_type_node",
         ]
         model_element_factory_mock = MagicMock(name="model_element_factory")
         model_element_factory_mock.create_element.return_value = "instance"
+        model_element_factory_mock.describe.return_value = description_mock
         isinstance_mock.return_value = False
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
-        instantiator._aspect_graph = aspect_graph_mock
         instantiator._samm = MagicMock()
         instantiator._sammc = MagicMock()
         instantiator._samm.get_urn.return_value = "data_type_predicate"
@@ -236,11 +262,14 @@ class TestInstantiatorBase:
         result = instantiator._get_data_type("element_node")
 
         assert result is None
-        aspect_graph_mock.value.assert_has_calls(
+        model_element_factory_mock.describe.assert_has_calls(
+            [mock.call("element_node"), mock.call("element_characteristic_node")]
+        )
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="element_node", predicate="element_characteristic_predicate"),
-                mock.call(subject="element_characteristic_node", predicate="data_type_predicate"),
-                mock.call(subject="element_characteristic_node", predicate=rdflib.RDF.type),
+                mock.call("element_characteristic_predicate"),
+                mock.call("data_type_predicate"),
+                mock.call(rdflib.RDF.type),
             ]
         )
         instantiator._sammc.get_urn.assert_called_once_with(SAMMC.element_characteristic)
@@ -258,11 +287,11 @@ class TestInstantiatorBase:
 
     def test_get_data_type_without_element_characteristic(self):
         """Test _get_data_type gets data_type directly from element_node if no element_characteristic."""
-        aspect_graph_mock = MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = [None, None]
+        description_mock = MagicMock(name="description")
+        description_mock.value.side_effect = [None, None]
         model_element_factory_mock = MagicMock(name="model_element_factory")
+        model_element_factory_mock.describe.return_value = description_mock
         instantiator = InstantiatorBaseImpl(model_element_factory_mock)
-        instantiator._aspect_graph = aspect_graph_mock
         instantiator._samm = MagicMock()
         instantiator._sammc = MagicMock()
         instantiator._samm.get_urn.return_value = "data_type_predicate"
@@ -270,10 +299,11 @@ class TestInstantiatorBase:
         result = instantiator._get_data_type("element_node")
 
         assert result is None
-        aspect_graph_mock.value.assert_has_calls(
+        model_element_factory_mock.describe.assert_called_once_with("element_node")
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="element_node", predicate="element_characteristic_predicate"),
-                mock.call(subject="element_node", predicate="data_type_predicate"),
+                mock.call("element_characteristic_predicate"),
+                mock.call("data_type_predicate"),
             ]
         )
         instantiator._sammc.get_urn.assert_called_once_with(SAMMC.element_characteristic)
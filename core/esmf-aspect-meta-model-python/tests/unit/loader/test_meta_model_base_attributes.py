@@ -4,7 +4,11 @@ from unittest import mock
 
 import pytest
 
+from rdflib import BNode, Graph, Literal, URIRef
+
+from esmf_aspect_meta_model_python.loader.empty_containers import EMPTY_DICT, EMPTY_LIST
 from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+from esmf_aspect_meta_model_python.loader.reverse_edge_index import ReverseEdgeIndex
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
 
 
@@ -52,8 +56,8 @@ class TestMetaModelBaseAttributes:
     ):
         get_language_strings_mock.side_effect = ({"language": "preferred_name"}, {"language": "descriptions"})
         get_attribute_value_list_mock.return_value = ["see"]
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "name_result"
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "name_result"
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ("preferred_name_urn", "description_urn", "see_urn", "name")
         rdf_helper_to_python_mock.return_value = "name"
@@ -61,7 +65,13 @@ class TestMetaModelBaseAttributes:
         node_mock = mock.MagicMock(name="meta_model_element_node")
         node_mock.toPython.return_value = "urn"
         get_name_from_urn_mock.return_value = "urn_name"
-        result = MetaModelBaseAttributes.from_meta_model_element(node_mock, aspect_graph_mock, samm_mock, "1.0.0")
+        result = MetaModelBaseAttributes.from_meta_model_element(
+            node_mock,
+            "aspect_graph",
+            samm_mock,
+            "1.0.0",
+            description_mock,
+        )
 
         assert result.meta_model_version == "1.0.0"
         assert result.urn == "urn"
@@ -79,12 +89,12 @@ class TestMetaModelBaseAttributes:
         )
         get_language_strings_mock.assert_has_calls(
             [
-                mock.call(node_mock, aspect_graph_mock, "preferred_name_urn"),
-                mock.call(node_mock, aspect_graph_mock, "description_urn"),
+                mock.call(description_mock, "preferred_name_urn"),
+                mock.call(description_mock, "description_urn"),
             ]
         )
-        get_attribute_value_list_mock.assert_called_once_with(node_mock, aspect_graph_mock, "see_urn")
-        aspect_graph_mock.value.assert_called_once_with(subject=node_mock, predicate="name")
+        get_attribute_value_list_mock.assert_called_once_with(description_mock, "see_urn")
+        description_mock.value.assert_called_once_with("name")
         rdf_helper_to_python_mock.assert_called_once_with("name_result")
         node_mock.toPython.assert_called_once()
         get_name_from_urn_mock.assert_called_once_with("urn")
@@ -107,7 +117,7 @@ class TestMetaModelBaseAttributes:
         get_language_strings_mock.side_effect = ({"language": "preferred_name"}, {"language": "descriptions"})
         get_attribute_value_list_mock.return_value = ["see"]
         aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "name_result"
+        aspect_graph_mock.triples.return_value = []
         samm_mock = mock.MagicMock(name="SAMM")
         samm_mock.get_urn.side_effect = ("preferred_name_urn", "description_urn", "see_urn")
         isinstance_mock.side_effect = (False, False)
@@ -123,6 +133,39 @@ class TestMetaModelBaseAttributes:
             "Unexpected type. Get MetaModelBaseAttributes.from_meta_model_element can't handle this type."
         )
 
+    @pytest.mark.parametrize("with_index", [True, False])
+    def test_from_meta_model_element_blank_node(self, with_index):
+        samm = SAMM("2.2.0")
+        graph = Graph()
+        characteristic_node = BNode()
+        constraint_node = BNode()
+        graph.add(
+            (URIRef("urn:samm:org.example:1.0.0#property"), samm.get_urn(SAMM.characteristic), characteristic_node)
+        )
+        graph.add((characteristic_node, URIRef("urn:samm:org.example:1.0.0#constraint"), constraint_node))
+        reverse_edge_index = ReverseEdgeIndex(graph) if with_index else None
+        characteristic = MetaModelBaseAttributes.from_meta_model_element(
+            characteristic_node, graph, samm, "2.2.0", reverse_edge_index=reverse_edge_index
+        )
+        constraint = MetaModelBaseAttributes.from_meta_model_element(
+            constraint_node, graph, samm, "2.2.0", reverse_edge_index=reverse_edge_index
+        )
+
+        assert characteristic.urn is None
+        assert characteristic.name == "property_characteristic"
+        assert constraint.name == "property_characteristic_1"
+
+    def test_from_meta_model_element_shares_empty_containers(self):
+        samm = SAMM("2.2.0")
+        graph = Graph()
+        node = URIRef("urn:samm:org.example:1.0.0#property")
+        graph.add((node, samm.get_urn(SAMM.preferred_name), Literal("Property", lang="en")))
+        result = MetaModelBaseAttributes.from_meta_model_element(node, graph, samm, "2.2.0")
+
+        assert result.preferred_names == {"en": "Property"}
+        assert result.descriptions is EMPTY_DICT
+        assert result.see is EMPTY_LIST
+
     def test_get_name_from_urn_prefix_with_3_parts(self):
         urn = "urn:samm:org.eclipse.esmf.examples#testProperty"
         result = MetaModelBaseAttributes._MetaModelBaseAttributes__get_name_from_urn(urn)
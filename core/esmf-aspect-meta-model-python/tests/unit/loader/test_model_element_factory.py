@@ -6,8 +6,16 @@ import pytest
 import rdflib  # type: ignore
 
 from esmf_aspect_meta_model_python.base.base import Base
+from esmf_aspect_meta_model_python.loader import instantiator
+from esmf_aspect_meta_model_python.loader.instantiator import (
+    CharacteristicInstantiator,
+    CodeInstantiator,
+    PropertyInstantiator,
+    ScalarInstantiator,
+)
 from esmf_aspect_meta_model_python.loader.model_element_factory import ModelElementFactory
 from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
+from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
 
 
 class TestModelElementFactory:
@@ -36,6 +44,100 @@ class TestModelElementFactory:
         assert result._aspect_graph == "aspect_graph"
         assert result._cache == "cache"
         assert result._instantiators == dict()
+        assert result._descriptions == dict()
+        assert result._lazy is False
+        assert result._proxies == dict()
+        assert result._reverse_edge_index._aspect_graph == "aspect_graph"
+        assert result._type_index._aspect_graph == "aspect_graph"
+
+    def test_create_child(self):
+        """Test create_child creates the element if not in lazy mode."""
+        factory = self._get_model_element_factory_instance()
+        factory.create_element = mock.MagicMock(name="create_element", return_value="element")
+        result = factory.create_child("node", "parent", "attr_name")
+
+        assert result == "element"
+        factory.create_element.assert_called_once_with("node", "parent", "attr_name")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SharedNamespaceStore.get_parent_links")
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.ElementProxy")
+    def test_create_child_lazy(self, element_proxy_mock, get_parent_links_mock):
+        """Test create_child creates one proxy per node in lazy mode."""
+        get_parent_links_mock.return_value = "parent_links"
+        element_proxy_mock.return_value = "proxy"
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.get.return_value = None
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), cache_mock, lazy=True)
+        factory.create_element = mock.MagicMock(name="create_element")
+
+        assert factory.create_child("node", "parent", "attr_name") == "proxy"
+        assert factory.create_child("node", "parent", "attr_name") == "proxy"
+        element_proxy_mock.assert_called_once_with(factory, "node", "parent_links", "parent", "attr_name")
+        factory.create_element.assert_not_called()
+        cache_mock.get.return_value = "element"
+        assert factory.create_child("node", "parent", "attr_name") == "element"
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SharedNamespaceStore.collect_parent_links")
+    def test_resolve_proxy(self, collect_parent_links_mock):
+        """Test resolve_proxy creates the element and drops the proxy."""
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.has_active_path.return_value = False
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), cache_mock, lazy=True)
+        factory.create_element = mock.MagicMock(name="create_element", return_value="element")
+        factory._proxies["node"] = "proxy"
+        result = factory.resolve_proxy("node", "parent_links", "parent", "attr_name")
+
+        assert result == "element"
+        assert factory._proxies == {}
+        factory.create_element.assert_called_once_with("node", "parent", "attr_name")
+        collect_parent_links_mock.assert_called_once_with("parent_links")
+        cache_mock.restore_cycle_references.assert_called_once()
+
+    def test_resolve_proxy_deferred(self):
+        """Test resolve_proxy keeps the proxy and the deferred references while an element is instantiated."""
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.has_active_path.return_value = True
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), cache_mock, lazy=True)
+        factory.create_element = mock.MagicMock(name="create_element", return_value=None)
+        factory._proxies["node"] = "proxy"
+        result = factory.resolve_proxy("node", None, "parent", "attr_name")
+
+        assert result is None
+        assert factory._proxies == {"node": "proxy"}
+        cache_mock.restore_cycle_references.assert_not_called()
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SharedNamespaceStore.get")
+    def test_find_instance(self, shared_namespace_store_get_mock):
+        """Test find_instance looks up the cache and the shared elements without instantiating."""
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.get.return_value = None
+        shared_namespace_store_get_mock.return_value = "shared_element"
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), cache_mock, lazy=True)
+
+        assert factory.find_instance(rdflib.URIRef("urn:node")) == "shared_element"
+        assert factory.find_instance(rdflib.BNode()) is None
+        cache_mock.get.return_value = "element"
+        assert factory.find_instance(rdflib.URIRef("urn:node")) == "element"
+        shared_namespace_store_get_mock.assert_called_once_with("urn:node")
+
+    def test_resolve_proxy_without_parent_links(self):
+        """Test resolve_proxy outside of a collection of parent links."""
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), mock.MagicMock(name="cache"), lazy=True)
+        factory.create_element = mock.MagicMock(name="create_element", return_value="element")
+
+        assert factory.resolve_proxy("node", None) == "element"
+
+    def test_get_reverse_edge_index(self):
+        """Test the reverse edge index given to the factory."""
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), "cache", "reverse_edge_index")
+
+        assert factory.get_reverse_edge_index() == "reverse_edge_index"
+
+    def test_get_type_index(self):
+        """Test the type index given to the factory."""
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), "cache", type_index="type_index")
+
+        assert factory.get_type_index() == "type_index"
 
     def test_create_aspect_cached(self):
         """Test create_aspect returns cached instance if available."""
@@ -102,18 +204,75 @@ class TestModelElementFactory:
         )
         create_element_mock.assert_called_once_with(node_mock)
 
+    def test_create_graph_element(self):
+        """Test create_graph_element restores the deferred references before returning the element."""
+        manager_mock = mock.MagicMock(name="manager")
+        manager_mock.create_element.return_value = "instance"
+        factory = self._get_model_element_factory_instance()
+        factory.create_element = manager_mock.create_element
+        factory._cache = manager_mock.cache
+        factory._instantiators = {"Property": manager_mock.instantiator}
+        factory._descriptions = {"node": "description"}
+        result = factory.create_graph_element("node")
+
+        assert result == "instance"
+        assert factory._descriptions == {}
+        assert manager_mock.mock_calls == [
+            mock.call.create_element("node"),
+            mock.call.cache.restore_cycle_references(),
+            mock.call.instantiator.clear_existing_instances(),
+        ]
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory._logger")
+    def test_create_graph_element_raise_error(self, logger_mock):
+        """Test create_graph_element logs the node and does not restore the deferred references."""
+        create_element_mock = mock.MagicMock(name="create_element")
+        create_element_mock.side_effect = Exception("Creation error")
+        cache_mock = mock.MagicMock(name="cache")
+        factory = self._get_model_element_factory_instance()
+        factory.create_element = create_element_mock
+        factory._cache = cache_mock
+        with pytest.raises(Exception) as error:
+            factory.create_graph_element("node")
+
+        assert str(error.value) == "Creation error"
+        logger_mock.error.assert_called_once_with(
+            "Could not translate the node %s to a Python object. Error: %s",
+            "node",
+            create_element_mock.side_effect,
+        )
+        cache_mock.restore_cycle_references.assert_not_called()
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SharedNamespaceStore")
     @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.isinstance")
-    def test_add_to_cache(self, isinstance_mock):
-        """Test _add_to_cache adds instance to cache if it is a Base element."""
+    def test_add_to_cache(self, isinstance_mock, shared_namespace_store_mock):
+        """Test _add_to_cache adds the shared instance to cache if it is a Base element."""
         isinstance_mock.return_value = True
+        shared_namespace_store_mock.add.return_value = "shared_instance"
         cache_mock = mock.MagicMock(name="cache")
+        cache_mock.resolve_instance.return_value = "cached_instance"
         factory = self._get_model_element_factory_instance()
         factory._cache = cache_mock
         result = factory._add_to_cache("instance")
 
-        assert result is None
+        assert result == "cached_instance"
         isinstance_mock.assert_called_once_with("instance", Base)
+        shared_namespace_store_mock.add.assert_called_once_with("instance")
+        cache_mock.resolve_instance.assert_called_once_with("shared_instance")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SharedNamespaceStore")
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.isinstance")
+    def test_add_to_cache_lazy(self, isinstance_mock, shared_namespace_store_mock):
+        """Test _add_to_cache does not share the instances created in lazy mode."""
+        isinstance_mock.return_value = True
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.resolve_instance.return_value = "cached_instance"
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), cache_mock, lazy=True)
+        result = factory._add_to_cache("instance")
+
+        assert result == "cached_instance"
         cache_mock.resolve_instance.assert_called_once_with("instance")
+        shared_namespace_store_mock.add.assert_not_called()
 
     @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.isinstance")
     def test_add_to_cache_not_base(self, isinstance_mock):
@@ -124,7 +283,7 @@ class TestModelElementFactory:
         factory._cache = cache_mock
         result = factory._add_to_cache("instance")
 
-        assert result is None
+        assert result == "instance"
         isinstance_mock.assert_called_once_with("instance", Base)
         cache_mock.resolve_instance.assert_not_called()
 
@@ -204,6 +363,23 @@ class TestModelElementFactory:
         cache_mock.is_in_active_path.assert_called_once_with("node")
         cache_mock.get.assert_called_once_with("node")
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SharedNamespaceStore")
+    def test_create_element_shared(self, shared_namespace_store_mock):
+        """Test create_element returns the instance of a shared namespace and adds it to the cache."""
+        node = rdflib.URIRef("urn:samm:org.example.shared:1.0.0#Shared")
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.is_in_active_path.return_value = False
+        cache_mock.get.return_value = None
+        shared_namespace_store_mock.get.return_value = "shared_instance"
+        factory = self._get_model_element_factory_instance()
+        factory._cache = cache_mock
+        result = factory.create_element(node)
+
+        assert result == "shared_instance"
+        shared_namespace_store_mock.get.assert_called_once_with(str(node))
+        cache_mock.resolve_instance.assert_called_once_with("shared_instance")
+        cache_mock.add_to_active_path.assert_not_called()
+
     def test_create_element(self):
         """Test create_element creates new instance if not cached and no cycle detected."""
         cache_mock = mock.MagicMock(name="cache")
@@ -216,6 +392,7 @@ class TestModelElementFactory:
         instantiator_class_mock = mock.MagicMock(name="instantiator_class")
         instantiator_class_mock.get_instance.return_value = "instance"
         add_to_cache_mock = mock.MagicMock(name="_add_to_cache")
+        add_to_cache_mock.return_value = "shared_instance"
         factory = self._get_model_element_factory_instance()
         factory._cache = cache_mock
         factory._instantiators = {"element_type": instantiator_class_mock}
@@ -224,7 +401,7 @@ class TestModelElementFactory:
         factory._add_to_cache = add_to_cache_mock
         result = factory.create_element("node")
 
-        assert result == "instance"
+        assert result == "shared_instance"
         cache_mock.is_in_active_path.assert_called_once_with("node")
         cache_mock.get.assert_called_once_with("node")
         cache_mock.add_to_active_path.assert_called_once_with("node")
@@ -245,6 +422,7 @@ class TestModelElementFactory:
         create_instantiator_mock = mock.MagicMock(name="_create_instantiator")
         create_instantiator_mock.return_value = instantiator_class_mock
         add_to_cache_mock = mock.MagicMock(name="_add_to_cache")
+        add_to_cache_mock.return_value = "instance"
         factory = self._get_model_element_factory_instance()
         factory._cache = cache_mock
         factory._instantiators = {}
@@ -263,75 +441,78 @@ class TestModelElementFactory:
         instantiator_class_mock.get_instance.assert_called_once_with("node")
         add_to_cache_mock.assert_called_once_with("instance")
 
-    def test_get_element_type_is_none(self):
-        """Test _get_element_type returns None if element type URN is None."""
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.return_value = "element_type_urn"
-        samm_mock = mock.MagicMock(name="samm")
-        samm_mock.get_name.return_value = "element_type"
+    def test_get_element_type_from_type_index(self):
+        """Test _get_element_type takes the type of a node with a single type from the type index."""
         factory = self._get_model_element_factory_instance()
-        factory._aspect_graph = aspect_graph_mock
-        factory._samm = samm_mock
+        factory.describe = mock.MagicMock(name="describe")
+        factory._type_index = mock.MagicMock(name="type_index")
+        factory._type_index.get_types.return_value = ("element_type_urn",)
         result = factory._get_element_type("node")
 
-        assert result == "element_type"
-        aspect_graph_mock.value.assert_called_once_with(subject="node", predicate=rdflib.RDF.type)
-        samm_mock.get_name.assert_called_once_with("element_type_urn")
+        assert result == "element_type_urn"
+        factory._type_index.get_types.assert_called_once_with("node")
+        factory.describe.assert_not_called()
+
+    def test_get_element_type_from_description(self):
+        """Test _get_element_type takes the first type of the description of a node without a single type."""
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.return_value = "element_type_urn"
+        factory = self._get_model_element_factory_instance()
+        factory.describe = mock.MagicMock(name="describe", return_value=description_mock)
+        factory._type_index = mock.MagicMock(name="type_index")
+        factory._type_index.get_types.return_value = ()
+        result = factory._get_element_type("node")
+
+        assert result == "element_type_urn"
+        factory.describe.assert_called_once_with("node")
+        description_mock.value.assert_called_once_with(rdflib.RDF.type)
 
     def test__get_element_type_property(self):
-        """Test _get_element_type returns 'Property' if element type URN is None and node has 'extends' property."""
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = ["element_type_urn", "oproperty_value"]
+        """Test _get_element_type returns samm:Property if the node has no type and an 'extends' property."""
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = [None, "property_value"]
         samm_mock = mock.MagicMock(name="samm")
-        samm_mock.get_name.return_value = None
-        samm_mock.get_urn.return_value = "extends_urn"
+        samm_mock.get_urn.side_effect = ["extends_urn", "property_type_urn"]
         factory = self._get_model_element_factory_instance()
-        factory._aspect_graph = aspect_graph_mock
+        factory.describe = mock.MagicMock(name="describe", return_value=description_mock)
+        factory._type_index = mock.MagicMock(name="type_index")
+        factory._type_index.get_types.return_value = ()
         factory._samm = samm_mock
         result = factory._get_element_type("node")
 
-        assert result == "Property"
-        aspect_graph_mock.value.assert_has_calls(
-            [
-                mock.call(subject="node", predicate=rdflib.RDF.type),
-                mock.call(subject="node", predicate="extends_urn"),
-            ]
-        )
-        samm_mock.get_name.assert_called_once_with("element_type_urn")
-        samm_mock.get_urn.assert_called_once_with(SAMM.extends)
+        assert result == "property_type_urn"
+        factory.describe.assert_called_with("node")
+        description_mock.value.assert_has_calls([mock.call(rdflib.RDF.type), mock.call("extends_urn")])
+        samm_mock.get_urn.assert_has_calls([mock.call(SAMM.extends), mock.call(SAMM.Property)])
 
     def test__get_element_type_blank_property(self):
         """Test _get_element_type for subnode if node has property."""
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = [
-            "element_type_urn",
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = [
+            None,
             None,
             "property_node",
             "property_node",
             "child_element_type_urn",
         ]
         samm_mock = mock.MagicMock(name="samm")
-        samm_mock.get_name.side_effect = [None, "element_type"]
         samm_mock.get_urn.side_effect = ["extends_urn", "property_urn", "property_urn"]
         factory = self._get_model_element_factory_instance()
-        factory._aspect_graph = aspect_graph_mock
+        factory.describe = mock.MagicMock(name="describe", return_value=description_mock)
+        factory._type_index = mock.MagicMock(name="type_index")
+        factory._type_index.get_types.return_value = ()
         factory._samm = samm_mock
         result = factory._get_element_type("node")
 
-        assert result == "element_type"
-        aspect_graph_mock.value.assert_has_calls(
+        assert result == "child_element_type_urn"
+        factory.describe.assert_has_calls([mock.call("node"), mock.call("property_node")])
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="node", predicate=rdflib.RDF.type),
-                mock.call(subject="node", predicate="extends_urn"),
-                mock.call(subject="node", predicate="property_urn"),
-                mock.call(subject="node", predicate="property_urn"),
-                mock.call(subject="property_node", predicate=rdflib.RDF.type),
-            ]
-        )
-        samm_mock.get_name.assert_has_calls(
-            [
-                mock.call("element_type_urn"),
-                mock.call("child_element_type_urn"),
+                mock.call(rdflib.RDF.type),
+                mock.call("extends_urn"),
+                mock.call("property_urn"),
+                mock.call("property_urn"),
+                mock.call(rdflib.RDF.type),
             ]
         )
         samm_mock.get_urn.assert_has_calls(
@@ -343,30 +524,115 @@ class TestModelElementFactory:
         )
 
     def test__get_element_type_scalar(self):
-        """Test _get_element_type returns 'Scalar'."""
-        aspect_graph_mock = mock.MagicMock(name="aspect_graph")
-        aspect_graph_mock.value.side_effect = ["element_type_urn", None, None]
+        """Test _get_element_type returns samm:Scalar for a node without type, 'extends' and 'property'."""
+        description_mock = mock.MagicMock(name="description")
+        description_mock.value.side_effect = [None, None, None]
         samm_mock = mock.MagicMock(name="samm")
-        samm_mock.get_name.return_value = None
-        samm_mock.get_urn.side_effect = ["extends_urn", "property_urn"]
+        samm_mock.get_urn.side_effect = ["extends_urn", "property_urn", "scalar_urn"]
         factory = self._get_model_element_factory_instance()
-        factory._aspect_graph = aspect_graph_mock
+        factory.describe = mock.MagicMock(name="describe", return_value=description_mock)
+        factory._type_index = mock.MagicMock(name="type_index")
+        factory._type_index.get_types.return_value = ()
         factory._samm = samm_mock
         result = factory._get_element_type("node")
 
-        assert result == "Scalar"
-        aspect_graph_mock.value.assert_has_calls(
+        assert result == "scalar_urn"
+        factory.describe.assert_called_with("node")
+        description_mock.value.assert_has_calls(
             [
-                mock.call(subject="node", predicate=rdflib.RDF.type),
-                mock.call(subject="node", predicate="extends_urn"),
-                mock.call(subject="node", predicate="property_urn"),
+                mock.call(rdflib.RDF.type),
+                mock.call("extends_urn"),
+                mock.call("property_urn"),
             ]
         )
-        samm_mock.get_name.assert_called_once_with("element_type_urn")
+        samm_mock.get_urn.assert_has_calls(
+            [mock.call(SAMM.extends), mock.call(SAMM.property), mock.call(instantiator.SCALAR_TYPE)]
+        )
+
+    def test_get_element_type_of_model(self):
+        """Test _get_element_type returns the URNs of the built-in instantiators for the nodes of a model."""
+        samm = SAMM("2.2.0")
+        sammc = SAMMC("2.2.0")
+        graph = rdflib.Graph()
+        graph.add((rdflib.URIRef("urn:samm:org.example:1.0.0#code"), rdflib.RDF.type, sammc.get_urn(SAMMC.Code)))
+        graph.add((rdflib.URIRef("urn:samm:org.example:1.0.0#other"), samm.get_urn(SAMM.extends), samm.get_urn("a")))
+        factory = ModelElementFactory("2.2.0", graph, mock.MagicMock(name="cache"))
+
+        code_type = factory._get_element_type(rdflib.URIRef("urn:samm:org.example:1.0.0#code"))
+        property_type = factory._get_element_type(rdflib.URIRef("urn:samm:org.example:1.0.0#other"))
+        scalar_type = factory._get_element_type(rdflib.XSD.string)
+
+        assert factory._instantiator_classes[code_type] is CodeInstantiator
+        assert factory._instantiator_classes[property_type] is PropertyInstantiator
+        assert factory._instantiator_classes[scalar_type] is ScalarInstantiator
+
+    def test_create_instantiator_from_dispatch_table(self):
+        """Test _create_instantiator takes the class from the dispatch table."""
+        instantiator_class_mock = mock.MagicMock(name="instantiator_class")
+        instantiator_class_mock.return_value = "instantiator_object"
+        get_instantiator_path_mock = mock.MagicMock(name="get_instantiator_path")
+        factory = self._get_model_element_factory_instance()
+        factory.get_instantiator_path = get_instantiator_path_mock
+        factory._instantiator_classes = {"element_type": instantiator_class_mock}
+        result = factory._create_instantiator("element_type")
+
+        assert result == "instantiator_object"
+        assert factory._instantiators == {"element_type": "instantiator_object"}
+        instantiator_class_mock.assert_called_once_with(factory)
+        get_instantiator_path_mock.assert_not_called()
+
+    def test_init_instantiator_classes(self):
+        """Test the instantiator classes passed to a factory replace the built-in ones of this factory only."""
+        characteristic_urn = SAMM("2.2.0").get_urn(SAMM.Characteristic)
+        custom_urn = rdflib.URIRef("urn:samm:org.example:1.0.0#CustomType")
+        instantiator_class_mock = mock.MagicMock(name="instantiator_class")
+        factory = ModelElementFactory(
+            "2.2.0",
+            rdflib.Graph(),
+            mock.MagicMock(name="cache"),
+            instantiator_classes={characteristic_urn: instantiator_class_mock, custom_urn: instantiator_class_mock},
+        )
+        other_factory = ModelElementFactory("2.2.0", rdflib.Graph(), mock.MagicMock(name="cache"))
+
+        assert factory._instantiator_classes[characteristic_urn] is instantiator_class_mock
+        assert factory._instantiator_classes[custom_urn] is instantiator_class_mock
+        assert other_factory._instantiator_classes[characteristic_urn] is CharacteristicInstantiator
+        assert custom_urn not in other_factory._instantiator_classes
+
+    def test_register_instantiator(self):
+        """Test register_instantiator replaces the instantiator of an element type of the factory."""
+        characteristic_urn = SAMM("2.2.0").get_urn(SAMM.Characteristic)
+        instantiator_class_mock = mock.MagicMock(name="instantiator_class")
+        factory = ModelElementFactory("2.2.0", rdflib.Graph(), mock.MagicMock(name="cache"))
+        factory._instantiators[characteristic_urn] = "instantiator_object"
+        factory.register_instantiator(characteristic_urn, instantiator_class_mock)
+
+        assert factory._instantiator_classes[characteristic_urn] is instantiator_class_mock
+        assert characteristic_urn not in factory._instantiators
+        assert ModelElementFactory("2.2.0", rdflib.Graph(), "cache")._instantiator_classes[characteristic_urn] is (
+            CharacteristicInstantiator
+        )
+
+    def test_create_element_reuses_instantiator(self):
+        """Test create_element creates one instantiator per element type."""
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.is_in_active_path.return_value = False
+        cache_mock.get.return_value = None
+        instantiator_class_mock = mock.MagicMock(name="instantiator_class")
+        factory = self._get_model_element_factory_instance()
+        factory._cache = cache_mock
+        factory._get_element_type = mock.MagicMock(name="_get_element_type", return_value="element_type")
+        factory._add_to_cache = mock.MagicMock(name="_add_to_cache")
+        factory._instantiator_classes = {"element_type": instantiator_class_mock}
+        factory.create_element("node_1")
+        factory.create_element("node_2")
+
+        instantiator_class_mock.assert_called_once_with(factory)
+        assert instantiator_class_mock.return_value.get_instance.call_count == 2
 
     @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.importlib.import_module")
     def test_create_instantiator(self, import_module_mock):
-        """Test _create_instantiator."""
+        """Test _create_instantiator imports the instantiator of a type missing in the dispatch table by its name."""
         get_instantiator_path_mock = mock.MagicMock(name="get_instantiator_path")
         get_instantiator_path_mock.return_value = ("module_name", "class_name")
         instantiator_class_mock = mock.MagicMock(name="instantiator_class")
@@ -374,16 +640,20 @@ class TestModelElementFactory:
         module_mock = mock.MagicMock(name="module")
         module_mock.class_name = instantiator_class_mock
         import_module_mock.return_value = module_mock
+        samm_mock = mock.MagicMock(name="samm")
+        samm_mock.get_name.return_value = "element_type"
         factory = self._get_model_element_factory_instance()
         factory.get_instantiator_path = get_instantiator_path_mock
+        factory._samm = samm_mock
         factory._instantiators = {}
-        result = factory._create_instantiator("element_type")
+        result = factory._create_instantiator("element_type_urn")
 
         assert result == "instantiator_object"
+        samm_mock.get_name.assert_called_once_with("element_type_urn")
         get_instantiator_path_mock.assert_called_once_with("element_type")
         assert mock.call("module_name") in import_module_mock.call_args_list
         instantiator_class_mock.assert_called_once_with(factory)
-        assert factory._instantiators["element_type"] == "instantiator_object"
+        assert factory._instantiators["element_type_urn"] == "instantiator_object"
 
     def test_get_instantiator_path(self):
         """Test get_instantiator_path formats the module path and class name correctly."""
@@ -429,3 +699,24 @@ class TestModelElementFactory:
         result = factory.get_aspect_graph()
 
         assert result == "aspect_graph"
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SubjectDescription.from_graph")
+    def test_describe(self, from_graph_mock):
+        """Test describe reads the description of a subject once and keeps it."""
+        from_graph_mock.return_value = "description"
+        factory = self._get_model_element_factory_instance()
+        result = factory.describe("node")
+
+        assert result == "description"
+        assert factory.describe("node") == "description"
+        from_graph_mock.assert_called_once_with("node", "aspect_graph")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.model_element_factory.SubjectDescription.from_graph")
+    def test_describe_none(self, from_graph_mock):
+        """Test describe does not keep the empty description of a missing subject."""
+        from_graph_mock.return_value = "empty_description"
+        factory = self._get_model_element_factory_instance()
+        result = factory.describe(None)
+
+        assert result == "empty_description"
+        assert factory._descriptions == {}
@@ -0,0 +1,136 @@
+"""Model snapshot test suit."""
+
+import pickle
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.impl.characteristics.default_characteristic import DefaultCharacteristic
+from esmf_aspect_meta_model_python.impl.data_types.default_complex_type import DefaultComplexType
+from esmf_aspect_meta_model_python.impl.data_types.default_entity import DefaultEntity
+from esmf_aspect_meta_model_python.impl.default_aspect import DefaultAspect
+from esmf_aspect_meta_model_python.impl.default_property import DefaultProperty
+from esmf_aspect_meta_model_python.loader import model_snapshot
+from esmf_aspect_meta_model_python.loader.default_element_cache import DefaultElementCache
+from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
+
+NAMESPACE = "urn:samm:org.example:1.0.0#"
+
+
+def get_base_attributes(name):
+    return MetaModelBaseAttributes("2.2.0", NAMESPACE + name, name, {"en": name}, {}, [])
+
+
+@pytest.fixture
+def model(monkeypatch):
+    # Other test suits replace the urn property of DefaultComplexType with a class attribute.
+    if "urn" in vars(DefaultComplexType):
+        monkeypatch.delattr(DefaultComplexType, "urn")
+    monkeypatch.setattr(DefaultComplexType, "_instances", {})
+
+    entity = DefaultEntity(get_base_attributes("Entity"), [], None)
+    characteristic = DefaultCharacteristic(get_base_attributes("EntityCharacteristic"), entity)
+    entity_property = DefaultProperty(get_base_attributes("entityProperty"), characteristic)
+    entity.properties.append(entity_property)
+    aspect = DefaultAspect(get_base_attributes("Aspect"), [entity_property], [], [], False)
+
+    cache = DefaultElementCache()
+    for element in (aspect, entity_property, characteristic, entity):
+        cache.resolve_instance(element)
+
+    return aspect, [aspect, entity_property, characteristic, entity], cache
+
+
+class TestModelSnapshot:
+    """Model snapshot test suit."""
+
+    def test_save_and_load(self, model, tmp_path):
+        aspect, model_elements, cache = model
+        model_snapshot.save_model_snapshot(tmp_path / "model.snapshot", "2.2.0", cache, aspect, model_elements)
+        result = model_snapshot.load_model_snapshot(tmp_path / "model.snapshot")
+
+        assert result.samm_version == "2.2.0"
+        assert result.aspect is result.model_elements[0]
+        assert [element.urn for element in result.model_elements] == [element.urn for element in model_elements]
+
+    def test_load_preserves_identity_and_cycles(self, model, tmp_path):
+        aspect, model_elements, cache = model
+        model_snapshot.save_model_snapshot(tmp_path / "model.snapshot", "2.2.0", cache, aspect, model_elements)
+        result = model_snapshot.load_model_snapshot(tmp_path / "model.snapshot")
+
+        restored_aspect, restored_property, restored_characteristic, restored_entity = result.model_elements
+        assert restored_aspect.properties[0] is restored_property
+        assert restored_property.characteristic is restored_characteristic
+        assert restored_characteristic.data_type is restored_entity
+        assert restored_entity.properties[0] is restored_property
+        assert restored_entity.parent_elements == [restored_characteristic]
+
+    def test_load_rebuilds_cache(self, model, tmp_path):
+        aspect, model_elements, cache = model
+        model_snapshot.save_model_snapshot(tmp_path / "model.snapshot", "2.2.0", cache, aspect, model_elements)
+        DefaultComplexType._instances.pop(NAMESPACE + "Entity", None)
+        result = model_snapshot.load_model_snapshot(tmp_path / "model.snapshot")
+
+        restored_entity = result.model_elements[3]
+        assert result.cache.get(NAMESPACE + "Entity") is restored_entity
+        assert result.cache.get_by_name("entityProperty") == [result.model_elements[1]]
+        assert DefaultComplexType._instances[NAMESPACE + "Entity"] is restored_entity
+
+    def test_read_header(self, model, tmp_path):
+        aspect, model_elements, cache = model
+        model_snapshot.save_model_snapshot(tmp_path / "model.snapshot", "2.2.0", cache, aspect, model_elements)
+        result = model_snapshot.read_model_snapshot_header(tmp_path / "model.snapshot")
+
+        assert result == {
+            "format": model_snapshot.FORMAT_VERSION,
+            "loader_version": model_snapshot.get_loader_version(),
+            "samm_version": "2.2.0",
+            "element_count": 4,
+        }
+
+    def test_load_raise_error_not_snapshot(self, tmp_path):
+        (tmp_path / "model.snapshot").write_bytes(pickle.dumps({}))
+
+        with pytest.raises(ValueError) as error:
+            model_snapshot.load_model_snapshot(tmp_path / "model.snapshot")
+
+        assert str(error.value) == "The data is not a model snapshot or has an unsupported format version."
+
+    def test_load_raise_error_other_loader_version(self, model, tmp_path):
+        aspect, model_elements, cache = model
+        with mock.patch.object(model_snapshot, "get_loader_version", return_value="0.0.1"):
+            model_snapshot.save_model_snapshot(tmp_path / "model.snapshot", "2.2.0", cache, aspect, model_elements)
+
+        with pytest.raises(ValueError) as error:
+            model_snapshot.load_model_snapshot(tmp_path / "model.snapshot")
+
+        assert "was written by loader version 0.0.1" in str(error.value)
+
+
+class TestSAMMGraphSnapshot:
+    """SAMMGraph snapshot test suit."""
+
+    def test_save_and_load_snapshot(self, model, tmp_path):
+        aspect, model_elements, cache = model
+        samm_graph = SAMMGraph()
+        samm_graph.aspect = aspect
+        samm_graph.model_elements = model_elements
+        samm_graph._cache = cache
+        samm_graph.save_snapshot(tmp_path / "model.snapshot")
+        result = SAMMGraph.load_snapshot(tmp_path / "model.snapshot")
+
+        assert result.samm_version == samm_graph.samm_version
+        assert result.load_aspect_model() is result.model_elements[0]
+        assert result.load_model_elements() is result.model_elements
+        assert result.find_by_urn(NAMESPACE + "entityProperty") is result.model_elements[1]
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.save_model_snapshot")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.load_model_elements")
+    def test_save_snapshot_loads_model_elements(self, load_model_elements_mock, save_model_snapshot_mock):
+        samm_graph = SAMMGraph()
+        samm_graph.save_snapshot("path")
+
+        load_model_elements_mock.assert_called_once_with()
+        save_model_snapshot_mock.assert_called_once_with("path", samm_graph.samm_version, samm_graph._cache, None, None)
@@ -0,0 +1,38 @@
+"""RdfHelper class unit tests suit."""
+
+from rdflib import RDF, BNode, Graph, Literal
+from rdflib.collection import Collection
+
+from esmf_aspect_meta_model_python.loader.rdf_helper import RdfHelper
+
+
+class TestRdfHelper:
+    """RdfHelper unit tests class."""
+
+    def test_get_rdf_list_values(self):
+        """Test get_rdf_list_values walks a list longer than the recursion limit."""
+        graph = Graph()
+        values = [Literal(index) for index in range(5000)]
+        list_node = BNode()
+        Collection(graph, list_node, values)
+        result = RdfHelper.get_rdf_list_values(list_node, graph)
+
+        assert result == values
+
+    def test_get_rdf_list_values_empty(self):
+        """Test get_rdf_list_values for a missing and an empty list."""
+        assert RdfHelper.get_rdf_list_values(None, Graph()) == []
+        assert RdfHelper.get_rdf_list_values(RDF.nil, Graph()) == []
+
+    def test_iter_rdf_list_values_cycle(self):
+        """Test iter_rdf_list_values stops at a list node which has been visited before."""
+        graph = Graph()
+        first_node = BNode()
+        second_node = BNode()
+        graph.add((first_node, RDF.first, Literal("first")))
+        graph.add((first_node, RDF.rest, second_node))
+        graph.add((second_node, RDF.first, Literal("second")))
+        graph.add((second_node, RDF.rest, first_node))
+        result = list(RdfHelper.iter_rdf_list_values(first_node, graph))
+
+        assert result == [Literal("first"), Literal("second")]
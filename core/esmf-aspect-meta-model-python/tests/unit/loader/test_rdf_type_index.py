@@ -0,0 +1,69 @@
+"""RDF type index test suit."""
+
+from unittest import mock
+
+import pytest
+
+from rdflib import RDF, BNode, Graph, Literal, URIRef
+
+from esmf_aspect_meta_model_python.loader.rdf_type_index import RdfTypeIndex
+
+NAMESPACE = "urn:samm:org.example:1.0.0#"
+PROPERTY = URIRef(f"{NAMESPACE}Property")
+CHARACTERISTIC = URIRef(f"{NAMESPACE}Characteristic")
+TRAIT = URIRef(f"{NAMESPACE}Trait")
+
+
+@pytest.fixture
+def graph():
+    """Graph with two properties, a characteristic which is also a trait and an untyped node."""
+    graph = Graph()
+    graph.add((URIRef(f"{NAMESPACE}property1"), RDF.type, PROPERTY))
+    graph.add((URIRef(f"{NAMESPACE}property2"), RDF.type, PROPERTY))
+    graph.add((URIRef(f"{NAMESPACE}property2"), URIRef(f"{NAMESPACE}characteristic"), BNode("characteristic")))
+    graph.add((BNode("characteristic"), RDF.type, CHARACTERISTIC))
+    graph.add((BNode("characteristic"), RDF.type, TRAIT))
+    graph.add((URIRef(f"{NAMESPACE}untyped"), URIRef(f"{NAMESPACE}value"), Literal(1)))
+
+    return graph
+
+
+class TestRdfTypeIndex:
+    """RDF type index test suit."""
+
+    def test_lazy_build(self, graph):
+        graph_mock = mock.MagicMock(name="graph", wraps=graph)
+        index = RdfTypeIndex(graph_mock)
+
+        graph_mock.triples.assert_not_called()
+        assert repr(index) == "RdfTypeIndex(not built)"
+        assert len(index) == 3
+        assert index.get_types(URIRef(f"{NAMESPACE}property1")) == (PROPERTY,)
+        graph_mock.triples.assert_called_once_with((None, RDF.type, None))
+        assert repr(index) == "RdfTypeIndex(nodes=3, types=3)"
+
+    def test_get_types(self, graph):
+        index = RdfTypeIndex(graph)
+
+        assert set(index.get_types(BNode("characteristic"))) == {CHARACTERISTIC, TRAIT}
+        assert index.get_types(URIRef(f"{NAMESPACE}untyped")) == ()
+
+    def test_get_nodes(self, graph):
+        index = RdfTypeIndex(graph)
+
+        assert set(index.get_nodes(PROPERTY)) == {URIRef(f"{NAMESPACE}property1"), URIRef(f"{NAMESPACE}property2")}
+        assert index.get_nodes(URIRef(f"{NAMESPACE}Unit")) == ()
+
+    def test_get_nodes_of_types(self, graph):
+        index = RdfTypeIndex(graph)
+        result = index.get_nodes_of_types([CHARACTERISTIC, TRAIT, PROPERTY])
+
+        assert len(result) == 3
+        assert result[0] == BNode("characteristic")
+        assert set(result[1:]) == {URIRef(f"{NAMESPACE}property1"), URIRef(f"{NAMESPACE}property2")}
+
+    def test_contains(self, graph):
+        index = RdfTypeIndex(graph)
+
+        assert BNode("characteristic") in index
+        assert URIRef(f"{NAMESPACE}untyped") not in index
@@ -0,0 +1,90 @@
+"""Reverse edge index test suit."""
+
+from unittest import mock
+
+import pytest
+
+from rdflib import BNode, Graph, Literal, URIRef
+
+from esmf_aspect_meta_model_python.loader.rdf_helper import RdfHelper
+from esmf_aspect_meta_model_python.loader.reverse_edge_index import ReverseEdgeIndex
+
+NAMESPACE = "urn:samm:org.example:1.0.0#"
+PARENT = URIRef(f"{NAMESPACE}parent")
+CHARACTERISTIC = URIRef(f"{NAMESPACE}characteristic")
+CONSTRAINT = URIRef(f"{NAMESPACE}constraint")
+VALUE = URIRef(f"{NAMESPACE}value")
+
+
+@pytest.fixture
+def graph():
+    """Graph with a named parent, an anonymous characteristic and two anonymous constraints below it."""
+    graph = Graph()
+    characteristic = BNode("characteristic")
+    graph.add((PARENT, CHARACTERISTIC, characteristic))
+    graph.add((characteristic, CONSTRAINT, BNode("constraint_1")))
+    graph.add((characteristic, CONSTRAINT, BNode("constraint_2")))
+    graph.add((BNode("constraint_1"), VALUE, Literal(1)))
+
+    return graph
+
+
+class TestReverseEdgeIndex:
+    """Reverse edge index test suit."""
+
+    def test_lazy_build(self, graph):
+        graph_mock = mock.MagicMock(name="graph", wraps=graph)
+        index = ReverseEdgeIndex(graph_mock)
+
+        graph_mock.triples.assert_not_called()
+        assert repr(index) == "ReverseEdgeIndex(not built)"
+        assert len(index) == 3
+        assert index.get_parents(BNode("characteristic")) == ((PARENT, CHARACTERISTIC),)
+        graph_mock.triples.assert_called_once_with((None, None, None))
+        assert repr(index) == "ReverseEdgeIndex(objects=3)"
+
+    def test_get_parents(self, graph):
+        index = ReverseEdgeIndex(graph)
+
+        assert index.get_parents(BNode("constraint_2")) == ((BNode("characteristic"), CONSTRAINT),)
+        assert index.get_parents(PARENT) == ()
+        assert BNode("constraint_1") in index
+        assert Literal(1) not in index
+
+    def test_find_named_parent(self, graph):
+        index = ReverseEdgeIndex(graph)
+
+        assert index.find_named_parent(BNode("characteristic")) == (PARENT, CHARACTERISTIC, 0)
+        assert index.find_named_parent(BNode("constraint_1")) == (PARENT, CHARACTERISTIC, 1)
+        assert index.find_named_parent(PARENT) == (None, None, 0)
+
+    def test_find_named_parent_memoized(self, graph):
+        index = ReverseEdgeIndex(graph)
+        index.find_named_parent(BNode("constraint_1"))
+
+        assert set(index._named_parents) == {BNode("constraint_1"), BNode("characteristic")}
+        with mock.patch.object(index, "_resolve_named_parent") as resolve_mock:
+            assert index.find_named_parent(BNode("characteristic")) == (PARENT, CHARACTERISTIC, 0)
+        resolve_mock.assert_not_called()
+
+    def test_find_named_parent_same_as_rdf_helper(self, graph):
+        index = ReverseEdgeIndex(graph)
+
+        for node in (BNode("characteristic"), BNode("constraint_1"), BNode("constraint_2"), PARENT):
+            assert index.find_named_parent(node) == RdfHelper.find_named_parent(node, graph)
+
+    def test_find_named_parent_deep_chain(self):
+        graph = Graph()
+        nodes = [BNode() for _ in range(5000)]
+        graph.add((PARENT, CHARACTERISTIC, nodes[0]))
+        for parent, child in zip(nodes, nodes[1:]):
+            graph.add((parent, CONSTRAINT, child))
+
+        assert ReverseEdgeIndex(graph).find_named_parent(nodes[-1]) == (PARENT, CHARACTERISTIC, 4999)
+
+    def test_find_named_parent_cycle(self):
+        graph = Graph()
+        graph.add((BNode("first"), CONSTRAINT, BNode("second")))
+        graph.add((BNode("second"), CONSTRAINT, BNode("first")))
+
+        assert ReverseEdgeIndex(graph).find_named_parent(BNode("first")) == (None, None, 0)
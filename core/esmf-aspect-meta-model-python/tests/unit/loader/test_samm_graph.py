@@ -3,10 +3,12 @@
 from unittest import mock
 
 import pytest
+import rdflib
 
 import esmf_aspect_meta_model_python.constants as const
 
 from esmf_aspect_meta_model_python.base.aspect import Aspect
+from esmf_aspect_meta_model_python.base.property import Property
 from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
 
 
@@ -30,6 +32,13 @@ class TestSAMMGraph:
         assert result.model_elements is None
         assert result._samm is None
         assert result._reader is None
+        assert result._model_graph is None
+        assert result._instantiator_classes is None
+
+    def test_init_instantiator_classes(self):
+        result = SAMMGraph(instantiator_classes={"type_urn": "instantiator_class"})
+
+        assert result._instantiator_classes == {"type_urn": "instantiator_class"}
 
     def test_str(self):
         samm_graph = SAMMGraph()
@@ -57,9 +66,15 @@ class TestSAMMGraph:
         input_handler_mock.return_value.get_reader.return_value = reader_mock
         reader_mock.read.return_value = "rdf_graph"
         samm_graph = SAMMGraph()
+        samm_graph._model_layers = "model_layers"
+        samm_graph._reverse_edge_index = "reverse_edge_index"
+        samm_graph._type_index = "type_index"
         samm_graph._get_rdf_graph(input_data, input_type)
 
         assert samm_graph.rdf_graph == "rdf_graph"
+        assert samm_graph._model_layers is None
+        assert samm_graph._reverse_edge_index is None
+        assert samm_graph._type_index is None
         input_handler_mock.assert_called_once_with(input_data, input_type)
         input_handler_mock.return_value.get_reader.assert_called_once_with()
         reader_mock.read.assert_called_once_with(input_data)
@@ -74,15 +89,25 @@ class TestSAMMGraph:
         assert samm_graph._samm == "samm"
         samm_mock.assert_called_once_with("1.2.3")
 
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.AspectMetaModelResolver")
-    def test_get_samm_graph(self, aspect_meta_model_resolver_mock):
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.MetaModelStore")
+    def test_get_samm_graph(self, meta_model_store_mock):
+        meta_model_store_mock.get_graph.return_value = "samm_graph"
         samm_graph = SAMMGraph()
-        samm_graph.samm_graph = "samm_graph"
         samm_graph.samm_version = "1.2.3"
         result = samm_graph._get_samm_graph()
 
         assert result is None
-        aspect_meta_model_resolver_mock.return_value.parse.assert_called_once_with("samm_graph", "1.2.3")
+        assert samm_graph.samm_graph == "samm_graph"
+        meta_model_store_mock.get_graph.assert_called_once_with("1.2.3")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.MetaModelStore")
+    def test_get_samm_graph_from_reader(self, meta_model_store_mock):
+        samm_graph = SAMMGraph()
+        samm_graph._reader = mock.MagicMock(name="reader", samm_graph="reader_samm_graph")
+        samm_graph._get_samm_graph()
+
+        assert samm_graph.samm_graph == "reader_samm_graph"
+        meta_model_store_mock.get_graph.assert_not_called()
 
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_samm_graph")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_samm")
@@ -96,6 +121,26 @@ class TestSAMMGraph:
         get_samm_mock.assert_called_once()
         get_samm_graph_mock.assert_called_once()
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_samm_graph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_samm")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_rdf_graph")
+    def test_parse_with_resolver_options(self, get_rdf_graph_mock, get_samm_mock, get_samm_graph_mock):
+        samm_graph = SAMMGraph()
+        samm_graph.parse("input_data", parallel=True)
+
+        get_rdf_graph_mock.assert_called_once_with("input_data", None, parallel=True)
+
+    def test_resolution_report_not_parsed(self):
+        samm_graph = SAMMGraph()
+
+        assert samm_graph.resolution_report is None
+
+    def test_resolution_report(self):
+        samm_graph = SAMMGraph()
+        samm_graph._reader = mock.MagicMock(name="reader", resolution_report="report")
+
+        assert samm_graph.resolution_report == "report"
+
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RDF.type")
     def test_get_aspect_urn(self, rdf_type_mock):
         graph_mock = mock.MagicMock(name="rdf_graph")
@@ -129,46 +174,38 @@ class TestSAMMGraph:
         graph_mock.subjects.assert_called_once_with(predicate=rdf_type_mock, object="aspect_type_urn")
         samm_mock.get_urn.assert_called_once_with("Aspect")
 
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RDF.type")
-    def test_get_node_from_graph(self, rdf_type_mock):
-        graph_mock = mock.MagicMock(name="rdf_graph")
-        graph_mock.subjects.return_value = ["node1", "node2"]
-        samm_graph = SAMMGraph()
-        samm_graph.rdf_graph = graph_mock
-        node_mock = mock.MagicMock(name="node")
-        result = samm_graph._get_node_from_graph(node_mock)
-
-        assert result == ["node1", "node2"]
-        graph_mock.subjects.assert_called_once_with(predicate=rdf_type_mock, object=node_mock)
-
-    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_node_from_graph")
-    def test_get_all_model_elements(self, get_node_from_graph_mock):
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_graph")
+    def test_get_all_model_elements(self, get_model_graph_mock):
+        node_1 = rdflib.URIRef("urn:samm:org.eclipse.test:1.0.0#node1")
+        node_2 = rdflib.URIRef("urn:samm:org.eclipse.test:1.0.0#node2")
+        rdf_graph = rdflib.Graph()
+        rdf_graph.add((node_1, rdflib.RDF.type, rdflib.URIRef("urn1")))
+        rdf_graph.add((node_2, rdflib.RDF.type, rdflib.URIRef("urn2")))
+        rdf_graph.add((node_2, rdflib.RDF.type, rdflib.URIRef("urn1")))
+        rdf_graph.add((rdflib.URIRef("urn:samm:org.eclipse.test:1.0.0#node3"), rdflib.RDF.type, rdflib.RDFS.Class))
         samm_mock = mock.MagicMock(name="samm")
         samm_mock.meta_model_elements = ["element1", "element2"]
-        samm_mock.get_urn.side_effect = ("urn1", "urn2")
-        get_node_from_graph_mock.side_effect = (["node1"], ["node2"])
+        samm_mock.get_urn.side_effect = (rdflib.URIRef("urn1"), rdflib.URIRef("urn2"))
         samm_graph = SAMMGraph()
+        samm_graph.rdf_graph = rdf_graph
         samm_graph._samm = samm_mock
         result = samm_graph.get_all_model_elements()
 
-        assert result == ["node1", "node2"]
+        assert sorted(result) == [node_1, node_2]
         samm_mock.get_urn.assert_has_calls(
             [
                 mock.call("element1"),
                 mock.call("element2"),
             ]
         )
-        get_node_from_graph_mock.assert_has_calls(
-            [
-                mock.call("urn1"),
-                mock.call("urn2"),
-            ]
-        )
+        get_model_graph_mock.assert_not_called()
+        assert samm_graph._type_index is None
 
     def test_get_all_model_elements_raises_value_error(self):
         samm_mock = mock.MagicMock(name="samm")
         samm_mock.meta_model_elements = []
         samm_graph = SAMMGraph()
+        samm_graph.rdf_graph = rdflib.Graph()
         samm_graph._samm = samm_mock
 
         with pytest.raises(ValueError) as error:
@@ -224,12 +261,25 @@ class TestSAMMGraph:
             ]
         )
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RdfTypeIndex")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ReverseEdgeIndex")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_layers")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.LayeredGraph")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_aspect_urn")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._validate_samm_namespace_version")
     def test_load_aspect_model_create_element(
-        self, validate_samm_namespace_version_mock, get_aspect_urn_mock, model_element_factory_mock
+        self,
+        validate_samm_namespace_version_mock,
+        get_aspect_urn_mock,
+        model_element_factory_mock,
+        layered_graph_mock,
+        get_model_layers_mock,
+        reverse_edge_index_mock,
+        rdf_type_index_mock,
     ):
+        get_model_layers_mock.return_value = "model_layers"
+        layered_graph_mock.return_value = "rdf_graph_samm_graph"
         reader_mock = mock.MagicMock(name="reader")
         cache_mock = mock.MagicMock(name="cache")
         samm_graph = SAMMGraph()
@@ -246,13 +296,108 @@ class TestSAMMGraph:
         result = samm_graph.load_aspect_model()
 
         assert result is aspect_mock
+        layered_graph_mock.assert_called_once_with("rdf_graph", "_samm_graph", samm_version="1.2.3")
         get_aspect_urn_mock.assert_called_once()
         reader_mock.prepare_aspect_model.assert_called_once_with("rdf_graph_samm_graph")
-        model_element_factory_mock.assert_called_once_with("1.2.3", "rdf_graph_samm_graph", cache_mock)
+        model_element_factory_mock.assert_called_once_with(
+            "1.2.3",
+            "rdf_graph_samm_graph",
+            cache_mock,
+            reverse_edge_index_mock.return_value,
+            rdf_type_index_mock.return_value,
+            lazy=False,
+            instantiator_classes=None,
+        )
+        reverse_edge_index_mock.assert_called_once_with("model_layers")
+        rdf_type_index_mock.assert_called_once_with("model_layers")
         model_element_factory_mock.create_aspect.assert_called_once_with("aspect_urn")
         validate_samm_namespace_version_mock.assert_called_once_with("rdf_graph_samm_graph")
         aspect_mock.validate.assert_called_once()
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_graph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_aspect_urn")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._validate_samm_namespace_version")
+    def test_load_aspect_model_lazy(self, _, get_aspect_urn_mock, model_element_factory_mock, get_model_graph_mock):
+        get_model_graph_mock.return_value = "model_graph"
+        get_aspect_urn_mock.return_value = "aspect_urn"
+        aspect_mock = mock.MagicMock(name="aspect")
+        model_element_factory_mock.return_value.create_aspect.return_value = aspect_mock
+        samm_graph = SAMMGraph()
+        samm_graph._reverse_edge_index = "reverse_edge_index"
+        samm_graph._type_index = "type_index"
+        result = samm_graph.load_aspect_model(lazy=True)
+
+        assert result is aspect_mock
+        model_element_factory_mock.assert_called_once_with(
+            samm_graph.samm_version,
+            "model_graph",
+            samm_graph._cache,
+            "reverse_edge_index",
+            "type_index",
+            lazy=True,
+            instantiator_classes=None,
+        )
+        aspect_mock.validate.assert_not_called()
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.LayeredGraph")
+    def test_get_model_graph(self, layered_graph_mock):
+        reader_mock = mock.MagicMock(name="reader")
+        layered_graph_mock.return_value = "model_graph"
+        samm_graph = SAMMGraph()
+        samm_graph.rdf_graph = "rdf_graph"
+        samm_graph.samm_graph = "samm_graph"
+        samm_graph.samm_version = "1.2.3"
+        samm_graph._reader = reader_mock
+        result = samm_graph._get_model_graph()
+
+        assert result == "model_graph"
+        assert samm_graph._get_model_graph() == "model_graph"
+        layered_graph_mock.assert_called_once_with("rdf_graph", "samm_graph", samm_version="1.2.3")
+        reader_mock.prepare_aspect_model.assert_called_once_with("model_graph")
+
+    def test_get_model_layers(self):
+        aspect_triple = (rdflib.URIRef("urn:samm:org.example:1.0.0#aspect"), rdflib.RDF.type, rdflib.RDFS.Class)
+        dependency_triple = (rdflib.URIRef("urn:samm:org.example:1.0.0#dependency"), rdflib.RDF.type, rdflib.RDFS.Class)
+        samm_triple = (rdflib.URIRef("urn:samm:org.example:1.0.0#samm"), rdflib.RDF.type, rdflib.RDFS.Class)
+        reader_mock = mock.MagicMock(name="reader")
+        reader_mock.prepare_aspect_model.side_effect = lambda graph: graph.add(dependency_triple)
+        samm_graph = SAMMGraph()
+        samm_graph.rdf_graph = rdflib.Graph()
+        samm_graph.rdf_graph.add(aspect_triple)
+        samm_graph.samm_graph = rdflib.Graph()
+        samm_graph.samm_graph.add(samm_triple)
+        samm_graph._reader = reader_mock
+        result = samm_graph._get_model_layers()
+
+        assert set(result) == {aspect_triple, dependency_triple}
+        assert samm_graph._get_model_layers() is result
+        assert samm_triple in samm_graph._get_model_graph()
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ReverseEdgeIndex")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_layers")
+    def test_reverse_edge_index(self, get_model_layers_mock, reverse_edge_index_mock):
+        get_model_layers_mock.return_value = "model_layers"
+        reverse_edge_index_mock.return_value = "reverse_edge_index"
+        samm_graph = SAMMGraph()
+        result = samm_graph.reverse_edge_index
+
+        assert result == "reverse_edge_index"
+        assert samm_graph.reverse_edge_index == "reverse_edge_index"
+        reverse_edge_index_mock.assert_called_once_with("model_layers")
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RdfTypeIndex")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_layers")
+    def test_type_index(self, get_model_layers_mock, rdf_type_index_mock):
+        get_model_layers_mock.return_value = "model_layers"
+        rdf_type_index_mock.return_value = "type_index"
+        samm_graph = SAMMGraph()
+        result = samm_graph.type_index
+
+        assert result == "type_index"
+        assert samm_graph.type_index == "type_index"
+        rdf_type_index_mock.assert_called_once_with("model_layers")
+
     def test_load_model_elements(self):
         samm_graph = SAMMGraph()
         samm_graph.model_elements = "model_elements"
@@ -260,9 +405,23 @@ class TestSAMMGraph:
 
         assert result == "model_elements"
 
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.RdfTypeIndex")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ReverseEdgeIndex")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_layers")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.LayeredGraph")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_all_model_elements")
-    def test_load_model_elements_create_elements(self, get_all_model_elements_mock, model_element_factory_mock):
+    def test_load_model_elements_create_elements(
+        self,
+        get_all_model_elements_mock,
+        model_element_factory_mock,
+        layered_graph_mock,
+        get_model_layers_mock,
+        reverse_edge_index_mock,
+        rdf_type_index_mock,
+    ):
+        get_model_layers_mock.return_value = "model_layers"
+        layered_graph_mock.return_value = "rdf_graph_samm_graph"
         reader_mock = mock.MagicMock(name="reader")
         cache_mock = mock.MagicMock(name="cache")
         samm_graph = SAMMGraph()
@@ -282,11 +441,86 @@ class TestSAMMGraph:
         assert result == [element_1_mock, element_2_mock]
         get_all_model_elements_mock.assert_called_once()
         reader_mock.prepare_aspect_model.assert_called_once_with("rdf_graph_samm_graph")
-        model_element_factory_mock.assert_called_once_with("1.2.3", "rdf_graph_samm_graph", cache_mock)
+        model_element_factory_mock.assert_called_once_with(
+            "1.2.3",
+            "rdf_graph_samm_graph",
+            cache_mock,
+            reverse_edge_index_mock.return_value,
+            rdf_type_index_mock.return_value,
+            instantiator_classes=None,
+        )
+        reverse_edge_index_mock.assert_called_once_with("model_layers")
         model_element_factory_mock.create_all_graph_elements.assert_called_once_with("model_elements")
         element_1_mock.validate.assert_called_once()
         element_2_mock.validate.assert_called_once()
 
+    def test_iter_model_elements_loaded(self):
+        samm_graph = SAMMGraph()
+        samm_graph.model_elements = ["element_1", "element_2"]
+        result = list(samm_graph.iter_model_elements())
+
+        assert result == ["element_1", "element_2"]
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SharedNamespaceStore")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_graph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_all_model_elements")
+    def test_iter_model_elements(
+        self, get_all_model_elements_mock, get_model_graph_mock, model_element_factory_mock, shared_store_mock
+    ):
+        get_all_model_elements_mock.return_value = ["node_1", "node_2"]
+        get_model_graph_mock.return_value = "model_graph"
+        aspect_mock = mock.MagicMock(name="aspect")
+        aspect_mock.__class__ = Aspect
+        element_mock = mock.MagicMock(name="element")
+        factory_mock = model_element_factory_mock.return_value
+        factory_mock.create_graph_element.side_effect = [aspect_mock, element_mock]
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.items.return_value = [("aspect", aspect_mock), ("element", element_mock)]
+        samm_graph = SAMMGraph()
+        samm_graph.samm_version = "1.2.3"
+        samm_graph._cache = cache_mock
+        samm_graph._reverse_edge_index = "reverse_edge_index"
+        samm_graph._type_index = "type_index"
+        iterator = samm_graph.iter_model_elements()
+
+        assert next(iterator) is aspect_mock
+        aspect_mock.validate.assert_called_once()
+        factory_mock.create_graph_element.assert_called_once_with("node_1")
+        assert samm_graph.aspect is aspect_mock
+        assert next(iterator) is element_mock
+        element_mock.validate.assert_called_once()
+        shared_store_mock.freeze.assert_not_called()
+        assert list(iterator) == []
+        assert samm_graph.model_elements is None
+        model_element_factory_mock.assert_called_once_with(
+            "1.2.3", "model_graph", cache_mock, "reverse_edge_index", "type_index", instantiator_classes=None
+        )
+        factory_mock.create_graph_element.assert_has_calls([mock.call("node_1"), mock.call("node_2")])
+        assert shared_store_mock.collect_parent_links.call_count == 2
+        shared_store_mock.collect_parent_links.assert_called_with(samm_graph._parent_links)
+        assert list(shared_store_mock.freeze.call_args.args[0]) == [aspect_mock, element_mock]
+
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SharedNamespaceStore")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.ModelElementFactory")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph._get_model_graph")
+    @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.get_all_model_elements")
+    def test_iter_model_elements_without_validation(
+        self, get_all_model_elements_mock, _, model_element_factory_mock, shared_store_mock
+    ):
+        get_all_model_elements_mock.return_value = ["node"]
+        element_mock = mock.MagicMock(name="element")
+        model_element_factory_mock.return_value.create_graph_element.return_value = element_mock
+        samm_graph = SAMMGraph()
+        samm_graph._reverse_edge_index = "reverse_edge_index"
+        samm_graph._type_index = "type_index"
+        result = list(samm_graph.iter_model_elements(validate=False))
+
+        assert result == [element_mock]
+        element_mock.validate.assert_not_called()
+        assert samm_graph.aspect is None
+        shared_store_mock.freeze.assert_called_once()
+
     def test_find_by_name(self):
         cache_mock = mock.MagicMock(name="cache")
         cache_mock.get_by_name.return_value = "node"
@@ -307,6 +541,16 @@ class TestSAMMGraph:
         assert result == "node"
         cache_mock.get_by_urn.assert_called_once_with("urn")
 
+    def test_find_by_type(self):
+        cache_mock = mock.MagicMock(name="cache")
+        cache_mock.find_by_type.return_value = ["node"]
+        samm_graph = SAMMGraph()
+        samm_graph._cache = cache_mock
+        result = samm_graph.find_by_type(Property)
+
+        assert result == ["node"]
+        cache_mock.find_by_type.assert_called_once_with(Property)
+
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.determine_element_access_path")
     @mock.patch("esmf_aspect_meta_model_python.loader.samm_graph.SAMMGraph.find_by_name")
     def test_determine_access_path(self, find_by_name_mock, determine_element_access_path_mock):
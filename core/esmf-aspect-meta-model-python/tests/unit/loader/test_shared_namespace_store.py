@@ -0,0 +1,105 @@
+"""Shared namespace store test suit."""
+
+import pytest
+
+from esmf_aspect_meta_model_python.impl.characteristics.default_characteristic import DefaultCharacteristic
+from esmf_aspect_meta_model_python.impl.default_property import DefaultProperty
+from esmf_aspect_meta_model_python.loader.meta_model_base_attributes import MetaModelBaseAttributes
+from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
+from esmf_aspect_meta_model_python.loader.shared_namespace_store import SharedNamespaceStore
+
+SHARED_NAMESPACE = "urn:samm:org.example.shared:1.0.0"
+ASPECT_NAMESPACE = "urn:samm:org.example.aspect:1.0.0"
+
+
+def get_base_attributes(namespace, name):
+    return MetaModelBaseAttributes("2.2.0", f"{namespace}#{name}", name, {"en": name}, {}, [])
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch):
+    monkeypatch.setattr(SharedNamespaceStore, "_namespaces", set())
+    monkeypatch.setattr(SharedNamespaceStore, "_elements", {})
+    SharedNamespaceStore.register_namespace(SHARED_NAMESPACE + "#")
+
+    return SharedNamespaceStore
+
+
+@pytest.fixture
+def shared_characteristic():
+    characteristic = DefaultCharacteristic(get_base_attributes(SHARED_NAMESPACE, "SharedCharacteristic"), None)
+
+    return SharedNamespaceStore.add(characteristic)
+
+
+class TestSharedNamespaceStore:
+    """Shared namespace store test suit."""
+
+    def test_is_shared(self):
+        assert SharedNamespaceStore.is_shared(f"{SHARED_NAMESPACE}#Element") is True
+        assert SharedNamespaceStore.is_shared(f"{ASPECT_NAMESPACE}#Element") is False
+        assert SharedNamespaceStore.is_shared(None) is False
+
+    def test_add(self, shared_characteristic):
+        other = DefaultCharacteristic(get_base_attributes(SHARED_NAMESPACE, "SharedCharacteristic"), None)
+        aspect_characteristic = DefaultCharacteristic(get_base_attributes(ASPECT_NAMESPACE, "Characteristic"), None)
+
+        assert SharedNamespaceStore.get(shared_characteristic.urn) is shared_characteristic
+        assert SharedNamespaceStore.add(other) is shared_characteristic
+        assert SharedNamespaceStore.add(aspect_characteristic) is aspect_characteristic
+        assert SharedNamespaceStore.get(aspect_characteristic.urn) is None
+
+    def test_parent_links_are_collected_per_model(self, shared_characteristic):
+        parent_links_1: dict = {}
+        parent_links_2: dict = {}
+        shared_property = DefaultProperty(get_base_attributes(SHARED_NAMESPACE, "sharedProperty"), None)
+        shared_property._set_characteristic(shared_characteristic)
+
+        with SharedNamespaceStore.collect_parent_links(parent_links_1):
+            property_1 = DefaultProperty(get_base_attributes(ASPECT_NAMESPACE, "property1"), None)
+            property_1._set_characteristic(shared_characteristic)
+        with SharedNamespaceStore.collect_parent_links(parent_links_2):
+            property_2 = DefaultProperty(get_base_attributes(ASPECT_NAMESPACE, "property2"), None)
+            property_2._set_characteristic(shared_characteristic)
+
+        assert shared_characteristic.parent_elements == [shared_property]
+        assert parent_links_1 == {shared_characteristic.urn: [property_1]}
+        assert parent_links_2 == {shared_characteristic.urn: [property_2]}
+
+    def test_freeze(self, shared_characteristic):
+        aspect_characteristic = DefaultCharacteristic(get_base_attributes(ASPECT_NAMESPACE, "Characteristic"), None)
+        SharedNamespaceStore.freeze([shared_characteristic, aspect_characteristic])
+        aspect_characteristic._data_type = None
+
+        with pytest.raises(AttributeError):
+            shared_characteristic._data_type = None
+
+    def test_shared_parent_links_to_frozen_element(self, shared_characteristic):
+        parent_links: dict = {}
+        shared_property_1 = DefaultProperty(get_base_attributes(SHARED_NAMESPACE, "sharedProperty1"), None)
+        shared_property_1._set_characteristic(shared_characteristic)
+        SharedNamespaceStore.freeze([shared_characteristic])
+
+        with SharedNamespaceStore.collect_parent_links(parent_links):
+            shared_property_2 = DefaultProperty(get_base_attributes(SHARED_NAMESPACE, "sharedProperty2"), None)
+            shared_property_2._set_characteristic(shared_characteristic)
+        shared_property_3 = DefaultProperty(get_base_attributes(SHARED_NAMESPACE, "sharedProperty3"), None)
+        shared_property_3._set_characteristic(shared_characteristic)
+
+        assert shared_characteristic.parent_elements == [shared_property_1]
+        assert parent_links == {shared_characteristic.urn: [shared_property_2]}
+
+    def test_unregister_namespace(self, shared_characteristic):
+        SharedNamespaceStore.unregister_namespace(SHARED_NAMESPACE)
+
+        assert SharedNamespaceStore.is_shared(shared_characteristic.urn) is False
+        assert SharedNamespaceStore.get(shared_characteristic.urn) is None
+
+    def test_samm_graph_get_parent_elements(self, shared_characteristic):
+        samm_graph = SAMMGraph()
+        with SharedNamespaceStore.collect_parent_links(samm_graph._parent_links):
+            aspect_property = DefaultProperty(get_base_attributes(ASPECT_NAMESPACE, "property"), None)
+            aspect_property._set_characteristic(shared_characteristic)
+
+        assert samm_graph.get_parent_elements(shared_characteristic) == [aspect_property]
+        assert SAMMGraph().get_parent_elements(shared_characteristic) == []
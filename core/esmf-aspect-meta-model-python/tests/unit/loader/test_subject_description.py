@@ -0,0 +1,47 @@
+"""Subject description test suit."""
+
+import rdflib
+
+from esmf_aspect_meta_model_python.loader.subject_description import SubjectDescription
+
+EX = rdflib.Namespace("urn:samm:org.example:1.0.0#")
+
+
+class TestSubjectDescription:
+    """SubjectDescription test suit."""
+
+    def _get_graph(self):
+        graph = rdflib.Graph()
+        graph.add((EX.property, rdflib.RDF.type, EX.Property))
+        graph.add((EX.property, EX.preferredName, rdflib.Literal("Property", lang="en")))
+        graph.add((EX.property, EX.preferredName, rdflib.Literal("Eigenschaft", lang="de")))
+        graph.add((EX.other, EX.preferredName, rdflib.Literal("Other", lang="en")))
+
+        return graph
+
+    def test_from_graph(self):
+        graph = self._get_graph()
+        result = SubjectDescription.from_graph(EX.property, graph)
+
+        assert result.subject == EX.property
+        assert len(result) == 2
+        assert EX.preferredName in result
+        assert EX.description not in result
+        assert result.value(rdflib.RDF.type) == graph.value(EX.property, rdflib.RDF.type)
+        assert result.value(EX.preferredName) == graph.value(EX.property, EX.preferredName)
+        assert set(result.objects(EX.preferredName)) == set(graph.objects(EX.property, EX.preferredName))
+        assert set(result.predicate_objects()) == set(graph.predicate_objects(EX.property))
+
+    def test_missing_predicate(self):
+        result = SubjectDescription.from_graph(EX.property, self._get_graph())
+
+        assert result.value(EX.description) is None
+        assert result.value(EX.description, default=EX.default) == EX.default
+        assert result.objects(EX.description) == ()
+
+    def test_from_graph_none(self):
+        result = SubjectDescription.from_graph(None, self._get_graph())
+
+        assert result.subject is None
+        assert len(result) == 0
+        assert list(result.predicate_objects()) == []
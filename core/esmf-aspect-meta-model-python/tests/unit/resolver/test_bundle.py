@@ -0,0 +1,182 @@
+"""Aspect model bundle test suit."""
+
+from unittest import mock
+
+import pytest
+
+from rdflib import RDF, RDFS, BNode, Graph, Literal, Namespace, URIRef
+
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.layered_graph import LayeredGraph
+from esmf_aspect_meta_model_python.loader.samm_graph import SAMMGraph
+from esmf_aspect_meta_model_python.resolver import bundle
+from esmf_aspect_meta_model_python.resolver.handler import InputHandler
+
+SAMM = Namespace(f"urn:samm:org.eclipse.esmf.samm:meta-model:{SAMM_VERSION}#")
+SAMMC = Namespace(f"urn:samm:org.eclipse.esmf.samm:characteristic:{SAMM_VERSION}#")
+XSD_STRING = URIRef("http://www.w3.org/2001/XMLSchema#string")
+
+
+def write_model(models_root, namespace, name, body):
+    model_path = models_root / namespace / "1.0.0" / f"{name}.ttl"
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+    model_path.write_text(
+        f"@prefix samm: <{SAMM}> .\n"
+        f"@prefix samm-c: <{SAMMC}> .\n"
+        "@prefix a: <urn:samm:org.example.a:1.0.0#> .\n"
+        "@prefix b: <urn:samm:org.example.b:1.0.0#> .\n"
+        f"{body}\n"
+    )
+
+    return model_path
+
+
+@pytest.fixture
+def samm_graph():
+    graph = Graph()
+    graph.add((SAMMC.Text, RDF.type, SAMM.Characteristic))
+    graph.add((SAMMC.Text, SAMM.dataType, XSD_STRING))
+    graph.add((SAMM.Characteristic, RDFS.subClassOf, SAMM.AbstractEntity))
+    graph.add((SAMM.AbstractEntity, RDFS.label, Literal("Abstract entity")))
+    restriction = BNode()
+    graph.add((SAMM.Property, RDFS.subClassOf, restriction))
+    graph.add((restriction, RDFS.label, Literal("restriction")))
+    graph.add((SAMMC.Boolean, RDF.type, SAMM.Characteristic))
+
+    return graph
+
+
+@pytest.fixture
+def aspect_path(tmp_path):
+    write_model(tmp_path, "org.example.b", "Shared", "b:shared a samm:Property ; samm:characteristic samm-c:Text .")
+
+    return write_model(tmp_path, "org.example.a", "Aspect", "a:Aspect a samm:Aspect ; samm:properties ( b:shared ) .")
+
+
+@pytest.fixture
+def bundle_path(aspect_path, samm_graph, tmp_path):
+    bundle_path = tmp_path / "aspect.bundle"
+    with mock.patch("esmf_aspect_meta_model_python.resolver.bundle.MetaModelStore.get_graph") as get_graph_mock:
+        get_graph_mock.return_value = samm_graph
+        bundle.compile_bundle(aspect_path, bundle_path)
+
+    return bundle_path
+
+
+class TestMetaModelSubset:
+    """Meta-model subset test suit."""
+
+    def test_get_meta_model_subset(self, samm_graph):
+        model_graph = Graph()
+        model_graph.add((URIRef("urn:samm:org.example:1.0.0#property"), SAMM.characteristic, SAMMC.Text))
+        model_graph.add((URIRef("urn:samm:org.example:1.0.0#property"), RDF.type, SAMM.Property))
+        result = set(bundle.get_meta_model_subset(model_graph, samm_graph))
+
+        assert result == {triple for triple in samm_graph if triple[0] != SAMMC.Boolean}
+
+
+class TestBundle:
+    """Bundle compilation and reading test suit."""
+
+    def test_compile_bundle(self, bundle_path, aspect_path):
+        result = bundle.read_bundle(bundle_path, Graph(), Graph())
+
+        assert result["format"] == bundle.FORMAT_VERSION
+        assert result["samm_version"] == SAMM_VERSION
+        assert result["aspect_file"] == "Aspect.ttl"
+        assert [file_path.split("/")[-1] for file_path in result["files"]] == ["Aspect.ttl", "Shared.ttl"]
+        assert list(result["sections"]) == ["model", "dependencies", "meta_model"]
+
+    def test_read_bundle(self, bundle_path, samm_graph):
+        model_graph = Graph()
+        meta_model_graph = Graph()
+        bundle.read_bundle(bundle_path, model_graph, meta_model_graph)
+
+        assert len(model_graph) == 6
+        assert (URIRef("urn:samm:org.example.b:1.0.0#shared"), SAMM.characteristic, SAMMC.Text) in model_graph
+        assert len(meta_model_graph) == 6
+        assert (SAMMC.Boolean, RDF.type, SAMM.Characteristic) not in meta_model_graph
+        assert model_graph.namespace_manager.store.namespace("b") == URIRef("urn:samm:org.example.b:1.0.0#")
+
+    def test_read_bundle_with_dependencies_graph(self, bundle_path):
+        model_graph = Graph()
+        dependencies_graph = Graph()
+        bundle.read_bundle(bundle_path, model_graph, Graph(), dependencies_graph)
+
+        assert len(model_graph) == 4
+        assert (URIRef("urn:samm:org.example.a:1.0.0#Aspect"), RDF.type, SAMM.Aspect) in model_graph
+        assert set(dependencies_graph) == {
+            (URIRef("urn:samm:org.example.b:1.0.0#shared"), RDF.type, SAMM.Property),
+            (URIRef("urn:samm:org.example.b:1.0.0#shared"), SAMM.characteristic, SAMMC.Text),
+        }
+
+    def test_read_bundle_does_not_touch_models_root(self, bundle_path, aspect_path):
+        aspect_path.unlink()
+        model_graph = Graph()
+        bundle.read_bundle(bundle_path, model_graph, Graph())
+
+        assert len(model_graph) == 6
+
+    def test_read_bundle_raise_error(self, aspect_path):
+        with pytest.raises(ValueError) as error:
+            bundle.read_bundle(aspect_path, Graph(), Graph())
+
+        assert str(error.value) == "The data is not an aspect model bundle or has an unsupported format version."
+
+    def test_is_bundle(self, bundle_path, aspect_path, tmp_path):
+        assert bundle.is_bundle(bundle_path)
+        assert not bundle.is_bundle(aspect_path)
+        assert not bundle.is_bundle(tmp_path / "missing")
+
+
+class TestBundleResolver:
+    """Bundle resolver test suit."""
+
+    def test_read(self, bundle_path):
+        resolver = bundle.BundleResolver()
+        result = resolver.read(bundle_path)
+
+        assert len(result) == 4
+        assert len(resolver.dependencies_graph) == 2
+        assert len(resolver.samm_graph) == 6
+        assert resolver.samm_graph.frozen
+
+    def test_prepare_aspect_model(self, bundle_path):
+        resolver = bundle.BundleResolver()
+        aspect_graph = resolver.read(bundle_path)
+        model_graph = LayeredGraph(aspect_graph)
+        resolver.prepare_aspect_model(model_graph)
+
+        assert len(aspect_graph) == 4
+        assert len(model_graph) == 6
+        assert len(model_graph.layers[0]) == 2
+        assert model_graph.namespace_manager.store.namespace("b") == URIRef("urn:samm:org.example.b:1.0.0#")
+
+    def test_two_aspects_in_one_folder(self, samm_graph, tmp_path):
+        write_model(tmp_path, "org.example.b", "Shared", "b:shared a samm:Property .")
+        write_model(tmp_path, "org.example.a", "ZZZ", "a:ZZZ a samm:Aspect ; samm:properties ( ) .")
+        aspect_path = write_model(tmp_path, "org.example.a", "AAA", "a:AAA a samm:Aspect ; samm:properties ( ) .")
+        bundle_path = tmp_path / "AAA.bundle"
+        with mock.patch("esmf_aspect_meta_model_python.resolver.bundle.MetaModelStore.get_graph") as get_graph_mock:
+            get_graph_mock.return_value = samm_graph
+            bundle.compile_bundle(aspect_path, bundle_path)
+
+        samm_graph = SAMMGraph().parse(bundle_path)
+
+        assert samm_graph.get_aspect_urn() == URIRef("urn:samm:org.example.a:1.0.0#AAA")
+        assert (URIRef("urn:samm:org.example.a:1.0.0#ZZZ"), RDF.type, SAMM.Aspect) not in samm_graph.rdf_graph
+        assert (URIRef("urn:samm:org.example.a:1.0.0#ZZZ"), RDF.type, SAMM.Aspect) in samm_graph._get_model_graph()
+
+    def test_read_raise_error_other_samm_version(self, bundle_path):
+        resolver = bundle.BundleResolver()
+        with mock.patch("esmf_aspect_meta_model_python.resolver.bundle.SAMM_VERSION", "1.0.0"):
+            with pytest.raises(ValueError) as error:
+                resolver.read(bundle_path)
+
+        assert f"is compiled for SAMM {SAMM_VERSION}, but SAMM 1.0.0 is required" in str(error.value)
+
+    def test_input_handler(self, bundle_path):
+        handler = InputHandler(str(bundle_path))
+
+        assert handler.input_type == InputHandler.BUNDLE_TYPE
+        assert isinstance(handler.get_reader(), bundle.BundleResolver)
@@ -15,6 +15,7 @@ class TestInputHandler:
 
         assert result.input_data == "input_data"
         assert result.input_type == "input_type"
+        assert result.file_resolver_options == {}
 
     @mock.patch("esmf_aspect_meta_model_python.resolver.handler.LocalFileResolver")
     def test_get_reader_local_file(self, local_file_resolver_mock):
@@ -25,6 +26,15 @@ class TestInputHandler:
         assert result == "local_file_reader"
         local_file_resolver_mock.assert_called_once()
 
+    @mock.patch("esmf_aspect_meta_model_python.resolver.handler.LocalFileResolver")
+    def test_get_reader_local_file_with_options(self, local_file_resolver_mock):
+        local_file_resolver_mock.return_value = "local_file_reader"
+        handler = InputHandler("file_path", InputHandler.FILE_PATH_TYPE, parallel=True, max_workers=2)
+        result = handler.get_reader()
+
+        assert result == "local_file_reader"
+        local_file_resolver_mock.assert_called_once_with(parallel=True, max_workers=2)
+
     @mock.patch("esmf_aspect_meta_model_python.resolver.handler.DataStringResolver")
     def test_get_reader_data_string(self, data_string_resolver):
         data_string_resolver.return_value = "data_string_reader"
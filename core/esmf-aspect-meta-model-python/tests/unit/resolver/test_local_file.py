@@ -1,8 +1,14 @@
 """Local file resolver test suit."""
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from rdflib import RDFS, Graph, URIRef
+
+from esmf_aspect_meta_model_python import utils
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.layered_graph import LayeredGraph
 from esmf_aspect_meta_model_python.resolver.local_file import LocalFileResolver
 
 
@@ -33,18 +39,23 @@ class TestLocalFileResolver:
         assert str(error.value) == "Could not find a file file_path"
         exists_mock.assert_called_once_with("file_path")
 
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.utils.get_file_digest")
     @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.AdaptiveGraph")
     @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver.validate_file")
-    def test_read(self, validate_file_mock, graph_mock):
+    def test_read(self, validate_file_mock, graph_mock, get_file_digest_mock):
         rdf_graph_mock = mock.MagicMock(name="rdf_graph")
         graph_mock.return_value = rdf_graph_mock
+        get_file_digest_mock.return_value = "digest"
         resolver = LocalFileResolver()
         resolver.samm_version = "1.0.0"
 
         result = resolver.read("file_path")
 
         assert result == rdf_graph_mock
+        assert resolver.aspect_graph == rdf_graph_mock
+        assert resolver.resolution_report.files["file_path"]["digest"] == "digest"
         validate_file_mock.assert_called_once_with("file_path")
+        get_file_digest_mock.assert_called_once_with("file_path")
         graph_mock.assert_called_once_with()
         rdf_graph_mock.parse.assert_called_once_with(source="file_path")
 
@@ -86,18 +97,30 @@ class TestLocalFileResolver:
         parse_namespace_mock.assert_called_once_with("namespace")
         join_mock.assert_called_once_with("base_path", "namespace", "version")
 
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._parse_dependency_file")
     @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._get_dirs_for_advanced_loading")
-    def test_get_dependency_folders(self, get_dirs_for_advanced_loading_mock):
-        graph_mock = mock.MagicMock(name="graph")
+    def test_get_dependency_folders(self, get_dirs_for_advanced_loading_mock, parse_dependency_file_mock):
+        parse_dependency_file_mock.return_value = "file_graph"
         get_dirs_for_advanced_loading_mock.return_value = "dependency_folders"
         resolver = LocalFileResolver()
         resolver.file_path = "base_file_path"
-        resolver.graph = graph_mock
         result = resolver._get_dependency_folders("file_path")
 
         assert result == "dependency_folders"
-        graph_mock.parse.assert_called_once_with(source="file_path", format="turtle")
-        get_dirs_for_advanced_loading_mock.assert_called_once_with("file_path")
+        parse_dependency_file_mock.assert_called_once_with("file_path")
+        get_dirs_for_advanced_loading_mock.assert_called_once_with("file_path", "file_graph")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._parse_dependency_file")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._get_dirs_for_advanced_loading")
+    def test_get_dependency_folders_base_file(self, get_dirs_for_advanced_loading_mock, parse_dependency_file_mock):
+        get_dirs_for_advanced_loading_mock.return_value = "dependency_folders"
+        resolver = LocalFileResolver()
+        resolver.file_path = "base_file_path"
+        result = resolver._get_dependency_folders("base_file_path")
+
+        assert result == "dependency_folders"
+        parse_dependency_file_mock.assert_not_called()
+        get_dirs_for_advanced_loading_mock.assert_called_once_with("base_file_path")
 
     @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.exists")
     def test_get_additional_files_from_dir_raise_error(self, exists_mock):
@@ -159,6 +182,25 @@ class TestLocalFileResolver:
         get_dependency_folders_mock.assert_has_calls([mock.call("file_path"), mock.call("additional_file_path")])
         get_additional_files_from_dir_mock.assert_called_once_with("dependency_folder")
 
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._get_additional_files_from_dir")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._get_dependency_folders")
+    def test_get_dependency_files_scans_each_folder_once(
+        self,
+        get_dependency_folders_mock,
+        get_additional_files_from_dir_mock,
+    ):
+        get_dependency_folders_mock.side_effect = (["folder_a"], ["folder_a", "folder_b"], ["folder_b"], ["folder_a"])
+        get_additional_files_from_dir_mock.side_effect = (["file_a"], ["file_b", "file_c"])
+        resolver = LocalFileResolver()
+        folder_dependencies = {}
+        result = resolver._get_dependency_files({}, folder_dependencies, "file_path")
+
+        assert list(result) == ["file_path", "file_a", "file_b", "file_c"]
+        assert folder_dependencies == {"folder_a": ["file_a"], "folder_b": ["file_b", "file_c"]}
+        assert get_dependency_folders_mock.call_count == 4
+        get_additional_files_from_dir_mock.assert_has_calls([mock.call("folder_a"), mock.call("folder_b")])
+        assert resolver.resolution_report.folders == {"folder_a": 1, "folder_b": 2}
+
     @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._get_dependency_files")
     def test_prepare_aspect_model(self, get_dependency_files_mock):
         graph_mock = mock.MagicMock(name="graph")
@@ -166,5 +208,225 @@ class TestLocalFileResolver:
         resolver.file_path = "aspect_file_path"
         result = resolver.prepare_aspect_model(graph_mock)
 
-        assert result is None
+        assert result == resolver.resolution_report
         get_dependency_files_mock.assert_called_once_with({}, {}, "aspect_file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.LocalFileResolver._get_dependency_files_parallel")
+    def test_prepare_aspect_model_parallel(self, get_dependency_files_parallel_mock):
+        graph_mock = mock.MagicMock(name="graph")
+        resolver = LocalFileResolver(parallel=True)
+        resolver.file_path = "aspect_file_path"
+        result = resolver.prepare_aspect_model(graph_mock)
+
+        assert result == resolver.resolution_report
+        get_dependency_files_parallel_mock.assert_called_once_with({}, {}, "aspect_file_path")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.print")
+    @mock.patch("esmf_aspect_meta_model_python.resolver.local_file.graph_snapshot")
+    def test_parse_dependency_files_parallel_raise_error(self, graph_snapshot_mock, print_mock):
+        future_mock = mock.MagicMock(name="future")
+        future_mock.result.side_effect = Exception("error")
+        executor_mock = mock.MagicMock(name="executor")
+        executor_mock.submit.return_value = future_mock
+        resolver = LocalFileResolver(parallel=True)
+        resolver.graph = mock.MagicMock(name="graph", samm_version="1.2.3")
+        with pytest.raises(Exception) as error:
+            resolver._parse_dependency_files_parallel(executor_mock, ["file_path"])
+
+        assert str(error.value) == "error"
+        executor_mock.submit.assert_called_once()
+        graph_snapshot_mock.decode_into.assert_not_called()
+        print_mock.assert_called_once_with("Could not parse file file_path\nError: error")
+
+    def test_mentions(self, tmp_path):
+        file_path = tmp_path / "model.ttl"
+        file_path.write_text(":ElementName a samm:Property .\n")
+
+        assert LocalFileResolver._mentions(str(file_path), "ElementName")
+        assert not LocalFileResolver._mentions(str(file_path), "Element")
+
+    def test_get_mentioned_names(self, tmp_path):
+        file_path = tmp_path / "model.ttl"
+        file_path.write_text(":ElementName a samm:Property ; samm:see <urn:samm:org.example:1.0.0#Other-Name> .\n")
+
+        result = LocalFileResolver._get_mentioned_names(str(file_path))
+
+        assert {"ElementName", "Property", "see", "Other-Name"} <= result
+        assert "Element" not in result
+
+    def test_get_files_by_name_reads_files_once(self, tmp_path):
+        first_path = tmp_path / "First.ttl"
+        first_path.write_text(":First samm:see :Second .\n")
+        second_path = tmp_path / "Second.ttl"
+        second_path.write_text(":Second a samm:Property .\n")
+        folder_files = [str(first_path), str(second_path)]
+        resolver = LocalFileResolver()
+        names_by_folder = {}
+
+        with mock.patch.object(
+            LocalFileResolver, "_get_mentioned_names", side_effect=LocalFileResolver._get_mentioned_names
+        ) as get_mentioned_names_mock:
+            first_result = resolver._get_files_by_name(names_by_folder, str(tmp_path), folder_files)
+            second_result = resolver._get_files_by_name(names_by_folder, str(tmp_path), folder_files)
+
+        assert get_mentioned_names_mock.call_count == 2
+        assert second_result is first_result
+        assert first_result["Second"] == folder_files
+        assert first_result["First"] == [str(first_path)]
+
+
+class TestLocalFileResolverModelsRoot:
+    """Dependency resolution in a models root test suit."""
+
+    @staticmethod
+    def _write_model(models_root, namespace, name, body):
+        model_path = models_root / namespace / "1.0.0" / f"{name}.ttl"
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        model_path.write_text(
+            f"@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:{SAMM_VERSION}#> .\n"
+            "@prefix a: <urn:samm:org.example.a:1.0.0#> .\n"
+            "@prefix b: <urn:samm:org.example.b:1.0.0#> .\n"
+            "@prefix c: <urn:samm:org.example.c:1.0.0#> .\n"
+            f"{body}\n"
+        )
+
+        return model_path
+
+    @pytest.fixture
+    def aspect_path(self, tmp_path):
+        self._write_model(tmp_path, "org.example.c", "Definitions", "c:Shared a samm:Property .")
+        self._write_model(tmp_path, "org.example.c", "Unused", "c:Unused a samm:Property .")
+        self._write_model(tmp_path, "org.example.b", "Nested", "b:Nested a samm:Property ; samm:see c:Shared .")
+        self._write_model(tmp_path, "org.example.b", "Other", "b:Other a samm:Property .")
+
+        return self._write_model(tmp_path, "org.example.a", "Aspect", "a:Aspect a samm:Aspect ; samm:see b:Nested .")
+
+    @staticmethod
+    def _resolve(aspect_path, **options):
+        resolver = LocalFileResolver(**options)
+        graph = resolver.read(str(aspect_path))
+        resolver.prepare_aspect_model(graph)
+
+        return graph
+
+    def test_lazy_parses_only_referenced_files(self, aspect_path):
+        sequential_graph = self._resolve(aspect_path)
+        lazy_graph = self._resolve(aspect_path, lazy=True)
+
+        assert len(lazy_graph) == 5
+        assert set(lazy_graph) == {
+            triple
+            for triple in sequential_graph
+            if triple[0]
+            not in (URIRef("urn:samm:org.example.b:1.0.0#Other"), URIRef("urn:samm:org.example.c:1.0.0#Unused"))
+        }
+
+    def test_lazy_file_dependencies(self, aspect_path):
+        resolver = LocalFileResolver(lazy=True)
+        resolver.read(str(aspect_path))
+        result = resolver._get_dependency_files_lazy({}, str(aspect_path))
+
+        assert {Path(file_path).name: urns for file_path, urns in result.items()} == {
+            "Nested.ttl": ["urn:samm:org.example.b:1.0.0#Nested"],
+            "Definitions.ttl": ["urn:samm:org.example.c:1.0.0#Shared"],
+        }
+
+    def test_lazy_collects_urns_of_aspect_graph_only(self, aspect_path):
+        resolver = LocalFileResolver(lazy=True)
+        aspect_graph = resolver.read(str(aspect_path))
+        meta_model_graph = Graph()
+        meta_model_graph.add(
+            (URIRef("urn:samm:test#Element"), RDFS.seeAlso, URIRef("urn:samm:org.example.c:1.0.0#Unused"))
+        )
+        model_graph = LayeredGraph(aspect_graph, meta_model_graph)
+
+        with mock.patch(
+            "esmf_aspect_meta_model_python.resolver.local_file.utils.collect_urns", side_effect=utils.collect_urns
+        ) as collect_urns_mock:
+            result = resolver.prepare_aspect_model(model_graph)
+
+        assert collect_urns_mock.call_args_list[0] == mock.call(aspect_graph)
+        assert {Path(file_path).name for file_path in result.files} == {"Aspect.ttl", "Nested.ttl", "Definitions.ttl"}
+
+    def test_lazy_unresolved_urn(self, tmp_path):
+        aspect_path = self._write_model(tmp_path, "org.example.a", "Aspect", "a:Aspect samm:see b:Missing .")
+        self._write_model(tmp_path, "org.example.b", "Other", "b:Other a samm:Property .")
+        graph = self._resolve(aspect_path, lazy=True)
+
+        assert len(graph) == 1
+
+    def test_resolution_report(self, aspect_path):
+        resolver = LocalFileResolver()
+        graph = resolver.read(str(aspect_path))
+        result = resolver.prepare_aspect_model(graph)
+
+        assert {Path(file_path).name: file_info["triples"] for file_path, file_info in result.files.items()} == {
+            "Aspect.ttl": 2,
+            "Nested.ttl": 2,
+            "Other.ttl": 1,
+            "Definitions.ttl": 1,
+            "Unused.ttl": 1,
+        }
+        assert {Path(folder).parent.name: file_count for folder, file_count in result.folders.items()} == {
+            "org.example.a": 1,
+            "org.example.b": 2,
+            "org.example.c": 2,
+        }
+        assert result.total_triples == len(graph)
+
+    def test_parallel_resolution_report(self, aspect_path):
+        resolver = LocalFileResolver(parallel=True, max_workers=2)
+        graph = resolver.read(str(aspect_path))
+        result = resolver.prepare_aspect_model(graph)
+
+        assert len(result.files) == 5
+        assert len(result.folders) == 3
+        assert result.total_triples == len(graph)
+
+    def test_parallel_file_dependencies_match_sequential(self, tmp_path):
+        samm_prefix = f"@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:{SAMM_VERSION}#> .\n"
+        for namespace, name, prefixes, body in (
+            ("org.example.a", "Aspect", "ab", "a:Aspect a samm:Aspect ; samm:see b:Nested ."),
+            ("org.example.b", "Nested", "bc", "b:Nested a samm:Property ; samm:see c:Shared ."),
+            ("org.example.c", "Definitions", "c", "c:Shared a samm:Property ."),
+        ):
+            model_path = tmp_path / namespace / "1.0.0" / f"{name}.ttl"
+            model_path.parent.mkdir(parents=True)
+            model_path.write_text(
+                samm_prefix
+                + "".join(f"@prefix {prefix}: <urn:samm:org.example.{prefix}:1.0.0#> .\n" for prefix in prefixes)
+                + body
+            )
+        aspect_path = str(tmp_path / "org.example.a" / "1.0.0" / "Aspect.ttl")
+
+        results = []
+        for options in ({}, {"parallel": True, "max_workers": 2}):
+            resolver = LocalFileResolver(**options)
+            resolver.read(aspect_path)
+            get_dependency_files = (
+                resolver._get_dependency_files_parallel if options else resolver._get_dependency_files
+            )
+            file_dependencies = get_dependency_files({}, {}, aspect_path)
+            results.append(
+                {
+                    Path(file_path).name: sorted(Path(folder).parent.name for folder in folders)
+                    for file_path, folders in file_dependencies.items()
+                }
+            )
+
+        assert (
+            results[1]
+            == results[0]
+            == {
+                "Aspect.ttl": ["org.example.a", "org.example.b"],
+                "Nested.ttl": ["org.example.b", "org.example.c"],
+                "Definitions.ttl": ["org.example.c"],
+            }
+        )
+
+    def test_parallel_matches_sequential(self, aspect_path):
+        sequential_graph = self._resolve(aspect_path)
+        parallel_graph = self._resolve(aspect_path, parallel=True, max_workers=2)
+
+        assert len(parallel_graph) == 7
+        assert set(parallel_graph) == set(sequential_graph)
@@ -4,6 +4,9 @@ from unittest import mock
 
 import pytest
 
+from rdflib import Graph, URIRef
+
+from esmf_aspect_meta_model_python import graph_snapshot
 from esmf_aspect_meta_model_python.resolver.meta_model import AspectMetaModelResolver
 
 
@@ -24,6 +27,14 @@ class TestAspectMetaModelResolver:
         assert result._base_path == "parent_3"
         path_mock.assert_called_once()
 
+    def test_init_use_snapshot(self, monkeypatch):
+        monkeypatch.delenv("ESMF_ASPECT_MODEL_LOADER_DISABLE_CACHE", raising=False)
+        assert AspectMetaModelResolver("base_path")._use_snapshot is True
+
+        monkeypatch.setenv("ESMF_ASPECT_MODEL_LOADER_DISABLE_CACHE", "1")
+        assert AspectMetaModelResolver("base_path")._use_snapshot is False
+        assert AspectMetaModelResolver("base_path", use_snapshot=True)._use_snapshot is True
+
     @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.exists")
     def test_validate_file(self, exists_mock):
         exists_mock.return_value = False
@@ -41,10 +52,83 @@ class TestAspectMetaModelResolver:
     def test_parse(self, get_samm_files_path_mock, validate_file_mock):
         get_samm_files_path_mock.return_value = ["samm_file_path"]
         aspect_graph_mock = mock.MagicMock(name="graph")
-        aspect_resolver = AspectMetaModelResolver("base_path")
+        aspect_resolver = AspectMetaModelResolver("base_path", use_snapshot=False)
         result = aspect_resolver.parse(aspect_graph_mock, "meta_model_version")
 
         assert result is None
         get_samm_files_path_mock.assert_called_once_with("meta_model_version")
         validate_file_mock.assert_called_once_with("samm_file_path")
         aspect_graph_mock.parse.assert_called_once_with("samm_file_path", format="turtle")
+
+    @pytest.fixture
+    def samm_folder(self, tmp_path):
+        version_folder = tmp_path / AspectMetaModelResolver.samm_folder_path / "meta-model" / "2.2.0"
+        version_folder.mkdir(parents=True)
+        (version_folder / "aspect-meta-model-definitions.ttl").write_text(
+            "@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#> .\n"
+            'samm:Aspect samm:preferredName "Aspect"@en .\n'
+        )
+
+        return tmp_path
+
+    def test_parse_builds_snapshot(self, samm_folder, tmp_path):
+        cache_dir = tmp_path / "cache"
+        aspect_resolver = AspectMetaModelResolver(str(samm_folder), cache_dir=cache_dir)
+        rdf_graph = Graph()
+        aspect_resolver.parse(rdf_graph, "2.2.0")
+
+        snapshots = list(cache_dir.glob("samm-meta-model-2.2.0-*.bin"))
+        assert len(snapshots) == 1
+        assert len(rdf_graph) == 1
+        assert ("samm", URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#")) in list(rdf_graph.namespaces())
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model.AspectMetaModelResolver._parse_files")
+    def test_parse_loads_snapshot(self, parse_files_mock, samm_folder, tmp_path):
+        cache_dir = tmp_path / "cache"
+        AspectMetaModelResolver(str(samm_folder), use_snapshot=True, cache_dir=cache_dir).parse(Graph(), "2.2.0")
+        parse_files_mock.reset_mock()
+
+        rdf_graph = Graph()
+        AspectMetaModelResolver(str(samm_folder), cache_dir=cache_dir).parse(rdf_graph, "2.2.0")
+
+        parse_files_mock.assert_not_called()
+
+    def test_parse_invalidates_outdated_snapshot(self, samm_folder, tmp_path):
+        cache_dir = tmp_path / "cache"
+        aspect_resolver = AspectMetaModelResolver(str(samm_folder), cache_dir=cache_dir)
+        aspect_resolver.parse(Graph(), "2.2.0")
+        samm_file = next(samm_folder.rglob("*.ttl"))
+        samm_file.write_text(samm_file.read_text() + 'samm:Aspect samm:description "Description"@en .\n')
+
+        rdf_graph = Graph()
+        aspect_resolver.parse(rdf_graph, "2.2.0")
+
+        assert len(rdf_graph) == 2
+        assert len(list(cache_dir.glob("samm-meta-model-2.2.0-*.bin"))) == 1
+
+    def test_get_snapshot_path_hashes_unchanged_files_once(self, samm_folder, tmp_path):
+        aspect_resolver = AspectMetaModelResolver(str(samm_folder), cache_dir=tmp_path / "cache")
+        samm_files = aspect_resolver._get_samm_files_path("2.2.0")
+        snapshot_path = aspect_resolver.get_snapshot_path(samm_files, "2.2.0")
+
+        with mock.patch(
+            "esmf_aspect_meta_model_python.resolver.meta_model.utils.get_file_digest"
+        ) as get_file_digest_mock:
+            result = aspect_resolver.get_snapshot_path(samm_files, "2.2.0")
+
+        assert result == snapshot_path
+        get_file_digest_mock.assert_not_called()
+
+    def test_parse_ignores_broken_snapshot(self, samm_folder, tmp_path):
+        cache_dir = tmp_path / "cache"
+        aspect_resolver = AspectMetaModelResolver(str(samm_folder), cache_dir=cache_dir)
+        samm_files = aspect_resolver._get_samm_files_path("2.2.0")
+        snapshot_path = aspect_resolver.get_snapshot_path(samm_files, "2.2.0")
+        snapshot_path.parent.mkdir(parents=True)
+        snapshot_path.write_bytes(b"broken")
+
+        rdf_graph = Graph()
+        aspect_resolver.parse(rdf_graph, "2.2.0")
+
+        assert len(rdf_graph) == 1
+        assert snapshot_path.read_bytes().startswith(graph_snapshot.MAGIC)
@@ -0,0 +1,96 @@
+"""Meta Model Store test suit."""
+
+from unittest import mock
+
+import pytest
+
+from rdflib import Graph, URIRef
+from rdflib.graph import ModificationException
+
+from esmf_aspect_meta_model_python.resolver.meta_model_store import MetaModelStore, ReadOnlyGraph
+
+TRIPLE = (
+    URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#Aspect"),
+    URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#name"),
+    URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#value"),
+)
+
+
+class TestReadOnlyGraph:
+    """Read-only graph test suit."""
+
+    def test_modify_before_freeze(self):
+        graph = ReadOnlyGraph()
+        graph.add(TRIPLE)
+        graph.remove(TRIPLE)
+        graph.addN([TRIPLE + (graph,)])
+
+        assert graph.frozen is False
+        assert len(graph) == 1
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            lambda graph: graph.add(TRIPLE),
+            lambda graph: graph.addN([TRIPLE + (graph,)]),
+            lambda graph: graph.remove(TRIPLE),
+            lambda graph: graph.parse(data="<urn:a> <urn:b> <urn:c> .", format="turtle"),
+        ],
+    )
+    def test_modify_frozen(self, modify):
+        graph = ReadOnlyGraph()
+        graph.add(TRIPLE)
+        result = graph.freeze()
+
+        assert result is graph
+        assert graph.frozen is True
+        with pytest.raises(ModificationException):
+            modify(graph)
+        assert len(graph) == 1
+
+
+class TestMetaModelStore:
+    """Meta Model Store test suit."""
+
+    @pytest.fixture(autouse=True)
+    def clear_store(self):
+        MetaModelStore.clear()
+        yield
+        MetaModelStore.clear()
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model_store.AspectMetaModelResolver")
+    def test_get_graph(self, aspect_meta_model_resolver_mock):
+        aspect_meta_model_resolver_mock.return_value.parse.side_effect = lambda graph, _: graph.add(TRIPLE)
+        result = MetaModelStore.get_graph("2.2.0", "base_path")
+
+        assert isinstance(result, ReadOnlyGraph)
+        assert result.frozen is True
+        assert list(result) == [TRIPLE]
+        aspect_meta_model_resolver_mock.assert_called_once_with("base_path")
+        aspect_meta_model_resolver_mock.return_value.parse.assert_called_once_with(result, "2.2.0")
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model_store.AspectMetaModelResolver")
+    def test_get_graph_is_shared(self, aspect_meta_model_resolver_mock):
+        result = MetaModelStore.get_graph("2.2.0")
+
+        assert MetaModelStore.get_graph("2.2.0") is result
+        assert MetaModelStore.get_graph("2.1.0") is not result
+        assert aspect_meta_model_resolver_mock.return_value.parse.call_count == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model_store.AspectMetaModelResolver")
+    def test_get_graph_not_cached_on_error(self, aspect_meta_model_resolver_mock):
+        aspect_meta_model_resolver_mock.return_value.parse.side_effect = [FileNotFoundError("not found"), None]
+        with pytest.raises(FileNotFoundError):
+            MetaModelStore.get_graph("2.2.0")
+
+        result = MetaModelStore.get_graph("2.2.0")
+
+        assert isinstance(result, Graph)
+        assert aspect_meta_model_resolver_mock.return_value.parse.call_count == 2
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.meta_model_store.AspectMetaModelResolver")
+    def test_clear(self, aspect_meta_model_resolver_mock):
+        result = MetaModelStore.get_graph("2.2.0")
+        MetaModelStore.clear()
+
+        assert MetaModelStore.get_graph("2.2.0") is not result
@@ -0,0 +1,122 @@
+"""Model index test suit."""
+
+import json
+import os
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.resolver.local_file import LocalFileResolver
+from esmf_aspect_meta_model_python.resolver.model_index import ModelIndex
+
+PREFIXES = (
+    f"@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:{SAMM_VERSION}#> .\n"
+    "@prefix a: <urn:samm:org.example.a:1.0.0#> .\n"
+    "@prefix b: <urn:samm:org.example.b:1.0.0#> .\n"
+)
+
+
+def write_model(models_root, namespace, name, body):
+    model_path = models_root / namespace / "1.0.0" / f"{name}.ttl"
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+    model_path.write_text(PREFIXES + body + "\n")
+
+    return model_path
+
+
+class TestModelIndex:
+    """Model index test suit."""
+
+    @pytest.fixture
+    def models_root(self, tmp_path):
+        models_root = tmp_path / "models"
+        write_model(models_root, "org.example.a", "Aspect", "a:Aspect a samm:Aspect ; samm:properties ( b:Shared ) .")
+        write_model(models_root, "org.example.b", "Definitions", "b:Shared a samm:Property .")
+
+        return models_root
+
+    @pytest.fixture
+    def index(self, models_root, tmp_path):
+        return ModelIndex(models_root, tmp_path / "index.json").load()
+
+    @mock.patch("esmf_aspect_meta_model_python.resolver.model_index.utils.get_cache_dir")
+    def test_init_default_index_path(self, get_cache_dir_mock, tmp_path):
+        get_cache_dir_mock.return_value = tmp_path / "cache"
+        index = ModelIndex(tmp_path)
+
+        assert index.models_root == tmp_path.resolve()
+        assert index.index_path.parent == tmp_path / "cache" / "model-index"
+        assert index.index_path.suffix == ".json"
+
+    def test_update(self, index, models_root):
+        result = index.update()
+
+        assert result == 2
+        assert len(index) == 2
+        assert index.find_definition_files("urn:samm:org.example.b:1.0.0#Shared") == [
+            models_root / "org.example.b" / "1.0.0" / "Definitions.ttl"
+        ]
+        assert index.find_definition_files("urn:samm:org.example.b:1.0.0#Missing") == []
+
+    def test_defined_and_referenced_urns(self, index, models_root):
+        index.update()
+        aspect_path = models_root / "org.example.a" / "1.0.0" / "Aspect.ttl"
+
+        assert index.get_defined_urns(aspect_path) == ["urn:samm:org.example.a:1.0.0#Aspect"]
+        assert index.get_referenced_urns(aspect_path) == ["urn:samm:org.example.b:1.0.0#Shared"]
+
+    def test_get_entry_raise_error(self, index, models_root):
+        with pytest.raises(KeyError):
+            index.get_defined_urns(models_root / "org.example.a" / "1.0.0" / "Aspect.ttl")
+
+    def test_update_persists_index(self, index, models_root, tmp_path):
+        index.update()
+        loaded_index = ModelIndex(models_root, tmp_path / "index.json").load()
+
+        assert len(loaded_index) == 2
+        assert loaded_index.update() == 0
+        assert loaded_index.find_definition_files("urn:samm:org.example.a:1.0.0#Aspect") == [
+            models_root / "org.example.a" / "1.0.0" / "Aspect.ttl"
+        ]
+
+    def test_update_is_incremental(self, index, models_root):
+        index.update()
+        changed_path = write_model(models_root, "org.example.b", "Definitions", "b:Renamed a samm:Property .")
+        file_stat = changed_path.stat()
+        os.utime(changed_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+        (models_root / "org.example.a" / "1.0.0" / "Aspect.ttl").unlink()
+
+        with mock.patch.object(ModelIndex, "_index_file", wraps=ModelIndex._index_file) as index_file_mock:
+            result = index.update()
+
+        assert result == 2
+        index_file_mock.assert_called_once()
+        assert len(index) == 1
+        assert index.find_definition_files("urn:samm:org.example.b:1.0.0#Shared") == []
+        assert index.find_definition_files("urn:samm:org.example.b:1.0.0#Renamed") == [changed_path]
+
+    def test_load_ignores_other_models_root(self, index, models_root, tmp_path):
+        index.update()
+        data = json.loads((tmp_path / "index.json").read_text())
+        data["models_root"] = "other"
+        (tmp_path / "index.json").write_text(json.dumps(data))
+
+        assert len(ModelIndex(models_root, tmp_path / "index.json").load()) == 0
+
+    def test_load_ignores_broken_file(self, models_root, tmp_path):
+        (tmp_path / "index.json").write_text("{broken")
+
+        assert len(ModelIndex(models_root, tmp_path / "index.json").load()) == 0
+
+    def test_lazy_resolver_uses_index(self, index, models_root):
+        index.update()
+        resolver = LocalFileResolver(lazy=True, model_index=index)
+        graph = resolver.read(str(models_root / "org.example.a" / "1.0.0" / "Aspect.ttl"))
+
+        with mock.patch.object(LocalFileResolver, "_mentions") as mentions_mock:
+            resolver.prepare_aspect_model(graph)
+
+        mentions_mock.assert_not_called()
+        assert len(graph) == 5
@@ -0,0 +1,67 @@
+"""Resolution report test suit."""
+
+from esmf_aspect_meta_model_python.resolver.resolution_report import ResolutionReport
+
+
+class TestResolutionReport:
+    """Resolution report test suit."""
+
+    def test_init(self):
+        result = ResolutionReport()
+
+        assert result.files == {}
+        assert result.folders == {}
+        assert result.folder_listings == {}
+        assert result.total_seconds == 0
+        assert result.total_triples == 0
+
+    def test_add_file(self):
+        report = ResolutionReport()
+        report.add_file("file_a", 0.5, 10)
+        report.add_file("file_b", 1.5, 20)
+
+        assert report.files == {"file_a": {"seconds": 0.5, "triples": 10}, "file_b": {"seconds": 1.5, "triples": 20}}
+        assert report.total_seconds == 2.0
+        assert report.total_triples == 30
+
+    def test_add_file_with_digest(self):
+        report = ResolutionReport()
+        report.add_file("file_a", 0.5, 10, "digest")
+
+        assert report.files == {"file_a": {"seconds": 0.5, "triples": 10, "digest": "digest"}}
+
+    def test_add_folder(self):
+        report = ResolutionReport()
+        report.add_folder("folder", 3)
+
+        assert report.folders == {"folder": 3}
+        assert report.folder_listings == {}
+
+    def test_add_folder_with_listing(self):
+        report = ResolutionReport()
+        report.add_folder("folder", 3, "listing")
+
+        assert report.folders == {"folder": 3}
+        assert report.folder_listings == {"folder": "listing"}
+
+    def test_get_slowest_files(self):
+        report = ResolutionReport()
+        report.add_file("file_a", 0.5, 10)
+        report.add_file("file_b", 1.5, 20)
+        report.add_file("file_c", 1.0, 5)
+        result = report.get_slowest_files(2)
+
+        assert result == [("file_b", 1.5), ("file_c", 1.0)]
+
+    def test_to_dict(self):
+        report = ResolutionReport()
+        report.add_file("file_a", 0.5, 10)
+        report.add_folder("folder", 1)
+        result = report.to_dict()
+
+        assert result == {
+            "files": {"file_a": {"seconds": 0.5, "triples": 10}},
+            "folders": {"folder": 1},
+            "total_seconds": 0.5,
+            "total_triples": 10,
+        }
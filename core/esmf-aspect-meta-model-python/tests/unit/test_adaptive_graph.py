@@ -8,6 +8,7 @@
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 #
 #   SPDX-License-Identifier: MPL-2.0
+import os
 import pathlib
 import subprocess
 
@@ -15,10 +16,19 @@ from unittest import mock
 
 import pytest
 
-from rdflib import Graph
+from rdflib import Graph, URIRef
 
 from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
 from esmf_aspect_meta_model_python.constants import SAMM_VERSION
+from esmf_aspect_meta_model_python.upgrade_cache import UpgradeCache
+
+
+@pytest.fixture(autouse=True)
+def upgrade_cache(monkeypatch, tmp_path):
+    cache = UpgradeCache(tmp_path / "upgrade_cache")
+    monkeypatch.setattr(AdaptiveGraph, "_upgrade_cache", cache)
+
+    return cache
 
 
 @pytest.fixture
@@ -71,6 +81,39 @@ def test_upgrade_data(mock_cli, graph, capsys, input_data):
     assert "[INFO] SAMM version mismatch detected in provided data" in captured.out
 
 
+@mock.patch.object(AdaptiveGraph, "_upgrade_ttl_file", return_value="upgraded content")
+def test_upgrade_source_cached(mock_cli, graph, tmp_path, upgrade_cache):
+    file = tmp_path / "file.ttl"
+    file.write_text("data")
+
+    first_result = graph._upgrade_source(file)
+    second_result = graph._upgrade_source(file)
+
+    assert first_result == second_result == "upgraded content"
+    mock_cli.assert_called_once_with(file)
+    assert upgrade_cache.statistics == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+@mock.patch.object(AdaptiveGraph, "_upgrade_ttl_file", return_value="upgraded content")
+def test_upgrade_data_cached(mock_cli, graph, upgrade_cache):
+    graph._upgrade_data("string data")
+    result = graph._upgrade_data(b"string data")
+
+    assert result == "upgraded content"
+    mock_cli.assert_called_once()
+    assert upgrade_cache.statistics == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+@mock.patch.object(AdaptiveGraph, "_upgrade_ttl_file", side_effect=["upgraded 1.0.0", "upgraded 2.0.0"])
+def test_upgrade_cache_key_contains_samm_version(mock_cli, graph):
+    graph._upgrade_data("string data")
+    graph.set_samm_version("2.0.0")
+    result = graph._upgrade_data("string data")
+
+    assert result == "upgraded 2.0.0"
+    assert mock_cli.call_count == 2
+
+
 def test_set_samm_version(graph):
     graph.set_samm_version("2.0.0")
 
@@ -161,6 +204,60 @@ class TestParse:
         mock_upgrade.assert_called_once_with(mock.ANY)
 
 
+class TestUpgradedRoot:
+    @pytest.fixture(autouse=True)
+    def upgraded_roots(self, monkeypatch):
+        monkeypatch.setattr(AdaptiveGraph, "_upgraded_roots", {})
+
+    @pytest.fixture
+    def models(self, tmp_path):
+        source = tmp_path / "models" / "org.eclipse.esmf.test" / "1.0.0" / "Aspect.ttl"
+        source.parent.mkdir(parents=True)
+        source.write_text("<urn:a> <urn:b> <urn:source> .")
+        upgraded = tmp_path / "upgraded" / "org.eclipse.esmf.test" / "1.0.0" / "Aspect.ttl"
+        upgraded.parent.mkdir(parents=True)
+        upgraded.write_text("<urn:a> <urn:b> <urn:upgraded> .")
+        AdaptiveGraph.register_upgraded_root(tmp_path / "models", tmp_path / "upgraded", "1.0.0")
+
+        return source, upgraded
+
+    @mock.patch("esmf_aspect_meta_model_python.utils.has_version_mismatch_from_input")
+    def test_parse_upgraded_source(self, mock_version_check, graph, models):
+        source, _ = models
+
+        graph.parse(source=source)
+
+        assert set(graph.objects()) == {URIRef("urn:upgraded")}
+        mock_version_check.assert_not_called()
+
+    @mock.patch("esmf_aspect_meta_model_python.utils.has_version_mismatch_from_input", return_value=False)
+    def test_parse_source_changed_after_upgrade(self, mock_version_check, graph, models):
+        source, upgraded = models
+        os.utime(upgraded, (0, 0))
+
+        graph.parse(source=source)
+
+        assert set(graph.objects()) == {URIRef("urn:source")}
+        mock_version_check.assert_called_once_with(source, samm_version="1.0.0")
+
+    def test_get_upgraded_source_of_samm_version(self, graph, models, tmp_path):
+        source, upgraded = models
+        other_upgraded = tmp_path / "upgraded_2" / "org.eclipse.esmf.test" / "1.0.0" / "Aspect.ttl"
+        other_upgraded.parent.mkdir(parents=True)
+        other_upgraded.write_text("<urn:a> <urn:b> <urn:upgraded_2> .")
+        AdaptiveGraph.register_upgraded_root(tmp_path / "models", tmp_path / "upgraded_2", "2.0.0")
+
+        assert graph._get_upgraded_source(source) == upgraded
+        assert AdaptiveGraph(samm_version="2.0.0")._get_upgraded_source(source) == other_upgraded
+        assert AdaptiveGraph(samm_version="3.0.0")._get_upgraded_source(source) is None
+
+    def test_get_upgraded_source_outside_models_root(self, graph, models, tmp_path):
+        other_source = tmp_path / "Aspect.ttl"
+        other_source.write_text("")
+
+        assert graph._get_upgraded_source(other_source) is None
+
+
 @pytest.mark.parametrize(
     ("operation", "operation_name"),
     [
@@ -0,0 +1,133 @@
+"""Batch Upgrader test suite."""
+
+import os
+import pathlib
+import subprocess
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
+from esmf_aspect_meta_model_python.batch_upgrade import BatchUpgrader
+
+OLD_MODEL = "@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .\n<urn:a> <urn:b> <urn:c> .\n"
+NEW_MODEL = "@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#> .\n<urn:a> <urn:b> <urn:c> .\n"
+
+
+@pytest.fixture(autouse=True)
+def upgraded_roots(monkeypatch):
+    monkeypatch.setattr(AdaptiveGraph, "_upgraded_roots", {})
+
+
+@pytest.fixture
+def models_root(tmp_path):
+    root = tmp_path / "models"
+    version_folder = root / "org.eclipse.esmf.test" / "1.0.0"
+    version_folder.mkdir(parents=True)
+    (version_folder / "Old.ttl").write_text(OLD_MODEL)
+    (version_folder / "New.ttl").write_text(NEW_MODEL)
+
+    return root
+
+
+@pytest.fixture
+def samm_cli_mock():
+    samm_cli = mock.MagicMock(name="samm_cli")
+    samm_cli.prettyprint.return_value = NEW_MODEL
+
+    return samm_cli
+
+
+@pytest.fixture
+def upgrader(models_root, tmp_path, samm_cli_mock):
+    return BatchUpgrader(
+        models_root, tmp_path / "upgraded", samm_version="2.2.0", max_workers=2, samm_cli=samm_cli_mock
+    )
+
+
+class TestBatchUpgrader:
+    """Batch Upgrader test suite."""
+
+    @mock.patch("esmf_aspect_meta_model_python.batch_upgrade.utils.get_cache_dir")
+    def test_init_defaults(self, get_cache_dir_mock, models_root, tmp_path):
+        get_cache_dir_mock.return_value = tmp_path / "cache"
+        result = BatchUpgrader(models_root, samm_version="2.2.0")
+
+        assert result.models_root == models_root.resolve()
+        assert result.upgraded_root.parent == tmp_path / "cache" / "upgraded" / "2.2.0"
+        assert result.max_workers >= 1
+        assert result._samm_cli is AdaptiveGraph._samm_cli
+
+    def test_get_upgraded_path(self, upgrader, models_root, tmp_path):
+        result = upgrader.get_upgraded_path(models_root / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl")
+
+        assert result == tmp_path / "upgraded" / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl"
+
+    def test_find_outdated_files(self, upgrader, models_root):
+        result = upgrader.find_outdated_files()
+
+        assert result == [models_root.resolve() / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl"]
+
+    def test_upgrade(self, upgrader, models_root, samm_cli_mock, tmp_path):
+        old_file = models_root.resolve() / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl"
+        upgraded_file = tmp_path / "upgraded" / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl"
+
+        result = upgrader.upgrade()
+
+        assert result == {old_file: upgraded_file}
+        assert upgraded_file.read_text() == NEW_MODEL
+        assert AdaptiveGraph._upgraded_roots == {(models_root.resolve(), "2.2.0"): tmp_path / "upgraded"}
+        assert upgrader.find_outdated_files() == []
+        samm_cli_mock.prettyprint.assert_called_once_with(str(old_file), capture=True)
+
+    def test_upgrade_outdated_after_source_change(self, upgrader, models_root):
+        upgrader.upgrade()
+        old_file = models_root / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl"
+        os.utime(upgrader.get_upgraded_path(old_file), (0, 0))
+
+        assert upgrader.find_outdated_files() == [old_file.resolve()]
+
+    def test_upgrade_given_files(self, upgrader, models_root, samm_cli_mock):
+        new_file = models_root / "org.eclipse.esmf.test" / "1.0.0" / "New.ttl"
+
+        result = upgrader.upgrade([str(new_file)])
+
+        assert list(result) == [new_file.resolve()]
+        samm_cli_mock.prettyprint.assert_called_once_with(str(new_file.resolve()), capture=True)
+
+    def test_upgrade_file_outside_models_root(self, upgrader, models_root, samm_cli_mock, tmp_path):
+        old_file = models_root / "org.eclipse.esmf.test" / "1.0.0" / "Old.ttl"
+        other_file = tmp_path / "Other.ttl"
+        other_file.write_text(OLD_MODEL)
+
+        with pytest.raises(RuntimeError) as exc_info:
+            upgrader.upgrade([old_file, other_file])
+
+        assert str(exc_info.value) == (
+            "Could not upgrade 1 of 2 files:\n"
+            f"{other_file.resolve()} is not in the models root {models_root.resolve()}."
+        )
+        assert upgrader.find_outdated_files() == []
+        assert (models_root.resolve(), "2.2.0") in AdaptiveGraph._upgraded_roots
+        samm_cli_mock.prettyprint.assert_called_once_with(str(old_file.resolve()), capture=True)
+
+    def test_upgrade_failure(self, upgrader, models_root, samm_cli_mock):
+        (models_root / "org.eclipse.esmf.test" / "1.0.0" / "Other.ttl").write_text(OLD_MODEL)
+        error = subprocess.CalledProcessError(returncode=1, cmd="prettyprint", output="STDOUT", stderr="STDERR")
+
+        def prettyprint(path, capture):
+            if pathlib.Path(path).name == "Other.ttl":
+                raise error
+
+            return NEW_MODEL
+
+        samm_cli_mock.prettyprint.side_effect = prettyprint
+
+        with pytest.raises(RuntimeError) as exc_info:
+            upgrader.upgrade()
+
+        assert str(exc_info.value).startswith("Could not upgrade 1 of 2 files:\nSAMM CLI failed for ")
+        assert upgrader.find_outdated_files() == [
+            models_root.resolve() / "org.eclipse.esmf.test" / "1.0.0" / "Other.ttl"
+        ]
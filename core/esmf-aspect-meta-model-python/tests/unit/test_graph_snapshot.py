@@ -0,0 +1,86 @@
+"""Graph snapshot test suite."""
+
+import json
+import struct
+
+import pytest
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.compare import isomorphic
+
+from esmf_aspect_meta_model_python import graph_snapshot
+
+EX = Namespace("urn:samm:org.eclipse.esmf.test:1.0.0#")
+
+
+@pytest.fixture
+def graph():
+    rdf_graph = Graph()
+    rdf_graph.bind("ex", EX)
+    blank_node = BNode()
+    rdf_graph.add((EX.aspect, EX.property, EX.property1))
+    rdf_graph.add((EX.aspect, EX.preferredName, Literal("Aspect", lang="en")))
+    rdf_graph.add((EX.aspect, EX.numberOfItems, Literal(5)))
+    rdf_graph.add((EX.aspect, EX.comment, Literal("plain")))
+    rdf_graph.add((EX.aspect, EX.nested, blank_node))
+    rdf_graph.add((blank_node, EX.value, URIRef("urn:samm:org.eclipse.esmf.test:1.0.0#value")))
+
+    return rdf_graph
+
+
+class TestGraphSnapshot:
+    """Graph snapshot test suite."""
+
+    def test_round_trip(self, graph):
+        data = graph_snapshot.encode_graph(graph, {"key": "value"})
+        result = Graph()
+        metadata = graph_snapshot.decode_into(data, result)
+
+        assert metadata == {"key": "value"}
+        assert isomorphic(graph, result)
+        assert ("ex", URIRef(str(EX))) in list(result.namespaces())
+
+    def test_round_trip_keeps_literal_types(self, graph):
+        result = Graph()
+        graph_snapshot.decode_into(graph_snapshot.encode_graph(graph), result)
+
+        assert result.value(EX.aspect, EX.preferredName) == Literal("Aspect", lang="en")
+        assert result.value(EX.aspect, EX.numberOfItems).toPython() == 5
+        assert result.value(EX.aspect, EX.comment) == Literal("plain")
+
+    def test_decode_invalid_data(self):
+        with pytest.raises(ValueError) as error:
+            graph_snapshot.decode_into(b"invalid data", Graph())
+
+        assert str(error.value) == "The data is not a graph snapshot or has an unsupported format version."
+
+    def test_term_table_is_json(self, graph):
+        data = graph_snapshot.encode_graph(graph)
+        header_length = struct.unpack_from("<I", data, len(graph_snapshot.MAGIC))[0]
+        offset = len(graph_snapshot.MAGIC) + 4 + header_length
+        terms_length = struct.unpack_from("<I", data, offset)[0]
+        terms_start = offset + 4
+        terms_end = terms_start + terms_length
+        terms = json.loads(data[terms_start:terms_end].decode("utf-8"))
+
+        assert ["3", "Aspect", "en"] in [[str(value) for value in term] for term in terms]
+        assert len(terms) == 12
+
+    def test_decode_unknown_term_kind(self, graph):
+        data = graph_snapshot.encode_graph(graph).replace(b'[0,"urn:', b'[9,"urn:', 1)
+
+        with pytest.raises(ValueError) as error:
+            graph_snapshot.decode_into(data, Graph())
+
+        assert str(error.value) == "The graph snapshot contains a term of unknown kind 9."
+
+    def test_write_and_read_snapshot(self, graph, tmp_path):
+        snapshot_path = tmp_path / "folder" / "graph.bin"
+        graph_snapshot.write_snapshot(snapshot_path, graph_snapshot.encode_graph(graph, {"version": "2.2.0"}))
+        result = Graph()
+        metadata = graph_snapshot.read_snapshot(snapshot_path, result)
+
+        assert metadata == {"version": "2.2.0"}
+        assert isomorphic(graph, result)
+        assert graph_snapshot.read_snapshot_metadata(snapshot_path) == {"version": "2.2.0"}
+        assert [path.name for path in snapshot_path.parent.iterdir()] == ["graph.bin"]
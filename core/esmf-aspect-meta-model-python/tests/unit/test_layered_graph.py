@@ -0,0 +1,124 @@
+"""Layered Graph test suite."""
+
+import pytest
+
+from rdflib import Graph, Literal, Namespace, URIRef
+
+from esmf_aspect_meta_model_python.adaptive_graph import AdaptiveGraph
+from esmf_aspect_meta_model_python.layered_graph import LayeredGraph, LayeredStore
+
+SAMM = Namespace("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#")
+EX = Namespace("urn:samm:org.eclipse.esmf.test:1.0.0#")
+
+
+class CountingGraph(Graph):
+    """Graph recording its membership checks."""
+
+    def __init__(self):
+        super().__init__()
+        self.checked = []
+
+    def __contains__(self, triple):
+        self.checked.append(triple)
+        return super().__contains__(triple)
+
+
+@pytest.fixture
+def aspect_graph():
+    graph = Graph()
+    graph.bind("samm", SAMM)
+    graph.bind("", EX)
+    graph.add((EX.TestAspect, SAMM.preferredName, Literal("Test Aspect", lang="en")))
+    graph.add((EX.TestAspect, SAMM.description, Literal("Description", lang="en")))
+
+    return graph
+
+
+@pytest.fixture
+def meta_model_graph():
+    graph = Graph()
+    graph.bind("samm", SAMM)
+    graph.bind("ex", URIRef("urn:samm:org.eclipse.esmf.other:1.0.0#"))
+    graph.add((SAMM.Aspect, SAMM.preferredName, Literal("Aspect", lang="en")))
+    graph.add((EX.TestAspect, SAMM.description, Literal("Description", lang="en")))
+
+    return graph
+
+
+class TestLayeredStore:
+    """Layered Store test suite."""
+
+    def test_init_without_layers(self):
+        with pytest.raises(ValueError) as error:
+            LayeredStore([])
+
+        assert str(error.value) == "At least one graph layer is required."
+
+    def test_triples_checks_only_layers_with_the_subject(self, aspect_graph, meta_model_graph):
+        aspect_layer = CountingGraph()
+        for triple in aspect_graph:
+            aspect_layer.add(triple)
+        store = LayeredStore([Graph(), aspect_layer, meta_model_graph])
+
+        result = [triple for triple, _ in store.triples((None, None, None))]
+
+        assert len(result) == 3
+        assert len(store) == 3
+        assert aspect_layer.checked.count((SAMM.Aspect, None, None)) == 2
+        assert (SAMM.Aspect, SAMM.preferredName, Literal("Aspect", lang="en")) not in aspect_layer.checked
+        assert (EX.TestAspect, SAMM.description, Literal("Description", lang="en")) in aspect_layer.checked
+
+
+class TestLayeredGraph:
+    """Layered Graph test suite."""
+
+    def test_init(self, aspect_graph, meta_model_graph):
+        result = LayeredGraph(aspect_graph, meta_model_graph, samm_version="2.1.0")
+
+        assert isinstance(result, AdaptiveGraph)
+        assert result._samm_version == "2.1.0"
+        assert result.layers[1:] == [aspect_graph, meta_model_graph]
+
+    def test_triples(self, aspect_graph, meta_model_graph):
+        result = LayeredGraph(aspect_graph, meta_model_graph)
+
+        assert len(result) == 3
+        assert len(list(result)) == 3
+        assert set(result) == set(aspect_graph) | set(meta_model_graph)
+        assert result.value(SAMM.Aspect, SAMM.preferredName) == Literal("Aspect", lang="en")
+        assert list(result.objects(EX.TestAspect, SAMM.description)) == [Literal("Description", lang="en")]
+
+    def test_add_goes_to_own_layer(self, aspect_graph, meta_model_graph):
+        graph = LayeredGraph(aspect_graph, meta_model_graph)
+        graph.add((EX.TestAspect, SAMM.see, URIRef("https://eclipse-esmf.github.io")))
+        graph.parse(data="<urn:a> <urn:b> <urn:c> .", format="turtle")
+
+        assert len(graph) == 5
+        assert len(graph.layers[0]) == 2
+        assert len(aspect_graph) == 2
+        assert len(meta_model_graph) == 2
+
+    def test_remove_from_own_layer_only(self, aspect_graph, meta_model_graph):
+        graph = LayeredGraph(aspect_graph, meta_model_graph)
+        graph.add((EX.TestAspect, SAMM.see, URIRef("https://eclipse-esmf.github.io")))
+        graph.remove((EX.TestAspect, None, None))
+
+        assert len(graph) == 3
+        assert len(aspect_graph) == 2
+
+    def test_namespaces(self, aspect_graph, meta_model_graph):
+        graph = LayeredGraph(aspect_graph, meta_model_graph)
+        namespaces = dict(graph.namespaces())
+
+        assert namespaces["samm"] == URIRef(str(SAMM))
+        assert namespaces["ex"] == URIRef("urn:samm:org.eclipse.esmf.other:1.0.0#")
+        assert graph.store.namespace("samm") == URIRef(str(SAMM))
+        assert graph.store.prefix(URIRef(str(SAMM))) == "samm"
+        assert graph.store.namespace("unknown") is None
+        assert graph.store.prefix(URIRef("urn:unknown#")) is None
+
+    def test_query(self, aspect_graph, meta_model_graph):
+        graph = LayeredGraph(aspect_graph, meta_model_graph)
+        result = graph.query("SELECT ?name WHERE { ?element samm:preferredName ?name }")
+
+        assert {row.name for row in result} == {Literal("Aspect", lang="en"), Literal("Test Aspect", lang="en")}
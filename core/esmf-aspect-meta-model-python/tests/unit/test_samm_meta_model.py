@@ -66,18 +66,16 @@ class TestSammCli:
         assert str(error.value) == "There is no such file unit_file_path"
         exists_mock.assert_called_once_with("unit_file_path")
 
-    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.rdflib.Graph")
+    @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.MetaModelStore")
     @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._validate_path")
     @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_file_path")
-    def test_get_units(self, get_file_path_mock, validate_path_mock, rdflib_graph_mock):
+    def test_get_units(self, get_file_path_mock, validate_path_mock, meta_model_store_mock):
         get_file_path_mock.return_value = "unit_file_path"
-        graph_mock = mock.MagicMock()
-        rdflib_graph_mock.return_value = graph_mock
+        meta_model_store_mock.get_graph.return_value = "graph"
         result = SammUnitsGraph()
 
-        assert result._graph == graph_mock
-        rdflib_graph_mock.assert_called_once()
-        graph_mock.parse.assert_called_once_with("unit_file_path", format="turtle")
+        assert result._graph == "graph"
+        meta_model_store_mock.get_graph.assert_called_once_with(SammUnitsGraph.SAMM_VERSION)
 
     @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._get_units")
     @mock.patch("esmf_aspect_meta_model_python.samm_meta_model.SammUnitsGraph._validate_path")
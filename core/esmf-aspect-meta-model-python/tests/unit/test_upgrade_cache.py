@@ -0,0 +1,102 @@
+"""Upgrade Cache test suite."""
+
+import os
+
+from unittest import mock
+
+import pytest
+
+from esmf_aspect_meta_model_python.upgrade_cache import UpgradeCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return UpgradeCache(tmp_path / "cache", max_size=10)
+
+
+class TestUpgradeCache:
+    """Upgrade Cache test suite."""
+
+    @mock.patch("esmf_aspect_meta_model_python.upgrade_cache.utils.get_cache_dir")
+    def test_default_cache_dir(self, get_cache_dir_mock, tmp_path):
+        get_cache_dir_mock.return_value = tmp_path
+        result = UpgradeCache()
+
+        assert result.cache_dir == tmp_path / UpgradeCache.FOLDER_NAME
+        assert result.max_size == UpgradeCache.DEFAULT_MAX_SIZE
+
+    @mock.patch("esmf_aspect_meta_model_python.upgrade_cache.JAVA_CLI_VERSION", "1.0.0")
+    def test_get_key(self):
+        key = UpgradeCache.get_key("data", "2.2.0")
+
+        assert key == UpgradeCache.get_key(b"data", "2.2.0")
+        assert key != UpgradeCache.get_key("other data", "2.2.0")
+        assert key != UpgradeCache.get_key("data", "2.1.0")
+        with mock.patch("esmf_aspect_meta_model_python.upgrade_cache.JAVA_CLI_VERSION", "2.0.0"):
+            assert key != UpgradeCache.get_key("data", "2.2.0")
+
+    def test_get_and_put(self, cache):
+        assert cache.get("key") is None
+
+        cache.put("key", "upgraded")
+
+        assert cache.get("key") == "upgraded"
+        assert cache.statistics == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_disabled(self, tmp_path):
+        cache = UpgradeCache(tmp_path / "cache", enabled=False)
+        cache.put("key", "upgraded")
+
+        assert cache.get("key") is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_disabled_by_environment(self, monkeypatch, cache):
+        monkeypatch.setenv("ESMF_ASPECT_MODEL_LOADER_DISABLE_CACHE", "1")
+        cache.put("key", "upgraded")
+
+        assert cache.enabled is False
+        assert cache.get("key") is None
+        assert not cache.cache_dir.exists()
+
+    def test_evict_least_recently_used(self, cache):
+        cache.put("first", "12345")
+        cache.put("second", "12345")
+        os.utime(cache.cache_dir / "first.ttl", (1, 1))
+        os.utime(cache.cache_dir / "second.ttl", (2, 2))
+        cache.get("first")
+
+        cache.put("third", "12345")
+
+        assert cache.get("first") == "12345"
+        assert cache.get("second") is None
+        assert cache.get("third") == "12345"
+        assert cache.statistics["evictions"] == 1
+
+    def test_put_scans_only_when_size_limit_is_crossed(self, cache):
+        with mock.patch.object(UpgradeCache, "_evict", autospec=True, side_effect=UpgradeCache._evict) as evict_mock:
+            cache.put("first", "1234")
+            cache.put("second", "1234")
+            cache.put("second", "1234")
+
+            assert evict_mock.call_count == 1
+            assert cache._total_size == 8
+
+            cache.put("third", "1234")
+
+            assert evict_mock.call_count == 2
+            assert cache._total_size == 8
+            assert cache.statistics["evictions"] == 1
+
+    def test_put_write_error(self, cache):
+        with mock.patch("esmf_aspect_meta_model_python.upgrade_cache.utils.write_file_atomically") as write_mock:
+            write_mock.side_effect = OSError("read-only file system")
+            cache.put("key", "upgraded")
+
+        assert cache.get("key") is None
+
+    def test_clear(self, cache):
+        cache.put("key", "upgraded")
+        cache.clear()
+
+        assert cache.get("key") is None
+        assert cache._total_size is None
@@ -1,9 +1,12 @@
+import hashlib
 import pathlib
 
 from unittest import mock
 
 import pytest
 
+from rdflib import RDF, Graph, URIRef
+
 from esmf_aspect_meta_model_python import utils
 
 
@@ -76,11 +79,123 @@ class TestHasVersionMismatchInGraph:
         graph_mock.namespace_manager.namespaces.assert_called_once_with()
 
 
+TURTLE_HEADER = """\ufeff# Copyright <https://eclipse-esmf.github.io#>
+
+@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> . @prefix : <urn:samm:org.eclipse.esmf.test:1.0.0#> .
+PREFIX samm-c: <urn:samm:org.eclipse.esmf.samm:characteristic:2.1.0#>  # comment
+@base <urn:samm:org.eclipse.esmf.test:1.0.0#> .
+BASE <urn:samm:org.eclipse.esmf.test:1.0.0#>
+
+:TestAspect a samm:Aspect .
+@prefix samm-e: <urn:samm:org.eclipse.esmf.samm:entity:2.1.0#> .
+"""
+
+
+class TestScanPrefixes:
+    EXPECTED = [
+        ("samm", "urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#"),
+        ("", "urn:samm:org.eclipse.esmf.test:1.0.0#"),
+        ("samm-c", "urn:samm:org.eclipse.esmf.samm:characteristic:2.1.0#"),
+    ]
+
+    def test_from_data(self):
+        result = list(utils.scan_prefixes(TURTLE_HEADER))
+
+        assert result == self.EXPECTED
+
+    def test_from_bytes(self):
+        result = list(utils.scan_prefixes(TURTLE_HEADER.encode("utf-8")))
+
+        assert result == self.EXPECTED
+
+    def test_from_path(self, tmp_path):
+        input_source = tmp_path / "aspect.ttl"
+        input_source.write_text(TURTLE_HEADER, encoding="utf-8")
+
+        result = list(utils.scan_prefixes(input_source))
+
+        assert result == self.EXPECTED
+
+    def test_stops_at_first_statement(self):
+        lines = iter(
+            [
+                "@prefix samm: <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .",
+                ":TestAspect a samm:Aspect .",
+                "@prefix samm-c: <urn:samm:org.eclipse.esmf.samm:characteristic:2.1.0#> .",
+            ]
+        )
+
+        result = list(utils._scan_prefix_lines(lines))
+
+        assert result == [("samm", "urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#")]
+        assert next(lines, None) == "@prefix samm-c: <urn:samm:org.eclipse.esmf.samm:characteristic:2.1.0#> ."
+
+
+@pytest.mark.parametrize(
+    "urn, expected",
+    [
+        ("urn:samm:org.example:1.0.0#Element", ("org.example", "1.0.0", "Element")),
+        ("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#Aspect", (None, None, "Aspect")),
+        ("urn:samm:org.example:1.0.0", (None, None, "")),
+    ],
+)
+def test_split_urn(urn, expected):
+    assert utils.split_urn(URIRef(urn)) == expected
+
+
+def test_collect_urns():
+    graph = Graph()
+    aspect = URIRef("urn:samm:org.example:1.0.0#Aspect")
+    property_urn = URIRef("urn:samm:org.example:1.0.0#property")
+    graph.add((aspect, RDF.type, URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#Aspect")))
+    graph.add((aspect, URIRef("urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#properties"), property_urn))
+
+    defined, referenced = utils.collect_urns(graph)
+
+    assert defined == {aspect}
+    assert referenced == {property_urn}
+
+
+@pytest.mark.parametrize(
+    "samm_version, has_mismatch",
+    [
+        ("2.1.0", False),
+        ("2.2.0", True),
+    ],
+)
+@mock.patch("esmf_aspect_meta_model_python.utils._parse_graph_from_input", autospec=True)
+def test_has_version_mismatch_from_input(parse_mock, samm_version, has_mismatch):
+    result = utils.has_version_mismatch_from_input(TURTLE_HEADER, samm_version=samm_version)
+
+    assert result is has_mismatch
+    parse_mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "samm_version, has_mismatch",
+    [
+        ("2.1.0", False),
+        ("2.2.0", True),
+    ],
+)
+def test_has_version_mismatch_from_multi_line_prefix(samm_version, has_mismatch):
+    data = """@prefix samm:
+    <urn:samm:org.eclipse.esmf.samm:meta-model:2.1.0#> .
+@prefix : <urn:samm:org.eclipse.esmf.test:1.0.0#> .
+
+:TestAspect a samm:Aspect .
+"""
+    assert list(utils.get_samm_versions_from_namespaces(utils.scan_prefixes(data))) == []
+
+    assert utils.has_version_mismatch_from_input(data, samm_version=samm_version) is has_mismatch
+    assert utils.has_version_mismatch_from_input(data.encode("utf-8"), samm_version=samm_version) is has_mismatch
+
+
 @pytest.mark.parametrize("has_mismatch", [True, False])
 @mock.patch("esmf_aspect_meta_model_python.utils._parse_graph_from_input", autospec=True)
 @mock.patch("esmf_aspect_meta_model_python.utils.has_version_mismatch_in_graph", autospec=True)
-def test_has_version_mismatch_from_input(mismatch_mock, parse_mock, has_mismatch):
-    input_source = "input source"
+def test_has_version_mismatch_from_non_turtle_file(mismatch_mock, parse_mock, has_mismatch):
+    input_source = pathlib.Path("aspect.jsonld")
     mismatch_mock.return_value = has_mismatch
 
     result = utils.has_version_mismatch_from_input(input_source, samm_version="1.0.0")
@@ -88,3 +203,32 @@ def test_has_version_mismatch_from_input(mismatch_mock, parse_mock, has_mismatch
     assert result is has_mismatch
     parse_mock.assert_called_once_with(input_source)
     mismatch_mock.assert_called_once_with(parse_mock.return_value, samm_version="1.0.0")
+
+
+def test_get_file_digest(tmp_path):
+    file_path = tmp_path / "Aspect.ttl"
+    file_path.write_bytes(b"content")
+
+    assert utils.get_file_digest(file_path) == hashlib.sha256(b"content").hexdigest()
+
+
+def test_get_folder_listing(tmp_path):
+    (tmp_path / "Aspect.ttl").write_text("aspect")
+    (tmp_path / "notes.txt").write_text("notes")
+    listing = utils.get_folder_listing(tmp_path)
+
+    (tmp_path / "other.txt").write_text("other")
+    assert utils.get_folder_listing(tmp_path) == listing
+
+    (tmp_path / "Entity.ttl").write_text("entity")
+    assert utils.get_folder_listing(tmp_path) != listing
+    assert utils.get_folder_listing(tmp_path / "missing") == ""
+
+
+@pytest.mark.parametrize("value, is_enabled", [(None, True), ("", True), ("0", True), ("1", False), ("True", False)])
+def test_is_cache_enabled(monkeypatch, value, is_enabled):
+    monkeypatch.delenv("ESMF_ASPECT_MODEL_LOADER_DISABLE_CACHE", raising=False)
+    if value is not None:
+        monkeypatch.setenv("ESMF_ASPECT_MODEL_LOADER_DISABLE_CACHE", value)
+
+    assert utils.is_cache_enabled() is is_enabled
@@ -0,0 +1,63 @@
+"""Vocabulary namespace test suit."""
+
+import rdflib
+
+from esmf_aspect_meta_model_python.vocabulary.namespace import Namespace
+from esmf_aspect_meta_model_python.vocabulary.samm import SAMM
+from esmf_aspect_meta_model_python.vocabulary.sammc import SAMMC
+from esmf_aspect_meta_model_python.vocabulary.unit import UNIT
+
+
+class TestNamespace:
+    """Vocabulary namespace test suit."""
+
+    def test_one_instance_per_class_and_version(self):
+        samm = SAMM("2.2.0")
+
+        assert SAMM("2.2.0") is samm
+        assert SAMM("2.1.0") is not samm
+        assert SAMMC("2.2.0") is not samm
+        assert samm.meta_model_version == "2.2.0"
+
+    def test_get_urn_is_prebuilt(self):
+        samm = SAMM("2.2.0")
+
+        assert SAMM.characteristic in samm._urns
+        assert samm.get_urn(SAMM.characteristic) is SAMM("2.2.0").get_urn(SAMM.characteristic)
+        assert samm.get_urn(SAMM.characteristic) == rdflib.URIRef(
+            "urn:samm:org.eclipse.esmf.samm:meta-model:2.2.0#characteristic"
+        )
+
+    def test_get_urn_does_not_intern_unknown_name(self):
+        unit = UNIT("2.2.0")
+        urn = unit.get_urn("metre")
+
+        assert urn == rdflib.URIRef("urn:samm:org.eclipse.esmf.samm:unit:2.2.0#metre")
+        assert "metre" not in unit._urns
+        assert urn not in Namespace._names
+
+    def test_subclass_implementing_get_urn(self):
+        class CustomNamespace(Namespace):
+            def __init__(self, meta_model_version):
+                self.meta_model_version = meta_model_version
+
+            def get_urn(self, element_type):
+                return rdflib.URIRef(f"urn:example:{self.meta_model_version}#{element_type}")
+
+        namespace = CustomNamespace("1.0.0")
+
+        assert namespace.get_urn("Element") == rdflib.URIRef("urn:example:1.0.0#Element")
+        assert CustomNamespace.get_name(namespace.get_urn("Element")) == "Element"
+
+    def test_get_name(self):
+        urn = SAMMC("2.2.0").get_urn(SAMMC.Enumeration)
+
+        assert SAMMC.get_name(urn) == "Enumeration"
+        assert SAMM.get_name("urn:samm:org.example:1.0.0#TestAspect") == "TestAspect"
+        assert SAMM.get_name(None) is None
+
+    def test_collections_urns(self):
+        sammc = SAMMC("2.2.0")
+
+        assert sammc.collections_urns() is sammc.collections_urns()
+        assert sammc.get_urn(SAMMC.List) in sammc.collections_urns()